@@ -66,6 +66,7 @@ class State:
     def __init__(self):
         self.dry_run = False
         self.logging_level = logging.INFO
+        self.scan_threads = None
 
 state = State()
 
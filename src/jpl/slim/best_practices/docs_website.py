@@ -67,27 +67,24 @@ class DocsWebsiteBestPractice(StandardPractice):
             return None
         
         # Validate AI model configuration before proceeding
-        from jpl.slim.utils.ai_utils import validate_model, generate_ai_content
+        from jpl.slim.utils.ai_utils import validate_model, check_model_health_async
         is_valid, error_message = validate_model(model)
         if not is_valid:
             logging.error(f"AI model validation failed: {error_message}")
             print(f"❌ Error: {error_message}")
             return None
         
-        # Test AI connectivity with a simple request
-        print("🔍 Testing AI model connectivity...")
-        test_prompt = "Reply with only the word 'OK' to confirm you are working."
-        test_response = generate_ai_content(test_prompt, model)
-        if not test_response:
-            logging.error(f"AI model connectivity test failed for {model}")
-            print(f"❌ Error: Cannot connect to AI model '{model}'. Please check your API keys and network connection.")
-            return None
-        
-        print(f"✅ AI model '{model}' is working correctly")
+        # Check AI connectivity in the background while the repository and template
+        # are set up; the generator waits for the result before its first AI request
+        print("🔍 Testing AI model connectivity in the background...")
+        model_health = check_model_health_async(model)
         
         # Extract additional parameters that might be passed via the command line
         template_only = kwargs.get('template_only', False)
         revise_site = kwargs.get('revise_site', False)
+        incremental = kwargs.get('incremental', False)
+        template_ref = kwargs.get('template_ref')
+        batch_pages = kwargs.get('batch_pages', 1)
         output_dir = kwargs.get('output_dir')
         
         if not output_dir:
@@ -121,7 +118,11 @@ class DocsWebsiteBestPractice(StandardPractice):
                 config_file=None,
                 verbose=logging.getLogger().getEffectiveLevel() <= logging.DEBUG,
                 template_only=template_only,
-                revise_site=revise_site
+                revise_site=revise_site,
+                incremental=incremental,
+                template_ref=template_ref,
+                batch_pages=batch_pages,
+                model_health=model_health
             )
             
             # Generate documentation with progress updates
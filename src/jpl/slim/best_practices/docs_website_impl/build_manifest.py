@@ -0,0 +1,141 @@
+"""
+Build manifest for incremental documentation generation.
+
+The manifest is stored in the generated site and records, for every page the
+AI generated, a hash of the prompt, a hash of the repository context and the
+model used. A later run with ``--incremental`` compares these inputs and only
+regenerates pages whose inputs changed.
+"""
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from jpl.slim.utils.file_utils import atomic_write
+
+BUILD_MANIFEST_FILE = ".slim-build-manifest.json"
+BUILD_MANIFEST_VERSION = 1
+
+# Repository facts that shape the generated pages; volatile values such as file
+# counts and sizes are left out so unrelated source edits do not trigger regeneration
+REPOSITORY_CONTEXT_KEYS = (
+    'project_name', 'description', 'version', 'repo_url', 'org_name', 'license',
+    'languages', 'key_files', 'src_dirs', 'test_dirs', 'doc_dirs'
+)
+
+
+class BuildManifest:
+    """
+    Records the inputs of each generated documentation page.
+    """
+
+    def __init__(self, output_dir: str, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the build manifest.
+
+        Args:
+            output_dir: Directory of the generated documentation site
+            logger: Logger instance
+        """
+        self.path = Path(output_dir) / BUILD_MANIFEST_FILE
+        self.logger = logger or logging.getLogger(__name__)
+        self.pages: Dict[str, Dict[str, str]] = {}
+
+    def load(self) -> bool:
+        """
+        Load the manifest written by a previous run.
+
+        Returns:
+            True if a compatible manifest was loaded, False otherwise
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.logger.debug(f"No build manifest found at {self.path}")
+            return False
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable build manifest {self.path}: {str(e)}")
+            return False
+
+        if data.get('version') != BUILD_MANIFEST_VERSION or not isinstance(data.get('pages'), dict):
+            self.logger.warning(f"Ignoring build manifest with unsupported format: {self.path}")
+            return False
+
+        self.pages = data['pages']
+        return True
+
+    def save(self) -> bool:
+        """
+        Write the manifest atomically, so an interrupted run never leaves a partial file.
+
+        Returns:
+            True if the manifest was written, False otherwise
+        """
+        data = {'version': BUILD_MANIFEST_VERSION, 'pages': dict(sorted(self.pages.items()))}
+        try:
+            atomic_write(self.path, json.dumps(data, indent=2) + '\n')
+        except OSError as e:
+            self.logger.warning(f"Could not write build manifest {self.path}: {str(e)}")
+            return False
+        return True
+
+    def record(self, page: str, inputs: Dict[str, str]) -> None:
+        """
+        Record the inputs a page was generated from.
+
+        Args:
+            page: Page path relative to the site directory
+            inputs: Page inputs as returned by page_inputs()
+        """
+        self.pages[page] = dict(inputs)
+
+    def is_current(self, page: str, inputs: Dict[str, str]) -> bool:
+        """
+        Check whether a page was generated from the same inputs.
+
+        Args:
+            page: Page path relative to the site directory
+            inputs: Page inputs as returned by page_inputs()
+
+        Returns:
+            True if the recorded inputs match
+        """
+        return self.pages.get(page) == inputs
+
+    @staticmethod
+    def page_inputs(prompt: str, context_hash: str, model: str) -> Dict[str, str]:
+        """
+        Build the manifest record for a page.
+
+        Args:
+            prompt: Fully formatted prompt used to generate the page
+            context_hash: Hash from repository_context_hash()
+            model: AI model used to generate the page
+
+        Returns:
+            Dictionary with prompt_hash, context_hash and model
+        """
+        return {
+            'prompt_hash': hashlib.sha256(prompt.encode('utf-8')).hexdigest(),
+            'context_hash': context_hash,
+            'model': model
+        }
+
+    @staticmethod
+    def repository_context_hash(repo_info: Dict[str, Any]) -> str:
+        """
+        Hash the repository facts that shape the generated pages.
+
+        Args:
+            repo_info: Repository information from the repository analysis
+
+        Returns:
+            Hex digest of the repository context
+        """
+        context = {key: repo_info.get(key) for key in REPOSITORY_CONTEXT_KEYS}
+        if isinstance(context.get('languages'), (list, set, tuple)):
+            context['languages'] = sorted(context['languages'])
+        serialized = json.dumps(context, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
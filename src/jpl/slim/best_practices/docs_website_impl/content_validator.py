@@ -5,11 +5,24 @@ This module provides validation for generated markdown content to ensure
 quality and completeness before finalizing documentation sites.
 """
 
+import hashlib
+import os
+import posixpath
 import re
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from jpl.slim.utils.file_utils import walk_repository
+
+# Default worker threads for validate_all_content()
+DEFAULT_VALIDATION_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+HEADER_PATTERN = re.compile(r'^#+\s+')
+MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
 
 
 @dataclass
@@ -22,6 +35,14 @@ class ValidationIssue:
     content_snippet: str
 
 
+@dataclass
+class _FileAnalysis:
+    """Checks of a file that depend only on its content, cached by content hash."""
+    issues: List[ValidationIssue] = field(default_factory=list)
+    # (line number, link URL, stripped line) of each relative markdown link
+    links: List[Tuple[int, str, str]] = field(default_factory=list)
+
+
 class ContentValidator:
     """
     Validates generated markdown content for completeness and correctness.
@@ -31,18 +52,31 @@ class ContentValidator:
     - Broken internal links
     - Empty or incomplete sections
     - Malformed markdown syntax
+    
+    Files are validated on a pool of worker threads. Links are resolved
+    against an index of the docs tree built once per validation, and the
+    content checks of each file are cached by content hash, so validating
+    again only re-reads and re-checks files that changed.
     """
     
-    def __init__(self, docs_dir: str, logger: Optional[logging.Logger] = None):
+    def __init__(self, docs_dir: str, logger: Optional[logging.Logger] = None,
+                 max_workers: Optional[int] = None):
         """
         Initialize the content validator.
         
         Args:
             docs_dir: Path to the docs directory to validate
             logger: Optional logger instance
+            max_workers: Worker threads for validating files; defaults to
+                DEFAULT_VALIDATION_WORKERS
         """
         self.docs_dir = Path(docs_dir)
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers or DEFAULT_VALIDATION_WORKERS
+        
+        # Content checks keyed by file path: (content hash, analysis)
+        self._cache: Dict[str, Tuple[str, _FileAnalysis]] = {}
+        self._cache_lock = threading.Lock()
         
         # Template markers that should not remain in final content
         self.template_markers = [
@@ -63,6 +97,7 @@ class ContentValidator:
             r'<([^>]+\.md)>',           # <file.md>
             r'href=["\']([^"\']+)["\']' # href="url"
         ]
+        self._marker_regexes = [re.compile(pattern, re.IGNORECASE) for pattern in self.template_markers]
     
     def validate_all_content(self) -> Tuple[bool, List[ValidationIssue]]:
         """
@@ -83,8 +118,8 @@ class ContentValidator:
             ))
             return False, issues
         
-        # Find all markdown files
-        md_files = list(self.docs_dir.rglob("*.md")) + list(self.docs_dir.rglob("*.mdx"))
+        # Find all markdown files and index every file for link validation in one walk
+        md_files, all_files = self._index_docs()
         
         if not md_files:
             issues.append(ValidationIssue(
@@ -98,11 +133,14 @@ class ContentValidator:
         
         self.logger.info(f"Validating {len(md_files)} markdown files...")
         
-        # Collect all existing files for link validation
-        all_files = self._collect_all_files()
+        workers = min(self.max_workers, len(md_files))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="slim-validate") as executor:
+                results = list(executor.map(lambda md_file: self._validate_file(md_file, all_files), md_files))
+        else:
+            results = [self._validate_file(md_file, all_files) for md_file in md_files]
         
-        for md_file in md_files:
-            file_issues = self._validate_file(md_file, all_files)
+        for file_issues in results:
             issues.extend(file_issues)
         
         is_valid = len(issues) == 0
@@ -120,7 +158,7 @@ class ContentValidator:
         
         Args:
             file_path: Path to the markdown file
-            all_files: Set of all available files for link validation
+            all_files: Index of docs-relative POSIX paths from _index_docs()
             
         Returns:
             List of validation issues found
@@ -128,24 +166,11 @@ class ContentValidator:
         issues = []
         
         try:
-            content = file_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
-            
-            # Check for template markers
-            marker_issues = self._check_template_markers(file_path, lines)
-            issues.extend(marker_issues)
+            analysis = self._analyze_file(file_path)
+            issues.extend(analysis.issues)
             
-            # Check for broken links
-            link_issues = self._check_links(file_path, lines, all_files)
-            issues.extend(link_issues)
-            
-            # Check for empty sections
-            empty_issues = self._check_empty_sections(file_path, lines)
-            issues.extend(empty_issues)
-            
-            # Check for basic markdown syntax
-            syntax_issues = self._check_markdown_syntax(file_path, lines)
-            issues.extend(syntax_issues)
+            # Links depend on the rest of the tree, so they are resolved on every run
+            issues.extend(self._resolve_links(file_path, analysis.links, all_files))
             
         except Exception as e:
             issues.append(ValidationIssue(
@@ -158,13 +183,49 @@ class ContentValidator:
         
         return issues
     
+    def _analyze_file(self, file_path: Path) -> _FileAnalysis:
+        """Run the content-only checks of a file, reusing the cached result if its content is unchanged."""
+        data = file_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        key = str(file_path)
+        
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached and cached[0] == digest:
+            return cached[1]
+        
+        # splitlines() drops the \r of CRLF lines, as read_text()'s newline translation did
+        lines = data.decode('utf-8').splitlines()
+        analysis = _FileAnalysis()
+        
+        # Check for template markers
+        analysis.issues.extend(self._check_template_markers(file_path, lines))
+        
+        # Collect relative links; whether they are broken is decided by _resolve_links
+        analysis.links = self._extract_links(lines)
+        
+        # Check for empty sections
+        analysis.issues.extend(self._check_empty_sections(file_path, lines))
+        
+        # Check for basic markdown syntax
+        analysis.issues.extend(self._check_markdown_syntax(file_path, lines))
+        
+        with self._cache_lock:
+            self._cache[key] = (digest, analysis)
+        return analysis
+    
+    def clear_cache(self) -> None:
+        """Forget cached content checks, so every file is checked again."""
+        with self._cache_lock:
+            self._cache.clear()
+    
     def _check_template_markers(self, file_path: Path, lines: List[str]) -> List[ValidationIssue]:
         """Check for remaining template markers that should have been replaced."""
         issues = []
         
         for line_num, line in enumerate(lines, 1):
-            for marker_pattern in self.template_markers:
-                matches = re.findall(marker_pattern, line, re.IGNORECASE)
+            for marker_regex in self._marker_regexes:
+                matches = marker_regex.findall(line)
                 for match in matches:
                     issues.append(ValidationIssue(
                         file_path=str(file_path),
@@ -178,86 +239,101 @@ class ContentValidator:
     
     def _check_links(self, file_path: Path, lines: List[str], all_files: Set[str]) -> List[ValidationIssue]:
         """Check for broken internal links."""
-        issues = []
+        return self._resolve_links(file_path, self._extract_links(lines), all_files)
+    
+    def _extract_links(self, lines: List[str]) -> List[Tuple[int, str, str]]:
+        """Find relative links to markdown files."""
+        links = []
         
         for line_num, line in enumerate(lines, 1):
-            # Find all markdown links
-            markdown_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', line)
-            
-            for link_text, link_url in markdown_links:
+            if '](' not in line:
+                continue
+            for link_text, link_url in MARKDOWN_LINK_PATTERN.findall(line):
                 # Skip external links (http/https)
                 if link_url.startswith(('http://', 'https://', 'mailto:', '#')):
                     continue
                 
                 # Clean up the link URL
                 clean_url = link_url.split('#')[0].strip()  # Remove anchors
-                if not clean_url:
-                    continue
-                
-                # Check if it's a relative path to a markdown file
                 if clean_url.endswith(('.md', '.mdx')):
-                    # Convert to absolute path from docs root
-                    if clean_url.startswith('./'):
-                        clean_url = clean_url[2:]
-                    elif clean_url.startswith('../'):
-                        # Handle relative paths from current file location
-                        file_dir = file_path.parent.relative_to(self.docs_dir)
-                        target_path = (file_dir / clean_url).resolve()
-                        clean_url = str(target_path)
-                    
-                    # Check if file exists
-                    full_path = self.docs_dir / clean_url
-                    if not full_path.exists():
-                        # Also check without .md extension
-                        without_ext = clean_url.replace('.md', '').replace('.mdx', '')
-                        alt_paths = [
-                            self.docs_dir / f"{without_ext}.md",
-                            self.docs_dir / f"{without_ext}.mdx",
-                            self.docs_dir / f"{without_ext}/index.md",
-                            self.docs_dir / f"{without_ext}/index.mdx"
-                        ]
-                        
-                        if not any(p.exists() for p in alt_paths):
-                            issues.append(ValidationIssue(
-                                file_path=str(file_path),
-                                issue_type="broken_link",
-                                line_number=line_num,
-                                description=f"Broken link to: {clean_url}",
-                                content_snippet=line.strip()
-                            ))
+                    links.append((line_num, clean_url, line.strip()))
+        
+        return links
+    
+    def _resolve_links(self, file_path: Path, links: List[Tuple[int, str, str]],
+                       all_files: Set[str]) -> List[ValidationIssue]:
+        """Report links that resolve to no file in the index; makes no filesystem calls."""
+        issues = []
+        if not links:
+            return issues
+        
+        try:
+            file_dir = file_path.parent.relative_to(self.docs_dir).as_posix()
+        except ValueError:
+            file_dir = '.'
+        
+        for line_num, clean_url, snippet in links:
+            if not self._link_exists(clean_url, file_dir, all_files):
+                issues.append(ValidationIssue(
+                    file_path=str(file_path),
+                    issue_type="broken_link",
+                    line_number=line_num,
+                    description=f"Broken link to: {clean_url}",
+                    content_snippet=snippet
+                ))
         
         return issues
     
+    @staticmethod
+    def _link_exists(clean_url: str, file_dir: str, all_files: Set[str]) -> bool:
+        """Check a link relative to the linking file's directory and to the docs root."""
+        url = clean_url.replace('\\', '/')
+        if url.startswith('/'):
+            bases = ['.']
+            url = url.lstrip('/')
+        else:
+            bases = [file_dir, '.'] if file_dir != '.' else ['.']
+        
+        for base in bases:
+            target = posixpath.normpath(posixpath.join(base, url))
+            if target.startswith('../') or target == '..':
+                continue
+            without_ext = posixpath.splitext(target)[0]
+            candidates = (target, f"{without_ext}.md", f"{without_ext}.mdx",
+                          f"{without_ext}/index.md", f"{without_ext}/index.mdx")
+            if any(candidate in all_files for candidate in candidates):
+                return True
+        return False
+    
     def _check_empty_sections(self, file_path: Path, lines: List[str]) -> List[ValidationIssue]:
-        """Check for empty sections that should have content."""
+        """Check for empty sections that should have content, in a single pass."""
         issues = []
         
-        # Look for headers followed immediately by another header or end of file
+        # Line index of the last header not yet followed by content
+        pending_header = None
         for i, line in enumerate(lines):
-            if re.match(r'^#+\s+', line):  # Found a header
-                # Check if the next non-empty line is another header
-                next_content_line = None
-                for j in range(i + 1, len(lines)):
-                    if lines[j].strip():
-                        next_content_line = lines[j]
-                        break
-                
-                if next_content_line and re.match(r'^#+\s+', next_content_line):
-                    issues.append(ValidationIssue(
-                        file_path=str(file_path),
-                        issue_type="empty_section",
-                        line_number=i + 1,
-                        description="Empty section with no content",
-                        content_snippet=line.strip()
-                    ))
-                elif next_content_line is None:  # End of file
-                    issues.append(ValidationIssue(
-                        file_path=str(file_path),
-                        issue_type="empty_section",
-                        line_number=i + 1,
-                        description="Header at end of file with no content",
-                        content_snippet=line.strip()
-                    ))
+            if not line.strip():
+                continue
+            is_header = HEADER_PATTERN.match(line) is not None
+            if pending_header is not None and is_header:
+                # A header followed immediately by another header
+                issues.append(ValidationIssue(
+                    file_path=str(file_path),
+                    issue_type="empty_section",
+                    line_number=pending_header + 1,
+                    description="Empty section with no content",
+                    content_snippet=lines[pending_header].strip()
+                ))
+            pending_header = i if is_header else None
+        
+        if pending_header is not None:  # End of file
+            issues.append(ValidationIssue(
+                file_path=str(file_path),
+                issue_type="empty_section",
+                line_number=pending_header + 1,
+                description="Header at end of file with no content",
+                content_snippet=lines[pending_header].strip()
+            ))
         
         return issues
     
@@ -296,17 +372,24 @@ class ContentValidator:
         
         return issues
     
-    def _collect_all_files(self) -> Set[str]:
-        """Collect all files in the docs directory for link validation."""
+    def _index_docs(self) -> Tuple[List[Path], Set[str]]:
+        """
+        Walk the docs directory once.
+        
+        Returns:
+            Tuple of (markdown files to validate, docs-relative POSIX paths of all files)
+        """
+        md_files = []
         all_files = set()
         
-        for file_path in self.docs_dir.rglob("*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(self.docs_dir)
-                all_files.add(str(rel_path))
-                all_files.add(str(rel_path).replace('\\', '/'))  # Handle Windows paths
+        for dirpath, dirnames, filenames in walk_repository(self.docs_dir, respect_gitignore=False):
+            rel_dir = Path(dirpath).relative_to(self.docs_dir).as_posix()
+            for filename in filenames:
+                all_files.add(filename if rel_dir == '.' else f"{rel_dir}/{filename}")
+                if filename.endswith(('.md', '.mdx')):
+                    md_files.append(Path(dirpath) / filename)
         
-        return all_files
+        return md_files, all_files
     
     def print_validation_report(self, issues: List[ValidationIssue]) -> None:
         """Print a formatted validation report."""
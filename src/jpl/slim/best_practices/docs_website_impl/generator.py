@@ -7,21 +7,55 @@ for repository analysis, AI enhancement, and template management.
 
 import logging
 import os
+import re
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 from jpl.slim.utils.repo_utils import scan_repository, extract_project_metadata
 from jpl.slim.utils.ai_utils import enhance_content
 from jpl.slim.utils.git_utils import extract_git_info, is_git_repository
+from jpl.slim.utils.file_utils import walk_repository
 from jpl.slim.best_practices.docs_website_impl.template_manager import TemplateManager
 from jpl.slim.best_practices.docs_website_impl.config_updater import ConfigUpdater
-from jpl.slim.best_practices.docs_website_impl.helpers import load_config, escape_mdx_special_characters, clean_api_doc, escape_yaml_value
+from jpl.slim.best_practices.docs_website_impl.helpers import (
+    load_config, escape_mdx_special_characters, clean_api_doc, escape_yaml_value,
+    compile_placeholders, replace_placeholders_in_file
+)
 from jpl.slim.best_practices.docs_website_impl.content_validator import ContentValidator
 from jpl.slim.best_practices.docs_website_impl.markdown_linter import MarkdownLinter
+from jpl.slim.best_practices.docs_website_impl.build_manifest import BuildManifest
+from jpl.slim.best_practices.docs_website_impl.stage_pipeline import StagePipeline
 
 __all__ = ["SlimDocGenerator"]
 
+# Path fragments that _determine_project_type looks for; only matching files are
+# kept from the repository scan so large repositories are not listed in memory
+PROJECT_TYPE_FILE_HINTS = (
+    'package.json', 'react', 'vue', 'setup.py', 'pyproject.toml', 'fastapi', 'flask',
+    'cli', 'main.py', 'pom.xml', 'build.gradle', 'cargo.toml', 'go.mod'
+)
+
+# Template files that may contain placeholders
+PLACEHOLDER_FILE_SUFFIXES = ('.js', '.md', '.json', '.tsx', '.jsx')
+
+# Pages whose markdown body is at most this many characters may share one AI request
+SMALL_PAGE_MAX_CHARS = 1500
+
+# Delimiter line the AI writes before each page of a batched response
+BATCH_FILE_MARKER = re.compile(r'^=+\s*FILE:\s*(.+?)\s*=+\s*$', re.MULTILINE)
+
+# Lint errors that break the MDX build; pages with any of them are regenerated
+CRITICAL_LINT_ERRORS = (
+    'unclosed_tag', 'email_as_jsx', 'url_as_jsx', 'loose_angle_bracket', 'at_in_tag',
+    'jekyll_site_syntax', 'jekyll_page_syntax', 'jekyll_layout_syntax',
+    'liquid_tag_syntax', 'generic_liquid_syntax', 'unescaped_variable'
+)
+
+# Installed dependencies and Docusaurus caches in the site directory; never scanned for placeholders
+VENDORED_DIRS = {'node_modules', '.git', '.docusaurus'}
+
 
 class SlimDocGenerator:
     """
@@ -38,7 +72,11 @@ class SlimDocGenerator:
         verbose: bool = False,
         template_only: bool = False,
         revise_site: bool = False,
-        strict_ai: bool = True
+        strict_ai: bool = True,
+        incremental: bool = False,
+        template_ref: Optional[str] = None,
+        batch_pages: int = 1,
+        model_health: Optional[Future] = None
     ):
         """
         Initialize the SLIM documentation generator.
@@ -53,6 +91,13 @@ class SlimDocGenerator:
             template_only: Whether to generate only the template structure
             revise_site: Whether to revise the site landing page
             strict_ai: Whether to fail if AI enhancement fails (default True)
+            incremental: Whether to keep pages whose prompt, repository context
+                and model match the build manifest of a previous run
+            template_ref: Branch, tag or commit of the template repository to use
+            batch_pages: Maximum number of small pages generated per AI request;
+                1 generates every page with its own request
+            model_health: Pending result of check_model_health_async() for use_ai;
+                awaited before the first AI request
         """
         self.logger = logging.getLogger("slim-doc-generator")
         
@@ -64,11 +109,33 @@ class SlimDocGenerator:
         self.template_only = template_only
         self.revise_site = revise_site
         self.strict_ai = strict_ai
+        self.incremental = incremental
+        self.batch_pages = max(1, batch_pages)
+        self.model_health = model_health
+        
+        # Wall-clock seconds per generation stage of the last generate() call
+        self.stage_timings: Dict[str, float] = {}
+        
+        # Background marker checks of pages written during AI enhancement
+        self._validation_executor: Optional[ThreadPoolExecutor] = None
+        self._page_validations: Dict[str, Future] = {}
         
         # Initialize template manager and config updater
-        self.template_manager = TemplateManager(template_repo, str(self.output_dir), self.logger)
+        self.template_manager = TemplateManager(template_repo, str(self.output_dir), self.logger,
+                                                template_ref=template_ref)
         self.config_updater = ConfigUpdater(str(self.output_dir), self.logger)
         
+        # Site tree entries per docs page, read from disk once per generation run
+        # and patched in memory when a written page changes its title or headings
+        self._site_tree_entries: Optional[Dict[str, List[str]]] = None
+        self._site_tree_text: Optional[str] = None
+        self._prompt_prefix_cache: Dict[Tuple, str] = {}
+        
+        # Inputs of the pages generated in this run, and of the previous run in incremental mode
+        self.build_manifest = BuildManifest(str(self.output_dir), self.logger)
+        self._previous_manifest: Optional[BuildManifest] = None
+        self._previous_pages: Dict[str, str] = {}
+        
         # Initialize target repo analysis if provided
         if target_repo_path:
             self.target_repo_path = Path(target_repo_path).resolve()
@@ -94,32 +161,73 @@ class SlimDocGenerator:
         """
         try:
             self.logger.debug("Starting documentation generation")
+            self._invalidate_site_tree()
+            
+            # Remember previously generated pages before the template overwrites them
+            if self.incremental:
+                self._load_previous_build()
+            
+            # Template setup and repository analysis are independent, so they run
+            # concurrently; the remaining steps wait for the steps they need
+            pipeline = StagePipeline(self.logger)
             
             # Step 1: Clone template to output directory
-            print("📁 Setting up template...")
-            if not self._setup_template():
-                print("❌ Template setup failed")
-                return False
+            def setup_template(results):
+                print("📁 Setting up template...")
+                if not self._setup_template():
+                    print("❌ Template setup failed")
+                    return False
+                return True
+            pipeline.add_stage('template', setup_template)
             
-            # Step 2: Analyze repository to extract basic information
-            print("🔍 Analyzing repository...")
-            repo_info = self._analyze_repository() if self.target_repo_path else {}
+            # Step 2: Analyze repository to extract basic information. An output
+            # directory inside the repository is scanned too, so it must be set up first
+            def analyze_repository(results):
+                print("🔍 Analyzing repository...")
+                return self._analyze_repository() if self.target_repo_path else {}
+            pipeline.add_stage('analysis', analyze_repository,
+                               depends_on=('template',) if self._output_inside_repository() else ())
             
             # Step 3: Replace universal placeholders (PROJECT_NAME, etc.)
-            if not self._replace_basic_placeholders(repo_info):
-                print("❌ Placeholder replacement failed")
-                return False
+            def replace_placeholders(results):
+                if not self._replace_basic_placeholders(results['analysis']):
+                    print("❌ Placeholder replacement failed")
+                    return False
+                return True
+            pipeline.add_stage('placeholders', replace_placeholders, depends_on=('template', 'analysis'))
+            last_stage = 'placeholders'
             
-            # Step 4: Use AI to fill [INSERT_CONTENT] markers in all markdown files
+            # Step 4: Use AI to fill [INSERT_CONTENT] markers in all markdown files;
+            # finished pages are validated in the background while others are generated
             if self.use_ai:
-                print("🤖 Starting AI content enhancement...")
-                if not self._ai_enhance_content(repo_info, progress, progress_task):
-                    print("❌ AI enhancement failed")
-                    return False
+                def run_enhancement(results):
+                    if not self._await_model_health():
+                        return False
+                    print("🤖 Starting AI content enhancement...")
+                    if not self._ai_enhance_content(results['analysis'], progress, progress_task):
+                        print("❌ AI enhancement failed")
+                        return False
+                    return True
+                pipeline.add_stage('enhancement', run_enhancement, depends_on=('placeholders',))
+                last_stage = 'enhancement'
             
             # Step 5: Validate content and fix issues
-            print("✅ Validating and fixing content...")
-            if not self._validate_and_fix_content(repo_info):
+            def validate_content(results):
+                print("✅ Validating and fixing content...")
+                return self._validate_and_fix_content(results['analysis'])
+            pipeline.add_stage('validation', validate_content, depends_on=('analysis', last_stage))
+            
+            self._validation_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slim-page-validation")
+            try:
+                success = pipeline.run()
+            finally:
+                self._validation_executor.shutdown(wait=True)
+                self._validation_executor = None
+                self._page_validations = {}
+            
+            self.stage_timings = dict(pipeline.timings)
+            print(f"⏱️  Stage timings: {pipeline.format_timings()}")
+            if not success:
                 return False
             self.logger.debug("Documentation generation completed successfully")
             return True
@@ -128,6 +236,26 @@ class SlimDocGenerator:
             self.logger.error(f"Error during documentation generation: {str(e)}")
             return False
     
+    def _output_inside_repository(self) -> bool:
+        """Check whether the output directory is part of the repository being analyzed."""
+        if not self.target_repo_path:
+            return False
+        return self.output_dir == self.target_repo_path or self.target_repo_path in self.output_dir.parents
+    
+    def _await_model_health(self) -> bool:
+        """Wait for the background model connectivity check, if one was started."""
+        if self.model_health is None:
+            return True
+        
+        health = self.model_health.result()
+        if not health.healthy:
+            self.logger.error(f"AI model health check failed for {health.model}: {health.message}")
+            print(f"❌ Error: {health.message}")
+            return False
+        
+        print(f"✅ AI model '{health.model}' is working correctly")
+        return True
+    
     def _setup_template(self) -> bool:
         """Setup the documentation template."""
         try:
@@ -142,14 +270,19 @@ class SlimDocGenerator:
         try:
             self.logger.debug(f"Analyzing repository: {self.target_repo_path}")
             
-            # Use repo_utils for comprehensive analysis
-            repo_info = scan_repository(self.target_repo_path)
+            # Use repo_utils for comprehensive analysis, keeping only the files
+            # needed to determine the project type
+            repo_info = scan_repository(
+                self.target_repo_path,
+                include_files=lambda path: any(hint in path.lower() for hint in PROJECT_TYPE_FILE_HINTS),
+                include_directories=False
+            )
             
             # Add git-specific information if it's a git repo
             if is_git_repository(str(self.target_repo_path)):
                 extract_git_info(str(self.target_repo_path), repo_info)
             
-            self.logger.debug(f"Repository analysis complete: {len(repo_info.get('files', []))} files, "
+            self.logger.debug(f"Repository analysis complete: {repo_info.get('file_count', 0)} files, "
                            f"{len(repo_info.get('languages', []))} languages detected")
             
             return repo_info
@@ -342,37 +475,25 @@ class SlimDocGenerator:
         return title, description, stats
     
     def _replace_placeholders_in_files(self, placeholders: Dict[str, str]) -> bool:
-        """Replace placeholders in all template files."""
+        """Replace placeholders in all template files in a single pass per file."""
         try:
-            # Find all files that might contain placeholders
-            files_to_process = []
-            for root, dirs, files in os.walk(self.output_dir):
-                for file in files:
-                    if file.endswith(('.js', '.md', '.json', '.tsx', '.jsx')):
-                        files_to_process.append(os.path.join(root, file))
+            pattern, replacements = compile_placeholders(placeholders)
             
-            for file_path in files_to_process:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Replace all placeholders
-                    modified = False
-                    for placeholder, replacement in placeholders.items():
-                        if placeholder in content:
-                            content = content.replace(placeholder, replacement)
-                            modified = True
-                    
-                    # Write back if modified
-                    if modified:
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        self.logger.debug(f"Updated placeholders in {file_path}")
-                
-                except Exception as e:
-                    self.logger.warning(f"Error processing file {file_path}: {str(e)}")
-                    continue
+            updated = 0
+            for root, dirs, files in walk_repository(self.output_dir, VENDORED_DIRS):
+                for file in files:
+                    if not file.endswith(PLACEHOLDER_FILE_SUFFIXES):
+                        continue
+                    file_path = os.path.join(root, file)
+                    try:
+                        if replace_placeholders_in_file(file_path, pattern, replacements):
+                            updated += 1
+                            self.logger.debug(f"Updated placeholders in {file_path}")
+                    except Exception as e:
+                        self.logger.warning(f"Error processing file {file_path}: {str(e)}")
+                        continue
             
+            self.logger.debug(f"Replaced placeholders in {updated} files")
             return True
             
         except Exception as e:
@@ -411,13 +532,20 @@ class SlimDocGenerator:
             
             all_files = priority_files + regular_files
             linter = MarkdownLinter(self.logger)
+            context_hash = BuildManifest.repository_context_hash(repo_info)
+            self.build_manifest.pages = {}
             
             # Track success/failure statistics
             successful_files = []
+            kept_files = []
             failed_files = []
             
-            for i, file_path in enumerate(all_files):
-                file_name = os.path.basename(file_path)
+            # Collect the pages to generate and hash their inputs. Every hash is taken
+            # before any page is written, against the template's site tree: writing a
+            # page adds its headings to the site tree, which would change the prompts
+            # of later pages and keep them from ever matching the manifest
+            candidate_pages = []
+            for file_path in all_files:
                 relative_path = os.path.relpath(file_path, self.output_dir)
                 
                 try:
@@ -428,6 +556,42 @@ class SlimDocGenerator:
                     if '[INSERT_CONTENT]' not in content:
                         continue
                     
+                    prompt = self._build_enhancement_prompt(content, file_path, repo_info)
+                    page_inputs = BuildManifest.page_inputs(prompt, context_hash, self.use_ai) if prompt else None
+                    candidate_pages.append((file_path, relative_path, content, page_inputs))
+                    
+                except Exception as e:
+                    self.logger.warning(f"Error processing file {os.path.basename(file_path)}: {str(e)}")
+                    failed_files.append({
+                        'path': relative_path,
+                        'error': str(e)
+                    })
+            
+            # Keep the previous pages that were generated from the same inputs
+            pending_pages = []
+            for file_path, relative_path, content, page_inputs in candidate_pages:
+                try:
+                    if page_inputs and self._restore_unchanged_page(relative_path, file_path, page_inputs):
+                        kept_files.append(relative_path)
+                        continue
+                except OSError as e:
+                    self.logger.debug(f"Could not restore {relative_path}, regenerating it: {e}")
+                pending_pages.append((file_path, relative_path, content, page_inputs))
+            
+            # Generate small pages several per request; pages that fail in a batch
+            # are retried one at a time below
+            if self.batch_pages > 1:
+                batched = self._ai_enhance_batches(pending_pages, repo_info, linter)
+                for file_path, relative_path, content, page_inputs in pending_pages:
+                    if relative_path in batched:
+                        self._write_enhanced_page(file_path, relative_path, batched[relative_path], page_inputs)
+                        successful_files.append(relative_path)
+                pending_pages = [page for page in pending_pages if page[1] not in batched]
+            
+            for file_path, relative_path, content, page_inputs in pending_pages:
+                file_name = os.path.basename(file_path)
+                
+                try:
                     # Try to enhance the file with retry loop
                     max_attempts = 10
                     success = False
@@ -445,30 +609,12 @@ class SlimDocGenerator:
                             self.logger.warning(f"AI failed to enhance {file_name} on attempt {attempt}")
                             continue
                         
-                        # Lint the enhanced content
-                        lint_errors = linter.lint_content(enhanced_content, file_name)
-                        
-                        # Check for critical errors and validation issues
-                        critical_errors = [
-                            error for error in lint_errors 
-                            if error.error_type in ['unclosed_tag', 'email_as_jsx', 'url_as_jsx', 
-                                                   'loose_angle_bracket', 'at_in_tag', 'jekyll_site_syntax',
-                                                   'jekyll_page_syntax', 'jekyll_layout_syntax', 
-                                                   'liquid_tag_syntax', 'generic_liquid_syntax', 'unescaped_variable']
-                        ]
-                        
-                        # Check for remaining placeholders
-                        validation_errors = []
-                        if '[PROJECT_NAME]' in enhanced_content:
-                            validation_errors.append("Contains unreplaced [PROJECT_NAME] placeholder")
-                        if '[INSERT_CONTENT]' in enhanced_content:
-                            validation_errors.append("Contains unreplaced [INSERT_CONTENT] marker")
+                        # Lint the enhanced content and check for remaining placeholders
+                        critical_errors, validation_errors = self._find_content_errors(enhanced_content, file_name, linter)
                         
                         if not critical_errors and not validation_errors:
                             # Success! Write the file
-                            self.logger.debug(f"AI-enhanced content for {file_name}:\n{enhanced_content}")
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                f.write(enhanced_content)
+                            self._write_enhanced_page(file_path, relative_path, enhanced_content, page_inputs)
                             self.logger.debug(f"Successfully enhanced {file_name} on attempt {attempt}")
                             successful_files.append(relative_path)
                             success = True
@@ -490,20 +636,15 @@ class SlimDocGenerator:
                             enhanced_content = content.replace('[INSERT_CONTENT]', fallback_content)
                             with open(file_path, 'w', encoding='utf-8') as f:
                                 f.write(enhanced_content)
+                            self._update_site_tree_entry(file_path, enhanced_content)
+                            self._submit_page_validation(file_path)
                             print(f"   ℹ️  Added fallback content for {file_name}")
                             successful_files.append(relative_path)
                             continue
                         
                         # Show detailed error information
                         if 'enhanced_content' in locals():
-                            final_lint_errors = linter.lint_content(enhanced_content, file_name)
-                            final_critical_errors = [
-                                error for error in final_lint_errors 
-                                if error.error_type in ['unclosed_tag', 'email_as_jsx', 'url_as_jsx', 
-                                                       'loose_angle_bracket', 'at_in_tag', 'jekyll_site_syntax',
-                                                       'jekyll_page_syntax', 'jekyll_layout_syntax', 
-                                                       'liquid_tag_syntax', 'generic_liquid_syntax', 'unescaped_variable']
-                            ]
+                            final_critical_errors, _ = self._find_content_errors(enhanced_content, file_name, linter)
                             
                             print(f"   📋 Final validation status for {file_name}:")
                             if '[PROJECT_NAME]' in enhanced_content:
@@ -535,9 +676,14 @@ class SlimDocGenerator:
                     # Continue processing other files
                     continue
             
+            # Record page inputs so the next incremental run can skip unchanged pages
+            self.build_manifest.save()
+            
             # Print summary of results
             print(f"\n📊 AI Enhancement Summary:")
             print(f"   ✅ Successfully generated: {len(successful_files)} files")
+            if kept_files:
+                print(f"   ♻️  Unchanged and kept: {len(kept_files)} files")
             if failed_files:
                 print(f"   ❌ Failed to generate: {len(failed_files)} files")
                 print(f"\n   📋 Files requiring manual attention:")
@@ -555,7 +701,7 @@ class SlimDocGenerator:
                     print(f"      ... and {len(failed_files) - 5} more files")
             
             # Return True if at least some files were successful
-            return len(successful_files) > 0
+            return len(successful_files) + len(kept_files) > 0
             
         except Exception as e:
             self.logger.error(f"Error during AI content enhancement: {str(e)}")
@@ -568,61 +714,28 @@ class SlimDocGenerator:
             if '[INSERT_CONTENT]' not in content:
                 return content
             
-            project_name = repo_info.get('project_name', 'this project')
             file_name = os.path.basename(file_path)
-            languages = ', '.join(repo_info.get('languages', []))
-            project_type = self._determine_project_type(repo_info)
             
             # Split content into YAML front matter and markdown body
-            yaml_front_matter, markdown_body = self._split_yaml_and_markdown(content)
+            yaml_front_matter, _ = self._split_yaml_and_markdown(content)
             
-            # Generate site tree for link context
-            try:
-                site_tree = self._generate_site_tree_from_template()
-            except Exception as e:
-                self.logger.warning(f"Error generating site tree: {str(e)}")
-                site_tree = "Site tree generation failed - use relative links like ./page or ../section/page"
+            prompt_parts = self._build_enhancement_prompt_parts(content, file_path, repo_info)
+            if not prompt_parts:
+                return content
+            prompt_prefix, page_prompt = prompt_parts
             
             # Generate content for the INSERT_CONTENT marker
             from jpl.slim.utils.ai_utils import generate_ai_content
             
-            prompt_template = self._get_prompt_template("docs-website", "generate_content_only")
-            if not prompt_template:
-                self.logger.error("Could not find generate_content_only prompt template")
-                return content
-            
-            # Format the prompt with full template structure - add error handling
-            try:
-                formatted_prompt = prompt_template.format(
-                    project_name=project_name,
-                    file_name=file_name,
-                    template_structure=markdown_body,
-                    project_type=project_type,
-                    languages=languages,
-                    site_tree=site_tree
-                )
-            except Exception as e:
-                self.logger.error(f"Error formatting prompt template: {str(e)}")
-                return content
-            
-            # Generate the enhanced template with temperature
-            generated_content = generate_ai_content(formatted_prompt, self.use_ai, temperature=temperature)
+            # Generate the enhanced template with temperature; the prefix is shared by
+            # every page and attempt, so providers can serve it from their prompt cache
+            generated_content = generate_ai_content(page_prompt, self.use_ai, prompt_prefix=prompt_prefix,
+                                                    temperature=temperature)
             
             if generated_content:
                 self.logger.debug(f"AI-generated raw content for {file_name}:\n{generated_content}")
                 # Clean up the generated content and recombine with YAML front matter
-                enhanced_markdown = generated_content.strip()
-                
-                # Ensure the enhanced content starts with markdown content, not YAML
-                if enhanced_markdown.startswith('---'):
-                    # If AI returned YAML, extract just the markdown part
-                    if enhanced_markdown.count('---') >= 2:
-                        parts = enhanced_markdown.split('---', 2)
-                        enhanced_markdown = parts[2].strip() if len(parts) > 2 else enhanced_markdown
-                
-                # Recombine YAML front matter with enhanced markdown
-                enhanced_content = yaml_front_matter + enhanced_markdown
-                return enhanced_content
+                return yaml_front_matter + self._clean_generated_markdown(generated_content)
             else:
                 self.logger.warning(f"AI failed to generate content for {file_name}")
                 return content
@@ -631,6 +744,225 @@ class SlimDocGenerator:
             self.logger.warning(f"Error enhancing file '{file_path}': {str(e)}")
             return content
     
+    @staticmethod
+    def _clean_generated_markdown(generated_content: str) -> str:
+        """Strip whitespace and any YAML front matter the AI returned despite instructions."""
+        enhanced_markdown = generated_content.strip()
+        
+        # Ensure the enhanced content starts with markdown content, not YAML
+        if enhanced_markdown.startswith('---'):
+            # If AI returned YAML, extract just the markdown part
+            if enhanced_markdown.count('---') >= 2:
+                parts = enhanced_markdown.split('---', 2)
+                enhanced_markdown = parts[2].strip() if len(parts) > 2 else enhanced_markdown
+        
+        return enhanced_markdown
+    
+    def _find_content_errors(self, enhanced_content: str, file_name: str, linter: MarkdownLinter) -> Tuple[List, List[str]]:
+        """
+        Check generated page content.
+        
+        Returns:
+            Tuple of (critical lint errors, descriptions of remaining placeholders)
+        """
+        lint_errors = linter.lint_content(enhanced_content, file_name)
+        critical_errors = [error for error in lint_errors if error.error_type in CRITICAL_LINT_ERRORS]
+        
+        validation_errors = []
+        if '[PROJECT_NAME]' in enhanced_content:
+            validation_errors.append("Contains unreplaced [PROJECT_NAME] placeholder")
+        if '[INSERT_CONTENT]' in enhanced_content:
+            validation_errors.append("Contains unreplaced [INSERT_CONTENT] marker")
+        
+        return critical_errors, validation_errors
+    
+    def _write_enhanced_page(self, file_path: str, relative_path: str, enhanced_content: str,
+                             page_inputs: Optional[Dict[str, str]]) -> None:
+        """Write a generated page and record it in the site tree, background validation and build manifest."""
+        self.logger.debug(f"AI-enhanced content for {os.path.basename(file_path)}:\n{enhanced_content}")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(enhanced_content)
+        self._update_site_tree_entry(file_path, enhanced_content)
+        self._submit_page_validation(file_path)
+        if page_inputs:
+            self.build_manifest.record(relative_path, page_inputs)
+    
+    def _ai_enhance_batches(self, pages: List[Tuple[str, str, str, Optional[Dict[str, str]]]],
+                            repo_info: Dict, linter: MarkdownLinter) -> Dict[str, str]:
+        """
+        Generate small pages several per AI request.
+        
+        Pages whose markdown body is at most SMALL_PAGE_MAX_CHARS are grouped
+        into batches of up to batch_pages. Each page of a response is validated
+        separately; pages that are missing from the response or fail validation
+        are left for the caller to retry individually.
+        
+        Args:
+            pages: (file path, relative path, content, page inputs) of pages to generate
+            repo_info: Repository information
+            linter: Markdown linter for validating generated pages
+        
+        Returns:
+            Enhanced content of the pages that passed validation, by relative path
+        """
+        small_pages = [page for page in pages
+                       if len(self._split_yaml_and_markdown(page[2])[1]) <= SMALL_PAGE_MAX_CHARS]
+        batches = [small_pages[i:i + self.batch_pages] for i in range(0, len(small_pages), self.batch_pages)]
+        
+        enhanced = {}
+        for batch in batches:
+            # A single page gains nothing from the batch format
+            if len(batch) < 2:
+                continue
+            
+            print(f"  📦 Generating {len(batch)} small pages in one request...")
+            responses = self._ai_enhance_batch(batch, repo_info)
+            
+            for file_path, relative_path, content, _ in batch:
+                file_name = os.path.basename(file_path)
+                generated = responses.get(relative_path)
+                if not generated:
+                    self.logger.debug(f"Batched response has no content for {file_name}, retrying individually")
+                    continue
+                
+                yaml_front_matter, _ = self._split_yaml_and_markdown(content)
+                enhanced_content = yaml_front_matter + self._clean_generated_markdown(generated)
+                critical_errors, validation_errors = self._find_content_errors(enhanced_content, file_name, linter)
+                if enhanced_content == content or critical_errors or validation_errors:
+                    self.logger.debug(f"Batched content for {file_name} failed validation, retrying individually")
+                    continue
+                enhanced[relative_path] = enhanced_content
+            
+            print(f"     ✅ {sum(1 for page in batch if page[1] in enhanced)}/{len(batch)} pages generated")
+        
+        return enhanced
+    
+    def _ai_enhance_batch(self, batch: List[Tuple[str, str, str, Optional[Dict[str, str]]]],
+                          repo_info: Dict) -> Dict[str, str]:
+        """Send one request for several pages and split the delimited response by page."""
+        prompt_template = self._get_prompt_template("docs-website", "generate_content_only")
+        batch_template = self._get_prompt_template("docs-website", "generate_content_batch")
+        if not prompt_template or not batch_template:
+            self.logger.error("Could not find generate_content_only or generate_content_batch prompt template")
+            return {}
+        
+        try:
+            site_tree = self._generate_site_tree_from_template()
+        except Exception as e:
+            self.logger.warning(f"Error generating site tree: {str(e)}")
+            site_tree = "Site tree generation failed - use relative links like ./page or ../section/page"
+        
+        # The shared instructions and project context are sent once for the whole batch
+        prompt_fields = {
+            'project_name': repo_info.get('project_name', 'this project'),
+            'project_type': self._determine_project_type(repo_info),
+            'languages': ', '.join(repo_info.get('languages', [])),
+            'site_tree': site_tree
+        }
+        prefix, _ = self._get_prompt_prefix(prompt_template, prompt_fields)
+        # Drop the single-file label ("FILE TO ENHANCE: "), as _build_enhancement_prompt_parts does
+        prefix = prefix[:prefix.rfind('\n') + 1]
+        pages = "\n\n".join(
+            f"===== FILE: {relative_path} =====\n{self._split_yaml_and_markdown(content)[1].strip()}"
+            for _, relative_path, content, _ in batch
+        )
+        batch_prompt = batch_template.format(page_count=len(batch), pages=pages)
+        
+        from jpl.slim.utils.ai_utils import generate_ai_content
+        response = generate_ai_content(batch_prompt, self.use_ai, prompt_prefix=prefix, temperature=0.7)
+        if not response:
+            self.logger.warning(f"AI failed to generate a batch of {len(batch)} pages")
+            return {}
+        
+        self.logger.debug(f"AI-generated raw batch content:\n{response}")
+        parts = BATCH_FILE_MARKER.split(response)
+        return {path.strip(): body for path, body in zip(parts[1::2], parts[2::2])}
+    
+    def _build_enhancement_prompt(self, content: str, file_path: str, repo_info: Dict) -> Optional[str]:
+        """Build the prompt used to fill the [INSERT_CONTENT] markers of a page, or None on error."""
+        prompt_parts = self._build_enhancement_prompt_parts(content, file_path, repo_info)
+        return ''.join(prompt_parts) if prompt_parts else None
+    
+    def _build_enhancement_prompt_parts(self, content: str, file_path: str, repo_info: Dict) -> Optional[Tuple[str, str]]:
+        """Build the enhancement prompt as (prefix shared by all pages, page-specific suffix), or None on error."""
+        project_name = repo_info.get('project_name', 'this project')
+        file_name = os.path.basename(file_path)
+        languages = ', '.join(repo_info.get('languages', []))
+        project_type = self._determine_project_type(repo_info)
+        
+        # Split content into YAML front matter and markdown body
+        _, markdown_body = self._split_yaml_and_markdown(content)
+        
+        # Generate site tree for link context
+        try:
+            site_tree = self._generate_site_tree_from_template()
+        except Exception as e:
+            self.logger.warning(f"Error generating site tree: {str(e)}")
+            site_tree = "Site tree generation failed - use relative links like ./page or ../section/page"
+        
+        prompt_template = self._get_prompt_template("docs-website", "generate_content_only")
+        if not prompt_template:
+            self.logger.error("Could not find generate_content_only prompt template")
+            return None
+        
+        # Format the prompt with full template structure - add error handling
+        try:
+            prompt_fields = {
+                'project_name': project_name,
+                'project_type': project_type,
+                'languages': languages,
+                'site_tree': site_tree
+            }
+            prefix, suffix_template = self._get_prompt_prefix(prompt_template, prompt_fields)
+            # End the shared prefix at a line break so the page label ("FILE TO ENHANCE: ")
+            # travels with the page and batched requests share the exact same prefix
+            split_at = prefix.rfind('\n') + 1
+            prefix, suffix_template = prefix[:split_at], prefix[split_at:] + suffix_template
+            return prefix, suffix_template.format(
+                file_name=file_name,
+                template_structure=markdown_body,
+                **prompt_fields
+            )
+        except Exception as e:
+            self.logger.error(f"Error formatting prompt template: {str(e)}")
+            return None
+    
+    def _load_previous_build(self) -> None:
+        """Read the previous build manifest and the pages it generated, for incremental runs."""
+        self._previous_manifest = None
+        self._previous_pages = {}
+        
+        manifest = BuildManifest(str(self.output_dir), self.logger)
+        if not manifest.load():
+            print("  ℹ️  No previous build manifest found, generating all pages")
+            return
+        
+        for page in manifest.pages:
+            page_path = self.output_dir / page
+            try:
+                with open(page_path, 'r', encoding='utf-8') as f:
+                    self._previous_pages[page] = f.read()
+            except OSError:
+                self.logger.debug(f"Previously generated page is missing: {page}")
+        
+        self._previous_manifest = manifest
+        self.logger.debug(f"Loaded build manifest with {len(manifest.pages)} pages")
+    
+    def _restore_unchanged_page(self, relative_path: str, file_path: str, page_inputs: Dict[str, str]) -> bool:
+        """Write back a previously generated page if its inputs are unchanged."""
+        if self._previous_manifest is None or relative_path not in self._previous_pages:
+            return False
+        if not self._previous_manifest.is_current(relative_path, page_inputs):
+            return False
+        
+        previous_content = self._previous_pages[relative_path]
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(previous_content)
+        self._update_site_tree_entry(file_path, previous_content)
+        self.build_manifest.record(relative_path, page_inputs)
+        print(f"  ♻️  Keeping unchanged {relative_path}")
+        return True
+    
     def _split_yaml_and_markdown(self, content: str) -> tuple[str, str]:
         """Split content into YAML front matter and markdown body."""
         if content.startswith('---'):
@@ -702,66 +1034,138 @@ class SlimDocGenerator:
             return ''
     
     def _generate_site_tree_from_template(self) -> str:
-        """Generate comprehensive site tree from template including sub-sections."""
-        try:
-            template_docs_dir = self.output_dir / "docs"
-            if not template_docs_dir.exists():
-                self.logger.warning("Template docs directory not found")
-                return "No site tree available"
-            
-            site_tree = []
-            site_tree.append("# Site Tree (Available Pages and Sections)")
-            site_tree.append("")
-            
-            # Walk through all markdown files in the template
-            for root, dirs, files in os.walk(template_docs_dir):
-                # Sort directories and files for consistent output
-                dirs.sort()
-                files.sort()
+        """
+        Generate comprehensive site tree from template including sub-sections.
+        
+        The docs directory is read once per generation run. Later calls reuse
+        the cached text, which is only re-rendered (from memory) after a written
+        page changed its title, ID or headings.
+        """
+        if self._site_tree_text is not None:
+            return self._site_tree_text
+        
+        if self._site_tree_entries is None:
+            try:
+                template_docs_dir = self.output_dir / "docs"
+                if not template_docs_dir.exists():
+                    self.logger.warning("Template docs directory not found")
+                    return "No site tree available"
                 
-                for file in files:
-                    if file.endswith('.md'):
-                        file_path = Path(root) / file
-                        relative_path = file_path.relative_to(template_docs_dir)
-                        
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            
-                            # Extract YAML front matter
-                            yaml_info = self._extract_yaml_frontmatter(content)
-                            
-                            # Extract section headings
-                            headings = self._extract_markdown_headings(content)
-                            
-                            # Build tree entry
-                            indent = "  " * (len(relative_path.parts) - 1)
-                            file_title = yaml_info.get('title', file.replace('.md', ''))
-                            file_id = yaml_info.get('id', file.replace('.md', ''))
-                            
-                            site_tree.append(f"{indent}- **{relative_path}** ({file_title})")
-                            if file_id != file.replace('.md', ''):
-                                site_tree.append(f"{indent}  - ID: `{file_id}`")
-                            
-                            # Add headings as sub-items
-                            for heading in headings:
-                                level = heading['level']
-                                text = heading['text']
-                                anchor = text.lower().replace(' ', '-').replace('&', 'and')
-                                anchor = ''.join(c for c in anchor if c.isalnum() or c in '-_')
-                                site_tree.append(f"{indent}  {'  ' * (level - 2)}- {text} (`#{anchor}`)")
-                            
-                            site_tree.append("")
+                entries = {}
+                
+                # Walk through all markdown files in the template
+                for root, dirs, files in os.walk(template_docs_dir):
+                    # Sort directories and files for consistent output
+                    dirs.sort()
+                    files.sort()
+                    
+                    for file in files:
+                        if file.endswith('.md'):
+                            file_path = Path(root) / file
+                            relative_path = file_path.relative_to(template_docs_dir)
                             
-                        except Exception as e:
-                            self.logger.warning(f"Error processing {file_path}: {str(e)}")
-                            continue
-            
-            return "\n".join(site_tree)
-            
-        except Exception as e:
-            self.logger.error(f"Error generating site tree: {str(e)}")
-            return "Error generating site tree"
+                            try:
+                                with open(file_path, 'r', encoding='utf-8') as f:
+                                    content = f.read()
+                                entries[str(relative_path)] = self._build_site_tree_entry(relative_path, content)
+                            except Exception as e:
+                                self.logger.warning(f"Error processing {file_path}: {str(e)}")
+                                continue
+                
+                self._site_tree_entries = entries
+                
+            except Exception as e:
+                self.logger.error(f"Error generating site tree: {str(e)}")
+                return "Error generating site tree"
+        
+        site_tree = ["# Site Tree (Available Pages and Sections)", ""]
+        for entry in self._site_tree_entries.values():
+            site_tree.extend(entry)
+        self._site_tree_text = "\n".join(site_tree)
+        return self._site_tree_text
+    
+    def _build_site_tree_entry(self, relative_path: Path, content: str) -> List[str]:
+        """Build the site tree lines for one page from its front matter and headings."""
+        file = relative_path.name
+        
+        # Extract YAML front matter
+        yaml_info = self._extract_yaml_frontmatter(content)
+        
+        # Extract section headings
+        headings = self._extract_markdown_headings(content)
+        
+        # Build tree entry
+        indent = "  " * (len(relative_path.parts) - 1)
+        file_title = yaml_info.get('title', file.replace('.md', ''))
+        file_id = yaml_info.get('id', file.replace('.md', ''))
+        
+        entry = [f"{indent}- **{relative_path}** ({file_title})"]
+        if file_id != file.replace('.md', ''):
+            entry.append(f"{indent}  - ID: `{file_id}`")
+        
+        # Add headings as sub-items
+        for heading in headings:
+            level = heading['level']
+            text = heading['text']
+            anchor = text.lower().replace(' ', '-').replace('&', 'and')
+            anchor = ''.join(c for c in anchor if c.isalnum() or c in '-_')
+            entry.append(f"{indent}  {'  ' * (level - 2)}- {text} (`#{anchor}`)")
+        
+        entry.append("")
+        return entry
+    
+    def _update_site_tree_entry(self, file_path: str, content: str) -> None:
+        """Refresh a page's site tree entry after it was written, invalidating the tree only if it changed."""
+        if self._site_tree_entries is None:
+            return
+        
+        try:
+            relative_path = Path(file_path).resolve().relative_to(self.output_dir / "docs")
+        except ValueError:
+            return
+        
+        key = str(relative_path)
+        entry = self._build_site_tree_entry(relative_path, content)
+        if self._site_tree_entries.get(key) == entry:
+            return
+        
+        if key in self._site_tree_entries:
+            self.logger.debug(f"Site tree entry changed for {key}")
+            self._site_tree_entries[key] = entry
+            self._site_tree_text = None
+            self._prompt_prefix_cache.clear()
+        else:
+            # A new page changes the walk order, so rebuild from disk next time
+            self._invalidate_site_tree()
+    
+    def _invalidate_site_tree(self) -> None:
+        """Drop the cached site tree and the prompt prefixes built from it."""
+        self._site_tree_entries = None
+        self._site_tree_text = None
+        self._prompt_prefix_cache.clear()
+    
+    def _get_prompt_prefix(self, prompt_template: str, fields: Dict[str, str]) -> Tuple[str, str]:
+        """
+        Split a prompt template into a formatted, cached prefix and a per-file suffix.
+        
+        Everything before the first per-file field ({file_name} or
+        {template_structure}) only depends on the project and the site tree, so
+        it is formatted once and reused verbatim for every page and attempt.
+        
+        Returns:
+            Tuple of (formatted prefix, unformatted suffix template)
+        """
+        split_at = min(
+            (index for index in (prompt_template.find('{file_name}'), prompt_template.find('{template_structure}'))
+             if index != -1),
+            default=len(prompt_template)
+        )
+        key = (prompt_template, tuple(sorted(fields.items())))
+        prefix = self._prompt_prefix_cache.get(key)
+        if prefix is None:
+            prefix = prompt_template[:split_at].format(**fields)
+            self._prompt_prefix_cache[key] = prefix
+        return prefix, prompt_template[split_at:]
     
     def _extract_yaml_frontmatter(self, content: str) -> Dict:
         """Extract YAML front matter from markdown content."""
@@ -915,6 +1319,17 @@ Browse the documentation sections above to find the information you need."""
         else:
             return "software project"
     
+    def _submit_page_validation(self, file_path: str) -> None:
+        """Check a finished page for remaining markers in the background, if generate() is running."""
+        if self._validation_executor is not None:
+            self._page_validations[str(Path(file_path))] = self._validation_executor.submit(self._page_has_markers, file_path)
+    
+    @staticmethod
+    def _page_has_markers(file_path: str) -> bool:
+        """Check whether a page still contains [INSERT_CONTENT] markers."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return '[INSERT_CONTENT]' in f.read()
+    
     def _validate_and_fix_content(self, repo_info: Dict) -> bool:
         """
         Simple validation - just check for any remaining [INSERT_CONTENT] markers.
@@ -926,12 +1341,14 @@ Browse the documentation sections above to find the information you need."""
                 self.logger.warning("No docs directory found for validation")
                 return True
             
-            # Quick check for remaining template markers
+            # Quick check for remaining template markers, reusing the checks of
+            # pages that were validated while AI enhancement was still running
             remaining_markers = []
             for md_file in docs_dir.rglob("*.md"):
                 try:
-                    content = md_file.read_text(encoding='utf-8')
-                    if '[INSERT_CONTENT]' in content:
+                    pending = self._page_validations.get(str(md_file))
+                    has_markers = pending.result() if pending else self._page_has_markers(str(md_file))
+                    if has_markers:
                         remaining_markers.append(str(md_file))
                 except Exception as e:
                     self.logger.warning(f"Error reading {md_file.name}: {str(e)}")
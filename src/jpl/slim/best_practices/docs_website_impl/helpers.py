@@ -3,11 +3,17 @@
 Helper functions for the SLIM documentation generator.
 """
 import logging
+import mmap
 import os
 import subprocess
 import yaml
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+from jpl.slim.utils.file_utils import atomic_write
+
+# Files at least this large are memory-mapped rather than read when replacing placeholders
+PLACEHOLDER_MMAP_THRESHOLD = 1024 * 1024
 
 
 def load_config(config_file: str) -> Dict:
@@ -330,4 +336,65 @@ def clean_api_doc(api_doc_path: str) -> None:
             
     except Exception as e:
         logging.error(f"Error cleaning API documentation: {str(e)}")
-        # Continue with generation even if cleaning fails
\ No newline at end of file
+        # Continue with generation even if cleaning fails
+
+
+def compile_placeholders(placeholders: Dict[str, str]) -> Tuple[Optional[Pattern[bytes]], Dict[bytes, bytes]]:
+    """
+    Compile placeholders into a single pattern for replace_placeholders_in_file().
+    
+    Longer placeholders are tried first, so a placeholder that is a prefix of
+    another never shadows it.
+    
+    Args:
+        placeholders: Mapping of placeholder text to replacement text
+        
+    Returns:
+        Tuple of (compiled pattern or None if there are no placeholders,
+        mapping of encoded placeholder to encoded replacement)
+    """
+    replacements = {key.encode('utf-8'): value.encode('utf-8') for key, value in placeholders.items() if key}
+    if not replacements:
+        return None, replacements
+    alternatives = sorted(replacements, key=len, reverse=True)
+    pattern = re.compile(b'|'.join(re.escape(key) for key in alternatives))
+    return pattern, replacements
+
+
+def replace_placeholders_in_file(file_path: str, pattern: Optional[Pattern[bytes]],
+                                 replacements: Dict[bytes, bytes]) -> bool:
+    """
+    Replace every placeholder in a file in one pass.
+    
+    The file is scanned as bytes, so line endings and encoding are preserved;
+    files of PLACEHOLDER_MMAP_THRESHOLD bytes or more are memory-mapped. The
+    file is only rewritten, atomically, when a placeholder was found.
+    
+    Args:
+        file_path: File to update
+        pattern: Pattern from compile_placeholders()
+        replacements: Replacement mapping from compile_placeholders()
+        
+    Returns:
+        True if the file was changed, False otherwise
+    """
+    if pattern is None:
+        return False
+    
+    def lookup(match):
+        return replacements[match.group()]
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= PLACEHOLDER_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                if pattern.search(content) is None:
+                    return False
+                updated = pattern.sub(lookup, content)
+        else:
+            content = f.read()
+            if pattern.search(content) is None:
+                return False
+            updated = pattern.sub(lookup, content)
+    
+    atomic_write(file_path, updated)
+    return True
@@ -5,45 +5,114 @@ Site revision module for updating landing page content based on docs/overview.md
 import logging
 import os
 import re
-from typing import Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from jpl.slim.best_practices.docs_website_impl.helpers import extract_frontmatter
 from jpl.slim.utils.prompt_utils import get_prompt
 
+# Seconds revise_site() waits for all landing page updates together
+DEFAULT_REVISION_TIMEOUT = 300
+
+
+@dataclass(frozen=True)
+class _LandingPageUpdate:
+    """A landing page file that is rewritten by the AI from overview.md."""
+    name: str
+    relative_path: str
+    prompt_key: str
+    fallback_prompt: str
+    current_label: str
+    return_instruction: str
+
+
+# Files updated by revise_site(); all three use the same overview.md context
+LANDING_PAGE_UPDATES = (
+    _LandingPageUpdate(
+        name="index.js",
+        relative_path=os.path.join('src', 'pages', 'index.js'),
+        prompt_key='index_js_update',
+        fallback_prompt="Using the provided overview.md content as context, update ONLY the text content in this React component (index.js) while preserving its existing structure completely.",
+        current_label="CURRENT INDEX.JS",
+        return_instruction="Return ONLY the complete, updated index.js code."
+    ),
+    _LandingPageUpdate(
+        name="HomepageFeatures",
+        relative_path=os.path.join('src', 'components', 'HomepageFeatures', 'index.js'),
+        prompt_key='homepage_features_update',
+        fallback_prompt="Using the provided overview.md content as context, update ONLY the feature descriptions in this React component while preserving its structure.",
+        current_label="CURRENT COMPONENT",
+        return_instruction="Return ONLY the updated component code."
+    ),
+    _LandingPageUpdate(
+        name="docusaurus.config.js",
+        relative_path='docusaurus.config.js',
+        prompt_key='docusaurus_config_update',
+        fallback_prompt="Using the provided overview.md content as context, update ONLY the title and tagline in this docusaurus.config.js file.",
+        current_label="CURRENT CONFIG",
+        return_instruction="Return ONLY the updated configuration code."
+    ),
+)
+
+
+@dataclass
+class RevisionResult:
+    """Outcome of updating one landing page file."""
+    name: str
+    file_path: str
+    status: str  # updated, unchanged, failed or timed_out
+    seconds: float
+    message: str = ""
+
 
 class SiteReviser:
     """
     Updates site landing page content based on docs/overview.md using AI enhancement.
     """
     
-    def __init__(self, output_dir: str, logger: logging.Logger, ai_enhancer=None):
+    def __init__(self, output_dir: str, logger: logging.Logger, ai_enhancer=None,
+                 timeout: Optional[float] = DEFAULT_REVISION_TIMEOUT):
         """
         Initialize the site reviser.
         
         Args:
             output_dir: Directory where the documentation site is generated
             logger: Logger instance
-            ai_enhancer: Optional AI enhancer for content improvement
+            ai_enhancer: Optional AI enhancer for content improvement; it should bound
+                its own requests with a timeout, see _run_updates()
+            timeout: Seconds revise_site() waits for all landing page updates together,
+                or None to wait indefinitely
         """
         self.output_dir = output_dir
         self.logger = logger
         self.ai_enhancer = ai_enhancer
+        self.timeout = timeout
         self.docs_dir = os.path.join(output_dir, 'docs')
         self.src_dir = os.path.join(output_dir, 'src')
         self.pages_dir = os.path.join(self.src_dir, 'pages')
         self.components_dir = os.path.join(self.src_dir, 'components')
         self.static_dir = os.path.join(output_dir, 'static')
         self.img_dir = os.path.join(self.static_dir, 'img')
+        self.results: List[RevisionResult] = []
+        # Set once the shared timeout expires, so late AI responses are never written
+        self._expired = threading.Event()
         
     def revise_site(self) -> bool:
         """
         Revise the site landing page content based on docs/overview.md using AI enhancement.
         
+        The landing page files are updated concurrently under one shared
+        timeout; the outcome for each file is kept in ``self.results``.
+        
         Returns:
             True if revision was successful, False otherwise
         """
         try:
             self.logger.debug("Revising site landing page content based on docs/overview.md")
+            self.results = []
             
             # Check if necessary directories exist
             if not os.path.exists(self.docs_dir):
@@ -71,284 +140,184 @@ class SiteReviser:
                 self.logger.warning("Could not read content from overview.md")
                 return False
             
-            # Update landing page files using AI with overview.md as context
-            # Track overall success but continue even if some files fail
-            overall_success = True
+            # Build the overview context once; it leads every prompt, so all
+            # three requests share an identical prefix
+            overview_context = self._build_overview_context(overview_content)
             
-            # Try updating each file independently to avoid one failure stopping the whole process
-            try:
-                if not self._update_index_js_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating index.js: {str(e)}")
-                overall_success = False
+            # Update each file independently so one failure or slow response
+            # does not hold up the others
+            self.results = self._run_updates(overview_context)
+            self._log_revision_report(self.results)
             
-            try:
-                if not self._update_homepage_features_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating HomepageFeatures: {str(e)}")
-                overall_success = False
-            
-            try:
-                if not self._update_docusaurus_config_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating docusaurus.config.js: {str(e)}")
-                overall_success = False
-            
-            if overall_success:
+            if all(result.status in ('updated', 'unchanged') for result in self.results):
                 self.logger.debug("Successfully revised site landing page content using AI with overview.md context")
-                return True
             else:
                 self.logger.warning("Some files could not be updated, but the process completed")
-                # Return True since we still successfully updated some files
-                return True
+            # Return True since we still successfully updated some files
+            return True
                 
         except Exception as e:
             self.logger.error(f"Error revising site landing page: {str(e)}")
             return False
     
-    def _read_overview_content(self, overview_path: str) -> Optional[str]:
+    def _run_updates(self, overview_context: str) -> List[RevisionResult]:
         """
-        Read content from overview.md.
+        Dispatch all landing page updates concurrently under the shared timeout.
+        
+        The timeout bounds how long this method waits, not how long the AI requests
+        run. A request still running when it expires is abandoned and its response
+        discarded, but its worker thread is not a daemon: the process cannot exit
+        until the AI enhancer's own request timeout ends the call.
         
         Args:
-            overview_path: Path to overview.md
+            overview_context: Overview block from _build_overview_context()
             
         Returns:
-            Content of overview.md or None if reading failed
+            One result per landing page file, in LANDING_PAGE_UPDATES order
         """
+        self._expired.clear()
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(LANDING_PAGE_UPDATES), thread_name_prefix="slim-revise")
         try:
-            with open(overview_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract frontmatter and content
-            frontmatter, content_text = extract_frontmatter(content)
-            
-            # Return full content including frontmatter for AI context
-            return content
-            
-        except Exception as e:
-            self.logger.error(f"Error reading content from overview.md: {str(e)}")
-            return None
+            futures = [executor.submit(self._update_file_with_ai, update, overview_context)
+                       for update in LANDING_PAGE_UPDATES]
+            wait(futures, timeout=self.timeout)
+            self._expired.set()
+            
+            results = []
+            for update, future in zip(LANDING_PAGE_UPDATES, futures):
+                if future.done():
+                    results.append(future.result())
+                else:
+                    self.logger.error(f"Timed out updating {update.name} after {self.timeout}s")
+                    results.append(RevisionResult(update.name, self._target_path(update), 'timed_out',
+                                                  time.monotonic() - started, f"no response within {self.timeout}s"))
+            return results
+        finally:
+            # Do not wait for timed-out requests; their responses are discarded, but their
+            # threads run until the enhancer's call returns
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    def _update_index_js_with_ai(self, overview_content: str) -> bool:
+    def _update_file_with_ai(self, update: _LandingPageUpdate, overview_context: str) -> RevisionResult:
         """
-        Update index.js using AI with overview.md as context.
+        Update one landing page file using AI with overview.md as context.
         
         Args:
-            overview_content: Content of overview.md
+            update: The file to update
+            overview_context: Overview block from _build_overview_context()
             
         Returns:
-            True if update was successful, False otherwise
+            Result for the file; exceptions are reported as a failed result
         """
-        index_js_path = os.path.join(self.pages_dir, 'index.js')
-        if not os.path.exists(index_js_path):
-            self.logger.warning(f"index.js not found at {index_js_path}")
-            return False
-            
+        started = time.monotonic()
+        file_path = self._target_path(update)
+        
+        def result(status: str, message: str = "") -> RevisionResult:
+            return RevisionResult(update.name, file_path, status, time.monotonic() - started, message)
+        
+        if not os.path.exists(file_path):
+            self.logger.warning(f"{update.name} not found at {file_path}")
+            return result('failed', "file not found")
+        
         try:
-            # Read current index.js
-            with open(index_js_path, 'r', encoding='utf-8') as f:
+            # Read the current file
+            with open(file_path, 'r', encoding='utf-8') as f:
                 current_content = f.read()
             
             # Get the prompt from centralized prompts.yaml
-            base_prompt = get_prompt('docgen', 'index_js_update')
+            base_prompt = get_prompt('docgen', update.prompt_key)
             if not base_prompt:
-                self.logger.warning("Could not load index_js_update prompt from prompts.yaml, using fallback")
-                base_prompt = "Using the provided overview.md content as context, update ONLY the text content in this React component (index.js) while preserving its existing structure completely."
+                self.logger.warning(f"Could not load {update.prompt_key} prompt from prompts.yaml, using fallback")
+                base_prompt = update.fallback_prompt
             
             # Create full prompt with context
-            prompt = f"""
+            prompt = f"""{overview_context}
 {base_prompt}
 
-OVERVIEW.MD CONTENT (Use this as the source of information):
-```
-{overview_content}
-```
-
-CURRENT INDEX.JS:
+{update.current_label}:
 ```
 {current_content}
 ```
 
-Return ONLY the complete, updated index.js code.
+{update.return_instruction}
 """
             
             # Use AI to update the content
-            self.logger.debug("Enhancing index_js_update content with AI")
-            updated_content = self.ai_enhancer.enhance(prompt, "index_js_update")
+            self.logger.debug(f"Enhancing {update.prompt_key} content with AI")
+            updated_content = self.ai_enhancer.enhance(prompt, update.prompt_key)
             
-            if updated_content:
-                self.logger.debug(f"AI-generated content for index.js:\n{updated_content}")
-                # Remove any markdown code blocks
-                updated_content = self._extract_code_block(updated_content, "javascript")
-                
-                # Only write if the content changed
-                if updated_content != current_content:
-                    with open(index_js_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_content)
-                    
-                    self.logger.debug("Updated index.js content using AI with overview.md context")
-                else:
-                    self.logger.debug("No changes needed for index.js")
-                
-                return True
-            else:
-                self.logger.warning("AI failed to generate updated index.js content")
-                return False
+            if not updated_content:
+                self.logger.warning(f"AI failed to generate updated {update.name} content")
+                return result('failed', "AI returned no content")
             
-        except Exception as e:
-            self.logger.error(f"Error updating index.js: {str(e)}")
-            return False
-    
-    def _update_homepage_features_with_ai(self, overview_content: str) -> bool:
-        """
-        Update HomepageFeatures component using AI with overview.md as context.
-        
-        Args:
-            overview_content: Content of overview.md
+            self.logger.debug(f"AI-generated content for {update.name}:\n{updated_content}")
+            # Remove any markdown code blocks
+            updated_content = self._extract_code_block(updated_content, "javascript")
             
-        Returns:
-            True if update was successful, False otherwise
-        """
-        # Find the HomepageFeatures directory
-        homepage_features_dir = os.path.join(self.components_dir, 'HomepageFeatures')
-        if not os.path.exists(homepage_features_dir):
-            self.logger.warning("HomepageFeatures component not found")
-            return False
-        
-        # Find the index.js file
-        index_js_path = os.path.join(homepage_features_dir, 'index.js')
-        if not os.path.exists(index_js_path):
-            self.logger.warning("HomepageFeatures/index.js not found")
-            return False
-        
-        try:
-            # Read current HomepageFeatures component
-            with open(index_js_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
+            if self._expired.is_set():
+                return result('timed_out', "response arrived after the timeout")
             
-            # Get the prompt from centralized prompts.yaml
-            base_prompt = get_prompt('docgen', 'homepage_features_update')
-            if not base_prompt:
-                self.logger.warning("Could not load homepage_features_update prompt from prompts.yaml, using fallback")
-                base_prompt = "Using the provided overview.md content as context, update ONLY the feature descriptions in this React component while preserving its structure."
+            # Only write if the content changed
+            if updated_content == current_content:
+                self.logger.debug(f"No changes needed for {update.name}")
+                return result('unchanged')
             
-            # Create full prompt with context
-            prompt = f"""
-{base_prompt}
-
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(updated_content)
+            self.logger.debug(f"Updated {update.name} content using AI with overview.md context")
+            return result('updated')
+            
+        except Exception as e:
+            self.logger.error(f"Error updating {update.name}: {str(e)}")
+            return result('failed', str(e))
+    
+    def _target_path(self, update: _LandingPageUpdate) -> str:
+        """Get the absolute path of a landing page file."""
+        return os.path.join(self.output_dir, update.relative_path)
+    
+    @staticmethod
+    def _build_overview_context(overview_content: str) -> str:
+        """Format the overview.md block shared by all landing page prompts."""
+        return f"""
 OVERVIEW.MD CONTENT (Use this as the source of information):
 ```
 {overview_content}
 ```
-
-CURRENT COMPONENT:
-```
-{current_content}
-```
-
-Return ONLY the updated component code.
 """
-            
-            # Use AI to update the content
-            self.logger.debug("Enhancing homepage_features_update content with AI")
-            updated_content = self.ai_enhancer.enhance(prompt, "homepage_features_update")
-            
-            if updated_content:
-                self.logger.debug(f"AI-generated content for HomepageFeatures:\n{updated_content}")
-                # Remove any markdown code blocks
-                updated_content = self._extract_code_block(updated_content, "javascript")
-                
-                # Only write if the content changed
-                if updated_content != current_content:
-                    with open(index_js_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_content)
-                    
-                    self.logger.debug("Updated HomepageFeatures content using AI with overview.md context")
-                else:
-                    self.logger.debug("No changes needed for HomepageFeatures")
-                
-                return True
+    
+    def _log_revision_report(self, results: List[RevisionResult]) -> None:
+        """Log the outcome of each landing page update."""
+        for result in results:
+            message = f" ({result.message})" if result.message else ""
+            line = f"{result.name}: {result.status} in {result.seconds:.1f}s{message}"
+            if result.status in ('updated', 'unchanged'):
+                self.logger.info(line)
             else:
-                self.logger.warning("AI failed to generate updated HomepageFeatures content")
-                return False
-            
-        except Exception as e:
-            self.logger.error(f"Error updating HomepageFeatures: {str(e)}")
-            return False
+                self.logger.warning(line)
     
-    def _update_docusaurus_config_with_ai(self, overview_content: str) -> bool:
+    def _read_overview_content(self, overview_path: str) -> Optional[str]:
         """
-        Update docusaurus.config.js using AI with overview.md as context.
+        Read content from overview.md.
         
         Args:
-            overview_content: Content of overview.md
+            overview_path: Path to overview.md
             
         Returns:
-            True if update was successful, False otherwise
+            Content of overview.md or None if reading failed
         """
-        config_path = os.path.join(self.output_dir, 'docusaurus.config.js')
-        if not os.path.exists(config_path):
-            self.logger.warning(f"docusaurus.config.js not found at {config_path}")
-            return False
-        
         try:
-            # Read current config
-            with open(config_path, 'r', encoding='utf-8') as f:
-                current_config = f.read()
-            
-            # Get the prompt from centralized prompts.yaml
-            base_prompt = get_prompt('docgen', 'docusaurus_config_update')
-            if not base_prompt:
-                self.logger.warning("Could not load docusaurus_config_update prompt from prompts.yaml, using fallback")
-                base_prompt = "Using the provided overview.md content as context, update ONLY the title and tagline in this docusaurus.config.js file."
-            
-            # Create full prompt with context
-            prompt = f"""
-{base_prompt}
-
-OVERVIEW.MD CONTENT (Use this as the source of information):
-```
-{overview_content}
-```
-
-CURRENT CONFIG:
-```
-{current_config}
-```
-
-Return ONLY the updated configuration code.
-"""
+            with open(overview_path, 'r', encoding='utf-8') as f:
+                content = f.read()
             
-            # Use AI to update the content
-            self.logger.debug("Enhancing docusaurus_config_update content with AI")
-            updated_config = self.ai_enhancer.enhance(prompt, "docusaurus_config_update")
+            # Extract frontmatter and content
+            frontmatter, content_text = extract_frontmatter(content)
             
-            if updated_config:
-                self.logger.debug(f"AI-generated content for docusaurus.config.js:\n{updated_config}")
-                # Remove any markdown code blocks
-                updated_config = self._extract_code_block(updated_config, "javascript")
-                
-                # Only write if the content changed
-                if updated_config != current_config:
-                    with open(config_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_config)
-                    
-                    self.logger.debug("Updated docusaurus.config.js content using AI with overview.md context")
-                else:
-                    self.logger.debug("No changes needed for docusaurus.config.js")
-                
-                return True
-            else:
-                self.logger.warning("AI failed to generate updated docusaurus.config.js content")
-                return False
+            # Return full content including frontmatter for AI context
+            return content
             
         except Exception as e:
-            self.logger.error(f"Error updating docusaurus.config.js: {str(e)}")
-            return False
+            self.logger.error(f"Error reading content from overview.md: {str(e)}")
+            return None
     
     def _extract_code_block(self, content: str, language: str) -> str:
         """
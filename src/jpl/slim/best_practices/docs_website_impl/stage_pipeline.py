@@ -0,0 +1,119 @@
+"""
+Stage pipeline for documentation generation.
+
+Generation is described as a small DAG of named stages. Each stage starts as
+soon as the stages it depends on have succeeded, so independent stages (for
+example cloning the template and analyzing the repository) run concurrently.
+A stage fails by raising or by returning False; stages that depend on it are
+skipped. The wall-clock time of every stage that ran is recorded.
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Stage:
+    """A named unit of work and the stages it waits for."""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+
+
+class StagePipeline:
+    """
+    Runs stages in dependency order, overlapping stages that are independent.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, max_workers: int = 4):
+        """
+        Initialize the pipeline.
+
+        Args:
+            logger: Logger instance
+            max_workers: Maximum number of stages running at the same time
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.stages: Dict[str, Stage] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, float] = {}
+        self.failed: List[str] = []
+        self.skipped: List[str] = []
+
+    def add_stage(self, name: str, func: Callable[[Dict[str, Any]], Any],
+                  depends_on: Tuple[str, ...] = ()) -> None:
+        """
+        Add a stage.
+
+        Args:
+            name: Unique stage name
+            func: Called with the results of completed stages (by name); its
+                return value becomes this stage's result
+            depends_on: Names of stages that must succeed first; they must
+                already have been added
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        missing = [dependency for dependency in depends_on if dependency not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {', '.join(missing)}")
+        self.stages[name] = Stage(name, func, tuple(depends_on))
+
+    def run(self) -> bool:
+        """
+        Run all stages.
+
+        Returns:
+            True if every stage succeeded, False otherwise
+        """
+        self.results, self.timings, self.failed, self.skipped = {}, {}, [], []
+        pending = dict(self.stages)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="slim-stage") as executor:
+            while pending or running:
+                # Start every stage whose dependencies have succeeded
+                if not self.failed:
+                    for name, stage in list(pending.items()):
+                        if all(dependency in self.results for dependency in stage.depends_on):
+                            del pending[name]
+                            running[executor.submit(self._run_stage, stage)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    succeeded, result = future.result()
+                    if succeeded:
+                        self.results[name] = result
+                    else:
+                        self.failed.append(name)
+
+        # After a failure no new stages start; whatever did not run is skipped
+        self.skipped = list(pending)
+        if self.skipped:
+            self.logger.debug(f"Skipped stages after failure of {', '.join(self.failed)}: {', '.join(self.skipped)}")
+        return not self.failed and not self.skipped
+
+    def format_timings(self) -> str:
+        """Format stage timings in the order the stages were added."""
+        return ", ".join(f"{name} {self.timings[name]:.1f}s" for name in self.stages if name in self.timings)
+
+    def _run_stage(self, stage: Stage) -> Tuple[bool, Any]:
+        """Run one stage, timing it and turning exceptions and False into failure."""
+        started = time.monotonic()
+        self.logger.debug(f"Stage '{stage.name}' started")
+        try:
+            result = stage.func(self.results)
+            succeeded = result is not False
+        except Exception as e:
+            self.logger.error(f"Stage '{stage.name}' failed: {str(e)}")
+            result, succeeded = None, False
+        self.timings[stage.name] = time.monotonic() - started
+        self.logger.debug(f"Stage '{stage.name}' finished in {self.timings[stage.name]:.2f}s")
+        return succeeded, result
@@ -1,11 +1,25 @@
 # File: src/jpl/slim/docgen/template/template_manager.py
 """
 Template management for documentation generation.
+
+Remote templates are cloned once into a per-user cache and refreshed with
+``git fetch`` when the cached copy is older than ``TEMPLATE_CACHE_MAX_AGE``.
+Each run checks out the requested ref (or the remote's default branch) and
+materializes that commit into the output directory with reflinks or plain
+copies, so generating sites for many repositories pays the clone cost once.
 """
+import hashlib
 import logging
 import os
+import re
 import shutil
-from typing import Dict
+import time
+from typing import Dict, Optional, Tuple
+
+from jpl.slim.utils.file_utils import file_lock, user_cache_dir, materialize_tree
+
+# Seconds before a cached template is fetched again; pinned commits are never refetched
+TEMPLATE_CACHE_MAX_AGE = 24 * 60 * 60
 
 
 class TemplateManager:
@@ -13,7 +27,8 @@ class TemplateManager:
     Manages the SLIM documentation template.
     """
     
-    def __init__(self, template_repo: str, output_dir: str, logger: logging.Logger):
+    def __init__(self, template_repo: str, output_dir: str, logger: logging.Logger,
+                 template_ref: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         Initialize the template manager.
         
@@ -21,10 +36,17 @@ class TemplateManager:
             template_repo: URL or path to the template repository
             output_dir: Directory where the documentation should be generated
             logger: Logger instance
+            template_ref: Branch, tag or commit of the template to use; defaults
+                to the remote's default branch
+            cache_dir: Directory for cached template clones; defaults to the
+                user cache directory
         """
         self.template_repo = template_repo
         self.output_dir = output_dir
         self.logger = logger
+        self.template_ref = template_ref
+        self.cache_dir = cache_dir
+        self.template_commit: Optional[str] = None
     
     def clone_template(self) -> bool:
         """
@@ -81,24 +103,22 @@ class TemplateManager:
     
     def _clone_git_template(self) -> bool:
         """
-        Clone template from a git repository.
+        Materialize a git template from the local template cache.
         
         Returns:
             True if cloning was successful, False otherwise
         """
         try:
-            # Import git here to avoid dependency if not needed
-            import git
+            cache_path = self._cache_path()
+            with file_lock(os.path.join(cache_path, '.lock')):
+                repo_dir, commit = self._update_cache(cache_path)
+                # Nothing is hardlinked: any file of a generated site may later be edited in
+                # place, and a shared inode would carry the edit into the cache
+                counts = materialize_tree(repo_dir, self.output_dir, skip=('.git',))
             
-            # Clone the repository
-            repo = git.Repo.clone_from(self.template_repo, self.output_dir)
-            
-            # Remove .git directory to start fresh
-            git_dir = os.path.join(self.output_dir, '.git')
-            if os.path.exists(git_dir):
-                shutil.rmtree(git_dir)
-            
-            self.logger.info(f"Git template cloned to {self.output_dir}")
+            self.template_commit = commit
+            self.logger.info(f"Template {self.template_repo} at {commit[:12]} materialized to {self.output_dir} "
+                             f"({counts['reflinked']} reflinked, {counts['copied']} copied)")
             return True
             
         except ImportError:
@@ -107,3 +127,90 @@ class TemplateManager:
         except Exception as e:
             self.logger.error(f"Error cloning git template: {str(e)}")
             return False
+    
+    def _cache_path(self) -> str:
+        """Get the cache directory for this template repository."""
+        key = hashlib.sha256(self.template_repo.encode('utf-8')).hexdigest()[:16]
+        if self.cache_dir:
+            path = os.path.join(self.cache_dir, key)
+            os.makedirs(path, exist_ok=True)
+            return path
+        return str(user_cache_dir('templates', key))
+    
+    def _update_cache(self, cache_path: str) -> Tuple[str, str]:
+        """
+        Clone or refresh the cached template and check out the requested ref.
+        
+        Args:
+            cache_path: Cache directory for this template repository
+        
+        Returns:
+            Tuple of (checked-out working tree, commit SHA)
+        """
+        import git
+        
+        repo_dir = os.path.join(cache_path, 'repo')
+        stamp_path = os.path.join(cache_path, 'last_fetch')
+        
+        if not os.path.isdir(os.path.join(repo_dir, '.git')):
+            if os.path.exists(repo_dir):
+                shutil.rmtree(repo_dir)
+            self.logger.info(f"Cloning template {self.template_repo} into cache {repo_dir}")
+            repo = git.Repo.clone_from(self.template_repo, repo_dir)
+            _touch(stamp_path)
+        else:
+            repo = git.Repo(repo_dir)
+            if self._needs_fetch(repo, stamp_path):
+                try:
+                    self.logger.debug(f"Fetching template updates into {repo_dir}")
+                    repo.remotes.origin.fetch(tags=True, prune=True)
+                    _touch(stamp_path)
+                except git.GitCommandError as e:
+                    # Offline or unreachable: the cached copy is still usable
+                    self.logger.warning(f"Could not refresh template cache, using cached copy: {str(e)}")
+        
+        commit = self._resolve_ref(repo)
+        if repo.head.is_detached and repo.head.commit.hexsha == commit:
+            return repo_dir, commit
+        repo.git.checkout('--detach', '--force', commit)
+        return repo_dir, commit
+    
+    def _needs_fetch(self, repo, stamp_path: str) -> bool:
+        """Freshness check: fetch unless the ref is a known commit or the cache is recent."""
+        if self.template_ref and _looks_like_commit(self.template_ref):
+            try:
+                repo.commit(self.template_ref)
+                return False
+            except Exception:
+                return True
+        try:
+            age = time.time() - os.path.getmtime(stamp_path)
+        except OSError:
+            return True
+        return age > TEMPLATE_CACHE_MAX_AGE
+    
+    def _resolve_ref(self, repo) -> str:
+        """Resolve the requested ref, preferring remote branches over stale local ones."""
+        if not self.template_ref:
+            candidates = ['origin/HEAD']
+        else:
+            candidates = [f'origin/{self.template_ref}', self.template_ref]
+        for candidate in candidates:
+            try:
+                return repo.commit(candidate).hexsha
+            except Exception:
+                continue
+        if not self.template_ref:
+            # Clones made without a remote HEAD reference: use the checked-out commit
+            return repo.head.commit.hexsha
+        raise ValueError(f"Template ref '{self.template_ref}' not found in {self.template_repo}")
+
+
+def _looks_like_commit(ref: str) -> bool:
+    """Check whether a ref looks like an abbreviated or full commit SHA."""
+    return bool(re.fullmatch(r'[0-9a-f]{7,40}', ref))
+
+
+def _touch(path: str) -> None:
+    with open(path, 'a'):
+        os.utime(path, None)
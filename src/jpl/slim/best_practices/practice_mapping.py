@@ -74,6 +74,12 @@ ALIAS_TO_FILE_PATH = {
     'container-scan-precommit': '.pre-commit-config.yml',
 }
 
+# Files written by practices that do not use the StandardPractice file mapping
+ALIAS_TO_EXTRA_FILE_PATHS = {
+    'secrets-github': ['.github/workflows/detect-secrets.yaml', '.secrets.baseline'],
+    'secrets-precommit': ['.pre-commit-config.yaml', '.secrets.baseline'],
+}
+
 # AI generation mapping for aliases (for ai_utils.py)
 ALIAS_AI_CONTEXT = {
     'governance-small': 'governance',
@@ -108,6 +114,21 @@ def get_file_path(alias: str):
     """
     return ALIAS_TO_FILE_PATH.get(alias)
 
+def get_deploy_paths(alias: str):
+    """
+    Get the repository-relative paths a practice writes, for committing on deploy.
+    
+    Args:
+        alias: The practice alias
+        
+    Returns:
+        List of file paths, or None if the practice's files are not known
+    """
+    if alias in ALIAS_TO_EXTRA_FILE_PATHS:
+        return list(ALIAS_TO_EXTRA_FILE_PATHS[alias])
+    file_path = ALIAS_TO_FILE_PATH.get(alias)
+    return [file_path] if file_path else None
+
 def get_ai_context_type(alias: str):
     """
     Get the AI context type for a given alias.
@@ -8,13 +8,23 @@ secrets detection best practices to repositories.
 import os
 import logging
 import subprocess
-import sys
-import json
 import git
 from pathlib import Path
 from jpl.slim.best_practices.standard import StandardPractice
 from jpl.slim.utils.io_utils import download_and_place_file
 from jpl.slim.utils.cli_utils import spinner_safe_input
+from jpl.slim.utils.secrets_scanner import (
+    BASELINE_FILE,
+    BUILTIN_SCANNER,
+    UNVERIFIED_SECRETS_LIMIT,
+    build_baseline,
+    count_unverified_secrets,
+    head_commit,
+    incremental_scan,
+    scan_repository,
+    write_baseline
+)
+from jpl.slim.utils.tool_utils import DETECT_SECRETS, PRE_COMMIT, ensure_tool, find_tool
 
 
 
@@ -39,11 +49,17 @@ class SecretsDetection(StandardPractice):
             target_dir_to_clone_to (str, optional): Directory to clone to. Defaults to None.
             branch (str, optional): Git branch to use. Defaults to None.
             no_prompt (bool, optional): Skip user confirmation prompts. Defaults to False.
+            **kwargs: secrets_scanner selects 'detect-secrets' (default) or 'builtin' to create the baseline;
+                incremental updates an existing baseline by rescanning only changed files (builtin only)
 
         Returns:
             git.Repo: Git repository object if successful, None otherwise
         """
         logging.debug(f"Applying best practice {self.best_practice_id} to repository: {repo_path}")
+        scanner = kwargs.get('secrets_scanner') or 'detect-secrets'
+        # The built-in scanner writes the baseline itself, so detect-secrets is not needed locally
+        needs_detect_secrets = scanner != BUILTIN_SCANNER
+        incremental = kwargs.get('incremental', False)
 
 
         # Setup repository using the parent class method
@@ -66,23 +82,25 @@ class SecretsDetection(StandardPractice):
                 # Install detect-secrets
                 if no_prompt:
                     # Skip confirmation if --no-prompt flag is used
-                    self._install_detect_secrets()
+                    if needs_detect_secrets:
+                        self._install_detect_secrets()
                     # Run scan and check for unverified secrets
-                    if not self._run_detect_secrets_scan(git_repo):
+                    if not self._run_detect_secrets_scan(git_repo, scanner, incremental):
                         logging.error("Detection of unverified secrets failed. Aborting application of best practice.")
                         return None
                 else:
                     # Prompt for confirmation before installing
-                    confirmation = spinner_safe_input("\nThe detect-secrets tool (https://github.com/Yelp/detect-secrets) is needed to support this best practice. Do you want me to install/re-install detect-secrets? (y/n): ")
-                    if confirmation.lower() in ['y', 'yes']:
-                        self._install_detect_secrets()
-                    else:
-                        logging.warning("Not installing detect-secrets. Assuming it is already installed.")
+                    if needs_detect_secrets:
+                        confirmation = spinner_safe_input("\nThe detect-secrets tool (https://github.com/Yelp/detect-secrets) is needed to support this best practice. Do you want me to install/re-install detect-secrets? (y/n): ")
+                        if confirmation.lower() in ['y', 'yes']:
+                            self._install_detect_secrets()
+                        else:
+                            logging.warning("Not installing detect-secrets. Assuming it is already installed.")
 
                     # Prompt for confirmation before installing
                     confirmation = spinner_safe_input("\nDo you want me to run an initial scan with detect-secrets (will overwrite an existing `.secrets-baseline` file)? (y/n): ")
                     if confirmation.lower() in ['y', 'yes']:
-                        scan_result = self._run_detect_secrets_scan(git_repo)
+                        scan_result = self._run_detect_secrets_scan(git_repo, scanner, incremental)
                         if not scan_result:
                             logging.error("Detection of unverified secrets failed. Aborting application of best practice.")
                             return None
@@ -102,15 +120,17 @@ class SecretsDetection(StandardPractice):
             # Install pre-commit
             if no_prompt:
                 # Skip confirmation if --no-prompt flag is used
-                self._install_detect_secrets()
+                if needs_detect_secrets:
+                    self._install_detect_secrets()
                 self._install_pre_commit()
             else:
                 # Prompt for confirmation before installing
-                confirmation = spinner_safe_input("\nThe detect-secrets tool (https://github.com/Yelp/detect-secrets) is needed to support this best practice. Do you want me to install/re-install detect-secrets? (y/n): ")
-                if confirmation.lower() in ['y', 'yes']:
-                    self._install_detect_secrets()
-                else:
-                    logging.warning("Not installing detect-secrets. Assuming it is already installed.")
+                if needs_detect_secrets:
+                    confirmation = spinner_safe_input("\nThe detect-secrets tool (https://github.com/Yelp/detect-secrets) is needed to support this best practice. Do you want me to install/re-install detect-secrets? (y/n): ")
+                    if confirmation.lower() in ['y', 'yes']:
+                        self._install_detect_secrets()
+                    else:
+                        logging.warning("Not installing detect-secrets. Assuming it is already installed.")
 
                 # Prompt for confirmation before installing
                 confirmation = spinner_safe_input("\nThe pre-commit tool (https://pre-commit.com) is needed to support this best practice. Do you want to install/re-install pre-commit? (y/n): ")
@@ -134,7 +154,7 @@ class SecretsDetection(StandardPractice):
                     baseline_file = os.path.join(git_repo.working_dir, '.secrets.baseline')
                     if not os.path.exists(baseline_file):
                         logging.debug("No existing .secrets.baseline file found. Running detect-secrets scan...")
-                        if not self._run_detect_secrets_scan(git_repo):
+                        if not self._run_detect_secrets_scan(git_repo, scanner, incremental):
                             logging.error("Detection of unverified secrets failed. Aborting application of best practice.")
                             return None
                 else:
@@ -151,7 +171,7 @@ class SecretsDetection(StandardPractice):
                         confirmation = spinner_safe_input("\nDo you want to run an initial scan with detect-secrets to create a .secrets.baseline file? (y/n): ")
                     
                     if confirmation.lower() in ['y', 'yes']:
-                        scan_result = self._run_detect_secrets_scan(git_repo)
+                        scan_result = self._run_detect_secrets_scan(git_repo, scanner, incremental)
                         if not scan_result:
                             logging.error("Detection of unverified secrets failed. Aborting application of best practice.")
                             return None
@@ -225,34 +245,14 @@ class SecretsDetection(StandardPractice):
             return False
 
     def _install_detect_secrets(self):
-        """Install detect-secrets using pip."""
-        try:
-            logging.debug("Installing detect-secrets...")
-            subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", "git+https://github.com/Yelp/detect-secrets.git"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            logging.debug("Successfully installed detect-secrets")
-            return True
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Failed to install detect-secrets: {e}")
-            return False
+        """Make detect-secrets available, installing it into SLIM's tool cache only if no suitable install exists."""
+        logging.debug("Checking for detect-secrets...")
+        return ensure_tool(DETECT_SECRETS) is not None
 
     def _install_pre_commit(self):
-        """Install pre-commit using pip."""
-        try:
-            logging.debug("Installing pre-commit...")
-            subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", "pre-commit"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            logging.debug("Successfully installed pre-commit")
-            return True
-        except subprocess.CalledProcessError as e:
-            logging.error(f"Failed to install pre-commit: {e}")
-            return False
+        """Make pre-commit available, installing it into SLIM's tool cache only if no suitable install exists."""
+        logging.debug("Checking for pre-commit...")
+        return ensure_tool(PRE_COMMIT) is not None
 
     def _install_pre_commit_hooks(self, git_repo):
         """Initialize pre-commit hooks in the repository.
@@ -263,97 +263,127 @@ class SecretsDetection(StandardPractice):
         try:
             logging.debug("Installing pre-commit hooks...")
             subprocess.check_call(
-                ["pre-commit", "install"],
+                [find_tool(PRE_COMMIT) or PRE_COMMIT.name, "install"],
                 cwd=git_repo.working_dir,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE
             )
             logging.debug("Successfully installed pre-commit hooks")
             return True
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             logging.error(f"Failed to install pre-commit hooks: {e}")
             return False
 
-    def _run_detect_secrets_scan(self, git_repo):
+    def _run_detect_secrets_scan(self, git_repo, scanner='detect-secrets', incremental=False):
         """
         Run detect-secrets scan to generate a baseline file and check for unverified secrets.
 
         Args:
             git_repo: Git repository object containing the working directory context
+            scanner (str, optional): 'detect-secrets' to run the detect-secrets tool, or 'builtin'
+                to scan with SLIM's built-in scanner. Defaults to 'detect-secrets'.
+            incremental (bool, optional): Update an existing baseline by rescanning only files
+                changed since it was generated (built-in scanner only). Defaults to False.
 
         Returns:
             bool: True if scan was successful and no unverified secrets were found,
                  False if scan failed or unverified secrets were found
         """
+        if scanner == BUILTIN_SCANNER:
+            return self._run_builtin_scan(git_repo, incremental)
+        if incremental:
+            logging.debug("Incremental secrets baselines need the built-in scanner. Running a full detect-secrets scan.")
+
         try:
             logging.debug("Running detect-secrets scan...")
-            cmd = "detect-secrets scan --all-files --exclude-files '\\.secrets.*' --exclude-files '\\.git.*' > .secrets.baseline"
-            # Using shell=True since we need shell features like redirection (>)
-            # Run in the repository's working directory
-            subprocess.check_call(
-                cmd,
-                shell=True,
-                cwd=git_repo.working_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
+            # Run the tool found on the system or in SLIM's tool cache, in the repository's working directory
+            cmd = [find_tool(DETECT_SECRETS) or DETECT_SECRETS.name, "scan", "--all-files",
+                   "--exclude-files", "\\.secrets.*", "--exclude-files", "\\.git.*"]
+            with open(os.path.join(git_repo.working_dir, BASELINE_FILE), 'w') as baseline:
+                subprocess.check_call(
+                    cmd,
+                    cwd=git_repo.working_dir,
+                    stdout=baseline,
+                    stderr=subprocess.PIPE
+                )
             logging.debug("Successfully created .secrets.baseline file")
 
             # Check the baseline file for unverified secrets
             return self._check_baseline_for_unverified_secrets(git_repo)
 
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             logging.error(f"Failed to run detect-secrets scan: {e}")
             return False
 
-    def _check_baseline_for_unverified_secrets(self, git_repo):
+    def _run_builtin_scan(self, git_repo, incremental=False):
+        """
+        Scan the repository with the built-in scanner and write a detect-secrets compatible baseline.
+
+        Args:
+            git_repo: Git repository object containing the working directory context
+            incremental (bool, optional): Rescan only files changed since the existing baseline
+                was generated, falling back to a full scan if that is not possible. Defaults to False.
+
+        Returns:
+            bool: True if scan was successful and no unverified secrets were found,
+                 False if scan failed or unverified secrets were found
+        """
+        try:
+            logging.debug("Running built-in secrets scan...")
+            # Recorded with the baseline so the next incremental scan diffs from the scanned commit
+            commit = head_commit(git_repo.working_dir)
+            baseline = incremental_scan(git_repo.working_dir) if incremental else None
+            if baseline is None:
+                if incremental:
+                    logging.debug("No usable .secrets.baseline for an incremental scan. Scanning all files.")
+                baseline = build_baseline(scan_repository(git_repo.working_dir))
+            write_baseline(os.path.join(git_repo.working_dir, BASELINE_FILE), baseline, commit)
+            logging.debug(f"Successfully created {BASELINE_FILE} file")
+        except OSError as e:
+            logging.error(f"Failed to run built-in secrets scan: {e}")
+            return False
+
+        return self._check_baseline_for_unverified_secrets(git_repo)
+
+    def _check_baseline_for_unverified_secrets(self, git_repo, limit=UNVERIFIED_SECRETS_LIMIT):
         """
         Check the .secrets.baseline file for unverified secrets.
 
+        The baseline is streamed rather than loaded, so very large baselines are
+        checked in constant memory.
+
         Args:
             git_repo: Git repository object containing the working directory context
+            limit (int, optional): Stop reading the baseline once more than this many
+                unverified secrets were found. Defaults to UNVERIFIED_SECRETS_LIMIT.
 
         Returns:
             bool: True if no unverified secrets were found, False otherwise
         """
         try:
             # Read the baseline file from the repository directory
-            baseline_file = os.path.join(git_repo.working_dir, '.secrets.baseline')
-            with open(baseline_file, 'r') as f:
-                baseline = json.load(f)
-
-            # Check the results for unverified secrets
-            if 'results' in baseline:
-                results = baseline['results']
-                unverified_secrets = []
-
-                # Iterate through files in results
-                for filename, secrets in results.items():
-                    for secret in secrets:
-                        # Check if the secret is unverified
-                        if secret.get('is_verified') is False:
-                            unverified_secrets.append({
-                                'filename': secret.get('filename', filename),
-                                'type': secret.get('type', 'Unknown'),
-                                'line_number': secret.get('line_number', 'Unknown')
-                            })
-
-                # If unverified secrets were found, report them and return False
-                if unverified_secrets:
-                    logging.error("Unverified secrets found in the repository:")
-                    for secret in unverified_secrets:
-                        logging.error(f"  - {secret['type']} in {secret['filename']} at line {secret['line_number']}")
-                    logging.error("Secrets must be verified or removed before deployment.")
-                    logging.error("To verify secrets, run 'detect-secrets audit .secrets.baseline'")
-                    logging.error("To remove secrets, edit the files and remove the sensitive information.")
-                    return False
+            baseline_file = os.path.join(git_repo.working_dir, BASELINE_FILE)
+            report = count_unverified_secrets(baseline_file, limit)
 
-                return True
-            else:
+            if not report.has_results:
                 # No results found, which is strange but not necessarily an error
                 logging.warning("No results found in .secrets.baseline file. This is unusual.")
                 return True
 
+            # If unverified secrets were found, report them and return False
+            if report.total:
+                logging.error("Unverified secrets found in the repository:")
+                for secret in report.secrets:
+                    logging.error(f"  - {secret['type']} in {secret['filename']} at line {secret['line_number']}")
+                if report.truncated:
+                    logging.error(f"  ... stopped after the first {report.total} unverified secrets in {len(report.per_file)} files")
+                logging.error("Secrets must be verified or removed before deployment.")
+                logging.error("To verify secrets, run 'detect-secrets audit .secrets.baseline'")
+                logging.error("To remove secrets, edit the files and remove the sensitive information.")
+                return False
+
+            return True
+
         except Exception as e:
             logging.error(f"Error checking .secrets.baseline file: {e}")
-            return False
\ No newline at end of file
+            return False
@@ -14,12 +14,12 @@ import uuid
 import git
 
 from jpl.slim.best_practices.base import BestPractice
-from jpl.slim.best_practices.practice_mapping import get_file_path
+from jpl.slim.best_practices.practice_mapping import get_file_path, get_deploy_paths
 from jpl.slim.utils.io_utils import download_and_place_file
 from jpl.slim.utils.ai_utils import generate_with_ai
 from jpl.slim.utils.prompt_utils import get_prompt_with_context, get_repository_context
 from jpl.slim.utils.io_utils import read_file_content, fetch_repository_context
-from jpl.slim.utils.git_utils import create_repo_temp_dir
+from jpl.slim.utils.git_utils import create_repo_temp_dir, commit_paths
 # Import the constant directly to avoid circular imports
 GIT_BRANCH_NAME_FOR_MULTIPLE_COMMITS = 'slim-best-practices'
 
@@ -220,12 +220,14 @@ class StandardPractice(BestPractice):
                 context_info = f"REPOSITORY CONTEXT:\n{repo_context}" if repo_context else "No repository context found."
                 logging.debug(f"Fetched repository context, length: {len(repo_context) if repo_context else 0}")
                 
-                # Construct full prompt
-                full_prompt = f"{prompt_with_context}\n\nTEMPLATE TO ENHANCE:\n{current_content}\n\nCONTEXT INFORMATION:\n{context_info}"
+                # Construct the per-repository part of the prompt; the prompt with its
+                # global and practice context is identical across repositories and is
+                # sent as a cacheable prefix
+                repository_prompt = f"\n\nTEMPLATE TO ENHANCE:\n{current_content}\n\nCONTEXT INFORMATION:\n{context_info}"
                 
                 # Generate AI content using the centralized AI utilities
                 from jpl.slim.utils.ai_utils import generate_ai_content
-                ai_content = generate_ai_content(full_prompt, model)
+                ai_content = generate_ai_content(repository_prompt, model, prompt_prefix=prompt_with_context)
             
             if ai_content:
                 logging.debug(f"AI-generated content for {file_path}:\n{ai_content}")
@@ -254,13 +256,20 @@ class StandardPractice(BestPractice):
             str: Error message if there was a failure, None otherwise
         """
         try:
-            # Add all changes
-            repo.git.add(A=True)
-            logging.debug("Added all changes to git index.")
+            paths = get_deploy_paths(self.best_practice_id)
+            if paths is not None:
+                # Commit only the files this best practice writes, through the index
+                if not commit_paths(repo, paths, commit_message):
+                    return False, f"Nothing to commit for best practice {self.best_practice_id}"
+                logging.debug(f"Committed {', '.join(paths)}.")
+            else:
+                # Add all changes
+                repo.git.add(A=True)
+                logging.debug("Added all changes to git index.")
 
-            # Commit changes
-            repo.git.commit('-m', commit_message)
-            logging.debug("Committed changes.")
+                # Commit changes
+                repo.git.commit('-m', commit_message)
+                logging.debug("Committed changes.")
 
             # Push changes if remote is specified
             if remote:
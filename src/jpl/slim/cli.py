@@ -44,7 +44,7 @@ VERSION = open(os.path.join(os.path.dirname(__file__), 'VERSION.txt')).read().st
 
 # CLI-level arguments that should never be passed to commands
 CLI_ONLY_ARGS = {
-    'version', 'dry_run', 'logging', 'command', 'func'
+    'version', 'dry_run', 'logging', 'scan_threads', 'command', 'func'
 }
 
 # Import command modules
@@ -65,6 +65,7 @@ from jpl.slim.utils.io_utils import (
 from jpl.slim.utils.git_utils import (
     generate_git_branch_name
 )
+from jpl.slim.utils.file_utils import configure_scan_threads
 from jpl.slim.utils.ai_utils import (
     generate_with_ai,
     construct_prompt,
@@ -179,7 +180,8 @@ def main_callback(
     ctx: typer.Context,
     version: bool = typer.Option(False, "--version", "-v", help="Show version and exit"),
     dry_run: bool = typer.Option(False, "--dry-run", "-d", help="Generate a dry-run plan of activities to be performed"),
-    logging_level: str = typer.Option("INFO", "--logging", "-l", help="Set the logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL")
+    logging_level: str = typer.Option("INFO", "--logging", "-l", help="Set the logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL"),
+    scan_threads: Optional[int] = typer.Option(None, "--scan-threads", min=1, help="Threads for scanning repository files (default: auto, parallel on network filesystems)")
 ):
     """
     SLIM CLI - Software Lifecycle Improvement & Modernization
@@ -201,10 +203,14 @@ def main_callback(
     # Store global options in state
     state.dry_run = dry_run
     state.logging_level = log_level
+    state.scan_threads = scan_threads
     
     # Set up logging
     setup_logging(log_level)
     
+    # Directory scans run serially unless a thread count is given or the filesystem is remote
+    configure_scan_threads(scan_threads)
+    
     # Print startup banner for interactive use (only if a command is being run)
     if len(sys.argv) > 1 and ctx.invoked_subcommand is not None:
         print_startup_banner()
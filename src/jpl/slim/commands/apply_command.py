@@ -28,6 +28,7 @@ from jpl.slim.manager.best_practices_manager import BestPracticeManager
 from jpl.slim.commands.common import (
     SLIM_REGISTRY_URI,
     GIT_BRANCH_NAME_FOR_MULTIPLE_COMMITS,
+    SecretsScanner,
     get_ai_model_pairs
 )
 from jpl.slim.app import app, state, handle_dry_run_for_command
@@ -93,6 +94,27 @@ def apply(
         "--revise-site",
         help="Revise an existing documentation site (for docs-website)"
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Regenerate only pages whose prompt, repository context or model changed since the last run (for docs-website); with --secrets-scanner builtin, rescan only files changed since .secrets.baseline was generated (for secrets-github/secrets-precommit)"
+    ),
+    template_ref: Optional[str] = typer.Option(
+        None,
+        "--template-ref",
+        help="Branch, tag or commit of the documentation template to use (for docs-website)"
+    ),
+    batch_pages: int = typer.Option(
+        1,
+        "--batch-pages",
+        min=1,
+        help="Generate up to this many small pages per AI request; failed pages are retried one at a time (for docs-website)"
+    ),
+    secrets_scanner: SecretsScanner = typer.Option(
+        SecretsScanner.detect_secrets,
+        "--secrets-scanner",
+        help="Scanner that creates .secrets.baseline: the detect-secrets tool, or SLIM's built-in parallel scanner that needs no install (for secrets-github/secrets-precommit)"
+    ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run", "-d",
@@ -132,6 +154,10 @@ def apply(
             output_dir=str(output_dir) if output_dir else None,
             template_only=template_only,
             revise_site=revise_site,
+            incremental=incremental,
+            template_ref=template_ref,
+            batch_pages=batch_pages,
+            secrets_scanner=secrets_scanner.value,
             dry_run=True
         ):
             return
@@ -157,7 +183,11 @@ def apply(
             no_prompt=no_prompt,
             output_dir=output_dir_str,
             template_only=template_only,
-            revise_site=revise_site
+            revise_site=revise_site,
+            incremental=incremental,
+            template_ref=template_ref,
+            batch_pages=batch_pages,
+            secrets_scanner=secrets_scanner.value
         )
         if success:
             end_time = time.time()
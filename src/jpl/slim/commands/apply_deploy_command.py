@@ -5,25 +5,35 @@ This module contains the implementation of the 'apply-deploy' subcommand,
 which applies and deploys best practices to repositories.
 """
 
+import json
 import logging
 import os
 import tempfile
 import time
 import urllib.parse
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from typing import List, Optional
 from pathlib import Path
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 import git
 
+from jpl.slim.utils.cli_utils import spinner_progress, spinners_disabled
 from jpl.slim.utils.io_utils import repo_file_to_list
 from jpl.slim.utils.git_utils import generate_git_branch_name, create_repo_temp_dir
 from jpl.slim.commands.apply_command import apply_best_practice
-from jpl.slim.commands.deploy_command import deploy_best_practice
+from jpl.slim.commands.deploy_command import (
+    deploy_best_practice,
+    deploy_best_practices,
+    DeployResult,
+    DEPLOY_STATUS_APPLY_FAILED,
+    DEPLOY_STATUS_PUSHED
+)
 from jpl.slim.commands.common import (
     GIT_BRANCH_NAME_FOR_MULTIPLE_COMMITS,
+    SecretsScanner,
     GIT_DEFAULT_COMMIT_MESSAGE,
     get_ai_model_pairs
 )
@@ -108,6 +118,49 @@ def apply_deploy(
         "--revise-site",
         help="Revise an existing documentation site (for doc-gen)"
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Regenerate only pages whose prompt, repository context or model changed since the last run (for doc-gen); with --secrets-scanner builtin, rescan only files changed since .secrets.baseline was generated (for secrets-github/secrets-precommit)"
+    ),
+    template_ref: Optional[str] = typer.Option(
+        None,
+        "--template-ref",
+        help="Branch, tag or commit of the documentation template to use (for doc-gen)"
+    ),
+    batch_pages: int = typer.Option(
+        1,
+        "--batch-pages",
+        min=1,
+        help="Generate up to this many small pages per AI request; failed pages are retried one at a time (for doc-gen)"
+    ),
+    secrets_scanner: SecretsScanner = typer.Option(
+        SecretsScanner.detect_secrets,
+        "--secrets-scanner",
+        help="Scanner that creates .secrets.baseline: the detect-secrets tool, or SLIM's built-in parallel scanner that needs no install (for secrets-github/secrets-precommit)"
+    ),
+    atomic: bool = typer.Option(
+        False,
+        "--atomic",
+        help="Push with --atomic so the remote accepts all ref updates or none"
+    ),
+    force_with_lease: bool = typer.Option(
+        False,
+        "--force-with-lease",
+        help="Push with --force-with-lease, refusing to overwrite remote changes made since the fetch"
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs", "-j",
+        min=1,
+        help="Number of repositories to apply and deploy concurrently; pushes to one host are capped separately. "
+             "Values above 1 require --no-prompt"
+    ),
+    summary_file: Optional[Path] = typer.Option(
+        None,
+        "--summary-file",
+        help="Write a JSON summary of which repositories and branches were pushed to this file"
+    ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run", "-d",
@@ -133,6 +186,11 @@ def apply_deploy(
     logging.debug(f"Best practice IDs: {best_practice_ids}")
     logging.debug(f"Use AI: {use_ai}")
     
+    # Concurrent repositories would interleave their confirmation prompts on one terminal
+    if jobs > 1 and not no_prompt:
+        console.print("❌ [red]--jobs greater than 1 requires --no-prompt[/red]")
+        raise typer.Exit(1)
+    
     # Handle dry-run mode
     if state.dry_run or dry_run:
         if handle_dry_run_for_command(
@@ -149,6 +207,14 @@ def apply_deploy(
             output_dir=str(output_dir) if output_dir else None,
             template_only=template_only,
             revise_site=revise_site,
+            incremental=incremental,
+            template_ref=template_ref,
+            batch_pages=batch_pages,
+            secrets_scanner=secrets_scanner.value,
+            atomic=atomic,
+            force_with_lease=force_with_lease,
+            jobs=jobs,
+            summary_file=str(summary_file) if summary_file else None,
             dry_run=True
         ):
             return
@@ -164,7 +230,7 @@ def apply_deploy(
     # Apply and deploy best practices with timing
     start_time = time.time()
     try:
-        apply_and_deploy_best_practices(
+        results = apply_and_deploy_best_practices(
             best_practice_ids=best_practice_ids,
             use_ai_flag=bool(use_ai),
             model=use_ai,
@@ -174,12 +240,25 @@ def apply_deploy(
             existing_repo_dir=repo_dir_str,
             target_dir_to_clone_to=clone_to_dir_str,
             no_prompt=no_prompt,
+            atomic=atomic,
+            force_with_lease=force_with_lease,
+            jobs=jobs,
             output_dir=output_dir_str,
             template_only=template_only,
-            revise_site=revise_site
+            revise_site=revise_site,
+            incremental=incremental,
+            template_ref=template_ref,
+            batch_pages=batch_pages,
+            secrets_scanner=secrets_scanner.value
         )
         end_time = time.time()
         duration = end_time - start_time
+        if summary_file:
+            write_deploy_summary(results, str(summary_file))
+            logging.debug(f"Wrote deploy summary to {summary_file}")
+        if len(results) > 1:
+            pushed = sum(1 for result in results if result.status == DEPLOY_STATUS_PUSHED)
+            console.print(f"\n📦 Pushed {pushed} of {len(results)} repositories")
         console.print(f"\n✅ [green]Apply-deploy operation completed in {duration:.2f} seconds[/green]")
     except Exception as e:
         console.print(f"❌ [red]Error in apply-deploy operation: {str(e)}[/red]")
@@ -188,7 +267,8 @@ def apply_deploy(
 def _apply_multiple_best_practices(best_practice_ids, use_ai_flag, model, remote=None, 
                                  commit_message=GIT_DEFAULT_COMMIT_MESSAGE, repo_url=None, 
                                  existing_repo_dir=None, target_dir_to_clone_to=None, 
-                                 branch_name=None, no_prompt=False, **kwargs):
+                                 branch_name=None, no_prompt=False, atomic=False, force_with_lease=False,
+                                 result=None, **kwargs):
     """
     Apply multiple best practices to a repository and deploy them.
     
@@ -203,6 +283,9 @@ def _apply_multiple_best_practices(best_practice_ids, use_ai_flag, model, remote
         target_dir_to_clone_to (str, optional): Directory to clone repository to. Defaults to None.
         branch_name (str, optional): Git branch to use. Defaults to None.
         no_prompt (bool, optional): Skip user confirmation prompts. Defaults to False.
+        atomic (bool, optional): Push with --atomic. Defaults to False.
+        force_with_lease (bool, optional): Push with --force-with-lease. Defaults to False.
+        result (DeployResult, optional): Result to record the outcome in. Defaults to None.
         **kwargs: Additional arguments for doc-gen and other features
         
     Returns:
@@ -236,20 +319,28 @@ def _apply_multiple_best_practices(best_practice_ids, use_ai_flag, model, remote
     # Deploy only if all best practices were successfully applied
     if all_applies_successful and repos_results:
         last_repo = repos_results[-1]  # Use the last repo for deployment
-        deployed = deploy_best_practice(
-            best_practice_id=best_practice_ids[-1],  # Use the last best practice ID
+        # Deploy every applied best practice so all of their files are committed
+        deployed = deploy_best_practices(
+            best_practice_ids=best_practice_ids,
             repo_dir=last_repo.working_tree_dir,
             remote=remote,
             commit_message=commit_message,
-            branch=branch_name
+            branch=branch_name,
+            atomic=atomic,
+            force_with_lease=force_with_lease,
+            result=result
         )
         return deployed
     else:
         logging.error(LOG_DEPLOY_FAILED_MULTIPLE)
+        if result:
+            result.status = DEPLOY_STATUS_APPLY_FAILED
+            result.error = LOG_DEPLOY_FAILED_MULTIPLE
         return False
 
 def apply_and_deploy_best_practices(best_practice_ids, use_ai_flag, model, remote=None, commit_message=GIT_DEFAULT_COMMIT_MESSAGE,
-                                    repo_urls=None, existing_repo_dir=None, target_dir_to_clone_to=None, no_prompt=False, **kwargs):
+                                    repo_urls=None, existing_repo_dir=None, target_dir_to_clone_to=None, no_prompt=False,
+                                    atomic=False, force_with_lease=False, jobs=1, **kwargs):
     """
     Apply and deploy best practices to repositories.
 
@@ -263,104 +354,160 @@ def apply_and_deploy_best_practices(best_practice_ids, use_ai_flag, model, remot
         existing_repo_dir: Existing repository directory to apply to
         target_dir_to_clone_to: Directory to clone repositories to
         no_prompt: Skip user confirmation prompts for dependencies installation
+        atomic: Push with --atomic
+        force_with_lease: Push with --force-with-lease
+        jobs: Number of repositories to apply and deploy concurrently; repositories
+            processed concurrently never prompt, as if no_prompt were set
         **kwargs: Additional arguments for doc-gen and other features
+
+    Returns:
+        list: DeployResult for each repository
     """
     branch_name = generate_git_branch_name(best_practice_ids)
+    results = []
+
+    if not best_practice_ids:
+        logging.error(LOG_NO_BEST_PRACTICE_IDS)
+        return results
+
+    deploy_options = dict(
+        best_practice_ids=best_practice_ids,
+        use_ai_flag=use_ai_flag,
+        model=model,
+        remote=remote,
+        commit_message=commit_message,
+        target_dir_to_clone_to=target_dir_to_clone_to,
+        branch_name=branch_name,
+        no_prompt=no_prompt,
+        atomic=atomic,
+        force_with_lease=force_with_lease,
+        **kwargs
+    )
 
     if existing_repo_dir:
         # Apply to existing repo directory
+        result = DeployResult(repository=existing_repo_dir, branch=branch_name)
+        deploy_options['target_dir_to_clone_to'] = None
+        _apply_and_deploy_repository(result, existing_repo_dir=existing_repo_dir, **deploy_options)
+        results.append(result)
+
+    # Apply to repo URLs
+    elif repo_urls:
+        results = [DeployResult(repository=repo_url, branch=branch_name) for repo_url in repo_urls]
+        if jobs > 1 and len(repo_urls) > 1:
+            logging.debug(f"Deploying {len(repo_urls)} repositories with {jobs} jobs")
+            # Workers share one terminal, so confirmation prompts would interleave
+            worker_options = dict(deploy_options, no_prompt=True)
+
+            def deploy_in_worker(result):
+                with spinners_disabled():
+                    _apply_and_deploy_repository(result, repo_url=result.repository, **worker_options)
+
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="slim-deploy") as executor:
+                for future in [executor.submit(deploy_in_worker, result) for result in results]:
+                    future.result()
+        else:
+            for result in results:
+                _apply_and_deploy_repository(result, repo_url=result.repository, **deploy_options)
+
+    return results
+
+def _apply_and_deploy_repository(result, best_practice_ids, use_ai_flag, model, remote=None,
+                                 commit_message=GIT_DEFAULT_COMMIT_MESSAGE, repo_url=None, existing_repo_dir=None,
+                                 target_dir_to_clone_to=None, branch_name=None, no_prompt=False, **kwargs):
+    """
+    Apply and deploy best practices to one repository, recording the outcome.
+
+    Args:
+        result: DeployResult to record the outcome in
+        best_practice_ids: List of best practice IDs to apply and deploy
+        use_ai_flag: Whether to use AI to customize the best practices
+        model: AI model to use if use_ai_flag is True
+        remote: Remote repository to push to
+        commit_message: Commit message to use
+        repo_url: Repository URL to apply to
+        existing_repo_dir: Existing repository directory to apply to
+        target_dir_to_clone_to: Directory to clone repositories to
+        branch_name: Git branch to use
+        no_prompt: Skip user confirmation prompts for dependencies installation
+        **kwargs: Push options, and additional arguments for doc-gen and other features
+
+    Returns:
+        bool: True if the repository was applied and deployed successfully, False otherwise
+    """
+    start_time = time.time()
+    result.best_practice_ids = list(best_practice_ids)
+    try:
         if len(best_practice_ids) > 1:
+            if repo_url:
+                logging.debug(f"Using repository URL {repo_url} for group of best_practice_ids {best_practice_ids}")
+
+                if not target_dir_to_clone_to:  # Make a temporary directory
+                    parsed_url = urllib.parse.urlparse(repo_url)
+                    repo_name = os.path.basename(parsed_url.path)
+                    repo_name = repo_name[:-4] if repo_name.endswith('.git') else repo_name  # Remove '.git' from repo name if present
+                    target_dir_to_clone_to = create_repo_temp_dir(repo_name)
+                    logging.debug(f"Generating temporary clone directory for group of best_practice_ids at {target_dir_to_clone_to}")
+
             # For multiple best practices
-            _apply_multiple_best_practices(
+            return _apply_multiple_best_practices(
                 best_practice_ids=best_practice_ids,
                 use_ai_flag=use_ai_flag,
                 model=model,
                 remote=remote,
                 commit_message=commit_message,
+                repo_url=repo_url,
                 existing_repo_dir=existing_repo_dir,
+                target_dir_to_clone_to=target_dir_to_clone_to,
                 branch_name=branch_name,
                 no_prompt=no_prompt,
+                result=result,
                 **kwargs
             )
-        elif len(best_practice_ids) == 1:
-            # For a single best practice
-            apply_and_deploy_best_practice(
-                best_practice_id=best_practice_ids[0],
-                use_ai_flag=use_ai_flag,
-                model=model,
-                remote=remote,
-                commit_message=commit_message,
-                existing_repo_dir=existing_repo_dir,
-                branch=branch_name,
-                no_prompt=no_prompt,
-                **kwargs
-            )
-        else:
-            logging.error(LOG_NO_BEST_PRACTICE_IDS)
 
-    # Apply to repo URLs
-    elif repo_urls:
-        for repo_url in repo_urls:
-            if len(best_practice_ids) > 1:
-                if repo_url:
-                    logging.debug(f"Using repository URL {repo_url} for group of best_practice_ids {best_practice_ids}")
+        # For a single best practice
+        return apply_and_deploy_best_practice(
+            best_practice_id=best_practice_ids[0],
+            use_ai_flag=use_ai_flag,
+            model=model,
+            remote=remote,
+            commit_message=commit_message,
+            repo_url=repo_url,
+            existing_repo_dir=existing_repo_dir,
+            target_dir_to_clone_to=target_dir_to_clone_to,
+            branch=branch_name,
+            no_prompt=no_prompt,
+            result=result,
+            **kwargs
+        )
+    except Exception as e:
+        logging.error(f"Unexpected error deploying to {result.repository}: {str(e)}")
+        result.error = str(e)
+        return False
+    finally:
+        result.duration = time.time() - start_time
 
-                    parsed_url = urllib.parse.urlparse(repo_url)
-                    repo_name = os.path.basename(parsed_url.path)
-                    repo_name = repo_name[:-4] if repo_name.endswith('.git') else repo_name  # Remove '.git' from repo name if present
+def write_deploy_summary(results, summary_file):
+    """
+    Write a machine-readable summary of a deployment as JSON.
 
-                    if target_dir_to_clone_to:
-                        # Apply and deploy with specific target directory
-                        _apply_multiple_best_practices(
-                            best_practice_ids=best_practice_ids,
-                            use_ai_flag=use_ai_flag,
-                            model=model,
-                            remote=remote,
-                            commit_message=commit_message,
-                            repo_url=repo_url,
-                            target_dir_to_clone_to=target_dir_to_clone_to,
-                            branch_name=branch_name,
-                            no_prompt=no_prompt,
-                            **kwargs
-                        )
-
-                    else:  # Make a temporary directory
-                        repo_dir = create_repo_temp_dir(repo_name)
-                        logging.debug(f"Generating temporary clone directory for group of best_practice_ids at {repo_dir}")
-                        
-                        # Apply and deploy with temporary directory
-                        _apply_multiple_best_practices(
-                            best_practice_ids=best_practice_ids,
-                            use_ai_flag=use_ai_flag,
-                            model=model,
-                            remote=remote,
-                            commit_message=commit_message,
-                            repo_url=repo_url,
-                            target_dir_to_clone_to=repo_dir,
-                            branch_name=branch_name,
-                            no_prompt=no_prompt,
-                            **kwargs
-                        )
-
-            elif len(best_practice_ids) == 1:
-                # For a single best practice
-                apply_and_deploy_best_practice(
-                    best_practice_id=best_practice_ids[0],
-                    use_ai_flag=use_ai_flag,
-                    model=model,
-                    remote=remote,
-                    commit_message=commit_message,
-                    repo_url=repo_url,
-                    target_dir_to_clone_to=target_dir_to_clone_to,
-                    branch=branch_name,
-                    no_prompt=no_prompt,
-                    **kwargs
-                )
-            else:
-                logging.error(LOG_NO_BEST_PRACTICE_IDS)
+    Args:
+        results: DeployResult for each repository
+        summary_file: Path of the JSON file to write
+    """
+    pushed = [result for result in results if result.status == DEPLOY_STATUS_PUSHED]
+    summary = {
+        'repositories': [asdict(result) for result in results],
+        'pushed': len(pushed),
+        'failed': len(results) - len(pushed)
+    }
+    with open(summary_file, 'w') as f:
+        json.dump(summary, f, indent=2)
+        f.write('\n')
 
 def apply_and_deploy_best_practice(best_practice_id, use_ai_flag, model, remote=None, commit_message=GIT_DEFAULT_COMMIT_MESSAGE,
-                                   repo_url=None, existing_repo_dir=None, target_dir_to_clone_to=None, branch=None, no_prompt=False, **kwargs):
+                                   repo_url=None, existing_repo_dir=None, target_dir_to_clone_to=None, branch=None, no_prompt=False,
+                                   atomic=False, force_with_lease=False, result=None, **kwargs):
     """
     Apply and deploy a best practice to a repository.
 
@@ -375,6 +522,9 @@ def apply_and_deploy_best_practice(best_practice_id, use_ai_flag, model, remote=
         target_dir_to_clone_to: Directory to clone repository to
         branch: Git branch to use
         no_prompt: Skip user confirmation prompts for dependencies installation
+        atomic: Push with --atomic
+        force_with_lease: Push with --force-with-lease
+        result: DeployResult to record the outcome in
         **kwargs: Additional arguments for doc-gen and other features
 
     Returns:
@@ -384,12 +534,7 @@ def apply_and_deploy_best_practice(best_practice_id, use_ai_flag, model, remote=
     logging.debug(f"Applying and deploying best practice ID: {best_practice_id}")
 
     # Apply the best practice with simple spinner
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True
-    ) as progress:
+    with spinner_progress(console) as progress:
         task = progress.add_task(f"Applying {best_practice_id}...", total=None)
         
         git_repo = apply_best_practice(
@@ -408,25 +553,23 @@ def apply_and_deploy_best_practice(best_practice_id, use_ai_flag, model, remote=
     
     # Deploy the best practice if applied successfully
     if git_repo:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
+        with spinner_progress(console) as progress:
             task = progress.add_task(f"Deploying {best_practice_id}...", total=None)
             
-            result = deploy_best_practice(
+            deployed = deploy_best_practice(
                 best_practice_id=best_practice_id,
                 repo_dir=git_repo.working_tree_dir,
                 remote=remote,
                 commit_message=commit_message,
-                branch=branch
+                branch=branch,
+                atomic=atomic,
+                force_with_lease=force_with_lease,
+                result=result
             )
             
             progress.update(task, description=f"Completed deploying {best_practice_id}")
         
-        if result:
+        if deployed:
             logging.debug(LOG_SUCCESS_APPLY_DEPLOY.format(best_practice_id))
             
             # Print success message to user  
@@ -443,4 +586,7 @@ def apply_and_deploy_best_practice(best_practice_id, use_ai_flag, model, remote=
             return False
     else:
         logging.error(LOG_UNABLE_TO_APPLY_DEPLOY.format(best_practice_id))
+        if result:
+            result.status = DEPLOY_STATUS_APPLY_FAILED
+            result.error = LOG_APPLY_FAILED.format(best_practice_id)
         return False
\ No newline at end of file
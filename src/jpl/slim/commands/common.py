@@ -8,6 +8,7 @@ through LiteLLM integration.
 
 import logging
 import os
+from enum import Enum
 from typing import Dict, List, Any, Tuple
 
 # Constants
@@ -177,6 +178,12 @@ GIT_CUSTOM_REMOTE_NAME = 'slim-custom'
 GIT_DEFAULT_COMMIT_MESSAGE = 'SLIM-CLI Best Practices Bot Commit'
 
 
+class SecretsScanner(str, Enum):
+    """Scanners that can create the .secrets.baseline file for the secrets practices."""
+    detect_secrets = "detect-secrets"
+    builtin = "builtin"
+
+
 def is_documentation_practice(practice_id: str) -> bool:
     """
     Check if a practice ID is for documentation generation.
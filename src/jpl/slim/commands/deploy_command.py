@@ -8,23 +8,43 @@ which deploys best practices to repositories.
 import os
 import logging
 import time
+from dataclasses import dataclass, field
 from typing import List, Optional
 from pathlib import Path
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 import git
 
-from jpl.slim.utils.git_utils import generate_git_branch_name
+from jpl.slim.utils.cli_utils import spinner_progress
+from jpl.slim.utils.git_utils import generate_git_branch_name, DeployTransaction
+from jpl.slim.best_practices.practice_mapping import get_deploy_paths
 from jpl.slim.commands.common import (
     GIT_DEFAULT_REMOTE_NAME,
-    GIT_CUSTOM_REMOTE_NAME,
     GIT_DEFAULT_COMMIT_MESSAGE
 )
 from jpl.slim.app import app, state, handle_dry_run_for_command
 
 console = Console()
 
+# Deploy result statuses
+DEPLOY_STATUS_PUSHED = "pushed"
+DEPLOY_STATUS_APPLY_FAILED = "apply_failed"
+DEPLOY_STATUS_DEPLOY_FAILED = "deploy_failed"
+
+
+@dataclass
+class DeployResult:
+    """Outcome of deploying best practices to one repository, for machine-readable summaries."""
+    repository: str
+    branch: Optional[str]
+    best_practice_ids: List[str] = field(default_factory=list)
+    status: str = DEPLOY_STATUS_DEPLOY_FAILED
+    remote: Optional[str] = None
+    commits: List[str] = field(default_factory=list)
+    push_attempts: int = 0
+    error: Optional[str] = None
+    duration: float = 0.0
+
 @app.command()
 def deploy(
     best_practice_ids: List[str] = typer.Option(
@@ -50,6 +70,16 @@ def deploy(
         "--commit-message", "-m",
         help=f"Commit message to use for the deployment."
     ),
+    atomic: bool = typer.Option(
+        False,
+        "--atomic",
+        help="Push with --atomic so the remote accepts all ref updates or none"
+    ),
+    force_with_lease: bool = typer.Option(
+        False,
+        "--force-with-lease",
+        help="Push with --force-with-lease, refusing to overwrite remote changes made since the fetch"
+    ),
     dry_run: bool = typer.Option(
         False,
         "--dry-run", "-d",
@@ -83,6 +113,8 @@ def deploy(
             repo_dir=str(repo_dir) if repo_dir else None,
             remote=remote,
             commit_message=commit_message,
+            atomic=atomic,
+            force_with_lease=force_with_lease,
             dry_run=True
         ):
             return
@@ -97,7 +129,9 @@ def deploy(
             best_practice_ids=best_practice_ids,
             repo_dir=repo_dir_str,
             remote=remote,
-            commit_message=commit_message
+            commit_message=commit_message,
+            atomic=atomic,
+            force_with_lease=force_with_lease
         )
         if success:
             end_time = time.time()
@@ -109,49 +143,38 @@ def deploy(
         console.print(f"❌ [red]Error deploying best practices: {str(e)}[/red]")
         raise typer.Exit(1)
 
-def deploy_best_practices(best_practice_ids, repo_dir, remote=None, commit_message=GIT_DEFAULT_COMMIT_MESSAGE):
+def deploy_best_practices(best_practice_ids, repo_dir, remote=None, commit_message=GIT_DEFAULT_COMMIT_MESSAGE,
+                          branch=None, atomic=False, force_with_lease=False, result=None):
     """
     Deploy best practices to a repository.
 
+    All best practices are deployed in one transaction: the remote is fetched
+    once, the changes are committed and the branch is pushed once.
+
     Args:
         best_practice_ids: List of best practice IDs to deploy
         repo_dir: Repository directory to deploy to
         remote: Remote repository to push to
         commit_message: Commit message to use
+        branch: Git branch to use. Defaults to the shared branch name of the best practices
+        atomic: Push with --atomic
+        force_with_lease: Push with --force-with-lease
+        result: DeployResult to record the outcome in
     """
     logging.debug(f"deploy_best_practices called with: best_practice_ids={best_practice_ids}, repo_dir={repo_dir}")
     logging.debug(f"Remote: {remote}, commit_message: {commit_message}")
     
     # Use shared branch if multiple best_practice_ids else use default branch name
-    branch_name = generate_git_branch_name(best_practice_ids)
+    branch_name = branch if branch else generate_git_branch_name(best_practice_ids)
     logging.debug(f"Using branch name: {branch_name}")
 
-    success = True
-    for best_practice_id in best_practice_ids:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task(f"Deploying {best_practice_id}...", total=None)
-            
-            result = deploy_best_practice(
-                best_practice_id=best_practice_id,
-                repo_dir=repo_dir,
-                remote=remote,
-                commit_message=commit_message,
-                branch=branch_name
-            )
-            if not result:
-                success = False
-                break
-            
-            progress.update(task, description=f"Completed deployment of {best_practice_id}")
-    
-    return success
+    with spinner_progress(console) as progress:
+        progress.add_task(f"Deploying {', '.join(best_practice_ids)}...", total=None)
+        return _deploy_in_transaction(best_practice_ids, repo_dir, remote, commit_message, branch_name,
+                                      atomic=atomic, force_with_lease=force_with_lease, result=result)
 
-def deploy_best_practice(best_practice_id, repo_dir, remote=None, commit_message='Default commit message', branch=None):
+def deploy_best_practice(best_practice_id, repo_dir, remote=None, commit_message='Default commit message', branch=None,
+                         atomic=False, force_with_lease=False, result=None):
     """
     Deploy a best practice to a repository.
 
@@ -161,6 +184,9 @@ def deploy_best_practice(best_practice_id, repo_dir, remote=None, commit_message
         remote: Remote repository to push to
         commit_message: Commit message to use
         branch: Git branch to use
+        atomic: Push with --atomic
+        force_with_lease: Push with --force-with-lease
+        result: DeployResult to record the outcome in
 
     Returns:
         bool: True if deployment was successful, False otherwise
@@ -172,114 +198,88 @@ def deploy_best_practice(best_practice_id, repo_dir, remote=None, commit_message
     branch_name = branch if branch else best_practice_id
     logging.debug(f"Using branch name: {branch_name}")
 
-    try:
-        # Assuming repo_dir points to a local git repository directory
-        logging.debug(f"Opening git repository at: {repo_dir}")
-        repo = git.Repo(repo_dir)
+    return _deploy_in_transaction([best_practice_id], repo_dir, remote, commit_message, branch_name,
+                                  atomic=atomic, force_with_lease=force_with_lease, result=result)
 
-        # Checkout the branch or create it if it doesn't exist
-        try:
-            repo.git.checkout(branch_name)
-            logging.debug(f"Checked out to branch {branch_name}")
-        except git.exc.GitCommandError:
-            # Branch doesn't exist, create it
-            logging.debug(f"Branch {branch_name} doesn't exist, creating it")
-            repo.git.checkout('-b', branch_name)
-            logging.debug(f"Created and checked out branch {branch_name}")
-        
-        # Handle remote setup
-        if remote:
-            # Check if the remote name already exists in the repository
-            remote_exists = remote in [r.name for r in repo.remotes]
-            if remote_exists:
-                # Use the existing remote with the provided name
-                remote_name = remote
-                logging.debug(f"Using existing remote '{remote_name}'")
-            else:
-                # Assume remote is a valid Git URL - use it with the custom remote name
-                remote_name = GIT_CUSTOM_REMOTE_NAME
-                logging.debug(f"Creating new remote '{remote_name}' with URL '{remote}'")
-                
-                # Check if the custom remote name already exists
-                if remote_name in [r.name for r in repo.remotes]:
-                    # Update the existing remote's URL
-                    repo.git.remote('set-url', remote_name, remote)
-                    logging.debug(f"Updated URL for existing remote '{remote_name}'")
-                else:
-                    # Create a new remote
-                    repo.create_remote(remote_name, remote)
-                    logging.debug(f"Created new remote '{remote_name}'")
-            
-            # Fetch from the remote to ensure we have the latest
-            try:
-                repo.git.fetch(remote_name)
-                logging.debug(f"Fetched latest from remote '{remote_name}'")
-            except git.exc.GitCommandError as e:
-                logging.warning(f"Failed to fetch from remote '{remote_name}': {str(e)}")
-        else:
-            # Default to using the 'origin' remote
-            remote_name = GIT_DEFAULT_REMOTE_NAME
-            try:
-                repo.git.fetch(remote_name)
-                logging.debug(f"Fetched latest from remote '{remote_name}'")
-            except git.exc.GitCommandError as e:
-                logging.warning(f"Failed to fetch from remote '{remote_name}': {str(e)}")
-
-        # Check if the branch exists on the remote
-        try:
-            remote_refs = repo.git.ls_remote('--heads', remote_name, branch_name)
-            if remote_refs:
-                # Get the last commit on the remote branch
-                remote_commit = remote_refs.split()[0]
-                # Get the last commit on the local branch
-                local_commit = repo.heads[branch_name].commit.hexsha
+def _deploy_in_transaction(best_practice_ids, repo_dir, remote, commit_message, branch_name,
+                           atomic=False, force_with_lease=False, result=None):
+    """
+    Fetch, commit and push the changes of one or more best practices.
 
-                if remote_commit != local_commit:
-                    try:
-                        # Pull changes from the remote to make sure the local branch is up-to-date
-                        repo.git.pull(remote_name, branch_name, '--rebase=false')
-                        logging.debug(f"Pulled latest changes for branch {branch_name} from remote {remote_name}")
-                    except git.exc.GitCommandError as pull_error:
-                        logging.warning(f"Could not pull from remote '{remote_name}': {str(pull_error)}")
-                        logging.warning("Continuing with local changes only.")
-                else:
-                    logging.debug(f"Local branch {branch_name} is up-to-date with remote {remote_name}. No pull needed.")
-            else:
-                logging.debug(f"Branch {branch_name} does not exist on remote {remote_name}. No pull performed.")
-        except git.exc.GitCommandError as ls_error:
-            logging.warning(f"Failed to check if branch exists on remote: {str(ls_error)}")
-            logging.warning("Continuing with local changes only.")
+    Args:
+        best_practice_ids: Best practice IDs being deployed
+        repo_dir: Repository directory to deploy to
+        remote: Remote repository to push to
+        commit_message: Commit message to use
+        branch_name: Git branch to use
+        atomic: Push with --atomic
+        force_with_lease: Push with --force-with-lease
+        result: DeployResult to record the outcome in
 
-        # Add / Commit changes
-        repo.git.add(A=True)  # Adds all untracked files
-        logging.debug("Added all changes to git index.")
+    Returns:
+        bool: True if deployment was successful, False otherwise
+    """
+    if result is None:
+        result = DeployResult(repository=str(repo_dir), branch=branch_name)
+    result.branch = branch_name
+    result.best_practice_ids = list(best_practice_ids)
+    practices = ', '.join(best_practice_ids)
+    transaction = DeployTransaction(repo_dir, branch_name, remote=remote, atomic=atomic,
+                                    force_with_lease=force_with_lease)
+    try:
+        logging.debug(f"Opening git repository at: {repo_dir}")
+        transaction.begin()
 
-        repo.git.commit('-m', commit_message)
-        logging.debug("Committed changes.")
+        # The applied files of every best practice are already in the worktree,
+        # so they go into one combined commit
+        result.remote = transaction.remote_name
+        if not transaction.commit(commit_message, paths=_known_deploy_paths(best_practice_ids)):
+            result.error = "Nothing to commit"
+            logging.error(f"Nothing to commit for best practice id(s) '{practices}' in {repo_dir}")
+            return False
+        result.commits = list(transaction.commits)
 
-        # Push changes to the remote
         try:
-            repo.git.push(remote_name, branch_name)
-            logging.debug(f"Pushed changes to remote {remote_name} on branch {branch_name}")
-            logging.debug(f"Deployed best practice id '{best_practice_id}' to remote '{remote_name}' on branch '{branch_name}'")
-            
-            # Print success message to user
-            console.print(f"✅ Successfully deployed best practice '{best_practice_id}' to repository")
-            console.print(f"   📁 Repository: {repo.working_dir}")
-            console.print(f"   🌿 Branch: {branch_name}")
-            console.print(f"   💬 Commit: {commit_message}")
-            console.print(f"   🚀 Deployed to: {remote_name}")
-            
+            transaction.push()
         except git.exc.GitCommandError as push_error:
-            logging.error(f"Failed to push to remote '{remote_name}': {str(push_error)}")
+            logging.error(f"Failed to push to remote '{transaction.remote_name}': {str(push_error)}")
             raise  # Re-raise to be caught by the outer exception handler
+        finally:
+            result.push_attempts = transaction.push_attempts
 
+        logging.debug(f"Deployed best practice id(s) '{practices}' to remote '{transaction.remote_name}' on branch '{branch_name}'")
+
+        # Print success message to user
+        label = "best practice" if len(best_practice_ids) == 1 else "best practices"
+        console.print(f"✅ Successfully deployed {label} '{practices}' to repository")
+        console.print(f"   📁 Repository: {transaction.repo.working_dir}")
+        console.print(f"   🌿 Branch: {branch_name}")
+        console.print(f"   💬 Commit: {commit_message}")
+        console.print(f"   🚀 Deployed to: {transaction.remote_name}")
+        result.status = DEPLOY_STATUS_PUSHED
         return True
-    except git.exc.GitCommandError as e:
-        # Initialize remote_name to a default value if it's not defined yet
-        if 'remote_name' not in locals():
-            remote_name = remote or GIT_DEFAULT_REMOTE_NAME
-        logging.error(f"Unable to deploy best practice id '{best_practice_id}' to remote '{remote_name}' on branch '{branch_name}'")
+    except (git.exc.GitCommandError, git.exc.HookExecutionError) as e:
+        result.error = str(e).strip()
+        logging.error(f"Unable to deploy best practice id(s) '{practices}' to remote '{transaction.remote_name}' on branch '{branch_name}'")
         logging.error(f"Git command failed: {str(e)}")
-        logging.error(f"An error occurred: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+def _known_deploy_paths(best_practice_ids):
+    """
+    Get the files written by the given best practices.
+
+    Args:
+        best_practice_ids: Best practice IDs being deployed
+
+    Returns:
+        list: Repository-relative paths to commit, or None if any practice's
+            files are unknown and all changes have to be committed
+    """
+    paths = []
+    for best_practice_id in best_practice_ids:
+        practice_paths = get_deploy_paths(best_practice_id)
+        if practice_paths is None:
+            logging.debug(f"Files of best practice '{best_practice_id}' are not known; committing all changes")
+            return None
+        paths.extend(path for path in practice_paths if path not in paths)
+    return paths
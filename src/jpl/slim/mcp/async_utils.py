@@ -0,0 +1,144 @@
+"""
+Helpers for asynchronous MCP tool handlers.
+
+SLIM's operations (cloning, applying, scanning, HTTP fetches) are blocking.
+MCP tools await them through a shared thread pool so the server's event loop
+keeps serving other requests, send periodic progress notifications while they
+run, and return as soon as the client cancels a call.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+# Blocking tool calls that may run at the same time
+DEFAULT_TOOL_WORKERS = 8
+TOOL_WORKERS_ENV = 'SLIM_MCP_TOOL_WORKERS'
+# Seconds between progress notifications for long-running calls
+PROGRESS_INTERVAL = 5.0
+HTTP_TIMEOUT = 30.0
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by the MCP tools, creating it on first use."""
+    global _executor
+    if _executor is None:
+        try:
+            workers = int(os.environ.get(TOOL_WORKERS_ENV, DEFAULT_TOOL_WORKERS))
+        except ValueError:
+            workers = DEFAULT_TOOL_WORKERS
+        _executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="slim-mcp-tool")
+    return _executor
+
+
+async def notify(ctx: Any, message: str, progress: Optional[float] = None, total: Optional[float] = None) -> None:
+    """
+    Send a log message and optionally a progress notification to the MCP client.
+
+    Works with sync and async Context implementations and with no context at all;
+    notification failures are logged and never fail the tool call.
+
+    Args:
+        ctx: FastMCP Context, or None
+        message: Message to log to the client
+        progress: Progress so far, if a progress notification should be sent
+        total: Total progress, if known
+    """
+    if ctx is None:
+        return
+    try:
+        result = ctx.info(message)
+        if inspect.isawaitable(result):
+            await result
+        if progress is not None and hasattr(ctx, 'report_progress'):
+            result = ctx.report_progress(progress, total)
+            if inspect.isawaitable(result):
+                await result
+    except Exception as e:
+        logger.debug(f"Could not notify MCP client: {e}")
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, ctx: Any = None, description: Optional[str] = None,
+                       **kwargs: Any) -> Any:
+    """
+    Run a blocking function in the shared thread pool and await its result.
+
+    With a context, a progress notification with the elapsed seconds is sent
+    every PROGRESS_INTERVAL until the function returns. If the awaiting task is
+    cancelled, the call returns immediately; a function that has not started
+    yet is not run, and one that has started finishes in the background.
+
+    Args:
+        func: Blocking function to run
+        *args: Positional arguments for func
+        ctx: FastMCP Context for progress notifications, or None
+        description: What is running, for progress messages; defaults to the function name
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The function's return value
+
+    Raises:
+        asyncio.CancelledError: If the call was cancelled
+        Exception: Whatever func raised
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+    description = description or getattr(func, '__name__', 'operation')
+    started = time.monotonic()
+    try:
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=PROGRESS_INTERVAL if ctx is not None else None)
+            if done:
+                return future.result()
+            elapsed = time.monotonic() - started
+            await notify(ctx, f"{description} still running ({elapsed:.0f}s)", progress=elapsed)
+    except asyncio.CancelledError:
+        # Drops the call if it is still queued; a running thread cannot be interrupted
+        future.cancel()
+        logger.info(f"{description} cancelled by the client")
+        raise
+
+
+async def fetch_text(url: str, timeout: float = HTTP_TIMEOUT) -> str:
+    """
+    Fetch a URL without blocking the event loop.
+
+    Uses httpx when it is installed (it ships with the MCP SDK), otherwise
+    requests in the shared thread pool.
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+
+    Returns:
+        The response body as text
+
+    Raises:
+        Exception: If the request fails or returns an error status
+    """
+    try:
+        import httpx
+    except ImportError:
+        return await run_blocking(_fetch_text_blocking, url, timeout)
+
+    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.text
+
+
+def _fetch_text_blocking(url: str, timeout: float) -> str:
+    import requests
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
@@ -0,0 +1,521 @@
+"""
+Background jobs for long-running MCP operations.
+
+Applying or deploying best practices across several repositories can take
+longer than an MCP client waits for a tool call. Such operations are submitted
+as jobs instead: submitting returns a job id at once, and the client polls the
+job's status and log tail until it finishes. Jobs run on a bounded pool of
+worker threads that takes queued jobs from each client in turn, so one client
+queueing many jobs cannot starve the others. Jobs, results and logs are kept in
+a SQLite database under SLIM's user cache, so they can be inspected from any
+server process and survive restarts.
+
+Cancelling a queued job removes it from the queue. A running job is stopped at
+its next cancellation checkpoint (see raise_if_cancelled()); work already done
+is not rolled back.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from jpl.slim.utils.file_utils import user_cache_dir
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED, JOB_CANCELLED)
+
+# Jobs that may run at the same time
+DEFAULT_JOB_WORKERS = 2
+JOB_WORKERS_ENV = 'SLIM_MCP_JOB_WORKERS'
+JOBS_DB_FILE = 'jobs.sqlite3'
+# Finished jobs and their logs are deleted after this many seconds
+JOB_RETENTION = 7 * 24 * 3600
+DEFAULT_LOG_TAIL = 50
+DEFAULT_CLIENT = 'default'
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    pid INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_logs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    line TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_logs_job ON job_logs (job_id, seq);
+"""
+
+# The job run by the current worker thread
+_current = threading.local()
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job when it was cancelled."""
+
+
+@dataclass
+class Job:
+    """A submitted operation and its outcome."""
+    id: str
+    kind: str
+    client_id: str
+    params: Dict[str, Any]
+    status: str
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    cancel_requested: bool
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the job in the MCP tools' response layout, with ISO timestamps."""
+        data = asdict(self)
+        for key in ('created_at', 'started_at', 'finished_at'):
+            if data[key] is not None:
+                data[key] = datetime.fromtimestamp(data[key], timezone.utc).isoformat()
+        return data
+
+
+class JobStore:
+    """
+    SQLite storage for jobs and their logs.
+
+    One connection is shared by all threads of a process and serialized with a
+    lock; several server processes may use the same database file.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open the store, creating the database if needed.
+
+        Args:
+            path: Database file; defaults to jobs.sqlite3 in SLIM's MCP cache directory
+        """
+        self.path = Path(path) if path else user_cache_dir('mcp') / JOBS_DB_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def create(self, kind: str, params: Dict[str, Any], client_id: str = DEFAULT_CLIENT) -> Job:
+        """
+        Record a new queued job.
+
+        Args:
+            kind: Name of the handler that runs the job
+            params: Keyword arguments for the handler; must be JSON serializable
+            client_id: Client that submitted the job
+
+        Returns:
+            Job: The queued job
+        """
+        job_id = uuid.uuid4().hex
+        self._execute(
+            "INSERT INTO jobs (id, kind, client_id, params, status, pid, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, kind, client_id, json.dumps(params), JOB_QUEUED, os.getpid(), time.time())
+        )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id, or None if it does not exist."""
+        rows = self._query("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return _job_from_row(rows[0]) if rows else None
+
+    def list(self, status: Optional[str] = None, limit: int = 20) -> List[Job]:
+        """
+        List jobs, newest first.
+
+        Args:
+            status: Only list jobs in this state
+            limit: Maximum number of jobs
+
+        Returns:
+            List[Job]: The jobs
+        """
+        if status:
+            rows = self._query("SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?", (status, limit))
+        else:
+            rows = self._query("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))
+        return [_job_from_row(row) for row in rows]
+
+    def claim(self, job_id: str) -> bool:
+        """
+        Move a queued job to running.
+
+        Returns:
+            bool: False if the job is no longer queued, e.g. because it was cancelled
+        """
+        return self._execute(
+            "UPDATE jobs SET status = ?, started_at = ?, pid = ? WHERE id = ? AND status = ?",
+            (JOB_RUNNING, time.time(), os.getpid(), job_id, JOB_QUEUED)
+        ) > 0
+
+    def finish(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+               error: Optional[str] = None) -> None:
+        """Record the outcome of a job."""
+        self._execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+            (status, json.dumps(result, default=str) if result is not None else None, error, time.time(), job_id)
+        )
+
+    def request_cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a queued job, or flag a running job to stop at its next checkpoint.
+
+        Returns:
+            Job: The job after the request, or None if it does not exist
+        """
+        self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, cancel_requested = 1 WHERE id = ? AND status = ?",
+            (JOB_CANCELLED, time.time(), job_id, JOB_QUEUED)
+        )
+        self._execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?", (job_id, JOB_RUNNING))
+        return self.get(job_id)
+
+    def cancel_requested(self, job_id: str) -> bool:
+        """Check whether a job was asked to stop."""
+        rows = self._query("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,))
+        return bool(rows and rows[0]['cancel_requested'])
+
+    def append_log(self, job_id: str, line: str) -> None:
+        """Append a line to a job's log."""
+        self._execute("INSERT INTO job_logs (job_id, line) VALUES (?, ?)", (job_id, line))
+
+    def log_tail(self, job_id: str, lines: int = DEFAULT_LOG_TAIL) -> List[str]:
+        """Get the last lines of a job's log, oldest first."""
+        rows = self._query("SELECT line FROM job_logs WHERE job_id = ? ORDER BY seq DESC LIMIT ?", (job_id, lines))
+        return [row['line'] for row in reversed(rows)]
+
+    def recover_interrupted(self) -> int:
+        """
+        Fail jobs left queued or running by server processes that no longer exist.
+
+        Returns:
+            int: Number of jobs marked failed
+        """
+        rows = self._query("SELECT id, pid FROM jobs WHERE status IN (?, ?)", (JOB_QUEUED, JOB_RUNNING))
+        interrupted = [row['id'] for row in rows if row['pid'] != os.getpid() and not _pid_alive(row['pid'])]
+        for job_id in interrupted:
+            self.finish(job_id, JOB_FAILED, error="The server stopped before the job finished")
+        return len(interrupted)
+
+    def prune(self, older_than: float = JOB_RETENTION) -> int:
+        """
+        Delete finished jobs and their logs.
+
+        Args:
+            older_than: Age in seconds of the finished jobs to delete
+
+        Returns:
+            int: Number of jobs deleted
+        """
+        cutoff = time.time() - older_than
+        placeholders = ', '.join('?' * len(FINISHED_STATES))
+        self._execute(
+            f"DELETE FROM job_logs WHERE job_id IN "
+            f"(SELECT id FROM jobs WHERE status IN ({placeholders}) AND finished_at < ?)",
+            (*FINISHED_STATES, cutoff)
+        )
+        return self._execute(
+            f"DELETE FROM jobs WHERE status IN ({placeholders}) AND finished_at < ?", (*FINISHED_STATES, cutoff)
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+class JobQueue:
+    """
+    Runs submitted jobs on a bounded pool of worker threads.
+
+    Each client has its own queue and workers take jobs from the clients in
+    turn. Log records emitted by a worker thread while it runs a job are
+    stored as the job's log.
+    """
+
+    def __init__(self, handlers: Dict[str, Callable[..., Dict[str, Any]]], store_path: Optional[Path] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize the queue; the store is opened and workers are started on first use.
+
+        Args:
+            handlers: Functions that run jobs, by job kind; they take the job's
+                params as keyword arguments and return a result dictionary whose
+                'success' key decides whether the job succeeded
+            store_path: Database file; defaults to the store's default location
+            max_workers: Jobs that may run at the same time; defaults to
+                $SLIM_MCP_JOB_WORKERS or DEFAULT_JOB_WORKERS
+        """
+        self.handlers = handlers
+        self.store_path = store_path
+        self.max_workers = max(1, max_workers if max_workers is not None else _workers_from_environment())
+        self._store: Optional[JobStore] = None
+        self._pending: 'OrderedDict[str, Deque[str]]' = OrderedDict()
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._log_handler: Optional[logging.Handler] = None
+        self._stopping = False
+
+    @property
+    def store(self) -> JobStore:
+        """The job store, opened on first use."""
+        with self._condition:
+            if self._store is None:
+                self._store = JobStore(self.store_path)
+                recovered = self._store.recover_interrupted()
+                if recovered:
+                    logger.warning(f"Marked {recovered} interrupted job(s) as failed")
+                self._store.prune()
+            return self._store
+
+    def submit(self, kind: str, params: Dict[str, Any], client_id: Optional[str] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Job kind; must be one of the queue's handlers
+            params: Keyword arguments for the handler
+            client_id: Client submitting the job, for fair scheduling
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            ValueError: If there is no handler for the kind
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job = self.store.create(kind, params, client_id or DEFAULT_CLIENT)
+        with self._condition:
+            self._start()
+            self._pending.setdefault(job.client_id, deque()).append(job.id)
+            self._condition.notify()
+        logger.info(f"Queued {kind} job {job.id}")
+        return job
+
+    def status(self, job_id: str, log_lines: int = DEFAULT_LOG_TAIL) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's state, result and the tail of its log.
+
+        Args:
+            job_id: Job id
+            log_lines: Number of log lines to include
+
+        Returns:
+            Dict: The job with a 'log_tail' list, or None if it does not exist
+        """
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        data = job.to_dict()
+        data['log_tail'] = self.store.log_tail(job_id, log_lines) if log_lines > 0 else []
+        return data
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job.
+
+        A queued job is cancelled at once; a running job stops at its next
+        cancellation checkpoint. Finished jobs are left unchanged.
+
+        Returns:
+            Job: The job after the request, or None if it does not exist
+        """
+        job = self.store.request_cancel(job_id)
+        if job is not None and job.status == JOB_CANCELLED:
+            with self._condition:
+                for client_id, job_ids in self._pending.items():
+                    if job_id in job_ids:
+                        job_ids.remove(job_id)
+                        if not job_ids:
+                            del self._pending[client_id]
+                        break
+        return job
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 20) -> List[Job]:
+        """List jobs, newest first; see JobStore.list()."""
+        return self.store.list(status, limit)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers after their current jobs; jobs still queued stay queued in the store."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            workers, self._workers = self._workers, []
+        if wait:
+            for worker in workers:
+                worker.join()
+        if self._log_handler:
+            logging.getLogger().removeHandler(self._log_handler)
+            self._log_handler = None
+        with self._condition:
+            self._stopping = False
+            self._pending.clear()
+
+    def _start(self) -> None:
+        """Start the workers and log capture; the caller holds the condition."""
+        if self._workers:
+            return
+        self._log_handler = _JobLogHandler()
+        logging.getLogger().addHandler(self._log_handler)
+        for index in range(self.max_workers):
+            worker = threading.Thread(target=self._work, name=f"slim-mcp-job-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _next_job(self) -> Optional[str]:
+        """Take the next job id, rotating between clients; None when shutting down."""
+        with self._condition:
+            while not self._pending and not self._stopping:
+                self._condition.wait()
+            if self._stopping:
+                return None
+            client_id, job_ids = next(iter(self._pending.items()))
+            job_id = job_ids.popleft()
+            # Move the client to the back so every other client gets a turn first
+            del self._pending[client_id]
+            if job_ids:
+                self._pending[client_id] = job_ids
+            return job_id
+
+    def _work(self) -> None:
+        while True:
+            job_id = self._next_job()
+            if job_id is None:
+                return
+            if self.store.claim(job_id):
+                self._run(self.store.get(job_id))
+
+    def _run(self, job: Job) -> None:
+        _current.job_id = job.id
+        _current.store = self.store
+        try:
+            logger.info(f"Started {job.kind} job {job.id}")
+            result = self.handlers[job.kind](**job.params)
+            if isinstance(result, dict) and not result.get('success', True):
+                self.store.finish(job.id, JOB_FAILED, result=result, error=result.get('error'))
+            else:
+                self.store.finish(job.id, JOB_SUCCEEDED, result=result)
+            logger.info(f"Finished {job.kind} job {job.id}")
+        except JobCancelled:
+            logger.info(f"Cancelled {job.kind} job {job.id}")
+            self.store.finish(job.id, JOB_CANCELLED, error="Cancelled by request")
+        except Exception as e:
+            logger.error(f"{job.kind} job {job.id} failed: {e}")
+            self.store.finish(job.id, JOB_FAILED, error=str(e))
+        finally:
+            _current.job_id = None
+            _current.store = None
+
+
+def raise_if_cancelled() -> None:
+    """
+    Cancellation checkpoint for code that may run as a job.
+
+    Does nothing outside a job.
+
+    Raises:
+        JobCancelled: If the job running in this thread was cancelled
+    """
+    job_id = getattr(_current, 'job_id', None)
+    if job_id and _current.store.cancel_requested(job_id):
+        raise JobCancelled(f"Job {job_id} was cancelled")
+
+
+class _JobLogHandler(logging.Handler):
+    """Stores log records emitted by a job's worker thread in the job's log."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        job_id = getattr(_current, 'job_id', None)
+        if not job_id:
+            return
+        try:
+            _current.store.append_log(job_id, self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def _job_from_row(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row['id'],
+        kind=row['kind'],
+        client_id=row['client_id'],
+        params=json.loads(row['params']),
+        status=row['status'],
+        result=json.loads(row['result']) if row['result'] else None,
+        error=row['error'],
+        cancel_requested=bool(row['cancel_requested']),
+        created_at=row['created_at'],
+        started_at=row['started_at'],
+        finished_at=row['finished_at']
+    )
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists."""
+    if os.name == 'nt':
+        # os.kill cannot probe processes on Windows; assume the owner is alive
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _workers_from_environment() -> int:
+    value = os.environ.get(JOB_WORKERS_ENV)
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {JOB_WORKERS_ENV}={value!r}")
+    return DEFAULT_JOB_WORKERS
@@ -0,0 +1,269 @@
+"""
+In-memory store of the SLIM registry for the MCP server.
+
+The registry is fetched once and kept as an immutable snapshot with prebuilt
+indexes by practice id, asset alias, normalized title and category, so tool
+calls look practices up in constant time. Snapshots expire after a TTL and are
+refreshed in the background; readers keep using the current snapshot until the
+new one is swapped in, and a failed refresh keeps the old one.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Seconds a registry snapshot is served before it is refreshed
+DEFAULT_REGISTRY_TTL = 900.0
+REGISTRY_TTL_ENV = 'SLIM_REGISTRY_TTL'
+
+logger = logging.getLogger(__name__)
+
+
+def practice_id_from_title(title: str) -> str:
+    """Derive the MCP practice id from a registry title, e.g. 'Secrets Detection' -> 'secrets-detection'."""
+    return title.lower().replace(" ", "-").replace(".md", "").replace("_", "-")
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title or id for case-insensitive lookups."""
+    return title.strip().lower().replace(".md", "")
+
+
+def process_practice(practice: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a raw registry entry to the practice record the MCP tools return.
+
+    Args:
+        practice: Entry from the SLIM registry
+
+    Returns:
+        Practice record with id, title, description, category, uri, tags and assets
+    """
+    return {
+        "id": practice_id_from_title(practice.get("title", "")),
+        "title": practice.get("title", ""),
+        "description": practice.get("description", ""),
+        "category": practice.get("category", "unknown"),
+        "uri": practice.get("uri", ""),
+        "tags": practice.get("tags", []),
+        "assets": [
+            {
+                "name": asset.get("name", ""),
+                "alias": asset.get("alias", ""),
+                "uri": asset.get("uri", ""),
+                "description": asset.get("description", "")
+            }
+            for asset in practice.get("assets") or []
+        ]
+    }
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """An immutable, indexed view of the registry at one point in time."""
+    practices: List[Dict[str, Any]] = field(default_factory=list)
+    registry_dict: Dict[str, Any] = field(default_factory=dict)
+    by_id: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    by_title: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    by_alias: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = field(default_factory=dict)
+    by_category: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+    assets_by_practice: Dict[str, Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+    fetched_at: float = 0.0
+
+    @classmethod
+    def build(cls, practices: List[Dict[str, Any]], registry_dict: Dict[str, Any],
+              fetched_at: Optional[float] = None) -> 'RegistrySnapshot':
+        """
+        Build a snapshot and its indexes from processed practices.
+
+        Args:
+            practices: Practice records from process_practice()
+            registry_dict: Registry dictionary keyed by asset alias
+            fetched_at: Monotonic time of the fetch; defaults to now
+
+        Returns:
+            RegistrySnapshot: The indexed snapshot
+        """
+        by_id, by_title, by_alias, by_category, assets_by_practice = {}, {}, {}, {}, {}
+        for practice in practices:
+            # setdefault keeps the first match, like the linear scans this replaces
+            by_id.setdefault(practice["id"], practice)
+            by_title.setdefault(normalize_title(practice["title"]), practice)
+            by_category.setdefault(practice["category"], []).append(practice)
+            assets = assets_by_practice.setdefault(practice["id"], {})
+            for asset in practice["assets"]:
+                if asset.get("alias"):
+                    by_alias.setdefault(asset["alias"], (practice, asset))
+                    assets.setdefault(asset["alias"], asset)
+        return cls(practices, registry_dict, by_id, by_title, by_alias, by_category, assets_by_practice,
+                   time.monotonic() if fetched_at is None else fetched_at)
+
+    def find_practice(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a practice by id, title or asset alias.
+
+        Args:
+            key: Practice id (e.g. 'secrets-detection'), title, or asset alias (e.g. 'secrets-github')
+
+        Returns:
+            The practice record, or None if not found
+        """
+        if not key:
+            return None
+        practice = self.by_id.get(key) or self.by_title.get(normalize_title(key))
+        if practice is None and key in self.by_alias:
+            practice = self.by_alias[key][0]
+        return practice
+
+    def find_asset(self, alias: str, practice: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find an asset by alias.
+
+        Args:
+            alias: Asset alias
+            practice: Only look among this practice's assets
+
+        Returns:
+            The asset record, or None if not found
+        """
+        if practice is not None:
+            return self.assets_by_practice.get(practice["id"], {}).get(alias)
+        found = self.by_alias.get(alias)
+        return found[1] if found else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the practices and registry dictionary in the MCP tools' response layout."""
+        return {"practices": self.practices, "registry_dict": self.registry_dict}
+
+
+class RegistryStore:
+    """
+    Serves registry snapshots, refreshing them in the background after a TTL.
+    """
+
+    def __init__(self, fetch: Callable[[], List[Dict[str, Any]]],
+                 build_registry_dict: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+                 ttl: Optional[float] = None):
+        """
+        Initialize the store.
+
+        Args:
+            fetch: Returns the raw registry entries; an empty list means the fetch failed
+            build_registry_dict: Builds the alias-keyed registry dictionary from raw entries
+            ttl: Seconds a snapshot is served before it is refreshed; defaults to
+                $SLIM_REGISTRY_TTL or DEFAULT_REGISTRY_TTL
+        """
+        self.fetch = fetch
+        self.build_registry_dict = build_registry_dict
+        self.ttl = ttl if ttl is not None else _ttl_from_environment()
+        self._snapshot: Optional[RegistrySnapshot] = None
+        # Held while fetching, so at most one fetch runs at a time
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def snapshot(self) -> RegistrySnapshot:
+        """
+        Get the current snapshot.
+
+        The first call fetches the registry. Later calls never wait for the
+        network: a stale snapshot is returned while a background refresh runs.
+
+        Returns:
+            RegistrySnapshot: The current snapshot; empty if the registry was never fetched
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._refresh_lock:
+                if self._snapshot is None:
+                    self._refresh()
+                snapshot = self._snapshot
+            return snapshot or RegistrySnapshot()
+
+        if self._is_stale(snapshot) and self._refresh_lock.acquire(blocking=False):
+            threading.Thread(target=self._refresh_in_background, name="slim-registry-refresh-once",
+                             daemon=True).start()
+        return snapshot
+
+    def refresh(self) -> bool:
+        """
+        Fetch the registry and swap in a new snapshot.
+
+        Returns:
+            bool: True if the snapshot was replaced, False if the fetch failed and the old one was kept
+        """
+        with self._refresh_lock:
+            return self._refresh()
+
+    def start(self) -> None:
+        """Start a daemon thread that refreshes the registry every TTL, ahead of tool calls."""
+        if self._refresher and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="slim-registry-refresh", daemon=True)
+        self._refresher.start()
+
+    def stop(self) -> None:
+        """Stop the refresh thread."""
+        self._stop.set()
+        if self._refresher:
+            self._refresher.join()
+            self._refresher = None
+
+    def _is_stale(self, snapshot: RegistrySnapshot) -> bool:
+        return time.monotonic() - snapshot.fetched_at >= self.ttl
+
+    def _refresh(self) -> bool:
+        """Fetch and swap in a new snapshot; the caller holds the refresh lock."""
+        try:
+            raw_practices = self.fetch()
+            if not raw_practices:
+                logger.error("No practices fetched from registry")
+                return False
+            snapshot = RegistrySnapshot.build([process_practice(practice) for practice in raw_practices],
+                                              self.build_registry_dict(raw_practices))
+        except Exception as e:
+            logger.error(f"Failed to fetch registry data: {e}")
+            return False
+
+        # Assigning the reference is atomic; readers see the old or the new snapshot, never a mix
+        self._snapshot = snapshot
+        logger.info(f"Loaded {len(snapshot.practices)} practices and {len(snapshot.registry_dict)} assets from registry")
+        return True
+
+    def _refresh_or_extend(self) -> None:
+        """Refresh; if that fails, keep serving the old snapshot for another TTL instead of retrying on every call."""
+        if not self._refresh() and self._snapshot is not None:
+            self._snapshot = replace(self._snapshot, fetched_at=time.monotonic())
+
+    def _refresh_in_background(self) -> None:
+        """Refresh from a one-off thread; the refresh lock was acquired by snapshot()."""
+        try:
+            self._refresh_or_extend()
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            snapshot = self._snapshot
+            if snapshot is None or self._is_stale(snapshot):
+                with self._refresh_lock:
+                    # A tool call may have refreshed while this thread waited for the lock
+                    if self._snapshot is snapshot:
+                        self._refresh_or_extend()
+                snapshot = self._snapshot
+            wait = self.ttl - (time.monotonic() - snapshot.fetched_at) if snapshot else self.ttl
+            self._stop.wait(max(wait, 1.0))
+
+
+def _ttl_from_environment() -> float:
+    value = os.environ.get(REGISTRY_TTL_ENV)
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            logger.warning(f"Ignoring invalid {REGISTRY_TTL_ENV}={value!r}")
+    return DEFAULT_REGISTRY_TTL
@@ -58,7 +58,7 @@ logger.info(f"Server script path: {__file__}")
 
 # Try to import FastMCP
 try:
-    from fastmcp import FastMCP
+    from fastmcp import FastMCP, Context
     logger.info("FastMCP imported successfully")
 except ImportError as e:
     logger.info(f"FastMCP not available: {e}")
@@ -79,7 +79,7 @@ except ImportError as e:
             import importlib
             importlib.invalidate_caches()
             
-            from fastmcp import FastMCP
+            from fastmcp import FastMCP, Context
             logger.info("FastMCP installed and imported successfully")
             installed = True
             break
@@ -114,6 +114,8 @@ except ImportError as e:
 try:
     from jpl.slim.utils.io_utils import fetch_best_practices, create_slim_registry_dictionary
     from jpl.slim.commands.common import SLIM_REGISTRY_URI
+    from jpl.slim.mcp.registry_store import RegistryStore
+    from jpl.slim.mcp.async_utils import fetch_text, notify, run_blocking
     logger.info("SLIM CLI modules imported successfully")
 except ImportError as e:
     logger.error(f"SLIM CLI import failed: {e}")
@@ -124,76 +126,24 @@ except ImportError as e:
 # Create MCP server
 mcp = FastMCP("SLIM-CLI")
 
-# Cache for registry data
-_registry_cache = None
+# Registry snapshots, refreshed in the background so long-running sessions see registry updates
+registry_store = RegistryStore(
+    fetch=lambda: fetch_best_practices(SLIM_REGISTRY_URI),
+    build_registry_dict=create_slim_registry_dictionary
+)
 
 def get_live_registry_data():
-    """Fetch and process live SLIM registry data with caching."""
-    global _registry_cache
-    
-    if _registry_cache is not None:
-        return _registry_cache
-    
-    try:
-        logger.info(f"Fetching SLIM registry from: {SLIM_REGISTRY_URI}")
-        raw_practices = fetch_best_practices(SLIM_REGISTRY_URI)
-        
-        if not raw_practices:
-            logger.error("No practices fetched from registry")
-            return {"practices": [], "registry_dict": {}}
-        
-        logger.info(f"Fetched {len(raw_practices)} practices from registry")
-        
-        # Create registry dictionary for asset mapping
-        registry_dict = create_slim_registry_dictionary(raw_practices)
-        logger.info(f"Created registry dictionary with {len(registry_dict)} assets")
-        
-        # Process practices to extract relevant information
-        processed_practices = []
-        for practice in raw_practices:
-            practice_data = {
-                "id": practice.get("title", "").lower().replace(" ", "-").replace(".md", "").replace("_", "-"),
-                "title": practice.get("title", ""),
-                "description": practice.get("description", ""),
-                "category": practice.get("category", "unknown"),
-                "uri": practice.get("uri", ""),
-                "tags": practice.get("tags", []),
-                "assets": []
-            }
-            
-            # Add asset information
-            if "assets" in practice and practice["assets"]:
-                for asset in practice["assets"]:
-                    asset_data = {
-                        "name": asset.get("name", ""),
-                        "alias": asset.get("alias", ""),
-                        "uri": asset.get("uri", ""),
-                        "description": asset.get("description", "")
-                    }
-                    practice_data["assets"].append(asset_data)
-            
-            processed_practices.append(practice_data)
-        
-        _registry_cache = {
-            "practices": processed_practices,
-            "registry_dict": registry_dict
-        }
-        
-        return _registry_cache
-        
-    except Exception as e:
-        logger.error(f"Failed to fetch registry data: {e}")
-        # Return empty data on failure
-        return {"practices": [], "registry_dict": {}}
+    """Get the current SLIM registry practices and registry dictionary."""
+    return registry_store.snapshot().to_dict()
 
 @mcp.tool()
-def slim_list_all_practices():
+async def slim_list_all_practices():
     """
     SLIM: List ALL available SLIM best practices.
     Use when user mentions 'slim', 'list slim', 'show slim practices', etc.
     """
-    registry_data = get_live_registry_data()
-    practices = registry_data["practices"]
+    registry = await run_blocking(registry_store.snapshot)
+    practices = registry.practices
     
     if not practices:
         return {
@@ -205,13 +155,7 @@ def slim_list_all_practices():
             "message": "Unable to fetch SLIM best practices from registry"
         }
     
-    # Group by category
-    by_category = {}
-    for practice in practices:
-        category = practice["category"]
-        if category not in by_category:
-            by_category[category] = []
-        by_category[category].append(practice)
+    by_category = registry.by_category
     
     return {
         "success": True,
@@ -219,18 +163,22 @@ def slim_list_all_practices():
         "practices": practices,
         "practices_by_category": by_category,
         "categories": list(by_category.keys()),
-        "registry_dict": registry_data["registry_dict"],
+        "registry_dict": registry.registry_dict,
         "message": f"Found {len(practices)} SLIM best practices across {len(by_category)} categories from live registry",
         "source": "Live SLIM Registry",
         "registry_uri": SLIM_REGISTRY_URI
     }
 
 @mcp.tool()
-def slim_analyze_repository_context_tool(repo_dir: str = ".", practice_id: str = None):
+async def slim_analyze_repository_context_tool(repo_dir: str = ".", practice_id: str = None):
     """
     SLIM: Analyze repository context for applying SLIM best practices.
     Gathers project-specific context for AI customization.
     """
+    # Reads files from disk, so it runs off the event loop
+    return await run_blocking(_analyze_repository_context, repo_dir, practice_id)
+
+def _analyze_repository_context(repo_dir: str, practice_id: str = None):
     import os
     import json
     from pathlib import Path
@@ -293,14 +241,7 @@ def slim_analyze_repository_context_tool(repo_dir: str = ".", practice_id: str =
         context["project_type"] = "go"
     
     # Get registry data for the specific practice
-    registry_data = get_live_registry_data()
-    practice_info = None
-    
-    if practice_id:
-        for practice in registry_data["practices"]:
-            if practice["id"] == practice_id or practice["title"].lower() == practice_id.lower():
-                practice_info = practice
-                break
+    practice_info = registry_store.snapshot().find_practice(practice_id) if practice_id else None
     
     return {
         "success": True,
@@ -315,7 +256,7 @@ def slim_analyze_repository_context_tool(repo_dir: str = ".", practice_id: str =
     }
 
 @mcp.tool()
-def slim_apply_practice_with_ai(
+async def slim_apply_practice_with_ai(
     practice_id: str, 
     repo_dir: str = ".", 
     ai_instructions: str = None,
@@ -326,19 +267,14 @@ def slim_apply_practice_with_ai(
     Use when user wants to apply a SLIM practice with AI enhancement.
     """
     # Get practice information from registry
-    registry_data = get_live_registry_data()
-    practice_info = None
-    
-    for practice in registry_data["practices"]:
-        if practice["id"] == practice_id or practice["title"].lower().replace(".md", "") == practice_id.lower():
-            practice_info = practice
-            break
+    registry = await run_blocking(registry_store.snapshot)
+    practice_info = registry.find_practice(practice_id)
     
     if not practice_info:
         return {
             "success": False,
             "error": f"Practice '{practice_id}' not found in SLIM registry",
-            "available_practices": [p["id"] for p in registry_data["practices"][:10]]
+            "available_practices": [p["id"] for p in registry.practices[:10]]
         }
     
     return {
@@ -381,25 +317,21 @@ def slim_apply_practice_with_ai(
     }
 
 @mcp.tool()
-def slim_fetch_template_content(practice_id: str, asset_alias: str = None):
+async def slim_fetch_template_content(practice_id: str, asset_alias: str = None, ctx: Context = None):
     """
     SLIM: Fetch template content for a specific SLIM best practice.
     Retrieves the actual template files from the SLIM registry.
     """
-    registry_data = get_live_registry_data()
-    practice_info = None
+    registry = await run_blocking(registry_store.snapshot)
     
     # Find the practice
-    for practice in registry_data["practices"]:
-        if practice["id"] == practice_id or practice["title"].lower().replace(".md", "") == practice_id.lower():
-            practice_info = practice
-            break
+    practice_info = registry.find_practice(practice_id)
     
     if not practice_info:
         return {
             "success": False,
             "error": f"Practice '{practice_id}' not found in SLIM registry",
-            "available_practices": [p["id"] for p in registry_data["practices"][:10]]
+            "available_practices": [p["id"] for p in registry.practices[:10]]
         }
     
     assets = practice_info.get("assets", [])
@@ -421,11 +353,7 @@ def slim_fetch_template_content(practice_id: str, asset_alias: str = None):
         }
     
     # Find specific asset
-    target_asset = None
-    for asset in assets:
-        if asset.get("alias") == asset_alias:
-            target_asset = asset
-            break
+    target_asset = registry.find_asset(asset_alias, practice_info)
     
     if not target_asset:
         return {
@@ -444,17 +372,16 @@ def slim_fetch_template_content(practice_id: str, asset_alias: str = None):
         }
     
     try:
-        import requests
-        response = requests.get(template_uri)
-        response.raise_for_status()
+        await notify(ctx, f"Fetching {template_uri}")
+        template_content = await fetch_text(template_uri)
         
         return {
             "success": True,
             "practice_id": practice_id,
             "asset_alias": asset_alias,
             "asset_info": target_asset,
-            "template_content": response.text,
-            "content_length": len(response.text),
+            "template_content": template_content,
+            "content_length": len(template_content),
             "template_uri": template_uri,
             "message": f"Successfully fetched template content for {practice_id}/{asset_alias}"
         }
@@ -468,7 +395,7 @@ def slim_fetch_template_content(practice_id: str, asset_alias: str = None):
         }
 
 @mcp.tool()
-def slim_models_recommend(task: str = "documentation", tier: str = "balanced"):
+async def slim_models_recommend(task: str = "documentation", tier: str = "balanced"):
     """Get AI model recommendations for SLIM tasks"""
     recommendations = {
         "premium": ["openai/gpt-4o", "anthropic/claude-3-5-sonnet"],
@@ -490,6 +417,7 @@ def slim_models_recommend(task: str = "documentation", tier: str = "balanced"):
 def main():
     try:
         logger.info("Starting SLIM CLI MCP server with live registry integration")
+        registry_store.start()
         logger.info("Available tools: slim_list_all_practices, slim_apply_practice_with_ai, slim_analyze_repository_context_tool, slim_fetch_template_content, slim_models_recommend")
         mcp.run()
     except KeyboardInterrupt:
@@ -34,6 +34,7 @@ from .tools import (
     slim_models_list,
     slim_models_recommend,
     slim_models_validate,
+    get_job_queue,
     TOOLS
 )
 from .ai_tools import AI_TOOLS
@@ -53,6 +54,7 @@ from .prompts import (
     generate_prompt,
     PROMPTS
 )
+from ..async_utils import notify, run_blocking
 from .utils import (
     log_mcp_operation,
     format_error_message,
@@ -76,7 +78,7 @@ mcp = FastMCP(
 
 # Tool implementations
 @mcp.tool()
-def slim_apply_tool(
+async def slim_apply_tool(
     best_practice_ids: List[str],
     repo_urls: Optional[List[str]] = None,
     repo_dir: Optional[str] = None,
@@ -88,6 +90,7 @@ def slim_apply_tool(
     template_only: bool = False,
     revise_site: bool = False,
     dry_run: bool = False,
+    background: bool = False,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """
@@ -106,15 +109,35 @@ def slim_apply_tool(
         template_only: Generate template only without repository analysis
         revise_site: Revise existing documentation site
         dry_run: Show what would be done without making changes
+        background: Queue the operation as a job and return its id instead of waiting;
+            poll it with slim_job_status_tool
     
     Returns:
-        Dictionary with operation results
+        Dictionary with operation results, or the job id when run in the background
     """
     try:
-        if ctx:
-            ctx.info(f"Applying best practices: {', '.join(best_practice_ids)}")
+        await notify(ctx, f"Applying best practices: {', '.join(best_practice_ids)}")
         
-        return slim_apply.execute(
+        if background:
+            return await run_blocking(
+                slim_apply.submit,
+                client_id=_client_id(ctx),
+                best_practice_ids=best_practice_ids,
+                repo_urls=repo_urls,
+                repo_dir=repo_dir,
+                repo_urls_file=repo_urls_file,
+                clone_to_dir=clone_to_dir,
+                use_ai=use_ai,
+                no_prompt=no_prompt,
+                output_dir=output_dir,
+                template_only=template_only,
+                revise_site=revise_site,
+                dry_run=dry_run
+            )
+        
+        return await run_blocking(
+            slim_apply.execute,
+            ctx=ctx,
             best_practice_ids=best_practice_ids,
             repo_urls=repo_urls,
             repo_dir=repo_dir,
@@ -135,12 +158,13 @@ def slim_apply_tool(
         }
 
 @mcp.tool()
-def slim_deploy_tool(
+async def slim_deploy_tool(
     best_practice_ids: List[str],
     repo_dir: str,
     remote: Optional[str] = None,
     commit_message: Optional[str] = None,
     dry_run: bool = False,
+    background: bool = False,
     ctx: Context = None
 ) -> Dict[str, Any]:
     """
@@ -152,15 +176,29 @@ def slim_deploy_tool(
         remote: Git remote name or URL
         commit_message: Commit message for the deployment
         dry_run: Show what would be done without making changes
+        background: Queue the operation as a job and return its id instead of waiting;
+            poll it with slim_job_status_tool
     
     Returns:
-        Dictionary with operation results
+        Dictionary with operation results, or the job id when run in the background
     """
     try:
-        if ctx:
-            ctx.info(f"Deploying best practices: {', '.join(best_practice_ids)}")
+        await notify(ctx, f"Deploying best practices: {', '.join(best_practice_ids)}")
+        
+        if background:
+            return await run_blocking(
+                slim_deploy.submit,
+                client_id=_client_id(ctx),
+                best_practice_ids=best_practice_ids,
+                repo_dir=repo_dir,
+                remote=remote,
+                commit_message=commit_message,
+                dry_run=dry_run
+            )
         
-        return slim_deploy.execute(
+        return await run_blocking(
+            slim_deploy.execute,
+            ctx=ctx,
             best_practice_ids=best_practice_ids,
             repo_dir=repo_dir,
             remote=remote,
@@ -175,7 +213,90 @@ def slim_deploy_tool(
         }
 
 @mcp.tool()
-def slim_list_tool(
+async def slim_job_status_tool(
+    job_id: str,
+    log_lines: int = 50
+) -> Dict[str, Any]:
+    """
+    Get the status, result and recent log lines of a background SLIM job.
+    
+    Args:
+        job_id: Job id returned when the job was queued
+        log_lines: Number of log lines to return
+    
+    Returns:
+        Dictionary with the job
+    """
+    try:
+        job = await run_blocking(get_job_queue().status, job_id, log_lines)
+        if job is None:
+            return {"success": False, "error": f"Job '{job_id}' not found"}
+        return {"success": True, "job": job}
+    except Exception as e:
+        logger.error(f"Error in slim_job_status_tool: {e}")
+        return {
+            "success": False,
+            "error": format_error_message(e, "SLIM job status lookup failed")
+        }
+
+@mcp.tool()
+async def slim_job_cancel_tool(
+    job_id: str
+) -> Dict[str, Any]:
+    """
+    Cancel a background SLIM job.
+    A queued job is cancelled at once; a running job stops before its next repository.
+    
+    Args:
+        job_id: Job id returned when the job was queued
+    
+    Returns:
+        Dictionary with the job's status after the request
+    """
+    try:
+        job = await run_blocking(get_job_queue().cancel, job_id)
+        if job is None:
+            return {"success": False, "error": f"Job '{job_id}' not found"}
+        return {
+            "success": True,
+            "job_id": job.id,
+            "status": job.status,
+            "cancel_requested": job.cancel_requested
+        }
+    except Exception as e:
+        logger.error(f"Error in slim_job_cancel_tool: {e}")
+        return {
+            "success": False,
+            "error": format_error_message(e, "SLIM job cancellation failed")
+        }
+
+@mcp.tool()
+async def slim_job_list_tool(
+    status: Optional[str] = None,
+    limit: int = 20
+) -> Dict[str, Any]:
+    """
+    List background SLIM jobs, newest first.
+    
+    Args:
+        status: Filter by status (queued, running, succeeded, failed, cancelled)
+        limit: Maximum number of jobs to return
+    
+    Returns:
+        Dictionary with the jobs
+    """
+    try:
+        jobs = await run_blocking(get_job_queue().list_jobs, status, limit)
+        return {"success": True, "jobs": [job.to_dict() for job in jobs]}
+    except Exception as e:
+        logger.error(f"Error in slim_job_list_tool: {e}")
+        return {
+            "success": False,
+            "error": format_error_message(e, "SLIM job listing failed")
+        }
+
+@mcp.tool()
+async def slim_list_tool(
     category: Optional[str] = None,
     detailed: bool = False
 ) -> Dict[str, Any]:
@@ -191,7 +312,8 @@ def slim_list_tool(
         Dictionary with list of best practices
     """
     try:
-        return slim_list.execute(
+        return await run_blocking(
+            slim_list.execute,
             category=category,
             detailed=detailed
         )
@@ -203,7 +325,7 @@ def slim_list_tool(
         }
 
 @mcp.tool()
-def slim_models_list_tool(
+async def slim_models_list_tool(
     provider: Optional[str] = None,
     tier: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -218,7 +340,8 @@ def slim_models_list_tool(
         Dictionary with list of AI models
     """
     try:
-        return slim_models_list.execute(
+        return await run_blocking(
+            slim_models_list.execute,
             provider=provider,
             tier=tier
         )
@@ -230,7 +353,7 @@ def slim_models_list_tool(
         }
 
 @mcp.tool()
-def slim_models_recommend_tool(
+async def slim_models_recommend_tool(
     task: str = "documentation",
     tier: str = "balanced"
 ) -> Dict[str, Any]:
@@ -245,7 +368,8 @@ def slim_models_recommend_tool(
         Dictionary with recommended models
     """
     try:
-        return slim_models_recommend.execute(
+        return await run_blocking(
+            slim_models_recommend.execute,
             task=task,
             tier=tier
         )
@@ -257,7 +381,7 @@ def slim_models_recommend_tool(
         }
 
 @mcp.tool()
-def slim_models_validate_tool(
+async def slim_models_validate_tool(
     model: str
 ) -> Dict[str, Any]:
     """
@@ -270,7 +394,8 @@ def slim_models_validate_tool(
         Dictionary with validation results
     """
     try:
-        return slim_models_validate.execute(
+        return await run_blocking(
+            slim_models_validate.execute,
             model=model
         )
     except Exception as e:
@@ -282,7 +407,7 @@ def slim_models_validate_tool(
 
 # New AI-focused tools
 @mcp.tool()
-def slim_apply_template_only_tool(
+async def slim_apply_template_only_tool(
     best_practice_id: str,
     repo_dir: Optional[str] = None,
     repo_url: Optional[str] = None,
@@ -295,13 +420,14 @@ def slim_apply_template_only_tool(
     Demonstrates core SLIM functionality - pure template application and Git operations.
     """
     try:
-        if ctx:
-            ctx.info(f"Applying template-only for: {best_practice_id}")
+        await notify(ctx, f"Applying template-only for: {best_practice_id}")
         
         from .ai_tools import SlimApplyTemplateOnlyTool
         tool = SlimApplyTemplateOnlyTool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
+            ctx=ctx,
             best_practice_id=best_practice_id,
             repo_dir=repo_dir,
             repo_url=repo_url,
@@ -316,7 +442,7 @@ def slim_apply_template_only_tool(
         }
 
 @mcp.tool()
-def slim_apply_with_ai_tool(
+async def slim_apply_with_ai_tool(
     best_practice_id: str,
     repo_dir: Optional[str] = None,
     repo_url: Optional[str] = None,
@@ -331,13 +457,14 @@ def slim_apply_with_ai_tool(
     Demonstrates MCP-coordinated AI integration with external tools like Claude Code.
     """
     try:
-        if ctx:
-            ctx.info(f"Applying template with AI for: {best_practice_id}")
+        await notify(ctx, f"Applying template with AI for: {best_practice_id}")
         
         from .ai_tools import SlimApplyWithAITool
         tool = SlimApplyWithAITool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
+            ctx=ctx,
             best_practice_id=best_practice_id,
             repo_dir=repo_dir,
             repo_url=repo_url,
@@ -354,7 +481,7 @@ def slim_apply_with_ai_tool(
         }
 
 @mcp.tool()
-def slim_get_prompt_tool(
+async def slim_get_prompt_tool(
     practice_type: str,
     section_name: str,
     additional_context: Optional[str] = None
@@ -367,7 +494,8 @@ def slim_get_prompt_tool(
         from .ai_tools import SlimPromptTool
         tool = SlimPromptTool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
             practice_type=practice_type,
             section_name=section_name,
             additional_context=additional_context
@@ -381,7 +509,7 @@ def slim_get_prompt_tool(
 
 # Comprehensive AI tool for all best practices
 @mcp.tool()
-def slim_apply_any_practice_with_ai_tool(
+async def slim_apply_any_practice_with_ai_tool(
     best_practice_id: str,
     repo_dir: Optional[str] = None,
     repo_url: Optional[str] = None,
@@ -396,13 +524,14 @@ def slim_apply_any_practice_with_ai_tool(
     Handles all complexity levels: simple templates, governance with Git analysis, complex multi-step workflows.
     """
     try:
-        if ctx:
-            ctx.info(f"Applying {best_practice_id} with comprehensive AI coordination")
+        await notify(ctx, f"Applying {best_practice_id} with comprehensive AI coordination")
         
         from .comprehensive_ai_tools import SlimComprehensiveAITool
         tool = SlimComprehensiveAITool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
+            ctx=ctx,
             best_practice_id=best_practice_id,
             repo_dir=repo_dir,
             repo_url=repo_url,
@@ -420,7 +549,7 @@ def slim_apply_any_practice_with_ai_tool(
 
 # Enhanced tools for improved UX
 @mcp.tool()
-def slim_list_all_practices_tool(
+async def slim_list_all_practices_tool(
     category: Optional[str] = None,
     detailed: bool = True
 ) -> Dict[str, Any]:
@@ -432,7 +561,8 @@ def slim_list_all_practices_tool(
         from .enhanced_tools import EnhancedSlimListTool
         tool = EnhancedSlimListTool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
             category=category,
             detailed=detailed
         )
@@ -444,7 +574,7 @@ def slim_list_all_practices_tool(
         }
 
 @mcp.tool()
-def slim_analyze_repository_context_tool(
+async def slim_analyze_repository_context_tool(
     repo_dir: str,
     best_practice_id: Optional[str] = None,
     context_depth: str = "standard"
@@ -457,7 +587,8 @@ def slim_analyze_repository_context_tool(
         from .enhanced_tools import SlimRepositoryContextTool
         tool = SlimRepositoryContextTool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
             repo_dir=repo_dir,
             best_practice_id=best_practice_id,
             context_depth=context_depth
@@ -470,7 +601,7 @@ def slim_analyze_repository_context_tool(
         }
 
 @mcp.tool()
-def slim_manage_prompts_tool(
+async def slim_manage_prompts_tool(
     action: str,
     practice_type: Optional[str] = None,
     prompt_key: Optional[str] = None,
@@ -485,7 +616,8 @@ def slim_manage_prompts_tool(
         from .enhanced_tools import SlimCentralizedPromptsManagementTool
         tool = SlimCentralizedPromptsManagementTool()
         
-        return tool.execute(
+        return await run_blocking(
+            tool.execute,
             action=action,
             practice_type=practice_type,
             prompt_key=prompt_key,
@@ -660,6 +792,10 @@ async def review_changes_prompt_impl(
             }
         ]
 
+def _client_id(ctx: Context) -> Optional[str]:
+    """Identify the client calling a tool, so queued jobs from different clients take turns."""
+    return getattr(ctx, "client_id", None) if ctx else None
+
 def check_dependencies() -> Dict[str, Any]:
     """Check if all required dependencies are available."""
     deps = check_slim_cli_dependencies()
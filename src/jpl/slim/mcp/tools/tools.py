@@ -6,6 +6,7 @@ This module provides MCP tools that wrap SLIM-CLI functionality.
 
 import logging
 import tempfile
+import threading
 import time
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
@@ -26,6 +27,7 @@ from src.jpl.slim.commands.common import (
 from src.jpl.slim.utils.io_utils import fetch_best_practices, repo_file_to_list
 from src.jpl.slim.commands.common import SLIM_REGISTRY_URI
 
+from ..jobs import JobCancelled, JobQueue, raise_if_cancelled
 from .config import TOOL_NAMES, AI_MODEL_TIERS, AI_TASKS
 from .utils import (
     log_mcp_operation,
@@ -106,6 +108,10 @@ class SlimApplyTool:
             "required": ["best_practice_ids"]
         }
     
+    def submit(self, client_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Queue the apply tool as a background job; see submit_job()."""
+        return submit_job(self.name, kwargs, client_id)
+    
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the apply tool."""
         try:
@@ -180,19 +186,30 @@ class SlimApplyTool:
                     "dry_run": True
                 }
             
-            # Execute apply
-            success = apply_best_practices(
-                best_practice_ids=best_practice_ids,
-                use_ai_flag=bool(use_ai),
-                model=use_ai,
-                repo_urls=repo_urls,
-                existing_repo_dir=repo_dir,
-                target_dir_to_clone_to=clone_to_dir,
-                no_prompt=no_prompt,
-                output_dir=output_dir,
-                template_only=template_only,
-                revise_site=revise_site
-            )
+            # Execute apply one repository at a time, so a cancelled job stops between repositories.
+            # A repo_dir takes precedence over the URLs and a lone docs-website only uses the
+            # first URL, so both keep a single call
+            if repo_urls and not repo_dir and best_practice_ids != ["docs-website"]:
+                batches = [[url] for url in repo_urls]
+            else:
+                batches = [repo_urls]
+            success = True
+            for batch_repo_urls in batches:
+                raise_if_cancelled()
+                success = apply_best_practices(
+                    best_practice_ids=best_practice_ids,
+                    use_ai_flag=bool(use_ai),
+                    model=use_ai,
+                    repo_urls=batch_repo_urls,
+                    existing_repo_dir=repo_dir,
+                    target_dir_to_clone_to=clone_to_dir,
+                    no_prompt=no_prompt,
+                    output_dir=output_dir,
+                    template_only=template_only,
+                    revise_site=revise_site
+                )
+                if not success:
+                    break
             
             duration = time.time() - start_time
             
@@ -213,6 +230,8 @@ class SlimApplyTool:
                     "duration": format_duration(duration)
                 }
         
+        except JobCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in slim_apply: {e}")
             return {
@@ -256,6 +275,10 @@ class SlimDeployTool:
             "required": ["best_practice_ids", "repo_dir"]
         }
     
+    def submit(self, client_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Queue the deploy tool as a background job; see submit_job()."""
+        return submit_job(self.name, kwargs, client_id)
+    
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the deploy tool."""
         try:
@@ -302,6 +325,7 @@ class SlimDeployTool:
                 }
             
             # Execute deploy
+            raise_if_cancelled()
             success = deploy_best_practices(
                 best_practice_ids=best_practice_ids,
                 repo_dir=repo_dir,
@@ -329,6 +353,8 @@ class SlimDeployTool:
                     "duration": format_duration(duration)
                 }
         
+        except JobCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in slim_deploy: {e}")
             return {
@@ -664,6 +690,49 @@ TOOLS = {
     "slim_models_validate": slim_models_validate
 }
 
+# Background jobs for long-running tools
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+def get_job_queue() -> JobQueue:
+    """Get the queue that runs apply and deploy jobs, creating it on first use."""
+    global _job_queue
+    with _job_queue_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue({
+                slim_apply.name: slim_apply.execute,
+                slim_deploy.name: slim_deploy.execute
+            })
+        return _job_queue
+
+def submit_job(tool_name: str, params: Dict[str, Any], client_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Queue a tool call as a background job.
+    
+    Args:
+        tool_name: Name of the tool to run
+        params: Tool parameters
+        client_id: Client submitting the job, so jobs from different clients take turns
+    
+    Returns:
+        Dictionary with the job id and status
+    """
+    try:
+        job = get_job_queue().submit(tool_name, params, client_id)
+        return {
+            "success": True,
+            "message": f"Queued {tool_name} job {job.id}; poll its status with the job id",
+            "job_id": job.id,
+            "status": job.status
+        }
+    except Exception as e:
+        logger.error(f"Error queueing {tool_name} job: {e}")
+        return {
+            "success": False,
+            "message": f"Error queueing {tool_name} job",
+            "error": format_error_message(e)
+        }
+
 def get_tool(tool_name: str) -> Optional[object]:
     """Get a tool by name."""
     return TOOLS.get(tool_name)
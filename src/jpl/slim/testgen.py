@@ -8,6 +8,7 @@ import logging
 import argparse
 from typing import Dict, List, Optional, Tuple, Any
 from .cli import generate_content, setup_logging
+from .utils.file_utils import walk_repository
 
 class TestGenerator:
     """
@@ -170,10 +171,8 @@ Please generate complete, runnable test code including imports and proper test s
         exclude_dirs = {'.git', 'node_modules', 'venv', '__pycache__', 'build', 'dist'}
         supported_extensions = set(self.test_conventions.keys())
         
-        for root, dirs, files in os.walk(self.repo_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            
+        # Skips excluded directories and anything ignored by git
+        for root, dirs, files in walk_repository(self.repo_path, exclude_dirs):
             for file in files:
                 ext = file.split('.')[-1]
                 if ext in supported_extensions:
@@ -10,6 +10,9 @@ Integrates with the centralized prompt management system.
 import os
 import logging
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Generator, Any, Dict, List, Union
 from dataclasses import dataclass
 
@@ -73,8 +76,14 @@ __all__ = [
     "construct_prompt",
     "generate_ai_content",
     "generate_with_model",
+    "build_prompt_messages",
+    "supports_prompt_cache_control",
     "enhance_content",
     "validate_model",
+    "check_model_health",
+    "check_model_health_async",
+    "clear_model_health_cache",
+    "ModelHealth",
     "get_model_recommendations",
     "PlaceholderAIGenerator",
     "PlaceholderMapping",
@@ -187,11 +196,10 @@ def enhance_content(content: str, practice_type: str, section_name: str,
             logging.warning(f"No prompt found for {practice_type}.{section_name}, using content as-is")
             return content
         
-        # Combine prompt with content
-        full_prompt = f"{enhancement_prompt}\n\nCONTENT TO ENHANCE:\n{content}"
-        
-        # Generate enhanced content
-        enhanced = generate_ai_content(full_prompt, model)
+        # Generate enhanced content; the prompt with its context is the same for
+        # every piece of content and is sent as the cacheable prefix
+        enhanced = generate_ai_content(f"\n\nCONTENT TO ENHANCE:\n{content}", model,
+                                       prompt_prefix=enhancement_prompt)
         
         if enhanced:
             logging.debug(f"Successfully enhanced {section_name} content")
@@ -205,13 +213,15 @@ def enhance_content(content: str, practice_type: str, section_name: str,
         return content
 
 
-def generate_ai_content(prompt: str, model: str, **kwargs) -> Optional[str]:
+def generate_ai_content(prompt: str, model: str, prompt_prefix: Optional[str] = None, **kwargs) -> Optional[str]:
     """
     Generate content using an AI model through a unified interface.
     
     Args:
-        prompt: Prompt for the AI model
+        prompt: Prompt for the AI model; the variable part when prompt_prefix is given
         model: Model name in format "provider/model" (e.g., "openai/gpt-4o", "anthropic/claude-3-5-sonnet-20241022")
+        prompt_prefix: Optional stable start of the prompt that is identical across
+            requests (instructions, project context); marked for provider prompt caching
         **kwargs: Additional parameters to pass to the model
         
     Returns:
@@ -226,20 +236,21 @@ def generate_ai_content(prompt: str, model: str, **kwargs) -> Optional[str]:
     
     # Use LiteLLM as the primary interface
     try:
-        logging.debug(f"Generating with prompt: {prompt}")
-        return generate_with_model(prompt, model, **kwargs)
+        logging.debug(f"Generating with prompt: {(prompt_prefix or '') + prompt}")
+        return generate_with_model(prompt, model, prompt_prefix=prompt_prefix, **kwargs)
     except Exception as e:
         logging.error(f"LiteLLM generation failed for {model}: {str(e)}")
         return None
 
 
-def generate_with_model(prompt: str, model: str, **kwargs) -> Optional[str]:
+def generate_with_model(prompt: str, model: str, prompt_prefix: Optional[str] = None, **kwargs) -> Optional[str]:
     """
     Generate content using the primary AI interface (currently LiteLLM).
     
     Args:
-        prompt: Prompt for the AI model
+        prompt: Prompt for the AI model; the variable part when prompt_prefix is given
         model: Model name in format "provider/model" (e.g., "openai/gpt-4o", "anthropic/claude-3-5-sonnet-20241022")
+        prompt_prefix: Optional stable start of the prompt (see build_prompt_messages())
         **kwargs: Additional parameters to pass to the model
         
     Returns:
@@ -253,7 +264,7 @@ def generate_with_model(prompt: str, model: str, **kwargs) -> Optional[str]:
         _configure_litellm_logging()
         
         # Prepare messages
-        messages = [{"role": "user", "content": prompt}]
+        messages = build_prompt_messages(prompt, model, prompt_prefix)
         
         # Set default parameters
         completion_kwargs = {
@@ -273,6 +284,7 @@ def generate_with_model(prompt: str, model: str, **kwargs) -> Optional[str]:
         if response and response.choices:
             content = response.choices[0].message.content
             logging.debug(f"Successfully generated {len(content)} characters with {model}")
+            _log_prompt_cache_usage(response, model)
             return content
         else:
             logging.error(f"No content returned from {model}")
@@ -286,6 +298,69 @@ def generate_with_model(prompt: str, model: str, **kwargs) -> Optional[str]:
         return None
 
 
+def build_prompt_messages(prompt: str, model: str, prompt_prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Build the chat messages for a prompt made of a stable prefix and a variable suffix.
+    
+    For providers that take explicit caching hints (Anthropic models, also on
+    Bedrock and Vertex AI) the prefix is sent as its own content block marked
+    with ``cache_control``, so repeated requests reuse the cached prefix.
+    Other providers get the plain concatenation; OpenAI caches long identical
+    prefixes automatically, which this ordering makes possible.
+    
+    Args:
+        prompt: Variable part of the prompt, or the whole prompt
+        model: Model name in format "provider/model"
+        prompt_prefix: Optional stable start of the prompt
+        
+    Returns:
+        List of messages for a chat completion request
+    """
+    if not prompt_prefix:
+        return [{"role": "user", "content": prompt}]
+    
+    if not supports_prompt_cache_control(model):
+        return [{"role": "user", "content": prompt_prefix + prompt}]
+    
+    return [{
+        "role": "user",
+        "content": [
+            {"type": "text", "text": prompt_prefix, "cache_control": PROMPT_CACHE_CONTROL},
+            {"type": "text", "text": prompt}
+        ]
+    }]
+
+
+def supports_prompt_cache_control(model: str) -> bool:
+    """
+    Check whether a model takes explicit prompt caching hints through LiteLLM.
+    
+    Args:
+        model: Model name in format "provider/model"
+        
+    Returns:
+        True if prefixes should be marked with cache_control
+    """
+    provider, _, model_name = model.partition('/')
+    if provider == 'anthropic':
+        return True
+    return provider in ('bedrock', 'vertex_ai') and 'claude' in model_name.lower()
+
+
+def _log_prompt_cache_usage(response: Any, model: str) -> None:
+    """Log how many prompt tokens were written to or read from the provider's prompt cache."""
+    usage = getattr(response, 'usage', None)
+    if usage is None:
+        return
+    cache_read = getattr(usage, 'cache_read_input_tokens', None)
+    if cache_read is None:
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cache_read = getattr(details, 'cached_tokens', None)
+    cache_write = getattr(usage, 'cache_creation_input_tokens', None)
+    if isinstance(cache_read, int) or isinstance(cache_write, int):
+        logging.debug(f"Prompt cache for {model}: {cache_read or 0} tokens read, {cache_write or 0} tokens written")
+
+
 def get_model_recommendations(task: str = "documentation") -> Dict[str, str]:
     """
     Get guidance on choosing AI models for specific tasks.
@@ -355,6 +430,127 @@ def validate_model(model: str) -> tuple[bool, str]:
     return True, ""
 
 
+# Caching hint for the stable prompt prefix; ephemeral is the cache type Anthropic offers
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Seconds a successful model health check is reused within the process
+MODEL_HEALTH_TTL = 15 * 60
+
+# Seconds a failed check is reused; short so that fixing a key or network takes effect quickly
+MODEL_HEALTH_FAILURE_TTL = 60
+
+MODEL_HEALTH_PROMPT = "Reply with only the word 'OK' to confirm you are working."
+
+
+@dataclass(frozen=True)
+class ModelHealth:
+    """Result of a model connectivity check."""
+    model: str
+    healthy: bool
+    message: str
+    checked_at: float
+
+
+_model_health_cache: Dict[str, ModelHealth] = {}
+_model_health_locks: Dict[str, threading.Lock] = {}
+_model_health_guard = threading.Lock()
+_model_health_executor: Optional[ThreadPoolExecutor] = None
+
+
+def check_model_health(model: str, ttl: Optional[float] = None) -> ModelHealth:
+    """
+    Check that a model is configured and reachable, at most once per TTL per process.
+    
+    The first caller for a model sends a minimal completion request; concurrent
+    callers for the same model wait for that request instead of sending their
+    own, and later callers reuse the cached result until it expires.
+    
+    Args:
+        model: Model name in format "provider/model"
+        ttl: Seconds to reuse a cached result; defaults to MODEL_HEALTH_TTL for
+            healthy models and MODEL_HEALTH_FAILURE_TTL for failures
+        
+    Returns:
+        ModelHealth: Result of the (possibly cached) check; never raises
+    """
+    with _model_health_guard:
+        lock = _model_health_locks.setdefault(model, threading.Lock())
+    
+    with lock:
+        cached = _model_health_cache.get(model)
+        if cached is not None:
+            max_age = ttl if ttl is not None else (MODEL_HEALTH_TTL if cached.healthy else MODEL_HEALTH_FAILURE_TTL)
+            if time.monotonic() - cached.checked_at < max_age:
+                logging.debug(f"Using cached health check for {model}: {'healthy' if cached.healthy else 'unhealthy'}")
+                return cached
+        
+        health = _probe_model(model)
+        _model_health_cache[model] = health
+        return health
+
+
+def check_model_health_async(model: str, ttl: Optional[float] = None) -> 'Future[ModelHealth]':
+    """
+    Start check_model_health() on a background thread.
+    
+    Lets callers clone templates or analyze repositories while the probe is in
+    flight, and wait for the result just before the first AI request.
+    
+    Args:
+        model: Model name in format "provider/model"
+        ttl: See check_model_health()
+        
+    Returns:
+        Future resolving to a ModelHealth
+    """
+    global _model_health_executor
+    with _model_health_guard:
+        if _model_health_executor is None:
+            _model_health_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slim-model-health")
+        executor = _model_health_executor
+    return executor.submit(check_model_health, model, ttl)
+
+
+def clear_model_health_cache() -> None:
+    """Forget all cached model health checks."""
+    with _model_health_guard:
+        _model_health_cache.clear()
+
+
+def _probe_model(model: str) -> ModelHealth:
+    """Validate the model configuration and send one minimal completion request."""
+    is_valid, error_message = validate_model(model)
+    if not is_valid:
+        return ModelHealth(model, False, error_message, time.monotonic())
+    
+    logging.debug(f"Checking connectivity to {model}")
+    try:
+        _send_health_probe(model)
+    except ImportError:
+        return ModelHealth(model, False, "AI library not available. Install with: pip install litellm", time.monotonic())
+    except Exception as e:
+        logging.debug(f"Health check for {model} raised: {str(e)}")
+        logging.error(f"AI model connectivity test failed for {model}")
+        return ModelHealth(model, False, f"Cannot connect to AI model '{model}'. Please check your API keys and network connection.",
+                           time.monotonic())
+    return ModelHealth(model, True, "", time.monotonic())
+
+
+def _send_health_probe(model: str) -> None:
+    """
+    Send one completion request, raising if it fails.
+    
+    Any completed response counts, even one without text: reasoning models may
+    spend their output on hidden tokens. No max_tokens cap is set for the same reason.
+    """
+    from litellm import completion
+    
+    _configure_litellm_logging()
+    response = completion(model=model, messages=build_prompt_messages(MODEL_HEALTH_PROMPT, model))
+    if not response or not response.choices:
+        raise RuntimeError(f"No completion returned from {model}")
+
+
 # PlaceholderAIGenerator Framework
 # Maximum attempts for AI generation retry
 MAX_AI_GENERATION_ATTEMPTS = 3
@@ -588,8 +784,9 @@ class PlaceholderAIGenerator:
             print(f"     Section {section.index} (attempt {attempt}/{MAX_AI_GENERATION_ATTEMPTS})...")
             
             try:
-                # Format prompt with context and section content
-                formatted_prompt = f"{prompt}\n\nCONTENT TO PROCESS:\n{section.content}"
+                # Format prompt with context and section content; the prompt is
+                # shared by all sections and attempts and sent as the cacheable prefix
+                formatted_prompt = f"\n\nCONTENT TO PROCESS:\n{section.content}"
                 if context:
                     # Add context information to prompt
                     context_str = "\n".join([f"{k}: {v}" for k, v in context.items()])
@@ -597,7 +794,8 @@ class PlaceholderAIGenerator:
                 
                 # Generate AI content with temperature based on attempt
                 temperature = 0.7 + (attempt - 1) * 0.1
-                generated_content = generate_ai_content(formatted_prompt, model, temperature=temperature)
+                generated_content = generate_ai_content(formatted_prompt, model, prompt_prefix=prompt,
+                                                        temperature=temperature)
                 
                 if not generated_content:
                     continue
@@ -6,10 +6,11 @@ including spinner management, user interaction, and terminal display utilities.
 """
 
 import sys
+import threading
 from contextlib import contextmanager
 from typing import Optional, Any
 from rich.console import Console
-from rich.progress import Progress
+from rich.progress import Progress, SpinnerColumn, TextColumn
 
 
 class SpinnerManager:
@@ -83,6 +84,9 @@ class SpinnerManager:
 # Global spinner manager instance
 _spinner_manager = SpinnerManager()
 
+# Rich allows only one live display at a time, so worker threads turn spinners off
+_thread_state = threading.local()
+
 
 def get_spinner_manager() -> SpinnerManager:
     """Get the global spinner manager instance."""
@@ -129,4 +133,37 @@ def managed_progress(progress: Progress):
     try:
         yield progress
     finally:
-        manager.clear_progress()
\ No newline at end of file
+        manager.clear_progress()
+
+@contextmanager
+def spinners_disabled():
+    """
+    Context manager that disables spinners created with spinner_progress() in the current thread.
+    
+    Use it in worker threads that run command steps concurrently.
+    """
+    previous = getattr(_thread_state, 'spinners_disabled', False)
+    _thread_state.spinners_disabled = True
+    try:
+        yield
+    finally:
+        _thread_state.spinners_disabled = previous
+
+
+def spinner_progress(console: Console) -> Progress:
+    """
+    Create a transient spinner for a command step.
+    
+    Args:
+        console: Console to render the spinner on
+        
+    Returns:
+        Progress: Spinner, disabled when running under spinners_disabled()
+    """
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+        disable=getattr(_thread_state, 'spinners_disabled', False)
+    )
@@ -0,0 +1,944 @@
+"""
+File enumeration utilities for SLIM.
+
+This module provides a single backend for listing the files of a repository or
+directory tree. When the target is the top level of a git work tree, files are
+listed from git's index with one ``git ls-files`` call, so ignored build trees
+(``.tox``, ``.gradle``, ``vendor``, generated assets, ...) are never visited.
+Other directories fall back to a walker that honors ``.gitignore`` files.
+
+Scanners plug in through ``walk_repository()``, which mirrors ``os.walk``
+(including in-place pruning of ``dirnames``), through ``scan_tree()`` when
+they also need per-file stat results, or through ``list_repository_files()``
+when only a flat list of paths is needed.
+
+On network filesystems (NFS, Lustre, ...) a walk is bound by the round trip of
+every ``readdir``/``stat`` call, so directory listings can be fanned out over a
+pool of worker threads. The walk still yields directories in the same sorted,
+top-down order as a serial walk. The thread count comes from the ``threads``
+argument, from ``configure_scan_threads()`` (``slim --scan-threads N``), or is
+picked automatically when the tree lives on a remote filesystem.
+"""
+
+import collections
+import functools
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from pathlib import Path
+
+__all__ = [
+    "git_ls_files",
+    "list_repository_files",
+    "walk_repository",
+    "scan_tree",
+    "configure_scan_threads",
+    "resolve_scan_threads",
+    "is_remote_filesystem",
+    "user_cache_dir",
+    "materialize_tree",
+    "atomic_write",
+    "file_lock",
+    "FileEntry",
+    "GitignoreMatcher"
+]
+
+# Worker threads used when a scan of a remote filesystem is auto-detected
+DEFAULT_REMOTE_SCAN_THREADS = 8
+
+# Filesystem types (as reported in /proc/mounts) where directory listings are network round trips
+REMOTE_FILESYSTEM_TYPES = {
+    'nfs', 'nfs4', 'lustre', 'cifs', 'smb3', 'smbfs', 'afs', 'gpfs', 'beegfs',
+    'ceph', 'glusterfs', 'fuse.glusterfs', 'fuse.sshfs', 'fuse.cephfs', '9p'
+}
+
+# Process-wide thread count set by the CLI; None means auto-detect
+_configured_scan_threads: Optional[int] = None
+
+# ioctl request that clones a file's extents on copy-on-write filesystems (Btrfs, XFS)
+_FICLONE = 0x40049409
+
+# Mode of a gitlink (submodule) entry in git's index
+_GITLINK_MODE = '160000'
+
+# Thread locks per lock file, since a process's own threads must also wait for each other
+_file_thread_locks: Dict[str, threading.Lock] = {}
+_file_thread_locks_guard = threading.Lock()
+
+
+def git_ls_files(root: Union[str, Path]) -> Optional[List[str]]:
+    """
+    List the non-ignored files of a git work tree using git's index.
+
+    Runs ``git ls-files`` once, which returns tracked files plus untracked
+    files that are not ignored, without walking the directory tree. Tracked
+    files deleted from the work tree, submodules and nested repositories are
+    left out, so every listed path is a regular file.
+
+    Args:
+        root: Top-level directory of the git work tree
+
+    Returns:
+        List of relative POSIX-style paths, or None if root is not the top level
+        of a git work tree or git is unavailable
+    """
+    root = str(root)
+    dot_git = os.path.join(root, '.git')
+    if not os.path.exists(dot_git):
+        return None
+
+    command = ['git']
+    if os.path.isdir(dot_git):
+        # Pin git to this repository so it never falls back to a parent repository
+        command += [f'--git-dir={dot_git}', f'--work-tree={root}']
+    # -t tags each entry (H tracked, R deleted, S skip-worktree, ? untracked) and -s adds the
+    # index mode, so one call tells deleted files and submodules apart from regular files
+    command += ['ls-files', '-z', '-t', '-s', '--cached', '--deleted', '--others', '--exclude-standard']
+
+    try:
+        result = subprocess.run(command, cwd=root, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.debug(f"git ls-files unavailable for {root}: {e}")
+        return None
+
+    output = result.stdout.decode('utf-8', errors='surrogateescape')
+    files, deleted = [], set()
+    for entry in output.split('\0'):
+        if not entry:
+            continue
+        tag, rest = entry[0], entry[2:]
+        if tag == '?':
+            # A trailing slash marks an untracked nested repository
+            if not rest.endswith('/'):
+                files.append(rest)
+            continue
+        stage_info, path = rest.split('\t', 1)
+        if tag == 'R':
+            deleted.add(path)
+        elif tag != 'S' and stage_info.split(' ', 1)[0] != _GITLINK_MODE:
+            files.append(path)
+    # Deduplicate: files with unmerged index entries are listed once per stage
+    return [path for path in dict.fromkeys(files) if path not in deleted]
+
+
+def list_repository_files(root: Union[str, Path],
+                          exclude_dirs: Optional[Set[str]] = None,
+                          respect_gitignore: bool = True,
+                          threads: Optional[int] = None) -> List[str]:
+    """
+    List the files under a directory as paths relative to it.
+
+    Args:
+        root: Directory to list
+        exclude_dirs: Directory names to skip at any depth
+        respect_gitignore: Whether to skip files ignored by git
+        threads: Worker threads for the directory walk (see ``resolve_scan_threads()``)
+
+    Returns:
+        List of relative file paths using the OS path separator
+    """
+    exclude_dirs = exclude_dirs or set()
+
+    if respect_gitignore:
+        git_files = git_ls_files(root)
+        if git_files is not None:
+            relative_paths = []
+            for path in git_files:
+                parts = path.split('/')
+                if exclude_dirs and any(part in exclude_dirs for part in parts[:-1]):
+                    continue
+                relative_paths.append(os.path.join(*parts))
+            return relative_paths
+
+    relative_paths = []
+    for dirpath, _, filenames in walk_repository(root, exclude_dirs, respect_gitignore, threads):
+        rel_dir = os.path.relpath(dirpath, root)
+        for filename in filenames:
+            relative_paths.append(filename if rel_dir == '.' else os.path.join(rel_dir, filename))
+    return relative_paths
+
+
+def walk_repository(root: Union[str, Path],
+                    exclude_dirs: Optional[Set[str]] = None,
+                    respect_gitignore: bool = True,
+                    threads: Optional[int] = None) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Walk a directory tree top-down, skipping files ignored by git.
+
+    This is a drop-in replacement for ``os.walk``: it yields
+    ``(dirpath, dirnames, filenames)`` tuples, and callers may prune the walk
+    by modifying ``dirnames`` in place. Git work trees are enumerated from the
+    index; other directories are walked while honoring ``.gitignore`` files.
+
+    Args:
+        root: Directory to walk
+        exclude_dirs: Directory names to skip at any depth
+        respect_gitignore: Whether to skip files ignored by git
+        threads: Worker threads for the directory walk (see ``resolve_scan_threads()``)
+
+    Yields:
+        Tuples of (dirpath, dirnames, filenames)
+    """
+    root = str(root)
+    for rel_dir, dirnames, file_entries in scan_tree(root, exclude_dirs, respect_gitignore, threads):
+        dirpath = os.path.join(root, rel_dir) if rel_dir else root
+        yield dirpath, dirnames, [entry.name for entry in file_entries]
+
+
+def scan_tree(root: Union[str, Path],
+              exclude_dirs: Optional[Set[str]] = None,
+              respect_gitignore: bool = True,
+              threads: Optional[int] = None,
+              prefetch_stat: bool = False) -> Iterator[Tuple[str, List[str], List[Any]]]:
+    """
+    Walk a directory tree top-down, yielding reusable file entries.
+
+    Like ``walk_repository()``, but directories are reported relative to root
+    and files as entry objects with ``name``, ``path`` and a cached ``stat()``.
+    Outside git work trees the walk is built on ``os.scandir``, so entries are
+    ``os.DirEntry`` objects whose file type comes from the directory listing
+    and whose stat result is fetched at most once. Callers can therefore get a
+    file's size with a single syscall and build relative paths as strings.
+
+    With more than one thread, directories are listed ahead of the caller by a
+    work-stealing thread pool: each listing queues its subdirectories, and idle
+    workers steal queued directories from busy ones. Results are still yielded
+    in sorted top-down order, and pruning ``dirnames`` cancels the listings of
+    the pruned subtrees, including those queued by listings already running.
+
+    Args:
+        root: Directory to walk
+        exclude_dirs: Directory names to skip at any depth
+        respect_gitignore: Whether to skip files ignored by git
+        threads: Worker threads for the walk (see ``resolve_scan_threads()``)
+        prefetch_stat: Whether worker threads should also stat every file, so
+            that callers needing sizes do not pay one round trip per file
+
+    Yields:
+        Tuples of (rel_dir, dirnames, file_entries), where rel_dir is '' for
+        root and uses the OS path separator. Callers may prune dirnames in place.
+    """
+    root = str(root)
+    exclude_dirs = exclude_dirs or set()
+    threads = resolve_scan_threads(root, threads)
+
+    git_files = git_ls_files(root) if respect_gitignore else None
+    if git_files is not None:
+        yield from _scan_file_list(root, git_files, exclude_dirs, threads if prefetch_stat else 1)
+        return
+
+    matcher = GitignoreMatcher() if respect_gitignore else None
+    if threads > 1:
+        yield from _scan_parallel(root, exclude_dirs, matcher, threads, prefetch_stat)
+        return
+
+    stack = [('', matcher)]
+    while stack:
+        rel_dir, matcher = stack.pop()
+        listing = _list_directory(root, rel_dir, exclude_dirs, matcher)
+        if listing is None:
+            continue
+        dirnames, file_entries, subdirs, child_matcher = listing
+
+        yield rel_dir, dirnames, file_entries
+
+        for name in reversed(dirnames):
+            if name in subdirs:
+                stack.append((os.path.join(rel_dir, name) if rel_dir else name, child_matcher))
+
+
+def configure_scan_threads(threads: Optional[int]) -> None:
+    """
+    Set the default number of worker threads for directory scans.
+
+    Args:
+        threads: Thread count for every later scan, or None to auto-detect
+            based on the filesystem being scanned
+    """
+    global _configured_scan_threads
+    _configured_scan_threads = threads
+    logging.debug(f"Directory scan threads set to {threads if threads else 'auto'}")
+
+
+def resolve_scan_threads(root: Union[str, Path], threads: Optional[int] = None) -> int:
+    """
+    Decide how many worker threads to use for scanning a directory tree.
+
+    Args:
+        root: Directory to be scanned
+        threads: Explicit thread count; None falls back to the value from
+            ``configure_scan_threads()`` and then to auto-detection
+
+    Returns:
+        int: Number of threads, where 1 means a serial walk
+    """
+    if threads is None:
+        threads = _configured_scan_threads
+    if threads is None:
+        threads = DEFAULT_REMOTE_SCAN_THREADS if is_remote_filesystem(root) else 1
+        if threads > 1:
+            logging.debug(f"{root} is on a remote filesystem, scanning with {threads} threads")
+    return max(1, threads)
+
+
+def is_remote_filesystem(path: Union[str, Path]) -> bool:
+    """
+    Check whether a path lives on a network filesystem such as NFS or Lustre.
+
+    The mount containing the path is looked up in ``/proc/mounts``; on systems
+    without it the path is assumed to be local.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        bool: True if the containing mount has a remote filesystem type
+    """
+    real_path = os.path.realpath(str(path))
+    best_mount = ''
+    best_type = None
+    for mount_point, fs_type in _read_mounts():
+        if real_path == mount_point or real_path.startswith(mount_point.rstrip('/') + '/'):
+            if len(mount_point) >= len(best_mount):
+                best_mount, best_type = mount_point, fs_type
+    return best_type in REMOTE_FILESYSTEM_TYPES
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """
+    Get a directory under SLIM's per-user cache, creating it if needed.
+
+    The cache lives in ``$SLIM_CACHE_DIR`` if set, otherwise in the platform's
+    user cache directory (``$XDG_CACHE_HOME/slim`` or ``~/.cache/slim`` on Linux).
+
+    Args:
+        *parts: Subdirectory names below the cache root
+
+    Returns:
+        Path: The cache directory
+    """
+    base = os.environ.get('SLIM_CACHE_DIR')
+    if not base:
+        if sys.platform == 'darwin':
+            base = os.path.join(os.path.expanduser('~'), 'Library', 'Caches', 'slim')
+        elif os.name == 'nt':
+            base = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'slim', 'Cache')
+        else:
+            base = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'slim')
+    path = Path(base, *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def materialize_tree(source: Union[str, Path], target: Union[str, Path],
+                     skip: Iterable[str] = ('.git',)) -> Dict[str, int]:
+    """
+    Copy a directory tree as cheaply as the filesystem allows.
+
+    Files are cloned with a reflink where the filesystem supports it (the copy
+    shares blocks until either side is modified), and copied otherwise. Existing
+    target files are replaced.
+
+    Args:
+        source: Directory to copy from
+        target: Directory to copy into; created if missing
+        skip: Entry names to skip at any depth
+
+    Returns:
+        Dict[str, int]: Number of files that were reflinked and copied
+    """
+    skip = set(skip)
+    counts = {'reflinked': 0, 'copied': 0}
+    # Stop trying a strategy after the first failure: it fails for the whole filesystem
+    strategies = {'reflink': sys.platform.startswith('linux')}
+
+    stack = [(str(source), str(target))]
+    while stack:
+        source_dir, target_dir = stack.pop()
+        os.makedirs(target_dir, exist_ok=True)
+        with os.scandir(source_dir) as it:
+            entries = list(it)
+
+        for entry in entries:
+            if entry.name in skip:
+                continue
+            target_path = os.path.join(target_dir, entry.name)
+            if entry.is_symlink():
+                if os.path.lexists(target_path):
+                    os.unlink(target_path)
+                os.symlink(os.readlink(entry.path), target_path)
+                counts['copied'] += 1
+            elif entry.is_dir():
+                stack.append((entry.path, target_path))
+            elif strategies['reflink'] and _reflink_file(entry.path, target_path, strategies):
+                counts['reflinked'] += 1
+            else:
+                if os.path.lexists(target_path) and os.stat(target_path).st_nlink > 1:
+                    # Never write through a hardlink into the source tree
+                    os.unlink(target_path)
+                shutil.copy2(entry.path, target_path)
+                counts['copied'] += 1
+
+    logging.debug(f"Materialized {source} into {target}: {counts}")
+    return counts
+
+
+def atomic_write(path: Union[str, Path], data: Union[str, bytes], encoding: str = 'utf-8') -> None:
+    """
+    Replace a file's content so readers see either the old or the new file.
+
+    The data is written to a temporary file in the same directory, which is
+    then renamed over ``path``. An existing file keeps its permission bits,
+    and a hardlinked file is detached rather than written through.
+
+    Args:
+        path: File to write
+        data: New content; str is encoded with ``encoding``
+        encoding: Encoding for str data
+    """
+    path = os.fspath(path)
+    if isinstance(data, str):
+        data = data.encode(encoding)
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = _create_temp_file(directory, name)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        try:
+            shutil.copymode(path, tmp_path)
+        except FileNotFoundError:
+            # A new file keeps the mode it was created with, which honors the umask
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def file_lock(path: Union[str, Path]) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a file across threads and processes.
+
+    The lock file is created if needed and locked with ``flock`` (``msvcrt.locking``
+    on Windows), so the OS releases the lock if the holding process dies and a
+    crashed process never leaves a stale lock behind.
+
+    Args:
+        path: Lock file
+    """
+    path = os.path.abspath(path)
+    with _file_thread_locks_guard:
+        thread_lock = _file_thread_locks.setdefault(path, threading.Lock())
+    with thread_lock, open(path, 'a+b') as lock_file:
+        _lock_file(lock_file, lock=True)
+        try:
+            yield
+        finally:
+            _lock_file(lock_file, lock=False)
+
+
+def _lock_file(lock_file, lock: bool) -> None:
+    """Lock or unlock an open file, blocking until the lock is available."""
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+        lock_file.seek(0)
+        if not lock:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+        while True:
+            try:
+                # LK_LOCK gives up after about ten seconds, so keep waiting
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    fcntl.flock(lock_file, fcntl.LOCK_EX if lock else fcntl.LOCK_UN)
+
+
+def _create_temp_file(directory: str, name: str) -> Tuple[int, str]:
+    """Create a uniquely named file next to ``name`` with mode 0o666 minus the umask, like open() would."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp_path = os.path.join(directory, f'.{name}.{os.urandom(6).hex()}.tmp')
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+class FileEntry:
+    """
+    Minimal ``os.DirEntry`` stand-in for files listed from git's index.
+    """
+
+    __slots__ = ('name', 'path', '_stat')
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self._stat = None
+
+    def is_dir(self) -> bool:
+        return False
+
+    def is_file(self) -> bool:
+        return True
+
+    def is_symlink(self) -> bool:
+        return os.path.islink(self.path)
+
+    def stat(self) -> os.stat_result:
+        """Stat the file once and cache the result, like os.DirEntry."""
+        if self._stat is None:
+            self._stat = os.stat(self.path)
+        return self._stat
+
+
+class GitignoreMatcher:
+    """
+    Evaluate ``.gitignore`` rules collected while walking a directory tree.
+
+    Rules are matched against paths relative to the walk root. As in git, the
+    last matching rule wins, so rules from deeper ``.gitignore`` files (added
+    later in a top-down walk) override rules from their parents.
+    """
+
+    def __init__(self):
+        self.rules = []
+
+    def add_file(self, gitignore_path: Union[str, Path], base_dir: str = '') -> None:
+        """
+        Load the rules from a ``.gitignore`` file.
+
+        Args:
+            gitignore_path: Path to the .gitignore file
+            base_dir: Directory containing the file, relative to the walk root
+        """
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8', errors='ignore') as f:
+                self.add_patterns(f.read().splitlines(), base_dir)
+        except OSError as e:
+            logging.debug(f"Could not read {gitignore_path}: {e}")
+
+    def add_patterns(self, patterns: Iterable[str], base_dir: str = '') -> None:
+        """
+        Add gitignore-style patterns.
+
+        Args:
+            patterns: Pattern lines in .gitignore syntax
+            base_dir: Directory the patterns are relative to, relative to the walk root
+        """
+        for line in patterns:
+            rule = _parse_gitignore_line(line)
+            if rule:
+                regex, negated, dir_only, anchored = rule
+                self.rules.append((base_dir, regex, negated, dir_only, anchored))
+
+    def copy(self) -> 'GitignoreMatcher':
+        """
+        Create a matcher with the same rules, which can be extended separately.
+
+        Returns:
+            GitignoreMatcher: Independent copy of this matcher
+        """
+        matcher = GitignoreMatcher()
+        matcher.rules = list(self.rules)
+        return matcher
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is ignored.
+
+        Args:
+            rel_path: POSIX-style path relative to the walk root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the last matching rule ignores the path
+        """
+        ignored = False
+        basename = rel_path.rsplit('/', 1)[-1]
+        for base_dir, regex, negated, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base_dir:
+                if not rel_path.startswith(base_dir + '/'):
+                    continue
+                sub_path = rel_path[len(base_dir) + 1:]
+            else:
+                sub_path = rel_path
+            if regex.fullmatch(sub_path if anchored else basename):
+                ignored = not negated
+        return ignored
+
+
+# Private helper functions
+
+def _join(rel_dir: str, name: str) -> str:
+    """Join a POSIX-style relative directory and an entry name."""
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+@functools.lru_cache(maxsize=1)
+def _read_mounts() -> Tuple[Tuple[str, str], ...]:
+    """Read (mount_point, fs_type) pairs from /proc/mounts, in mount order."""
+    mounts = []
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8', errors='surrogateescape') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3:
+                    # Mount points escape spaces and other special characters as octal
+                    mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1])
+                    mounts.append((mount_point, fields[2]))
+    except OSError:
+        pass
+    return tuple(mounts)
+
+
+def _list_directory(root: str, rel_dir: str, exclude_dirs: Set[str],
+                    matcher: Optional[GitignoreMatcher]):
+    """
+    List one directory for scan_tree.
+
+    Returns (dirnames, file_entries, subdirs, child_matcher), where subdirs are
+    the dirnames that may be descended into and child_matcher carries the rules
+    of this directory's .gitignore, or None if the directory cannot be listed.
+    """
+    dirpath = os.path.join(root, rel_dir) if rel_dir else root
+    try:
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError as e:
+        logging.debug(f"Could not list {dirpath}: {e}")
+        return None
+
+    dir_entries = {}
+    file_entries = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            dir_entries[entry.name] = entry
+        else:
+            file_entries.append(entry)
+
+    posix_dir = rel_dir.replace(os.sep, '/') if os.sep != '/' else rel_dir
+    if matcher is not None and any(entry.name == '.gitignore' for entry in file_entries):
+        # Rules only apply below this directory, so siblings keep the parent's matcher
+        matcher = matcher.copy()
+        matcher.add_file(os.path.join(dirpath, '.gitignore'), posix_dir)
+
+    dirnames = [d for d in dir_entries if d not in exclude_dirs and d != '.git']
+    if matcher is not None:
+        dirnames = [d for d in dirnames if not matcher.is_ignored(_join(posix_dir, d), is_dir=True)]
+        file_entries = [e for e in file_entries if not matcher.is_ignored(_join(posix_dir, e.name))]
+
+    # Like os.walk, do not descend into symlinked directories
+    subdirs = {d for d in dirnames if not dir_entries[d].is_symlink()}
+    return dirnames, file_entries, subdirs, matcher
+
+
+def _reflink_file(source: str, target: str, strategies: Dict[str, bool]) -> bool:
+    """Clone source into target with the FICLONE ioctl; disable reflinks on failure."""
+    try:
+        import fcntl
+    except ImportError:
+        strategies['reflink'] = False
+        return False
+
+    try:
+        if os.path.lexists(target) and os.stat(target).st_nlink > 1:
+            os.unlink(target)
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, target)
+        return True
+    except OSError as e:
+        logging.debug(f"Reflinks unavailable for {target}, copying instead: {e}")
+        strategies['reflink'] = False
+        return False
+
+
+def _prefetch_stats(entries: List[Any]) -> None:
+    """Stat entries so that their cached stat() results are ready for the caller."""
+    for entry in entries:
+        try:
+            entry.stat()
+        except OSError:
+            pass
+
+
+def _is_pruned(rel_dir: str, pruned: Set[str]) -> bool:
+    """Check whether a directory or one of its ancestors was pruned by the caller."""
+    while rel_dir:
+        if rel_dir in pruned:
+            return True
+        rel_dir = os.path.dirname(rel_dir)
+    return False
+
+
+def _scan_directory_task(pool: '_WorkStealingPool', root: str, rel_dir: str,
+                         exclude_dirs: Set[str], matcher: Optional[GitignoreMatcher],
+                         prefetch_stat: bool, pruned: Set[str]):
+    """List a directory on a worker thread and queue listings of its subdirectories."""
+    if _is_pruned(rel_dir, pruned):
+        return None
+    listing = _list_directory(root, rel_dir, exclude_dirs, matcher)
+    if listing is None or _is_pruned(rel_dir, pruned):
+        return None
+    dirnames, file_entries, subdirs, child_matcher = listing
+    if prefetch_stat:
+        _prefetch_stats(file_entries)
+
+    # Workers take their newest task first, so queue in reverse to list the first child next
+    children = {}
+    for name in reversed(dirnames):
+        if name in subdirs:
+            child_dir = os.path.join(rel_dir, name) if rel_dir else name
+            children[name] = pool.submit(_scan_directory_task, pool, root, child_dir,
+                                         exclude_dirs, child_matcher, prefetch_stat, pruned)
+    return dirnames, file_entries, children
+
+
+def _scan_parallel(root: str, exclude_dirs: Set[str], matcher: Optional[GitignoreMatcher],
+                   threads: int, prefetch_stat: bool) -> Iterator[Tuple[str, List[str], List[Any]]]:
+    """Yield scan_tree tuples in serial order while worker threads list directories ahead."""
+    pool = _WorkStealingPool(threads)
+    # Directories pruned by the caller; listings below them that already started stop queueing work
+    pruned: Set[str] = set()
+    try:
+        stack = [('', pool.submit(_scan_directory_task, pool, root, '', exclude_dirs, matcher,
+                                  prefetch_stat, pruned))]
+        while stack:
+            rel_dir, future = stack.pop()
+            listing = future.result()
+            if listing is None:
+                continue
+            dirnames, file_entries, children = listing
+
+            yield rel_dir, dirnames, file_entries
+
+            # Honor in-place pruning by the caller, cancelling listings nobody will consume
+            kept = set(dirnames)
+            for name, child in children.items():
+                if name not in kept:
+                    pruned.add(os.path.join(rel_dir, name) if rel_dir else name)
+                    child.cancel()
+            for name in reversed(dirnames):
+                if name in children:
+                    stack.append((os.path.join(rel_dir, name) if rel_dir else name, children[name]))
+    finally:
+        pool.shutdown()
+
+
+def _scan_file_list(root: str, files: List[str], exclude_dirs: Set[str],
+                    threads: int = 1) -> Iterator[Tuple[str, List[str], List[FileEntry]]]:
+    """
+    Yield scan_tree-style tuples for a flat list of relative POSIX file paths.
+
+    With more than one thread, the files of every directory are stat'ed ahead
+    of the caller by a work-stealing thread pool.
+    """
+    tree: Dict[str, Tuple[Set[str], List[str]]] = {'': (set(), [])}
+
+    def ensure_dir(rel_dir: str) -> None:
+        if rel_dir not in tree:
+            parent, _, name = rel_dir.rpartition('/')
+            ensure_dir(parent)
+            tree[parent][0].add(name)
+            tree[rel_dir] = (set(), [])
+
+    for path in files:
+        rel_dir, _, filename = path.rpartition('/')
+        ensure_dir(rel_dir)
+        tree[rel_dir][1].append(filename)
+
+    def make_entries(posix_dir: str) -> List[FileEntry]:
+        rel_dir = posix_dir.replace('/', os.sep) if os.sep != '/' else posix_dir
+        dirpath = os.path.join(root, rel_dir) if rel_dir else root
+        return [FileEntry(name, os.path.join(dirpath, name)) for name in sorted(tree[posix_dir][1])]
+
+    pool = None
+    prefetched = {}
+    if threads > 1:
+        pool = _WorkStealingPool(threads)
+        # Queue in reverse walk order: the submitting queue is drained newest first
+        for posix_dir in sorted(tree, reverse=True):
+            entries = make_entries(posix_dir)
+            prefetched[posix_dir] = (entries, pool.submit(_prefetch_stats, entries))
+
+    try:
+        stack = ['']
+        while stack:
+            posix_dir = stack.pop()
+            if pool is not None:
+                file_entries, future = prefetched.pop(posix_dir)
+                future.result()
+            else:
+                file_entries = make_entries(posix_dir)
+            rel_dir = posix_dir.replace('/', os.sep) if os.sep != '/' else posix_dir
+            dirnames = sorted(d for d in tree[posix_dir][0] if d not in exclude_dirs)
+            yield rel_dir, dirnames, file_entries
+            # Honor in-place pruning by the caller, visiting children in sorted order
+            stack.extend(_join(posix_dir, d) for d in reversed(dirnames) if _join(posix_dir, d) in tree)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+class _WorkStealingPool:
+    """
+    Fixed set of daemon worker threads with one task deque per worker.
+
+    Tasks submitted from a worker go to that worker's deque and are taken
+    newest first, so each worker keeps descending into the subtree it is
+    listing. An idle worker steals the oldest task from another worker's deque,
+    which is the shallowest and therefore largest piece of remaining work.
+    Tasks submitted from other threads go to the first worker's deque.
+    """
+
+    def __init__(self, threads: int):
+        self._queues = [collections.deque() for _ in range(threads)]
+        self._condition = threading.Condition()
+        self._closed = False
+        self._local = threading.local()
+        for index in range(threads):
+            worker = threading.Thread(target=self._run, args=(index,),
+                                      name=f"slim-scan-{index}", daemon=True)
+            worker.start()
+
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args) and return a Future for its result."""
+        future = Future()
+        index = getattr(self._local, 'index', 0)
+        with self._condition:
+            if self._closed:
+                future.cancel()
+                return future
+            self._queues[index].append((future, fn, args))
+            self._condition.notify()
+        return future
+
+    def shutdown(self) -> None:
+        """Cancel queued tasks and let the workers exit once idle."""
+        with self._condition:
+            self._closed = True
+            for queue in self._queues:
+                for future, _, _ in queue:
+                    future.cancel()
+                queue.clear()
+            self._condition.notify_all()
+
+    def _next_task(self, index: int):
+        own = self._queues[index]
+        if own:
+            return own.pop()
+        for offset in range(1, len(self._queues)):
+            victim = self._queues[(index + offset) % len(self._queues)]
+            if victim:
+                return victim.popleft()
+        return None
+
+    def _run(self, index: int) -> None:
+        self._local.index = index
+        while True:
+            with self._condition:
+                task = self._next_task(index)
+                while task is None and not self._closed:
+                    self._condition.wait()
+                    task = self._next_task(index)
+            if task is None:
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+def _parse_gitignore_line(line: str) -> Optional[Tuple['re.Pattern', bool, bool, bool]]:
+    """Parse one .gitignore line into (regex, negated, dir_only, anchored)."""
+    line = line.rstrip('\n\r')
+    if not line.endswith('\\ '):
+        line = line.rstrip()
+    if not line or line.startswith('#'):
+        return None
+
+    negated = line.startswith('!')
+    if negated:
+        line = line[1:]
+    elif line.startswith('\\'):
+        line = line[1:]
+
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+
+    # Patterns with a slash anywhere but the end are relative to the .gitignore location
+    anchored = '/' in line
+    line = line.lstrip('/')
+
+    return re.compile(_translate_glob(line)), negated, dir_only, anchored
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression."""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == n:
+            parts.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            parts.append('.*')
+            i += 2
+        elif c == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif c == '?':
+            parts.append('[^/]')
+            i += 1
+        elif c == '[':
+            # A ']' directly after '[' or '[!' is part of the set, not its end
+            start = i + 2 if pattern.startswith('[!', i) else i + 1
+            end = pattern.find(']', start + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f"[{body}]")
+                i = end + 1
+        elif c == '\\' and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return ''.join(parts)
@@ -7,13 +7,17 @@ deployment, and repository information.
 
 import os
 import logging
+import random
+import threading
+import time
 import git
 import requests
 import urllib.parse
 import tempfile
 import uuid
 import re
-from typing import Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
 
 # Constants (these should be moved to a constants module later)
 GIT_BRANCH_NAME_FOR_MULTIPLE_COMMITS = 'slim-best-practices'
@@ -42,6 +46,48 @@ def create_repo_temp_dir(repo_name: str) -> str:
 GIT_CUSTOM_REMOTE_NAME = 'slim-custom'
 GIT_DEFAULT_COMMIT_MESSAGE = 'SLIM-CLI Best Practices Bot Commit'
 
+# Concurrent pushes allowed to one host, to stay within secondary rate limits
+PUSH_CONCURRENCY_PER_HOST = 4
+# Retries of a push that failed for a transient reason, and the initial backoff in seconds
+PUSH_RETRIES = 3
+PUSH_RETRY_BACKOFF = 2.0
+# Push errors worth retrying: network failures, server errors and rate limiting
+TRANSIENT_PUSH_ERRORS = (
+    'could not resolve host',
+    'connection timed out',
+    'connection reset',
+    'operation timed out',
+    'failed to connect',
+    'the remote end hung up unexpectedly',
+    'early eof',
+    'rpc failed',
+    'secondary rate limit',
+    'rate limit exceeded',
+    'http 429',
+    'error: 429',
+    'http 500',
+    'http 502',
+    'http 503',
+    'http 504',
+    'internal server error',
+    'service unavailable',
+    'bad gateway',
+)
+# Push errors never worth retrying; git may report a hang-up alongside a rejection
+REJECTED_PUSH_ERRORS = (
+    '[rejected]',
+    '[remote rejected]',
+    'stale info',
+    'non-fast-forward',
+    'authentication failed',
+    'permission denied',
+    'repository not found',
+)
+
+_push_slots: Dict[str, threading.BoundedSemaphore] = {}
+_push_slots_lock = threading.Lock()
+_push_concurrency = PUSH_CONCURRENCY_PER_HOST
+
 __all__ = [
     "generate_git_branch_name",
     "clone_repository",
@@ -49,7 +95,13 @@ __all__ = [
     "extract_git_info",
     "is_git_repository",
     "get_git_info_summary",
-    "get_contributor_stats"
+    "get_contributor_stats",
+    "DeployTransaction",
+    "commit_paths",
+    "configure_push_concurrency",
+    "push_slot",
+    "remote_host",
+    "is_transient_push_error"
 ]
 
 
@@ -164,6 +216,293 @@ def create_branch(repo, branch_name):
         return None
 
 
+class DeployTransaction:
+    """
+    Deploys best practices to one branch with a single fetch and a single push.
+    
+    begin() checks out the branch, fetches the remote once and merges the remote
+    branch if it moved; commit() can then be called once per best practice (or
+    once for all of them); push() publishes every commit of the transaction in
+    one push.
+    """
+    
+    def __init__(self, repo_dir: str, branch: str, remote: Optional[str] = None,
+                 atomic: bool = False, force_with_lease: bool = False, retries: int = PUSH_RETRIES):
+        """
+        Initialize the transaction.
+        
+        Args:
+            repo_dir: Local repository directory
+            branch: Branch to commit to and push
+            remote: Remote name or URL; defaults to 'origin'. A URL is registered
+                under the 'slim-custom' remote name
+            atomic: Push with --atomic
+            force_with_lease: Push with --force-with-lease, leased on the remote
+                branch commit seen by the fetch
+            retries: Number of times a push that failed for a transient reason is retried
+        """
+        self.repo_dir = repo_dir
+        self.branch = branch
+        self.remote = remote
+        self.atomic = atomic
+        self.force_with_lease = force_with_lease
+        self.retries = retries
+        self.push_attempts = 0
+        self.repo = None
+        self.remote_name = remote or GIT_DEFAULT_REMOTE_NAME
+        self.fetched = False
+        self.remote_commit: Optional[str] = None
+        self.commits: List[str] = []
+    
+    def begin(self) -> None:
+        """
+        Check out the branch, fetch the remote once and bring the branch up to date.
+        
+        Raises:
+            git.exc.GitCommandError: If the branch cannot be checked out
+        """
+        self.repo = git.Repo(self.repo_dir)
+        
+        try:
+            self.repo.git.checkout(self.branch)
+            logging.debug(f"Checked out to branch {self.branch}")
+        except git.exc.GitCommandError:
+            logging.debug(f"Branch {self.branch} doesn't exist, creating it")
+            self.repo.git.checkout('-b', self.branch)
+        
+        self.remote_name = self._resolve_remote()
+        
+        try:
+            self.repo.git.fetch('--prune', self.remote_name)
+            self.fetched = True
+            logging.debug(f"Fetched latest from remote '{self.remote_name}'")
+        except git.exc.GitCommandError as e:
+            logging.warning(f"Failed to fetch from remote '{self.remote_name}': {str(e)}")
+            return
+        
+        # The fetch updated the remote-tracking ref, so no ls-remote round-trip is needed
+        try:
+            self.remote_commit = self.repo.git.rev_parse('--verify', '--quiet',
+                                                         f'refs/remotes/{self.remote_name}/{self.branch}')
+        except git.exc.GitCommandError:
+            logging.debug(f"Branch {self.branch} does not exist on remote {self.remote_name}. No merge performed.")
+            return
+        
+        if self.remote_commit == self.repo.head.commit.hexsha:
+            logging.debug(f"Local branch {self.branch} is up-to-date with remote {self.remote_name}. No merge needed.")
+            return
+        try:
+            self.repo.git.merge('--no-edit', f'refs/remotes/{self.remote_name}/{self.branch}')
+            logging.debug(f"Merged latest changes for branch {self.branch} from remote {self.remote_name}")
+        except git.exc.GitCommandError as merge_error:
+            logging.warning(f"Could not merge from remote '{self.remote_name}': {str(merge_error)}")
+            logging.warning("Continuing with local changes only.")
+            try:
+                self.repo.git.merge('--abort')
+            except git.exc.GitCommandError:
+                pass
+    
+    def commit(self, message: str, paths: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Commit changes to the branch.
+        
+        Args:
+            message: Commit message
+            paths: Paths to commit through the index, see commit_paths(); all
+                changes in the worktree if None
+        
+        Returns:
+            SHA of the new commit, or None if there was nothing to commit
+        """
+        if paths is not None:
+            commit = commit_paths(self.repo, paths, message)
+        else:
+            commit = self._commit_all(message)
+        if commit:
+            self.commits.append(commit)
+            logging.debug(f"Committed {commit[:12]}: {message}")
+        return commit
+    
+    def _commit_all(self, message: str) -> Optional[str]:
+        """Stage every change in the worktree and commit it with the git CLI."""
+        self.repo.git.add(A=True)
+        try:
+            self.repo.git.diff('--cached', '--quiet')
+            logging.debug(f"Nothing to commit for '{message}'")
+            return None
+        except git.exc.GitCommandError:
+            pass  # Exit status 1: there are staged changes
+        self.repo.git.commit('-m', message)
+        return self.repo.head.commit.hexsha
+    
+    def push(self) -> None:
+        """
+        Push the branch once with every commit made in the transaction.
+        
+        Pushes to one host are limited to PUSH_CONCURRENCY_PER_HOST at a time;
+        transient failures are retried with exponential backoff.
+        
+        Raises:
+            git.exc.GitCommandError: If the push is rejected or fails
+        """
+        args = []
+        if self.atomic:
+            args.append('--atomic')
+        if self.force_with_lease:
+            args.append(self._lease_option())
+        host = remote_host(self.repo.remotes[self.remote_name].url)
+        
+        for attempt in range(self.retries + 1):
+            self.push_attempts += 1
+            try:
+                with push_slot(host):
+                    self.repo.git.push(*args, self.remote_name, self.branch)
+                break
+            except git.exc.GitCommandError as e:
+                if attempt == self.retries or not is_transient_push_error(e):
+                    raise
+                # Full jitter keeps parallel deploys from retrying in lockstep
+                delay = random.uniform(0, PUSH_RETRY_BACKOFF * 2 ** attempt)
+                logging.warning(f"Push to {host} failed ({str(e).strip().splitlines()[-1]}); "
+                                f"retrying in {delay:.1f}s")
+                time.sleep(delay)
+        logging.debug(f"Pushed {len(self.commits)} commit(s) to remote {self.remote_name} on branch {self.branch}")
+    
+    def _resolve_remote(self) -> str:
+        """Get the remote name to use, registering a remote URL under the custom remote name."""
+        if not self.remote:
+            return GIT_DEFAULT_REMOTE_NAME
+        remote_names = [r.name for r in self.repo.remotes]
+        if self.remote in remote_names:
+            logging.debug(f"Using existing remote '{self.remote}'")
+            return self.remote
+        
+        # Assume remote is a valid Git URL - use it with the custom remote name
+        if GIT_CUSTOM_REMOTE_NAME in remote_names:
+            self.repo.git.remote('set-url', GIT_CUSTOM_REMOTE_NAME, self.remote)
+            logging.debug(f"Updated URL for existing remote '{GIT_CUSTOM_REMOTE_NAME}'")
+        else:
+            self.repo.create_remote(GIT_CUSTOM_REMOTE_NAME, self.remote)
+            logging.debug(f"Created new remote '{GIT_CUSTOM_REMOTE_NAME}' with URL '{self.remote}'")
+        return GIT_CUSTOM_REMOTE_NAME
+    
+    def _lease_option(self) -> str:
+        """Build the --force-with-lease option from the state seen by the fetch."""
+        if not self.fetched:
+            # Fall back to the remote-tracking ref left by an earlier fetch
+            return f'--force-with-lease=refs/heads/{self.branch}'
+        # An empty expected value requires the branch to still be absent on the remote
+        return f'--force-with-lease=refs/heads/{self.branch}:{self.remote_commit or ""}'
+
+
+def commit_paths(repo, paths: List[str], message: str) -> Optional[str]:
+    """
+    Commit a known list of paths through the index, without scanning the worktree.
+    
+    Only the given paths are staged, so unrelated modified or untracked files
+    are never swept into the commit. Paths that no longer exist are removed
+    from the index if they were tracked. Changes staged earlier by the user are
+    committed too, as with a plain ``git commit``. Commit hooks run as usual.
+    
+    Args:
+        repo: Git repository object
+        paths: File paths, absolute or relative to the working tree
+        message: Commit message
+        
+    Returns:
+        SHA of the new commit, or None if there was nothing to commit
+        
+    Raises:
+        git.exc.HookExecutionError: If a commit hook rejects the commit
+    """
+    index = repo.index
+    to_add, to_remove = [], []
+    for path in paths:
+        relative_path = os.path.relpath(path, repo.working_tree_dir) if os.path.isabs(path) else path
+        if os.path.lexists(os.path.join(repo.working_tree_dir, relative_path)):
+            to_add.append(relative_path)
+        elif (relative_path, 0) in index.entries:
+            to_remove.append(relative_path)
+    if to_add:
+        index.add(to_add)
+    if to_remove:
+        index.remove(to_remove, working_tree=False)
+    
+    tree = index.write_tree()
+    if repo.head.is_valid() and tree.hexsha == repo.head.commit.tree.hexsha:
+        logging.debug(f"Nothing to commit for '{message}'")
+        return None
+    if not repo.head.is_valid() and not index.entries:
+        return None
+    return index.commit(message).hexsha
+
+
+def configure_push_concurrency(per_host: int) -> None:
+    """
+    Set how many pushes may run at the same time against one host.
+    
+    Args:
+        per_host: Maximum concurrent pushes per host
+    """
+    global _push_concurrency
+    with _push_slots_lock:
+        _push_concurrency = max(1, per_host)
+        _push_slots.clear()
+
+
+@contextmanager
+def push_slot(host: str) -> Iterator[None]:
+    """
+    Hold one of the push slots of a host.
+    
+    Args:
+        host: Host name as returned by remote_host()
+    """
+    with _push_slots_lock:
+        slot = _push_slots.get(host)
+        if slot is None:
+            slot = _push_slots[host] = threading.BoundedSemaphore(_push_concurrency)
+    with slot:
+        yield
+
+
+def remote_host(url: str) -> str:
+    """
+    Get the host of a git remote URL.
+    
+    Args:
+        url: Remote URL, e.g. https://github.com/org/repo or git@github.com:org/repo.git
+        
+    Returns:
+        Lower-case host name, or 'local' for local paths
+    """
+    hostname = urllib.parse.urlparse(url).hostname
+    if hostname:
+        return hostname.lower()
+    # scp-like syntax: [user@]host:path
+    match = re.match(r'^(?:[^@/]+@)?([^:/]{2,}):', url)
+    if match:
+        return match.group(1).lower()
+    return 'local'
+
+
+def is_transient_push_error(error: Exception) -> bool:
+    """
+    Check whether a failed push is worth retrying.
+    
+    Args:
+        error: Exception raised by the push
+        
+    Returns:
+        True for network failures, server errors and rate limiting; False for
+        rejections such as non-fast-forward updates or authentication failures
+    """
+    message = str(error).lower()
+    if any(pattern in message for pattern in REJECTED_PUSH_ERRORS):
+        return False
+    return any(pattern in message for pattern in TRANSIENT_PUSH_ERRORS)
+
+
 def extract_git_info(repo_path: str, repo_info: Dict) -> None:
     """
     Extract git repository information including organization, URL, and default branch.
@@ -11,6 +11,8 @@ import requests
 import fnmatch
 from pathlib import Path
 
+from jpl.slim.utils.file_utils import list_repository_files, walk_repository
+
 
 def download_and_place_file(repo, url, filename, target_relative_path_in_repo=''):
     """
@@ -174,7 +176,7 @@ def repo_file_to_list(file_path):
 
 def fetch_relative_file_paths(directory):
     """
-    Fetch relative file paths in a directory.
+    Fetch relative file paths in a directory, skipping files ignored by git.
     
     Args:
         directory: Directory to fetch file paths from
@@ -182,13 +184,7 @@ def fetch_relative_file_paths(directory):
     Returns:
         list: List of relative file paths
     """
-    relative_paths = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            # Get the relative file path and add it to the list
-            relative_path = os.path.relpath(os.path.join(root, file), directory)
-            relative_paths.append(relative_path)
-    return relative_paths
+    return list_repository_files(directory)
 
 
 def fetch_readme(repo_path):
@@ -212,13 +208,15 @@ def fetch_readme(repo_path):
     return None
 
 
-def fetch_repository_context(repo_path, repository_context_config):
+def fetch_repository_context(repo_path, repository_context_config, threads=None):
     """
     Fetch repository context based on configuration categories and patterns.
     
     Args:
         repo_path: Path to the repository
         repository_context_config: Dictionary with categories, include_patterns, exclude_patterns, max_characters
+        threads: Worker threads for the directory walk; None uses the configured
+            default, or a thread pool when the repository is on a remote filesystem
         
     Returns:
         str: Combined context content, or None if not found
@@ -264,7 +262,7 @@ def fetch_repository_context(repo_path, repository_context_config):
     
     # Fetch files using the final pattern list
     # exclude_patterns are handled at the file level in _fetch_files_by_patterns
-    content = _fetch_files_by_patterns(repo_path, final_patterns, exclude_patterns)
+    content = _fetch_files_by_patterns(repo_path, final_patterns, exclude_patterns, threads=threads)
     
     # Handle max_characters limit
     if content and len(content) > max_characters:
@@ -272,7 +270,7 @@ def fetch_repository_context(repo_path, repository_context_config):
     
     # For structure category, handle separately as it doesn't use patterns
     if categories and "structure" in categories:
-        structure_content = fetch_directory_structure(repo_path, exclude_patterns)
+        structure_content = fetch_directory_structure(repo_path, exclude_patterns, threads=threads)
         if structure_content:
             if content:
                 content = f"{content}\n\n=== STRUCTURE ===\n{structure_content}"
@@ -318,7 +316,7 @@ def fetch_test_files(repo_path, include_patterns, exclude_patterns):
     return _fetch_files_by_patterns(repo_path, test_include, exclude_patterns, max_files=5)
 
 
-def fetch_directory_structure(repo_path, exclude_patterns):
+def fetch_directory_structure(repo_path, exclude_patterns, threads=None):
     """Fetch directory structure as a tree listing."""
     structure_lines = []
     
@@ -338,8 +336,8 @@ def fetch_directory_structure(repo_path, exclude_patterns):
         
         return dirs_filtered
     
-    # Walk directory tree
-    for root, dirs, files in os.walk(repo_path):
+    # Walk directory tree in sorted order so the listing is deterministic
+    for root, dirs, files in walk_repository(repo_path, threads=threads):
         if len(structure_lines) > 100:  # Limit total lines
             structure_lines.append("... [truncated]")
             break
@@ -350,12 +348,12 @@ def fetch_directory_structure(repo_path, exclude_patterns):
     return "\n".join(structure_lines) if structure_lines else None
 
 
-def _fetch_files_by_patterns(repo_path, include_patterns, exclude_patterns, max_files=None):
+def _fetch_files_by_patterns(repo_path, include_patterns, exclude_patterns, max_files=None, threads=None):
     """Helper function to fetch files matching include patterns but not exclude patterns."""
     content_parts = []
     file_count = 0
     
-    for root, dirs, files in os.walk(repo_path):
+    for root, dirs, files in walk_repository(repo_path, threads=threads):
         # Filter out excluded directories
         dirs[:] = [d for d in dirs if not _matches_exclude_patterns(os.path.join(root, d), exclude_patterns)]
         
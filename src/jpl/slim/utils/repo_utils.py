@@ -6,18 +6,26 @@ extracting project metadata from various sources, and categorizing repository
 contents. It leverages third-party libraries for robust file parsing.
 """
 
+import copy
+import fnmatch
 import json
 import logging
 import os
 import re
+import threading
 import tomllib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple, Any, Union
+from typing import Callable, Dict, Iterator, List, Set, Optional, Tuple, Any, Union
 import yaml
 import xml.etree.ElementTree as ET
 
+from jpl.slim.utils.file_utils import scan_tree, walk_repository
+
 __all__ = [
     "scan_repository",
+    "iter_repository_entries",
+    "RepositoryEntry",
     "extract_project_metadata", 
     "categorize_directories",
     "detect_languages",
@@ -98,6 +106,42 @@ LANGUAGE_EXTENSIONS = {
     '.env': 'Environment'
 }
 
+# Special cases for files without extensions or special names
+SPECIAL_FILE_LANGUAGES = {
+    'dockerfile': 'Docker',
+    'dockerfile.dev': 'Docker',
+    'dockerfile.prod': 'Docker',
+    'dockerfile.test': 'Docker',
+    'makefile': 'Makefile',
+    'gnumakefile': 'Makefile',
+    'rakefile': 'Ruby',
+    'gemfile': 'Ruby',
+    'guardfile': 'Ruby',
+    'podfile': 'Ruby',
+    'thorfile': 'Ruby',
+    'vagrantfile': 'Ruby',
+    'berksfile': 'Ruby',
+    'cheffile': 'Ruby',
+    'puppetfile': 'Ruby',
+    'fastfile': 'Ruby',
+    'appfile': 'Ruby',
+    'deliverfile': 'Ruby',
+    'snapfile': 'Ruby',
+    'scanfile': 'Ruby',
+    'gymfile': 'Ruby',
+    'matchfile': 'Ruby',
+    'jenkinsfile': 'Groovy',
+    'gulpfile.js': 'JavaScript',
+    'gruntfile.js': 'JavaScript',
+    'webpack.config.js': 'JavaScript',
+    'cmakelists.txt': 'CMake',
+    'build.gradle': 'Gradle',
+    'build.gradle.kts': 'Kotlin',
+    'settings.gradle': 'Gradle',
+    'settings.gradle.kts': 'Kotlin',
+    '.env': 'Environment'
+}
+
 # Key files to look for in repositories
 KEY_FILE_PATTERNS = {
     'readme': [
@@ -124,6 +168,12 @@ KEY_FILE_PATTERNS = {
     'github_workflows': [r'\.github/workflows/.*\.ya?ml$']
 }
 
+# Maximum number of parsed manifest files kept in memory
+MANIFEST_CACHE_SIZE = 256
+
+# Hidden files that are still scanned when hidden files are excluded
+IMPORTANT_DOTFILES = {'.env', '.gitignore', '.dockerignore', '.editorconfig', '.eslintrc', '.babelrc', '.prettierrc'}
+
 # Directories to exclude from analysis
 EXCLUDE_DIRECTORIES = {
     '.git', '.svn', '.hg', '.bzr',  # Version control
@@ -135,16 +185,50 @@ EXCLUDE_DIRECTORIES = {
 }
 
 
+@dataclass(slots=True)
+class RepositoryEntry:
+    """
+    Compact record for one file or directory yielded by iter_repository_entries().
+    
+    Attributes:
+        path: Path relative to the repository root
+        size: File size in bytes (0 for directories or when sizes are not computed)
+        language: Detected programming language, or None
+        category: "source", "test", "documentation" or "other". Directories are
+            categorized by name; files inherit the category of their nearest
+            categorized ancestor directory.
+        is_dir: Whether the entry is a directory
+    """
+    path: str
+    size: int
+    language: Optional[str]
+    category: str
+    is_dir: bool = False
+
+
 def scan_repository(repo_path: Union[str, Path], 
                    exclude_dirs: Optional[Set[str]] = None,
-                   include_hidden: bool = False) -> Dict[str, Any]:
+                   include_hidden: bool = False,
+                   include_files: Union[bool, Callable[[str], bool]] = True,
+                   include_directories: bool = True,
+                   threads: Optional[int] = None) -> Dict[str, Any]:
     """
     Scan a repository and extract comprehensive information about its structure.
     
+    The scan consumes iter_repository_entries(), so aggregates are computed on
+    the fly. Memory-sensitive callers can skip materializing the "files" and
+    "directories" lists; "file_count", "directory_count", "size_bytes",
+    "languages" and the categorized directory lists are always populated.
+    
     Args:
         repo_path: Path to the repository
         exclude_dirs: Additional directories to exclude (merges with defaults)
         include_hidden: Whether to include hidden files/directories
+        include_files: Whether to list every file in "files", or a predicate on
+            the relative path selecting which files to list
+        include_directories: Whether to list every directory in "directories"
+        threads: Worker threads for the directory walk; None uses the configured
+            default, or a thread pool when the repository is on a remote filesystem
         
     Returns:
         Dictionary containing repository analysis results
@@ -155,12 +239,6 @@ def scan_repository(repo_path: Union[str, Path],
     if not repo_path.exists():
         raise FileNotFoundError(f"Repository path does not exist: {repo_path}")
     
-    # Merge exclude directories
-    exclude_set = EXCLUDE_DIRECTORIES.copy()
-    if exclude_dirs:
-        exclude_set.update(exclude_dirs)
-    logging.debug(f"Excluding directories: {exclude_set}")
-    
     repo_info = {
         "project_name": repo_path.name,
         "description": "",
@@ -174,26 +252,114 @@ def scan_repository(repo_path: Union[str, Path],
         "test_dirs": [],
         "languages": set(),
         "file_count": 0,
+        "directory_count": 0,
         "size_bytes": 0
     }
     
-    logging.debug(f"Scanning repository: {repo_path}")
+    # Key files are needed for both the README metadata and the scan results
+    repo_info["key_files"] = find_key_files(repo_path)
     
     # Extract project metadata from various sources
-    _extract_all_metadata(repo_path, repo_info)
+    _extract_all_metadata(repo_path, repo_info, repo_info["key_files"])
     
     # Scan filesystem
-    _scan_filesystem(repo_path, repo_info, exclude_set, include_hidden)
+    entries = iter_repository_entries(repo_path, exclude_dirs, include_hidden, threads=threads)
+    _scan_filesystem(repo_path, repo_info, entries, include_files, include_directories)
     
     # Convert sets to lists for serialization
     repo_info["languages"] = list(repo_info["languages"])
     
-    logging.debug(f"Repository scan complete: {len(repo_info['files'])} files, "
-                 f"{len(repo_info['directories'])} directories")
+    logging.debug(f"Repository scan complete: {repo_info['file_count']} files, "
+                 f"{repo_info['directory_count']} directories")
     
     return repo_info
 
 
+def iter_repository_entries(repo_path: Union[str, Path],
+                            exclude_dirs: Optional[Set[str]] = None,
+                            include_hidden: bool = False,
+                            compute_size: bool = True,
+                            threads: Optional[int] = None) -> Iterator[RepositoryEntry]:
+    """
+    Stream the files and directories of a repository as compact records.
+    
+    Entries are yielded top-down: each directory is followed by its files, then
+    by its subdirectories. Nothing is accumulated, so callers can aggregate
+    what they need without holding the whole file list in memory.
+    
+    Args:
+        repo_path: Path to the repository
+        exclude_dirs: Additional directories to exclude (merges with defaults)
+        include_hidden: Whether to include hidden files/directories
+        compute_size: Whether to stat each file for its size
+        threads: Worker threads for the directory walk (see file_utils.resolve_scan_threads)
+        
+    Yields:
+        RepositoryEntry records for each directory and file
+    """
+    repo_path = Path(repo_path)
+    
+    # Merge exclude directories
+    exclude_set = EXCLUDE_DIRECTORIES.copy()
+    if exclude_dirs:
+        exclude_set.update(exclude_dirs)
+    logging.debug(f"Excluding directories: {exclude_set}")
+    
+    repo_str = str(repo_path)
+    
+    # Category inherited by files in each directory, keyed by relative path
+    inherited_categories = {'': 'other'}
+    
+    # scan_tree skips excluded and git-ignored directories and hands back
+    # entries whose file type and stat result are reused instead of re-queried
+    for rel_path, dirs, file_entries in scan_tree(repo_str, exclude_set, threads=threads,
+                                                  prefetch_stat=compute_size):
+        # Filter out hidden directories if not including them
+        if not include_hidden:
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+        
+        if rel_path:
+            # Categorize directories
+            dir_path = os.path.join(repo_str, rel_path)
+            if is_source_directory(dir_path):
+                category = "source"
+            elif is_test_directory(dir_path):
+                category = "test"
+            elif is_documentation_directory(dir_path):
+                category = "documentation"
+            else:
+                category = "other"
+            
+            parent_category = inherited_categories.get(os.path.dirname(rel_path), 'other')
+            inherited_categories[rel_path] = parent_category if category == "other" else category
+            yield RepositoryEntry(rel_path, 0, None, category, True)
+        
+        file_category = inherited_categories[rel_path]
+        prefix = rel_path + os.sep if rel_path else ''
+        
+        # Process files
+        for entry in file_entries:
+            file_name = entry.name
+            # Filter out hidden files if not including them, but allow important dotfiles
+            if not include_hidden and file_name.startswith('.') and file_name not in IMPORTANT_DOTFILES:
+                continue
+            
+            # Add file size
+            size = 0
+            if compute_size:
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    pass  # File might be a broken symlink or have permission issues
+            
+            # Only extensionless files with unknown names need their shebang read
+            language, needs_shebang = _language_from_name(file_name)
+            if needs_shebang and (size or not compute_size):
+                language = _language_from_shebang(entry.path)
+            
+            yield RepositoryEntry(prefix + file_name, size, language, file_category)
+
+
 def extract_project_metadata(repo_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Extract project metadata from various configuration files.
@@ -299,8 +465,7 @@ def extract_from_package_json(file_path: Union[str, Path], metadata: Dict[str, A
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_manifest(file_path, 'json')
             
         if 'name' in data:
             metadata['project_name'] = data['name']
@@ -345,8 +510,7 @@ def extract_from_setup_py(file_path: Union[str, Path], metadata: Dict[str, Any])
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _load_manifest(file_path, 'text')
             
         # Extract common setup() parameters using regex
         patterns = {
@@ -385,8 +549,7 @@ def extract_from_pyproject_toml(file_path: Union[str, Path], metadata: Dict[str,
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'rb') as f:
-            data = tomllib.load(f)
+        data = _load_manifest(file_path, 'toml')
             
         # Check for Poetry configuration
         if 'tool' in data and 'poetry' in data['tool']:
@@ -417,8 +580,7 @@ def extract_from_readme(file_path: Union[str, Path], metadata: Dict[str, Any]) -
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _load_manifest(file_path, 'text')
             
         # Try to extract the first heading as the project name
         title_match = re.search(r'^#\s+(.+)', content, re.MULTILINE)
@@ -461,8 +623,7 @@ def extract_from_pom_xml(file_path: Union[str, Path], metadata: Dict[str, Any])
         metadata: Dictionary to update with extracted information
     """
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        root = _load_manifest(file_path, 'xml').getroot()
         
         # Handle namespace - try with and without namespace
         ns = {}
@@ -528,8 +689,7 @@ def extract_from_build_gradle(file_path: Union[str, Path], metadata: Dict[str, A
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _load_manifest(file_path, 'text')
             
         # Extract common Gradle properties using regex
         patterns = {
@@ -566,8 +726,7 @@ def extract_from_cargo_toml(file_path: Union[str, Path], metadata: Dict[str, Any
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'rb') as f:
-            data = tomllib.load(f)
+        data = _load_manifest(file_path, 'toml')
             
         if 'package' in data:
             package = data['package']
@@ -610,8 +769,7 @@ def extract_from_go_mod(file_path: Union[str, Path], metadata: Dict[str, Any]) -
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _load_manifest(file_path, 'text')
             
         # Extract module name
         module_match = re.search(r'^module\s+(.+)$', content, re.MULTILINE)
@@ -652,8 +810,7 @@ def extract_from_composer_json(file_path: Union[str, Path], metadata: Dict[str,
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_manifest(file_path, 'json')
             
         if 'name' in data:
             metadata['project_name'] = data['name'].split('/')[-1]
@@ -696,8 +853,7 @@ def extract_from_gemfile(file_path: Union[str, Path], metadata: Dict[str, Any])
         metadata: Dictionary to update with extracted information
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _load_manifest(file_path, 'text')
             
         # Extract gem dependencies
         gems = re.findall(r'^\s*gem\s+[\'"]([^"\']+)["\']', content, re.MULTILINE)
@@ -720,8 +876,7 @@ def extract_from_gemfile(file_path: Union[str, Path], metadata: Dict[str, Any])
 def _extract_from_gemspec(file_path: Path, metadata: Dict[str, Any]) -> None:
     """Helper to extract info from .gemspec file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = _load_manifest(file_path, 'text')
             
         # Extract gem name
         name_match = re.search(r'\.name\s*=\s*[\'"]([^"\']+)["\']', content)
@@ -756,8 +911,7 @@ def extract_from_csproj(file_path: Union[str, Path], metadata: Dict[str, Any]) -
         metadata: Dictionary to update with extracted information
     """
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        root = _load_manifest(file_path, 'xml').getroot()
         
         # Extract from PropertyGroup elements
         for prop_group in root.findall('.//PropertyGroup'):
@@ -821,30 +975,32 @@ def find_key_files(repo_path: Union[str, Path]) -> Dict[str, str]:
     """
     repo_path = Path(repo_path)
     key_files = {}
+    found_files = {file_type: [] for file_type in KEY_FILE_PATTERNS}
+    compiled_patterns = [
+        (file_type, [re.compile(pattern) for pattern in patterns])
+        for file_type, patterns in KEY_FILE_PATTERNS.items()
+    ]
     
-    for file_type, patterns in KEY_FILE_PATTERNS.items():
-        found_files = []
+    # Walk through repository once, checking every file against every file type;
+    # excluded and git-ignored directories are never visited
+    for root, dirs, files in walk_repository(repo_path, EXCLUDE_DIRECTORIES, respect_gitignore=True):
+        # Skip hidden directories
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
         
-        # Walk through repository to find matching files
-        for root, dirs, files in os.walk(repo_path):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
+        root_path = Path(root)
+        for file_name in files:
+            rel_path = (root_path / file_name).relative_to(repo_path)
+            rel_str = str(rel_path)
             
-            root_path = Path(root)
-            for file_name in files:
-                file_path = root_path / file_name
-                rel_path = file_path.relative_to(repo_path)
-                
-                # Check if file matches any of the patterns
-                for pattern in patterns:
-                    if re.search(pattern, str(rel_path)):
-                        found_files.append(rel_path)
-                        break
-        
-        if found_files:
+            for file_type, patterns in compiled_patterns:
+                if any(pattern.search(rel_str) for pattern in patterns):
+                    found_files[file_type].append(rel_path)
+    
+    for file_type, paths in found_files.items():
+        if paths:
             # Sort by depth (prefer root directory) and then by name
-            found_files.sort(key=lambda x: (len(x.parts), str(x).lower()))
-            key_files[file_type] = str(found_files[0])
+            paths.sort(key=lambda x: (len(x.parts), str(x).lower()))
+            key_files[file_type] = str(paths[0])
     
     return key_files
 
@@ -853,76 +1009,19 @@ def get_file_language(file_path: Union[str, Path]) -> Optional[str]:
     """
     Determine the programming language of a file based on its extension.
     
+    Files without an extension and without a well-known name are identified by
+    their shebang line, if any.
+    
     Args:
         file_path: Path to the file
         
     Returns:
         Language name or None if not recognized
     """
-    file_path = Path(file_path)
-    extension = file_path.suffix.lower()
-    filename = file_path.name.lower()
-    
-    # Special cases for files without extensions or special names
-    special_files = {
-        'dockerfile': 'Docker',
-        'dockerfile.dev': 'Docker',
-        'dockerfile.prod': 'Docker',
-        'dockerfile.test': 'Docker',
-        'makefile': 'Makefile',
-        'gnumakefile': 'Makefile',
-        'rakefile': 'Ruby',
-        'gemfile': 'Ruby',
-        'guardfile': 'Ruby',
-        'podfile': 'Ruby',
-        'thorfile': 'Ruby',
-        'vagrantfile': 'Ruby',
-        'berksfile': 'Ruby',
-        'cheffile': 'Ruby',
-        'puppetfile': 'Ruby',
-        'fastfile': 'Ruby',
-        'appfile': 'Ruby',
-        'deliverfile': 'Ruby',
-        'snapfile': 'Ruby',
-        'scanfile': 'Ruby',
-        'gymfile': 'Ruby',
-        'matchfile': 'Ruby',
-        'jenkinsfile': 'Groovy',
-        'gulpfile.js': 'JavaScript',
-        'gruntfile.js': 'JavaScript',
-        'webpack.config.js': 'JavaScript',
-        'cmakelists.txt': 'CMake',
-        'build.gradle': 'Gradle',
-        'build.gradle.kts': 'Kotlin',
-        'settings.gradle': 'Gradle',
-        'settings.gradle.kts': 'Kotlin',
-        '.env': 'Environment'
-    }
-    
-    if filename in special_files:
-        return special_files[filename]
-    
-    # Check shebang for shell scripts without extension
-    if not extension and file_path.exists():
-        try:
-            with open(file_path, 'rb') as f:
-                first_line = f.readline()
-                if first_line.startswith(b'#!'):
-                    shebang = first_line.decode('utf-8', errors='ignore').strip()
-                    if 'python' in shebang:
-                        return 'Python'
-                    elif 'ruby' in shebang:
-                        return 'Ruby'
-                    elif 'node' in shebang:
-                        return 'JavaScript'
-                    elif 'sh' in shebang or 'bash' in shebang or 'zsh' in shebang:
-                        return 'Shell'
-                    elif 'perl' in shebang:
-                        return 'Perl'
-        except:
-            pass
-    
-    return LANGUAGE_EXTENSIONS.get(extension)
+    language, needs_shebang = _language_from_name(os.path.basename(file_path))
+    if needs_shebang:
+        return _language_from_shebang(file_path)
+    return language
 
 
 def is_source_directory(dir_path: Union[str, Path]) -> bool:
@@ -1004,84 +1103,182 @@ def is_documentation_directory(dir_path: Union[str, Path]) -> bool:
 
 # Private helper functions
 
-def _extract_all_metadata(repo_path: Path, metadata: Dict[str, Any]) -> None:
-    """Extract metadata from all available sources."""
-    # Try package.json (Node.js)
-    package_json = repo_path / 'package.json'
-    if package_json.exists():
-        extract_from_package_json(package_json, metadata)
+def _language_from_name(file_name: str) -> Tuple[Optional[str], bool]:
+    """
+    Determine a file's language from its name alone, without touching the filesystem.
     
-    # Try setup.py (Python)
-    setup_py = repo_path / 'setup.py'
-    if setup_py.exists():
-        extract_from_setup_py(setup_py, metadata)
-        
-    # Try pyproject.toml (Python)
-    pyproject_toml = repo_path / 'pyproject.toml'
-    if pyproject_toml.exists():
-        extract_from_pyproject_toml(pyproject_toml, metadata)
-        
-    # Try pom.xml (Java/Maven)
-    pom_xml = repo_path / 'pom.xml'
-    if pom_xml.exists():
-        extract_from_pom_xml(pom_xml, metadata)
-        
-    # Try build.gradle or build.gradle.kts (Java/Gradle)
-    for gradle_file in ['build.gradle', 'build.gradle.kts']:
-        gradle_path = repo_path / gradle_file
-        if gradle_path.exists():
-            extract_from_build_gradle(gradle_path, metadata)
-            break
+    Returns:
+        Tuple of (language, needs_shebang); needs_shebang is True when the name
+        is not conclusive and the file's first line should be inspected
+    """
+    filename = file_name.lower()
+    if filename in SPECIAL_FILE_LANGUAGES:
+        return SPECIAL_FILE_LANGUAGES[filename], False
     
-    # Try settings.gradle for project name (prioritize over directory name)
-    settings_gradle = repo_path / 'settings.gradle'
-    if settings_gradle.exists():
-        try:
-            with open(settings_gradle, 'r', encoding='utf-8') as f:
-                content = f.read()
-            name_match = re.search(r'rootProject\.name\s*=\s*[\'"]([^"\']+)["\']', content)
-            if name_match:
-                current_name = metadata.get('project_name', '')
-                # Only override if current name is the directory name or empty
-                if not current_name or current_name == repo_path.name:
-                    metadata['project_name'] = name_match.group(1)
-        except Exception:
-            pass
-            
-    # Try Cargo.toml (Rust)
-    cargo_toml = repo_path / 'Cargo.toml'
-    if cargo_toml.exists():
-        extract_from_cargo_toml(cargo_toml, metadata)
-        
-    # Try go.mod (Go)
-    go_mod = repo_path / 'go.mod'
-    if go_mod.exists():
-        extract_from_go_mod(go_mod, metadata)
-        
-    # Try composer.json (PHP)
-    composer_json = repo_path / 'composer.json'
-    if composer_json.exists():
-        extract_from_composer_json(composer_json, metadata)
-        
-    # Try Gemfile (Ruby)
-    gemfile = repo_path / 'Gemfile'
-    if gemfile.exists():
-        extract_from_gemfile(gemfile, metadata)
-        
-    # Try .csproj, .vbproj, .fsproj files (.NET)
-    for proj_pattern in ['*.csproj', '*.vbproj', '*.fsproj']:
-        proj_files = list(repo_path.glob(proj_pattern))
-        if proj_files:
-            extract_from_csproj(proj_files[0], metadata)
-            break
+    # Same semantics as Path.suffix: leading dots and trailing dots are not extensions
+    extension = os.path.splitext(filename)[1]
+    if extension == '.':
+        extension = ''
+    if not extension:
+        return None, True
+    return LANGUAGE_EXTENSIONS.get(extension), False
+
+
+def _language_from_shebang(file_path: Union[str, Path]) -> Optional[str]:
+    """Detect a script's language from its shebang line."""
+    try:
+        with open(file_path, 'rb') as f:
+            first_line = f.readline(256)
+    except OSError:
+        return None
+    
+    if first_line.startswith(b'#!'):
+        shebang = first_line.decode('utf-8', errors='ignore').strip()
+        if 'python' in shebang:
+            return 'Python'
+        elif 'ruby' in shebang:
+            return 'Ruby'
+        elif 'node' in shebang:
+            return 'JavaScript'
+        elif 'sh' in shebang or 'bash' in shebang or 'zsh' in shebang:
+            return 'Shell'
+        elif 'perl' in shebang:
+            return 'Perl'
+    return None
+
+
+def _extract_all_metadata(repo_path: Path, metadata: Dict[str, Any],
+                          key_files: Optional[Dict[str, str]] = None) -> None:
+    """
+    Extract metadata from all manifests present in the repository root.
+    
+    The root is listed once and only the extractors whose manifests are present
+    run, in the order of _MANIFEST_EXTRACTORS so that later manifests override
+    earlier ones. Parsed manifests are cached by _load_manifest().
+    """
+    try:
+        with os.scandir(repo_path) as it:
+            root_files = sorted(entry.name for entry in it if entry.is_file())
+    except OSError as e:
+        logging.warning(f"Could not list repository root {repo_path}: {e}")
+        root_files = []
+    root_file_set = set(root_files)
+    
+    for manifest_names, extractor in _MANIFEST_EXTRACTORS:
+        manifest = _match_manifest(manifest_names, root_files, root_file_set)
+        if manifest:
+            extractor(repo_path / manifest, metadata)
     
     # Try README files (last to not override more specific metadata)
-    key_files = find_key_files(repo_path)
+    if key_files is None:
+        key_files = find_key_files(repo_path)
     if 'readme' in key_files:
         readme_path = repo_path / key_files['readme']
         extract_from_readme(readme_path, metadata)
 
 
+def _extract_from_settings_gradle(file_path: Path, metadata: Dict[str, Any]) -> None:
+    """Helper to take the project name from settings.gradle."""
+    try:
+        content = _load_manifest(file_path, 'text')
+        name_match = re.search(r'rootProject\.name\s*=\s*[\'"]([^"\']+)["\']', content)
+        if name_match:
+            current_name = metadata.get('project_name', '')
+            # Only override if current name is the directory name or empty
+            if not current_name or current_name == Path(file_path).parent.name:
+                metadata['project_name'] = name_match.group(1)
+    except Exception:
+        pass
+
+
+# Manifest extractors in the order they run, so later manifests override earlier ones.
+# Each entry lists alternative file names (or globs); only the first one present is used.
+_MANIFEST_EXTRACTORS: List[Tuple[Tuple[str, ...], Callable[[Path, Dict[str, Any]], None]]] = [
+    (('package.json',), extract_from_package_json),                     # Node.js
+    (('setup.py',), extract_from_setup_py),                             # Python
+    (('pyproject.toml',), extract_from_pyproject_toml),                 # Python
+    (('pom.xml',), extract_from_pom_xml),                               # Java/Maven
+    (('build.gradle', 'build.gradle.kts'), extract_from_build_gradle),  # Java/Gradle
+    (('settings.gradle',), _extract_from_settings_gradle),              # Gradle project name
+    (('Cargo.toml',), extract_from_cargo_toml),                         # Rust
+    (('go.mod',), extract_from_go_mod),                                 # Go
+    (('composer.json',), extract_from_composer_json),                   # PHP
+    (('Gemfile',), extract_from_gemfile),                               # Ruby
+    (('*.csproj', '*.vbproj', '*.fsproj'), extract_from_csproj),        # .NET
+]
+
+
+def _match_manifest(manifest_names: Tuple[str, ...], root_files: List[str],
+                    root_file_set: Set[str]) -> Optional[str]:
+    """Return the first root file matching one of the manifest names or globs."""
+    for name in manifest_names:
+        if '*' not in name:
+            if name in root_file_set:
+                return name
+            continue
+        for file_name in root_files:
+            if fnmatch.fnmatchcase(file_name, name):
+                return file_name
+    return None
+
+
+# Parsed manifests keyed by (absolute path, format), with the (mtime, size) they were parsed at
+_manifest_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+_manifest_cache_lock = threading.Lock()
+
+
+def _parse_text(file_path: str) -> str:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _parse_json(file_path: str) -> Any:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _parse_toml(file_path: str) -> Dict[str, Any]:
+    with open(file_path, 'rb') as f:
+        return tomllib.load(f)
+
+
+_MANIFEST_PARSERS = {
+    'text': _parse_text,
+    'json': _parse_json,
+    'toml': _parse_toml,
+    'xml': ET.parse
+}
+# Formats parsed into nested dicts and lists, which callers receive as copies
+_MUTABLE_MANIFEST_FORMATS = {'json', 'toml'}
+
+
+def _load_manifest(file_path: Union[str, Path], file_format: str) -> Any:
+    """
+    Parse a manifest file, reusing the result while the file is unchanged.
+    
+    Repository scans and metadata extraction in the same run read the same
+    manifests, so each file is parsed at most once per modification. JSON and
+    TOML data is returned as a deep copy, so values placed in metadata never
+    alias the cache; XML trees are shared and must not be modified.
+    """
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = (path, file_format)
+    
+    with _manifest_cache_lock:
+        cached = _manifest_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        data = cached[1]
+    else:
+        data = _MANIFEST_PARSERS[file_format](path)
+        with _manifest_cache_lock:
+            if len(_manifest_cache) >= MANIFEST_CACHE_SIZE:
+                _manifest_cache.pop(next(iter(_manifest_cache)))
+            _manifest_cache[key] = (signature, data)
+    return copy.deepcopy(data) if file_format in _MUTABLE_MANIFEST_FORMATS else data
+
+
 def _extract_from_dict(config_dict: Dict[str, Any], metadata: Dict[str, Any]) -> None:
     """Extract metadata from a configuration dictionary."""
     mapping = {
@@ -1111,66 +1308,28 @@ def _extract_from_dict(config_dict: Dict[str, Any], metadata: Dict[str, Any]) ->
             metadata['dependencies'] = deps
 
 
-def _scan_filesystem(repo_path: Path, repo_info: Dict[str, Any], 
-                    exclude_dirs: Set[str], include_hidden: bool) -> None:
-    """Scan the filesystem and update repository information."""
-    for root, dirs, files in os.walk(repo_path):
-        root_path = Path(root)
-        
-        # Filter out excluded directories
-        dirs[:] = [d for d in dirs if d not in exclude_dirs]
-        
-        # Filter out hidden directories if not including them
-        if not include_hidden:
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-        
-        # Process relative path
-        try:
-            rel_path = root_path.relative_to(repo_path)
-            if str(rel_path) != '.':
-                repo_info["directories"].append(str(rel_path))
-                
-                # Categorize directories
-                if is_source_directory(root_path):
-                    repo_info["src_dirs"].append(str(rel_path))
-                elif is_test_directory(root_path):
-                    repo_info["test_dirs"].append(str(rel_path))
-                elif is_documentation_directory(root_path):
-                    repo_info["doc_dirs"].append(str(rel_path))
-        except ValueError:
-            # Path is not relative to repo_path, skip
+def _scan_filesystem(repo_path: Path, repo_info: Dict[str, Any],
+                    entries: Iterator[RepositoryEntry],
+                    include_files: Union[bool, Callable[[str], bool]],
+                    include_directories: bool) -> None:
+    """Aggregate a stream of repository entries into repository information."""
+    category_lists = {"source": "src_dirs", "test": "test_dirs", "documentation": "doc_dirs"}
+    
+    for entry in entries:
+        if entry.is_dir:
+            repo_info["directory_count"] += 1
+            if include_directories:
+                repo_info["directories"].append(entry.path)
+            if entry.category in category_lists:
+                repo_info[category_lists[entry.category]].append(entry.path)
             continue
         
-        # Process files
-        for file_name in files:
-            # Filter out hidden files if not including them, but allow important dotfiles
-            important_dotfiles = {'.env', '.gitignore', '.dockerignore', '.editorconfig', '.eslintrc', '.babelrc', '.prettierrc'}
-            if not include_hidden and file_name.startswith('.') and file_name not in important_dotfiles:
-                continue
-                
-            file_path = root_path / file_name
-            try:
-                rel_file_path = file_path.relative_to(repo_path)
-                repo_info["files"].append(str(rel_file_path))
-                repo_info["file_count"] += 1
-                
-                # Add file size
-                try:
-                    repo_info["size_bytes"] += file_path.stat().st_size
-                except OSError:
-                    pass  # File might be a symlink or have permission issues
-                
-                # Identify programming languages
-                language = get_file_language(file_path)
-                if language:
-                    repo_info["languages"].add(language)
-                    
-            except ValueError:
-                # File path is not relative to repo_path, skip
-                continue
-    
-    # Find key files
-    repo_info["key_files"] = find_key_files(repo_path)
+        repo_info["file_count"] += 1
+        repo_info["size_bytes"] += entry.size
+        if entry.language:
+            repo_info["languages"].add(entry.language)
+        if include_files is True or (callable(include_files) and include_files(entry.path)):
+            repo_info["files"].append(entry.path)
 
 
 def _is_build_directory(dir_path: Path) -> bool:
@@ -0,0 +1,875 @@
+"""
+Built-in secret scanner for SLIM.
+
+A fast, in-process alternative to running ``detect-secrets scan``. Files are
+scanned in a process pool with a regex and entropy rule set modeled on
+detect-secrets' default plugins and filters, findings are streamed as files
+are scanned, and the baseline is written in detect-secrets' format so that
+``detect-secrets audit`` and the detect-secrets pre-commit hook can use it.
+
+An existing baseline can also be updated incrementally: only files git reports
+as changed since the commit the baseline was generated from are rescanned, and
+audit results recorded for unchanged secrets are kept. That commit is recorded
+in SLIM's user cache when the baseline is written.
+
+Baselines are checked for unverified secrets by streaming their results, so a
+baseline of any size is read in constant memory.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
+
+from jpl.slim.utils.file_utils import atomic_write, list_repository_files, user_cache_dir
+
+# Value of the --secrets-scanner option that selects this scanner
+BUILTIN_SCANNER = 'builtin'
+BASELINE_FILE = '.secrets.baseline'
+# detect-secrets baseline format version written by the scanner
+BASELINE_VERSION = '1.5.0'
+# Audit results that `detect-secrets audit` records and a rescan must keep
+AUDIT_KEYS = ('is_verified', 'is_secret')
+GENERATED_AT_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+# Characters read from a baseline at a time when streaming its results
+BASELINE_READ_CHUNK_SIZE = 1 << 16
+# Reading a baseline stops once more unverified secrets than this were found
+UNVERIFIED_SECRETS_LIMIT = 100
+# Same exclusions SLIM passes to `detect-secrets scan --exclude-files`
+DEFAULT_EXCLUDE_FILES = (r'\.secrets.*', r'\.git.*')
+
+BASE64_ENTROPY_LIMIT = 4.5
+HEX_ENTROPY_LIMIT = 3.0
+
+# Below this many files the scan runs in-process; starting workers costs more than it saves
+PROCESS_POOL_MIN_FILES = 64
+# Files handed to a worker at a time
+SCAN_BATCH_SIZE = 32
+
+# File types detect-secrets does not scan
+NON_TEXT_SUFFIXES = frozenset((
+    '.7z', '.bin', '.bmp', '.bz2', '.class', '.css', '.dmg', '.doc', '.eot', '.exe', '.gif', '.gz',
+    '.ico', '.iml', '.ipr', '.iws', '.jar', '.jpg', '.jpeg', '.lock', '.map', '.mo', '.pdf', '.png',
+    '.prefs', '.psd', '.rar', '.realm', '.s7z', '.sum', '.svg', '.tar', '.tif', '.tiff', '.ttf',
+    '.webp', '.woff', '.woff2', '.xls', '.xlsx', '.zip'
+))
+LOCK_FILES = frozenset((
+    'Brewfile.lock.json', 'Cartfile.resolved', 'composer.lock', 'Gemfile.lock', 'Package.resolved',
+    'package-lock.json', 'Podfile.lock', 'yarn.lock', 'Pipfile.lock', 'poetry.lock', 'Cargo.lock',
+    'packages.lock.json', 'pnpm-lock.yaml', 'go.sum'
+))
+# Files where keywords are assigned unquoted values, e.g. `password: hunter2`
+CONFIG_SUFFIXES = frozenset(('.cfg', '.conf', '.env', '.ini', '.properties', '.toml', '.yaml', '.yml'))
+
+BASE64_CHARSET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/\\-_='
+HEX_CHARSET = '0123456789abcdefABCDEF'
+
+KEYWORD_DENYLIST = (
+    'api_?key', 'auth_?key', 'service_?key', 'account_?key', 'db_?key', 'database_?key',
+    'priv_?key', 'private_?key', 'client_?key', 'db_?pass', 'database_?pass', 'key_?pass',
+    'password', 'passwd', 'pwd', 'secret', 'contraseña', 'contrasena'
+)
+
+# Filters recorded in the baseline; they match the heuristics applied below
+FILTERS_USED = (
+    {'path': 'detect_secrets.filters.allowlist.is_line_allowlisted'},
+    {'path': 'detect_secrets.filters.common.is_baseline_file', 'filename': BASELINE_FILE},
+    {'path': 'detect_secrets.filters.common.is_ignored_due_to_verification_policies', 'min_level': 2},
+    {'path': 'detect_secrets.filters.heuristic.is_indirect_reference'},
+    {'path': 'detect_secrets.filters.heuristic.is_likely_id_string'},
+    {'path': 'detect_secrets.filters.heuristic.is_lock_file'},
+    {'path': 'detect_secrets.filters.heuristic.is_not_alphanumeric_string'},
+    {'path': 'detect_secrets.filters.heuristic.is_potential_uuid'},
+    {'path': 'detect_secrets.filters.heuristic.is_prefixed_with_dollar_sign'},
+    {'path': 'detect_secrets.filters.heuristic.is_sequential_string'},
+    {'path': 'detect_secrets.filters.heuristic.is_swagger_file'},
+    {'path': 'detect_secrets.filters.heuristic.is_templated_secret'},
+)
+
+
+@dataclass(frozen=True)
+class _Rule:
+    """A regex rule; the secret is the 'secret' group if present, else the whole match."""
+    plugin: str
+    secret_type: str
+    patterns: Tuple[Pattern, ...]
+
+
+def _rule(plugin: str, secret_type: str, *patterns: str, flags: int = 0) -> _Rule:
+    return _Rule(plugin, secret_type, tuple(re.compile(pattern, flags) for pattern in patterns))
+
+
+REGEX_RULES = (
+    _rule('AWSKeyDetector', 'AWS Access Key',
+          r'(?:A3T[A-Z0-9]|ABIA|ACCA|AKIA|ASIA)[0-9A-Z]{16}'),
+    _rule('AWSKeyDetector', 'AWS Access Key',
+          r'aws.{0,20}?(?:key|pwd|pw|password|pass|token).{0,20}?[\'"](?P<secret>[0-9a-zA-Z/+]{40})[\'"]',
+          flags=re.IGNORECASE),
+    _rule('ArtifactoryDetector', 'Artifactory Credentials',
+          r'(?:\s|=|:|"|^)(?P<secret>AKC[a-zA-Z0-9]{10,})(?:\s|"|$)',
+          r'(?:\s|=|:|"|^)(?P<secret>AP[\dABCDEF][a-zA-Z0-9]{8,})(?:\s|"|$)'),
+    _rule('AzureStorageKeyDetector', 'Azure Storage Account access key',
+          r'AccountKey=(?P<secret>[a-zA-Z0-9+/=]{88})'),
+    _rule('BasicAuthDetector', 'Basic Auth Credentials',
+          r'://[^:/?#\[\]@!$&\'()*+,;=\s]+:(?P<secret>[^:/?#\[\]@!$&\'()*+,;=\s]+)@'),
+    _rule('DiscordBotTokenDetector', 'Discord Bot Token',
+          r'[MNO][a-zA-Z\d_-]{23,25}\.[a-zA-Z\d_-]{6}\.[a-zA-Z\d_-]{27}'),
+    _rule('GitHubTokenDetector', 'GitHub Token',
+          r'(?:ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9_]{36}'),
+    _rule('GitLabTokenDetector', 'GitLab Token',
+          r'(?:glpat|gldt|glft|glsoat|glrt)-[A-Za-z0-9_\-]{20,50}(?!\w)'),
+    _rule('JwtTokenDetector', 'JSON Web Token',
+          r'eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*?'),
+    _rule('MailchimpDetector', 'Mailchimp Access Key',
+          r'[0-9a-z]{32}-us[0-9]{1,2}'),
+    _rule('NpmDetector', 'NPM tokens',
+          r'//.+/:_authToken=\s*(?P<secret>npm_[A-Za-z0-9]+|[A-Fa-f0-9-]{36})'),
+    _rule('OpenAIDetector', 'OpenAI Token',
+          r'sk-[A-Za-z0-9-_]*[A-Za-z0-9]{20}T3BlbkFJ[A-Za-z0-9]{20}'),
+    _rule('PrivateKeyDetector', 'Private Key',
+          r'BEGIN DSA PRIVATE KEY', r'BEGIN EC PRIVATE KEY', r'BEGIN OPENSSH PRIVATE KEY',
+          r'BEGIN PGP PRIVATE KEY BLOCK', r'BEGIN PRIVATE KEY', r'BEGIN RSA PRIVATE KEY',
+          r'BEGIN SSH2 ENCRYPTED PRIVATE KEY', r'PuTTY-User-Key-File-2'),
+    _rule('PypiTokenDetector', 'PyPI upload token',
+          r'pypi-AgEIcHlwaS5vcmc[A-Za-z0-9-_]{70,}'),
+    _rule('SendGridDetector', 'SendGrid API Key',
+          r'SG\.[a-zA-Z0-9_-]{22}\.[a-zA-Z0-9_-]{43}'),
+    _rule('SlackDetector', 'Slack Token',
+          r'xox(?:a|b|p|o|s|r)-(?:\d+-)+[a-z0-9]+',
+          r'https://hooks\.slack\.com/services/T[a-zA-Z0-9_]+/B[a-zA-Z0-9_]+/[a-zA-Z0-9_]+',
+          flags=re.IGNORECASE),
+    _rule('SquareOAuthDetector', 'Square OAuth Secret',
+          r'sq0csp-[0-9A-Za-z\\\-_]{43}'),
+    _rule('StripeDetector', 'Stripe Access Key',
+          r'(?:r|s)k_live_[0-9a-zA-Z]{24}'),
+    _rule('TelegramBotTokenDetector', 'Telegram Bot Token',
+          r'(?<![\w:])\d{8,10}:[0-9A-Za-z_-]{35}(?![\w-])'),
+    _rule('TwilioKeyDetector', 'Twilio API Key',
+          r'AC[a-z0-9]{32}', r'SK[a-z0-9]{32}'),
+)
+
+_KEYWORD = r'[A-Za-z0-9_-]*?(?:{})[A-Za-z0-9_-]*'.format('|'.join(KEYWORD_DENYLIST))
+_QUOTED_KEYWORD_PATTERN = re.compile(
+    _KEYWORD + r'["\']?\s*(?::=|=>|=|:)\s*[fbru]{0,2}(["\'])(?P<secret>[^\s"\']+?)\1', re.IGNORECASE)
+_CONFIG_KEYWORD_PATTERN = re.compile(
+    r'^\s*["\']?' + _KEYWORD + r'["\']?\s*(?:=|:)\s*(?P<secret>[^\s"\'#]+)\s*$', re.IGNORECASE)
+_BASE64_STRING_PATTERN = re.compile(r'([\'"])([{}]+)(\1)'.format(re.escape(BASE64_CHARSET)))
+_COMMIT_PATTERN = re.compile(r'[0-9a-f]{40,64}')
+_HEX_STRING_PATTERN = re.compile(r'([\'"])([{}]+)(\1)'.format(HEX_CHARSET))
+
+_ALLOWLIST_PATTERN = re.compile(r'pragma:\s*allowlist[ -]secret', re.IGNORECASE)
+_ALLOWLIST_NEXTLINE_PATTERN = re.compile(r'pragma:\s*allowlist[ -]nextline[ -]secret', re.IGNORECASE)
+_UUID_PATTERN = re.compile(r'[a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}', re.IGNORECASE)
+_ID_STRING_PATTERN = re.compile(r'(?:^|[^a-z0-9])(?:id|myid|userid)s?[^a-z0-9]*$|_ids?[^a-z0-9]*$', re.IGNORECASE)
+_SEQUENCES = (
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ' * 2,
+    '0123456789' * 2,
+    '0123456789ABCDEF' * 2,
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/' * 2,
+)
+_GENERIC_TYPES = frozenset(('Base64 High Entropy String', 'Hex High Entropy String', 'Secret Keyword'))
+_TEMPLATE_PREFIXES = ('{', '(', '<', '${', '#{', '%(', '%{')
+_SWAGGER_NAME_PATTERN = re.compile(r'swagger', re.IGNORECASE)
+
+PLUGINS_USED = tuple(sorted(
+    {rule.plugin for rule in REGEX_RULES} | {'Base64HighEntropyString', 'HexHighEntropyString', 'KeywordDetector'}
+))
+
+
+@dataclass(frozen=True)
+class Finding:
+    """A potential secret, as recorded in a detect-secrets baseline."""
+    type: str
+    filename: str
+    hashed_secret: str
+    line_number: int
+    is_verified: bool = False
+
+    def to_baseline(self) -> Dict[str, object]:
+        """Convert the finding to a baseline ``results`` entry."""
+        return {
+            'type': self.type,
+            'filename': self.filename,
+            'hashed_secret': self.hashed_secret,
+            'is_verified': self.is_verified,
+            'line_number': self.line_number
+        }
+
+
+def shannon_entropy(data: str, charset: str) -> float:
+    """
+    Compute the Shannon entropy of a string over a character set, as detect-secrets does.
+
+    Args:
+        data: String to measure
+        charset: Characters that count towards the entropy
+
+    Returns:
+        Entropy in bits per character
+    """
+    if not data:
+        return 0.0
+    entropy = 0.0
+    for char in set(data):
+        if char in charset:
+            probability = data.count(char) / len(data)
+            entropy -= probability * math.log2(probability)
+    return entropy
+
+
+def hash_secret(secret: str) -> str:
+    """Hash a secret the way detect-secrets records it in a baseline."""
+    return hashlib.sha1(secret.encode('utf-8')).hexdigest()
+
+
+def should_scan_file(relative_path: str, exclude_patterns: Sequence[Pattern]) -> bool:
+    """
+    Check whether a file is scanned at all.
+
+    Args:
+        relative_path: Path relative to the repository root, with forward slashes
+        exclude_patterns: Compiled --exclude-files patterns
+
+    Returns:
+        True if the file should be scanned
+    """
+    name = relative_path.rsplit('/', 1)[-1]
+    if os.path.splitext(name)[1].lower() in NON_TEXT_SUFFIXES or name in LOCK_FILES:
+        return False
+    if name == BASELINE_FILE or _SWAGGER_NAME_PATTERN.search(name):
+        return False
+    return not any(pattern.search(relative_path) for pattern in exclude_patterns)
+
+
+def scan_lines(filename: str, lines: Iterable[str]) -> List[Finding]:
+    """
+    Scan lines of text for potential secrets.
+
+    Args:
+        filename: Path recorded in the findings
+        lines: Lines of the file, with or without line endings
+
+    Returns:
+        Findings in line order, one per distinct secret and type
+    """
+    findings: Dict[Tuple[str, str], Finding] = {}
+    config_file = os.path.splitext(filename)[1].lower() in CONFIG_SUFFIXES
+    allow_next_line = False
+
+    for line_number, line in enumerate(lines, start=1):
+        allowlisted = allow_next_line or bool(_ALLOWLIST_PATTERN.search(line))
+        allow_next_line = bool(_ALLOWLIST_NEXTLINE_PATTERN.search(line))
+        if allowlisted:
+            continue
+        for secret_type, secret, start in _line_candidates(line, config_file):
+            if _is_false_positive(secret_type, secret, line[:start]):
+                continue
+            key = (secret_type, hash_secret(secret))
+            if key not in findings:
+                findings[key] = Finding(secret_type, filename, key[1], line_number)
+
+    return sorted(findings.values(), key=lambda f: (f.line_number, f.hashed_secret, f.type))
+
+
+def scan_file(root: str, relative_path: str) -> List[Finding]:
+    """
+    Scan one file for potential secrets.
+
+    Args:
+        root: Repository root
+        relative_path: File path relative to the root, with forward slashes
+
+    Returns:
+        Findings for the file; empty if it is not UTF-8 text or cannot be read
+    """
+    try:
+        with open(os.path.join(root, relative_path), 'r', encoding='utf-8') as f:
+            return scan_lines(relative_path, f)
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+def list_scan_files(root: Union[str, Path], exclude_files: Sequence[str] = DEFAULT_EXCLUDE_FILES) -> List[str]:
+    """
+    List the files a full scan covers, like ``detect-secrets scan --all-files``.
+
+    Args:
+        root: Repository root
+        exclude_files: Regular expressions of paths to skip
+
+    Returns:
+        Relative paths with forward slashes, sorted
+    """
+    exclude_patterns = [re.compile(pattern) for pattern in exclude_files]
+    files = (path.replace(os.sep, '/')
+             for path in list_repository_files(root, exclude_dirs={'.git'}, respect_gitignore=False))
+    return sorted(path for path in files if should_scan_file(path, exclude_patterns))
+
+
+def scan_files(root: Union[str, Path], files: Sequence[str],
+               max_workers: Optional[int] = None) -> Iterator[Finding]:
+    """
+    Scan files for potential secrets, yielding findings as files finish.
+
+    Large file lists are scanned in a process pool; small ones in-process.
+
+    Args:
+        root: Repository root
+        files: File paths relative to the root, with forward slashes
+        max_workers: Worker processes; defaults to the number of CPUs
+
+    Yields:
+        Findings, grouped by file, in no particular file order
+    """
+    root = str(root)
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1 or len(files) < PROCESS_POOL_MIN_FILES:
+        for relative_path in files:
+            yield from scan_file(root, relative_path)
+        return
+
+    batches = [files[i:i + SCAN_BATCH_SIZE] for i in range(0, len(files), SCAN_BATCH_SIZE)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_scan_batch, root, batch) for batch in batches]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def scan_repository(root: Union[str, Path], exclude_files: Sequence[str] = DEFAULT_EXCLUDE_FILES,
+                    max_workers: Optional[int] = None) -> Dict[str, List[Finding]]:
+    """
+    Scan every file of a repository.
+
+    Args:
+        root: Repository root
+        exclude_files: Regular expressions of paths to skip
+        max_workers: Worker processes; defaults to the number of CPUs
+
+    Returns:
+        Findings by file name, for files with findings
+    """
+    files = list_scan_files(root, exclude_files)
+    logging.debug(f"Scanning {len(files)} files in {root} for secrets")
+    results: Dict[str, List[Finding]] = {}
+    for finding in scan_files(root, files, max_workers):
+        results.setdefault(finding.filename, []).append(finding)
+    return results
+
+
+def build_baseline(results: Dict[str, List[Finding]], exclude_files: Sequence[str] = DEFAULT_EXCLUDE_FILES,
+                   generated_at: Optional[str] = None) -> Dict[str, object]:
+    """
+    Build a detect-secrets baseline document.
+
+    Args:
+        results: Findings by file name
+        exclude_files: Regular expressions of paths the scan skipped
+        generated_at: Timestamp to record; defaults to now
+
+    Returns:
+        Baseline as a dictionary ready for JSON serialization
+    """
+    plugins, filters = _scanner_settings(exclude_files)
+    return {
+        'version': BASELINE_VERSION,
+        'plugins_used': plugins,
+        'filters_used': filters,
+        'results': {
+            filename: [finding.to_baseline() if isinstance(finding, Finding) else finding
+                       for finding in _sorted_findings(results[filename])]
+            for filename in sorted(results) if results[filename]
+        },
+        'generated_at': generated_at or datetime.now(timezone.utc).strftime(GENERATED_AT_FORMAT)
+    }
+
+
+def write_baseline(path: Union[str, Path], baseline: Dict[str, object], commit: Optional[str] = None) -> None:
+    """
+    Write a baseline atomically, formatted like detect-secrets writes it.
+
+    Args:
+        path: Baseline file path
+        baseline: Baseline from build_baseline()
+        commit: Commit that was checked out when the files were scanned; recorded
+            so a later incremental scan knows which changes the baseline covers
+    """
+    atomic_write(path, json.dumps(baseline, indent=2) + '\n')
+    if commit:
+        atomic_write(_commit_record_path(path, baseline), commit + '\n')
+
+
+@dataclass
+class UnverifiedSecrets:
+    """Unverified secrets found in a baseline; truncated means reading stopped at the limit."""
+    has_results: bool = False
+    total: int = 0
+    truncated: bool = False
+    per_file: Dict[str, int] = field(default_factory=dict)
+    secrets: List[Dict[str, object]] = field(default_factory=list)
+
+
+class BaselineReader:
+    """
+    Streams the results of a detect-secrets baseline without loading the whole file.
+
+    The file is decoded in chunks; only one result entry is held in memory at a time.
+    """
+
+    _NON_WHITESPACE = re.compile(r'[^ \t\r\n]')
+    _DECODER = json.JSONDecoder()
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = BASELINE_READ_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            path: Baseline file path
+            chunk_size: Characters to read at a time
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.has_results = False
+        self._file = None
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def results(self) -> Iterator[Tuple[str, Dict[str, object]]]:
+        """
+        Iterate over the baseline's results.
+
+        Yields:
+            (file name, result entry) pairs in file order
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a JSON object
+        """
+        with open(self.path, 'r', encoding='utf-8') as self._file:
+            self._buffer, self._pos, self._eof = '', 0, False
+            self._expect('{')
+            if self._peek() == '}':
+                return
+            while True:
+                key = self._value()
+                self._expect(':')
+                if key == 'results' and self._peek() == '{':
+                    self.has_results = True
+                    yield from self._file_results()
+                else:
+                    self._value()
+                if not self._next_item('}'):
+                    return
+
+    def _file_results(self) -> Iterator[Tuple[str, Dict[str, object]]]:
+        """Stream the entries of the results object, one file list at a time."""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            filename = self._value()
+            self._expect(':')
+            if self._peek() == '[':
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        entry = self._value()
+                        if isinstance(entry, dict):
+                            yield filename, entry
+                        if not self._next_item(']'):
+                            break
+            else:
+                self._value()
+            if not self._next_item('}'):
+                return
+
+    def _next_item(self, closing: str) -> bool:
+        """Consume a comma and return True, or consume the closing bracket and return False."""
+        if self._peek() == ',':
+            self._pos += 1
+            return True
+        self._expect(closing)
+        return False
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' in {self.path}")
+        self._pos += 1
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, or '' at the end."""
+        while True:
+            match = self._NON_WHITESPACE.search(self._buffer, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+            self._pos = len(self._buffer)
+            if not self._read():
+                return ''
+
+    def _value(self) -> object:
+        """Decode the next JSON value, reading more of the file while it is incomplete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read(len(self._buffer) - self._pos):
+                    continue
+                raise
+            # A number ending the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read():
+                continue
+            self._pos = end
+            return value
+
+    def _read(self, at_least: int = 0) -> bool:
+        """Append the next chunk to the buffer, dropping what was consumed; False at the end of the file."""
+        if self._eof:
+            return False
+        # Grow reads for values larger than a chunk so they are not re-decoded once per chunk
+        chunk = self._file.read(max(self.chunk_size, at_least))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+
+def count_unverified_secrets(path: Union[str, Path], limit: Optional[int] = UNVERIFIED_SECRETS_LIMIT,
+                             chunk_size: int = BASELINE_READ_CHUNK_SIZE) -> UnverifiedSecrets:
+    """
+    Count the unverified secrets in a baseline by streaming its results.
+
+    Args:
+        path: Baseline file path
+        limit: Stop reading once more than this many unverified secrets were found;
+            None reads the whole file
+        chunk_size: Characters to read at a time
+
+    Returns:
+        Counts per file and the first unverified secrets, up to the limit
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    reader = BaselineReader(path, chunk_size)
+    report = UnverifiedSecrets()
+    results = reader.results()
+    try:
+        for filename, entry in results:
+            if entry.get('is_verified') is not False:
+                continue
+            if limit is not None and report.total >= limit:
+                report.truncated = True
+                break
+            report.total += 1
+            report.per_file[filename] = report.per_file.get(filename, 0) + 1
+            report.secrets.append({
+                'filename': entry.get('filename', filename),
+                'type': entry.get('type', 'Unknown'),
+                'line_number': entry.get('line_number', 'Unknown')
+            })
+    finally:
+        # Close the file right away when stopping early
+        results.close()
+    report.has_results = reader.has_results
+    return report
+
+
+def load_baseline(path: Union[str, Path]) -> Optional[Dict[str, object]]:
+    """
+    Load an existing baseline.
+
+    Args:
+        path: Baseline file path
+
+    Returns:
+        Baseline dictionary, or None if it is missing, unreadable or has no results
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable secrets baseline {path}: {str(e)}")
+        return None
+    if not isinstance(baseline, dict) or not isinstance(baseline.get('results'), dict):
+        logging.warning(f"Ignoring secrets baseline with unsupported format: {path}")
+        return None
+    return baseline
+
+
+def head_commit(root: Union[str, Path]) -> Optional[str]:
+    """
+    Get the commit checked out in a repository.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        Commit hash, or None if the directory is not a git repository with commits
+    """
+    output = _git(root, 'rev-parse', '--verify', '--quiet', 'HEAD^{commit}')
+    return (output or '').strip() or None
+
+
+def baseline_commit(root: Union[str, Path], baseline: Dict[str, object]) -> Optional[str]:
+    """
+    Find the commit that was checked out when the repository's baseline was generated.
+
+    The commit is the one recorded by write_baseline() for exactly this baseline
+    content; commit dates are not used, since commits pulled after the baseline was
+    generated can be dated before it.
+
+    Args:
+        root: Repository root
+        baseline: The repository's baseline, as loaded
+
+    Returns:
+        Commit hash, or None if none was recorded or it is not an ancestor of HEAD
+    """
+    try:
+        commit = _commit_record_path(os.path.join(root, BASELINE_FILE), baseline).read_text().strip()
+    except OSError:
+        return None
+    if not _COMMIT_PATTERN.fullmatch(commit):
+        return None
+    if _git(root, 'merge-base', '--is-ancestor', commit, 'HEAD') is None:
+        logging.debug(f"Secrets baseline commit {commit[:12]} is not an ancestor of HEAD")
+        return None
+    return commit
+
+
+def changed_files_since(root: Union[str, Path], commit: str) -> Optional[List[str]]:
+    """
+    List files that differ from a commit, including uncommitted and untracked files.
+
+    Args:
+        root: Repository root
+        commit: Commit to compare the working tree with
+
+    Returns:
+        Relative paths with forward slashes, sorted, or None if git cannot tell
+    """
+    changed = _git(root, 'diff', '--name-only', '--no-renames', '-z', commit, '--')
+    untracked = _git(root, 'ls-files', '-z', '--others', '--exclude-standard')
+    if changed is None or untracked is None:
+        return None
+    return sorted({path for path in (changed + untracked).split('\0') if path})
+
+
+def update_baseline(root: Union[str, Path], baseline: Dict[str, object], files: Sequence[str],
+                    exclude_files: Sequence[str] = DEFAULT_EXCLUDE_FILES,
+                    max_workers: Optional[int] = None) -> Dict[str, object]:
+    """
+    Rescan some files and merge their findings into a baseline.
+
+    Results of the listed files are replaced; a rescanned secret keeps the audit
+    results recorded for the same secret type and hash. Results of other files are
+    kept as they are, so the baseline must have been generated by this scanner with
+    the same exclusions.
+
+    Args:
+        root: Repository root
+        baseline: Existing baseline
+        files: Relative paths to rescan; missing or excluded files are dropped
+        exclude_files: Regular expressions of paths to skip
+        max_workers: Worker processes; defaults to the number of CPUs
+
+    Returns:
+        Updated baseline
+    """
+    exclude_patterns = [re.compile(pattern) for pattern in exclude_files]
+    previous = baseline.get('results', {})
+    rescan = set(files)
+    results = {filename: list(entries) for filename, entries in previous.items() if filename not in rescan}
+    to_scan = [path for path in files
+               if should_scan_file(path, exclude_patterns) and os.path.isfile(os.path.join(root, path))]
+
+    rescanned: Dict[str, List[Dict[str, object]]] = {}
+    for finding in scan_files(root, to_scan, max_workers):
+        rescanned.setdefault(finding.filename, []).append(finding.to_baseline())
+
+    for filename, entries in rescanned.items():
+        audited = {(entry.get('type'), entry.get('hashed_secret')): entry for entry in previous.get(filename, [])}
+        for entry in entries:
+            prior = audited.get((entry['type'], entry['hashed_secret']), {})
+            for key in AUDIT_KEYS:
+                if key in prior:
+                    entry[key] = prior[key]
+        results[filename] = entries
+
+    return build_baseline(results, exclude_files)
+
+
+def incremental_scan(root: Union[str, Path], exclude_files: Sequence[str] = DEFAULT_EXCLUDE_FILES,
+                     max_workers: Optional[int] = None) -> Optional[Dict[str, object]]:
+    """
+    Update the repository's baseline by rescanning only files changed since it was generated.
+
+    Args:
+        root: Repository root
+        exclude_files: Regular expressions of paths to skip
+        max_workers: Worker processes; defaults to the number of CPUs
+
+    Returns:
+        Updated baseline, or None if there is no usable baseline or git history, or
+        the baseline was generated with other settings, and a full scan is needed
+    """
+    baseline = load_baseline(os.path.join(root, BASELINE_FILE))
+    if baseline is None:
+        return None
+    commit = baseline_commit(root, baseline)
+    if commit is None:
+        logging.debug("No usable commit recorded for the secrets baseline")
+        return None
+    # Kept results are only valid if they were produced by this scanner with the same exclusions
+    plugins, filters = _scanner_settings(exclude_files)
+    if not (_same_entries(baseline.get('plugins_used'), plugins)
+            and _same_entries(baseline.get('filters_used'), filters)):
+        logging.debug("Secrets baseline was generated with other plugins, filters or exclusions")
+        return None
+    files = changed_files_since(root, commit)
+    if files is None:
+        return None
+    logging.debug(f"Rescanning {len(files)} files changed since {commit[:12]} for secrets")
+    return update_baseline(root, baseline, files, exclude_files, max_workers)
+
+
+def _scanner_settings(exclude_files: Sequence[str]) -> Tuple[List[Dict[str, object]], List[Dict[str, object]]]:
+    """Build the ``plugins_used`` and ``filters_used`` entries of a baseline."""
+    plugins = []
+    for name in PLUGINS_USED:
+        plugin = {'name': name}
+        if name == 'Base64HighEntropyString':
+            plugin['limit'] = BASE64_ENTROPY_LIMIT
+        elif name == 'HexHighEntropyString':
+            plugin['limit'] = HEX_ENTROPY_LIMIT
+        plugins.append(plugin)
+
+    filters = [dict(item) for item in FILTERS_USED]
+    if exclude_files:
+        filters.append({'path': 'detect_secrets.filters.regex.should_exclude_file', 'pattern': list(exclude_files)})
+    return plugins, filters
+
+
+def _same_entries(recorded, expected: List[Dict[str, object]]) -> bool:
+    """Check whether a baseline header list has the expected entries, in any order."""
+    if not isinstance(recorded, list):
+        return False
+    return sorted(json.dumps(entry, sort_keys=True) for entry in recorded) == \
+        sorted(json.dumps(entry, sort_keys=True) for entry in expected)
+
+
+def _commit_record_path(path: Union[str, Path], baseline: Dict[str, object]) -> Path:
+    """Get the cache file recording the scanned commit of a baseline file and content."""
+    digest = hashlib.sha256(os.path.realpath(path).encode('utf-8', errors='surrogateescape'))
+    digest.update(b'\0')
+    digest.update(json.dumps(baseline, sort_keys=True).encode('utf-8'))
+    return user_cache_dir('secrets') / f"{digest.hexdigest()}.commit"
+
+
+def _git(root: Union[str, Path], *args: str) -> Optional[str]:
+    """Run a git command in the repository and return its output, or None on failure."""
+    try:
+        result = subprocess.run(['git', *args], cwd=str(root), capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logging.debug(f"git {args[0]} failed in {root}: {e}")
+        return None
+    return result.stdout.decode('utf-8', errors='surrogateescape')
+
+
+def _scan_batch(root: str, batch: Sequence[str]) -> List[Finding]:
+    """Scan a batch of files in a worker process."""
+    findings = []
+    for relative_path in batch:
+        findings.extend(scan_file(root, relative_path))
+    return findings
+
+
+def _sorted_findings(findings):
+    def key(finding):
+        if isinstance(finding, Finding):
+            return finding.line_number, finding.hashed_secret, finding.type
+        return finding.get('line_number', 0), finding.get('hashed_secret', ''), finding.get('type', '')
+    return sorted(findings, key=key)
+
+
+def _line_candidates(line: str, config_file: bool) -> Iterator[Tuple[str, str, int]]:
+    """Yield (type, secret, start offset) for every rule match on a line."""
+    for rule in REGEX_RULES:
+        for pattern in rule.patterns:
+            for match in pattern.finditer(line):
+                group = 'secret' if 'secret' in pattern.groupindex else 0
+                secret = match.group(group)
+                if rule.secret_type == 'JSON Web Token' and not _is_valid_jwt(secret):
+                    continue
+                yield rule.secret_type, secret, match.start(group)
+
+    for match in _BASE64_STRING_PATTERN.finditer(line):
+        secret = match.group(2)
+        if shannon_entropy(secret, BASE64_CHARSET) > BASE64_ENTROPY_LIMIT:
+            yield 'Base64 High Entropy String', secret, match.start(2)
+    for match in _HEX_STRING_PATTERN.finditer(line):
+        secret = match.group(2)
+        entropy = shannon_entropy(secret, HEX_CHARSET)
+        if secret.isdigit() and len(secret) > 1:
+            # Numbers are not as random as their character distribution suggests
+            entropy -= 1.2 / math.log2(len(secret))
+        if entropy > HEX_ENTROPY_LIMIT:
+            yield 'Hex High Entropy String', secret, match.start(2)
+
+    for match in _QUOTED_KEYWORD_PATTERN.finditer(line):
+        yield 'Secret Keyword', match.group('secret'), match.start('secret')
+    if config_file:
+        match = _CONFIG_KEYWORD_PATTERN.match(line.rstrip('\r\n'))
+        if match:
+            yield 'Secret Keyword', match.group('secret'), match.start('secret')
+
+
+def _is_false_positive(secret_type: str, secret: str, line_before: str) -> bool:
+    """Apply detect-secrets' heuristic filters to a candidate secret."""
+    if not any(char.isalnum() for char in secret):
+        return True
+    if _UUID_PATTERN.search(secret):
+        return True
+    upper = secret.upper()
+    if len(secret) > 2 and any(upper in sequence.upper() for sequence in _SEQUENCES):
+        return True
+    # Only generic detectors guess at secrets; known token formats are reported even next to an id
+    if secret_type in _GENERIC_TYPES and _ID_STRING_PATTERN.search(line_before):
+        return True
+    if secret_type == 'Secret Keyword':
+        if secret.startswith(_TEMPLATE_PREFIXES) or secret.startswith('$'):
+            return True
+        if secret.lower() in ('true', 'false', 'none', 'null', 'nil', 'changeme', 'password'):
+            return True
+    return False
+
+
+def _is_valid_jwt(token: str) -> bool:
+    """Check that the header and payload of a token decode to JSON."""
+    parts = token.split('.')
+    for part in parts[:2]:
+        try:
+            decoded = base64.urlsafe_b64decode(part + '=' * (-len(part) % 4))
+            json.loads(decoded.decode('utf-8'))
+        except (ValueError, UnicodeDecodeError):
+            return False
+    return len(parts) >= 2
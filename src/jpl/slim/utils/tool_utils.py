@@ -0,0 +1,222 @@
+"""
+Provisioning of external command-line tools used by best practices.
+
+Tools such as detect-secrets and pre-commit are looked up before anything is
+installed: an install on the PATH or in SLIM's own environment is used if its
+version is recent enough. Otherwise the tool is installed once into a
+dedicated virtual environment under SLIM's user cache, verified, and reused by
+every later run on the machine.
+"""
+
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from jpl.slim.utils.file_utils import atomic_write, file_lock, user_cache_dir
+
+# Marker written into a cached tool environment once the install was verified
+TOOL_MARKER_FILE = '.slim-tool'
+VERSION_TIMEOUT = 30
+
+_VERSION_PATTERN = re.compile(r'(\d+(?:\.\d+)+)')
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """A command-line tool installable with pip."""
+    name: str
+    package: str
+    version: str
+    min_version: str
+
+
+DETECT_SECRETS = ToolSpec('detect-secrets', 'detect-secrets', version='1.5.0', min_version='1.4.0')
+PRE_COMMIT = ToolSpec('pre-commit', 'pre-commit', version='3.8.0', min_version='2.0.0')
+
+_resolved: Dict[ToolSpec, str] = {}
+_resolve_lock = threading.Lock()
+
+
+def parse_version(text: str) -> Optional[Tuple[int, ...]]:
+    """
+    Extract a dotted version number from a tool's --version output.
+
+    Args:
+        text: Output such as '1.5.0' or 'pre-commit 3.8.0'
+
+    Returns:
+        Version as a tuple of integers, or None if there is none
+    """
+    match = _VERSION_PATTERN.search(text or '')
+    return tuple(int(part) for part in match.group(1).split('.')) if match else None
+
+
+def tool_version(executable: str) -> Optional[Tuple[int, ...]]:
+    """
+    Ask an executable for its version.
+
+    Args:
+        executable: Path or name of the executable
+
+    Returns:
+        Version as a tuple of integers, or None if it cannot be run
+    """
+    try:
+        result = subprocess.run([executable, '--version'], capture_output=True, text=True,
+                                timeout=VERSION_TIMEOUT, check=True)
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.debug(f"Could not get the version of {executable}: {e}")
+        return None
+    return parse_version(result.stdout + result.stderr)
+
+
+def find_tool(spec: ToolSpec) -> Optional[str]:
+    """
+    Find an installed tool of a suitable version without installing anything.
+
+    The PATH is searched first, then the environment SLIM runs in, then SLIM's
+    tool cache.
+
+    Args:
+        spec: Tool to find
+
+    Returns:
+        Path of the executable, or None if no suitable install exists
+    """
+    with _resolve_lock:
+        if spec in _resolved:
+            return _resolved[spec]
+
+    executable = _find_existing(spec) or _find_cached(spec)
+    if executable:
+        with _resolve_lock:
+            _resolved[spec] = executable
+    return executable
+
+
+def ensure_tool(spec: ToolSpec) -> Optional[str]:
+    """
+    Find a tool, installing it into SLIM's tool cache if no suitable install exists.
+
+    Concurrent callers, in this process or others, install a given version at most once.
+
+    Args:
+        spec: Tool to provide
+
+    Returns:
+        Path of the executable, or None if it could not be installed
+    """
+    executable = find_tool(spec)
+    if executable:
+        return executable
+
+    venv_dir = tool_cache_dir(spec)
+    try:
+        with file_lock(venv_dir.with_name(venv_dir.name + '.lock')):
+            # Another thread or process may have finished the install while we waited
+            executable = _find_cached(spec) or _install(spec, venv_dir)
+    except OSError as e:
+        logging.error(f"Failed to install {spec.package} {spec.version}: {e}")
+        return None
+
+    if executable:
+        with _resolve_lock:
+            _resolved[spec] = executable
+    return executable
+
+
+def tool_cache_dir(spec: ToolSpec) -> Path:
+    """
+    Get the cached environment directory for a tool version.
+
+    Args:
+        spec: Tool
+
+    Returns:
+        Path: Directory of the tool's virtual environment
+    """
+    return user_cache_dir('tools') / f"{spec.package}-{spec.version}"
+
+
+def clear_resolved_tools() -> None:
+    """Forget the tools found so far, so the next lookup checks the system again."""
+    with _resolve_lock:
+        _resolved.clear()
+
+
+def _find_existing(spec: ToolSpec) -> Optional[str]:
+    """Find the tool on the PATH or next to the running interpreter."""
+    candidates = [shutil.which(spec.name), shutil.which(spec.name, path=os.path.dirname(sys.executable))]
+    minimum = parse_version(spec.min_version)
+    for executable in dict.fromkeys(candidate for candidate in candidates if candidate):
+        version = tool_version(executable)
+        if version and version >= minimum:
+            logging.debug(f"Using {spec.name} {'.'.join(map(str, version))} at {executable}")
+            return executable
+        logging.debug(f"Ignoring {spec.name} at {executable}: version {version} is older than {spec.min_version}")
+    return None
+
+
+def _find_cached(spec: ToolSpec) -> Optional[str]:
+    """Find a verified install in the tool cache."""
+    venv_dir = tool_cache_dir(spec)
+    executable = _venv_executable(venv_dir, spec.name)
+    try:
+        marker = (venv_dir / TOOL_MARKER_FILE).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    if marker != f"{spec.package}=={spec.version}" or not os.path.isfile(executable):
+        return None
+    logging.debug(f"Using cached {spec.name} {spec.version} at {executable}")
+    return str(executable)
+
+
+def _install(spec: ToolSpec, venv_dir: Path) -> Optional[str]:
+    """Install a tool into a fresh virtual environment and verify its version."""
+    logging.debug(f"Installing {spec.package} {spec.version} into {venv_dir}")
+    # Start from scratch; a directory without a marker is an interrupted install
+    shutil.rmtree(venv_dir, ignore_errors=True)
+    try:
+        _create_venv(venv_dir)
+        _pip_install(venv_dir, f"{spec.package}=={spec.version}")
+    except subprocess.CalledProcessError as e:
+        logging.error(f"Failed to install {spec.package} {spec.version}: {e}")
+        return None
+
+    executable = str(_venv_executable(venv_dir, spec.name))
+    version = tool_version(executable)
+    if version != parse_version(spec.version):
+        logging.error(f"Installed {spec.name} reports version {version}, expected {spec.version}")
+        return None
+
+    atomic_write(venv_dir / TOOL_MARKER_FILE, f"{spec.package}=={spec.version}\n")
+    logging.debug(f"Successfully installed {spec.name} {spec.version}")
+    return executable
+
+
+def _create_venv(venv_dir: Path) -> None:
+    """Create a virtual environment."""
+    subprocess.run([sys.executable, '-m', 'venv', str(venv_dir)], capture_output=True, check=True)
+
+
+def _pip_install(venv_dir: Path, requirement: str) -> None:
+    """Install a requirement into a virtual environment."""
+    subprocess.run(
+        [str(_venv_executable(venv_dir, 'python')), '-m', 'pip', 'install', '--quiet',
+         '--disable-pip-version-check', requirement],
+        capture_output=True, check=True
+    )
+
+
+def _venv_executable(venv_dir: Path, name: str) -> Path:
+    """Path of an executable installed in a virtual environment."""
+    if os.name == 'nt':
+        return venv_dir / 'Scripts' / f"{name}.exe"
+    return venv_dir / 'bin' / name
@@ -105,6 +105,11 @@ def test_ai_model_ready():
     yield TEST_AI_MODEL
 
 
+def run_git(cwd, *args) -> str:
+    """Run a git command quietly in a directory and return its stripped output."""
+    return subprocess.run(['git', *args], cwd=str(cwd), check=True, capture_output=True, text=True).stdout.strip()
+
+
 def create_temp_git_repo(repo_dir: str) -> git.Repo:
     """Create a temporary git repository with initial commit."""
     repo = git.Repo.init(repo_dir)
@@ -122,9 +127,10 @@ def create_temp_git_repo(repo_dir: str) -> git.Repo:
     return repo
 
 
-def create_bare_repo_with_remote(working_dir: str, remote_name: str = 'origin') -> Tuple[git.Repo, str]:
+def create_bare_repo_with_remote(working_dir: str, remote_name: str = 'origin',
+                                 bare_repo_dir: Optional[str] = None) -> Tuple[git.Repo, str]:
     """Create a bare repository and set it up as remote for working directory."""
-    bare_repo_dir = tempfile.mkdtemp(suffix='_bare')
+    bare_repo_dir = bare_repo_dir or tempfile.mkdtemp(suffix='_bare')
     bare_repo = git.Repo.init(bare_repo_dir, bare=True)
     working_repo = create_temp_git_repo(working_dir)
     working_repo.create_remote(remote_name, bare_repo_dir)
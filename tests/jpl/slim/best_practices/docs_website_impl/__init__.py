@@ -0,0 +1,3 @@
+"""
+Tests for the docs-website generator modules.
+"""
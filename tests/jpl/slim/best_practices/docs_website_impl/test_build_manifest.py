@@ -0,0 +1,43 @@
+"""
+Unit tests for the build_manifest module.
+"""
+
+import json
+import pytest
+
+from jpl.slim.best_practices.docs_website_impl.build_manifest import BuildManifest, BUILD_MANIFEST_FILE
+
+
+@pytest.mark.unit
+class TestBuildManifest:
+    """Test the BuildManifest class."""
+
+    def test_save_and_load(self, tmp_path):
+        """Test that recorded page inputs survive a save and load."""
+        inputs = BuildManifest.page_inputs("prompt", "context", "openai/gpt-4o")
+        manifest = BuildManifest(str(tmp_path))
+        manifest.record("docs/index.md", inputs)
+
+        assert manifest.save()
+        loaded = BuildManifest(str(tmp_path))
+
+        assert loaded.load()
+        assert loaded.is_current("docs/index.md", inputs)
+        assert not loaded.is_current("docs/index.md", BuildManifest.page_inputs("prompt", "context", "other/model"))
+        assert not loaded.is_current("docs/other.md", inputs)
+
+    def test_load_rejects_unknown_format(self, tmp_path):
+        """Test that manifests from another format version are ignored."""
+        (tmp_path / BUILD_MANIFEST_FILE).write_text(json.dumps({"version": 99, "pages": {}}))
+
+        assert not BuildManifest(str(tmp_path)).load()
+        assert not BuildManifest(str(tmp_path / "missing")).load()
+
+    def test_repository_context_hash_ignores_volatile_fields(self):
+        """Test that sizes and language order do not change the context hash."""
+        base = {"project_name": "demo", "languages": ["Python", "Go"], "size_bytes": 10, "file_count": 2}
+        changed_size = dict(base, languages=["Go", "Python"], size_bytes=99, file_count=3)
+        renamed = dict(base, project_name="other")
+
+        assert BuildManifest.repository_context_hash(base) == BuildManifest.repository_context_hash(changed_size)
+        assert BuildManifest.repository_context_hash(base) != BuildManifest.repository_context_hash(renamed)
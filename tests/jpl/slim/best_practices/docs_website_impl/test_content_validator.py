@@ -0,0 +1,76 @@
+"""
+Unit tests for the ContentValidator module.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from jpl.slim.best_practices.docs_website_impl.content_validator import ContentValidator
+
+
+@pytest.fixture
+def docs_dir(tmp_path):
+    """Create a docs tree with nested pages and links."""
+    docs = tmp_path / "docs"
+    (docs / "guides" / "advanced").mkdir(parents=True)
+    (docs / "index.md").write_text("# Home\n\nSee [install](guides/installation.md) and [missing](nowhere.md).\n")
+    (docs / "guides" / "installation.md").write_text(
+        "# Install\n\nSee [advanced](./advanced/index.md), [home](../index.md) and [api](/api.mdx).\n")
+    (docs / "guides" / "advanced" / "index.md").write_text("# Advanced\n\n[up](../installation)\n")
+    (docs / "api.mdx").write_text("# API\n\nReference.\n")
+    return docs
+
+
+@pytest.mark.unit
+class TestContentValidator:
+    """Test the ContentValidator class."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_link_resolution(self, docs_dir, max_workers):
+        """Test that file-relative and root-relative links resolve against the index."""
+        validator = ContentValidator(str(docs_dir), max_workers=max_workers)
+
+        is_valid, issues = validator.validate_all_content()
+
+        assert not is_valid
+        assert [(issue.issue_type, issue.description) for issue in issues] == [
+            ("broken_link", "Broken link to: nowhere.md")
+        ]
+
+    def test_empty_sections(self, tmp_path):
+        """Test headers followed by another header or by the end of the file."""
+        page = tmp_path / "page.md"
+        lines = ["# Title", "", "## Empty", "", "## Filled", "Text", "## Last", ""]
+
+        issues = ContentValidator(str(tmp_path))._check_empty_sections(page, lines)
+
+        assert [(issue.line_number, issue.description) for issue in issues] == [
+            (1, "Empty section with no content"),
+            (3, "Empty section with no content"),
+            (7, "Header at end of file with no content")
+        ]
+
+    def test_crlf_files_are_split_into_clean_lines(self, tmp_path):
+        """Test that Windows line endings do not leave a carriage return on checked lines."""
+        page = tmp_path / "page.md"
+        page.write_bytes(b"# Title\r\n\r\nSee [missing](nowhere.md).\r\n")
+        validator = ContentValidator(str(tmp_path))
+
+        with patch.object(validator, "_check_markdown_syntax", wraps=validator._check_markdown_syntax) as check:
+            analysis = validator._analyze_file(page)
+
+        assert check.call_args.args[1] == ["# Title", "", "See [missing](nowhere.md)."]
+        assert analysis.links == [(3, "nowhere.md", "See [missing](nowhere.md).")]
+
+    def test_unchanged_files_use_cache(self, docs_dir):
+        """Test that re-validation only re-checks files whose content changed."""
+        validator = ContentValidator(str(docs_dir), max_workers=1)
+        validator.validate_all_content()
+
+        (docs_dir / "api.mdx").write_text("# API\n\n[INSERT_CONTENT]\n")
+        (docs_dir / "nowhere.md").write_text("# Now here\n\nContent.\n")
+        with patch.object(validator, "_check_template_markers", wraps=validator._check_template_markers) as check:
+            is_valid, issues = validator.validate_all_content()
+
+        assert sorted(call.args[0].name for call in check.call_args_list) == ["api.mdx", "nowhere.md"]
+        assert [issue.issue_type for issue in issues] == ["template_marker"]
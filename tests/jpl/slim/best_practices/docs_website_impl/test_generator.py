@@ -0,0 +1,299 @@
+"""
+Unit tests for the SlimDocGenerator module.
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from jpl.slim.best_practices.docs_website_impl.generator import SlimDocGenerator
+
+
+@pytest.fixture
+def docs_site(tmp_path):
+    """Create a generated site with a small docs tree."""
+    docs_dir = tmp_path / "site" / "docs"
+    (docs_dir / "guides").mkdir(parents=True)
+    (docs_dir / "index.md").write_text("---\ntitle: Home\n---\n\n## Overview\n\n[INSERT_CONTENT]\n")
+    (docs_dir / "guides" / "installation.md").write_text("---\nid: install\n---\n\n## Prerequisites\n\n[INSERT_CONTENT]\n")
+    return tmp_path / "site"
+
+
+@pytest.fixture
+def generator(docs_site):
+    """Create a generator for the docs site."""
+    return SlimDocGenerator(None, str(docs_site), template_only=True)
+
+
+@pytest.mark.unit
+class TestSiteTree:
+    """Test site tree caching in SlimDocGenerator."""
+
+    def test_site_tree_lists_pages_and_headings(self, generator):
+        """Test that pages, IDs and headings appear in the site tree."""
+        site_tree = generator._generate_site_tree_from_template()
+
+        assert "- **index.md** (Home)" in site_tree
+        assert "- Overview (`#overview`)" in site_tree
+        assert "  - **guides/installation.md** (installation)" in site_tree
+        assert "    - ID: `install`" in site_tree
+
+    def test_site_tree_read_once(self, generator):
+        """Test that repeated calls do not re-read the docs directory."""
+        first = generator._generate_site_tree_from_template()
+
+        with patch("builtins.open", side_effect=AssertionError("docs re-read")):
+            assert generator._generate_site_tree_from_template() == first
+
+    def test_site_tree_kept_when_headings_unchanged(self, generator, docs_site):
+        """Test that writing body content keeps the cached tree."""
+        first = generator._generate_site_tree_from_template()
+        index_path = str(docs_site / "docs" / "index.md")
+
+        generator._update_site_tree_entry(index_path, "---\ntitle: Home\n---\n\n## Overview\n\nWelcome!\n")
+
+        assert generator._generate_site_tree_from_template() is first
+
+    def test_site_tree_updated_when_headings_change(self, generator, docs_site):
+        """Test that new headings in a written page show up without re-reading disk."""
+        generator._generate_site_tree_from_template()
+        index_path = str(docs_site / "docs" / "index.md")
+
+        generator._update_site_tree_entry(index_path, "---\ntitle: Home\n---\n\n## Overview\n\n### Next Steps\n")
+        with patch("builtins.open", side_effect=AssertionError("docs re-read")):
+            site_tree = generator._generate_site_tree_from_template()
+
+        assert "- Next Steps (`#next-steps`)" in site_tree
+
+    def test_prompt_prefix_reused(self, generator):
+        """Test that the project and site tree part of a prompt is formatted once."""
+        template = "Project {project_name}\n{site_tree}\nFile {file_name}\n{template_structure}"
+        fields = {'project_name': 'demo', 'site_tree': generator._generate_site_tree_from_template()}
+
+        prefix, suffix = generator._get_prompt_prefix(template, fields)
+        again, _ = generator._get_prompt_prefix(template, fields)
+
+        assert again is prefix
+        assert prefix.startswith("Project demo\n# Site Tree")
+        assert prefix.endswith("File ")
+        assert suffix == "{file_name}\n{template_structure}"
+
+
+@pytest.mark.unit
+class TestIncrementalGeneration:
+    """Test incremental regeneration with the build manifest."""
+
+    TEMPLATE_PAGE = "---\ntitle: Home\n---\n\n## Overview\n\n[INSERT_CONTENT]\n"
+
+    def _run(self, site, repo_info, incremental=False):
+        generator = SlimDocGenerator(None, str(site), use_ai="openai/gpt-4o", incremental=incremental)
+        if incremental:
+            generator._load_previous_build()
+        # Like the template setup, restore the page with its [INSERT_CONTENT] marker
+        (site / "docs" / "index.md").write_text(self.TEMPLATE_PAGE)
+        with patch("jpl.slim.utils.ai_utils.generate_ai_content",
+                   return_value="## Overview\n\nGenerated overview.") as generate:
+            assert generator._ai_enhance_content(repo_info)
+        return generate
+
+    @pytest.fixture
+    def site(self, tmp_path):
+        """Create a site with a single page to generate."""
+        (tmp_path / "docs").mkdir()
+        return tmp_path
+
+    def test_unchanged_pages_are_kept(self, site):
+        """Test that a re-run with the same inputs does not call the AI."""
+        self._run(site, {"project_name": "demo"})
+        (site / "docs" / "index.md").write_text("edited after generation")
+        previous = (site / "docs" / "index.md").read_text()
+
+        generate = self._run(site, {"project_name": "demo"}, incremental=True)
+
+        generate.assert_not_called()
+        assert (site / "docs" / "index.md").read_text() == previous
+
+    def test_changed_context_regenerates(self, site):
+        """Test that pages are regenerated when the repository context changes."""
+        self._run(site, {"project_name": "demo"})
+
+        generate = self._run(site, {"project_name": "demo", "description": "new"}, incremental=True)
+
+        generate.assert_called_once()
+        assert "Generated overview." in (site / "docs" / "index.md").read_text()
+
+    def test_unchanged_pages_are_kept_across_several_pages(self, site):
+        """Test that restoring pages with generated headings does not change the inputs of later pages."""
+        pages = {name: f"---\ntitle: {name}\n---\n\n## Overview\n\n[INSERT_CONTENT]\n"
+                 for name in ("index.md", "guide.md", "usage.md")}
+
+        def run(incremental=False):
+            generator = SlimDocGenerator(None, str(site), use_ai="openai/gpt-4o", incremental=incremental)
+            if incremental:
+                generator._load_previous_build()
+            for name, content in pages.items():
+                (site / "docs" / name).write_text(content)
+            # Generated pages add headings, which changes the site tree
+            with patch("jpl.slim.utils.ai_utils.generate_ai_content",
+                       return_value="## Overview\n\n### Details\n\nGenerated overview.") as generate:
+                assert generator._ai_enhance_content({"project_name": "demo"})
+            return generate.call_count
+
+        assert run() >= len(pages)
+        assert [run(incremental=True) for _ in range(3)] == [0, 0, 0]
+
+    def test_full_run_ignores_manifest(self, site):
+        """Test that runs without --incremental regenerate every page."""
+        self._run(site, {"project_name": "demo"})
+
+        generate = self._run(site, {"project_name": "demo"})
+
+        generate.assert_called_once()
+
+
+@pytest.mark.unit
+class TestReplacePlaceholdersInFiles:
+    """Test placeholder substitution across the generated site."""
+
+    def test_vendored_directories_are_skipped(self, generator, docs_site):
+        """Test that node_modules is never scanned and only changed files are rewritten."""
+        (docs_site / "docusaurus.config.js").write_text("title: '[PROJECT_NAME]'")
+        (docs_site / "node_modules" / "pkg").mkdir(parents=True)
+        (docs_site / "node_modules" / "pkg" / "index.js").write_text("'[PROJECT_NAME]'")
+        written = []
+
+        with patch("jpl.slim.best_practices.docs_website_impl.helpers.atomic_write",
+                   side_effect=lambda path, data: written.append(path) or Path(path).write_bytes(data)):
+            assert generator._replace_placeholders_in_files({"[PROJECT_NAME]": "Demo"})
+
+        assert written == [str(docs_site / "docusaurus.config.js")]
+        assert (docs_site / "docusaurus.config.js").read_text() == "title: 'Demo'"
+        assert (docs_site / "node_modules" / "pkg" / "index.js").read_text() == "'[PROJECT_NAME]'"
+
+
+@pytest.mark.unit
+class TestModelHealthGate:
+    """Test waiting for the background model health check."""
+
+    def test_unhealthy_model_stops_before_ai_enhancement(self, docs_site):
+        """Test that template setup runs while the check is pending and AI work is skipped on failure."""
+        from concurrent.futures import Future
+        from jpl.slim.utils.ai_utils import ModelHealth
+
+        model_health = Future()
+        generator = SlimDocGenerator(None, str(docs_site), use_ai="openai/gpt-4o", model_health=model_health)
+
+        def setup_template():
+            assert not model_health.done()
+            model_health.set_result(ModelHealth("openai/gpt-4o", False, "Cannot connect", 0.0))
+            return True
+
+        with patch.object(generator, "_setup_template", side_effect=setup_template), \
+             patch.object(generator, "_replace_basic_placeholders", return_value=True), \
+             patch.object(generator, "_ai_enhance_content") as enhance:
+            assert not generator.generate()
+
+        enhance.assert_not_called()
+
+
+@pytest.mark.unit
+class TestPipelinedGeneration:
+    """Test the stage DAG run by SlimDocGenerator.generate."""
+
+    def test_template_setup_overlaps_repository_analysis(self, tmp_path, docs_site):
+        """Test that template setup and analysis run concurrently and timings are recorded."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        generator = SlimDocGenerator(str(repo), str(docs_site))
+
+        with patch.object(generator, "_setup_template", side_effect=lambda: barrier.wait() is not None), \
+             patch.object(generator, "_analyze_repository", side_effect=lambda: barrier.wait() and {}), \
+             patch.object(generator, "_replace_basic_placeholders", return_value=True):
+            assert generator.generate()
+
+        assert set(generator.stage_timings) == {"template", "analysis", "placeholders", "validation"}
+
+    def test_output_inside_repository_is_set_up_first(self, tmp_path):
+        """Test that analysis waits for the template when it would scan the output."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+
+        assert SlimDocGenerator(str(repo), str(repo / "site"))._output_inside_repository()
+        assert not SlimDocGenerator(str(repo), str(tmp_path / "site"))._output_inside_repository()
+
+    def test_pages_validated_during_enhancement(self, generator, docs_site):
+        """Test that pages written during AI enhancement are checked in the background."""
+        generator.use_ai = "openai/gpt-4o"
+        index = docs_site / "docs" / "index.md"
+
+        def enhance(repo_info, progress, progress_task):
+            index.write_text("# Home\n\nDone.\n")
+            generator._submit_page_validation(str(index))
+            return True
+
+        with patch.object(generator, "_setup_template", return_value=True), \
+             patch.object(generator, "_replace_basic_placeholders", return_value=True), \
+             patch.object(generator, "_ai_enhance_content", side_effect=enhance), \
+             patch.object(generator, "_page_has_markers", wraps=generator._page_has_markers) as check:
+            assert generator.generate()
+
+        checked = sorted(Path(call.args[0]).name for call in check.call_args_list)
+        assert checked == ["index.md", "installation.md"]
+
+
+@pytest.mark.unit
+class TestBatchedGeneration:
+    """Test generating several small pages per AI request."""
+
+    @pytest.fixture
+    def site(self, tmp_path):
+        """Create a site with three small pages."""
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir()
+        for name in ("alpha", "beta", "gamma"):
+            (docs_dir / f"{name}.md").write_text(f"---\ntitle: {name}\n---\n\n## {name}\n\n[INSERT_CONTENT]\n")
+        return tmp_path
+
+    def test_batch_with_individual_retry(self, site):
+        """Test that pages are split from one response and only failed pages are retried."""
+        generator = SlimDocGenerator(None, str(site), use_ai="openai/gpt-4o", batch_pages=3)
+        batch_response = (
+            "===== FILE: docs/alpha.md =====\n## alpha\n\nAlpha text.\n\n"
+            "===== FILE: docs/beta.md =====\n## beta\n\n[INSERT_CONTENT]\n"
+            "===== FILE: docs/gamma.md =====\n## gamma\n\nGamma text.\n"
+        )
+        prompts = []
+
+        prefixes = []
+
+        def generate(prompt, model, prompt_prefix=None, **kwargs):
+            prefixes.append(prompt_prefix)
+            prompts.append(prompt_prefix + prompt)
+            return batch_response if len(prompts) == 1 else "## beta\n\nBeta text."
+
+        with patch("jpl.slim.utils.ai_utils.generate_ai_content", side_effect=generate):
+            assert generator._ai_enhance_content({"project_name": "demo"})
+
+        assert len(prompts) == 2
+        assert prompts[0].count("===== FILE: docs/") == 3
+        assert prefixes[0] == prefixes[1]
+        assert "FILE TO ENHANCE: beta.md" in prompts[1]
+        assert (site / "docs" / "alpha.md").read_text() == "---\ntitle: alpha\n---\n\n## alpha\n\nAlpha text."
+        assert "Beta text." in (site / "docs" / "beta.md").read_text()
+        assert "Gamma text." in (site / "docs" / "gamma.md").read_text()
+        assert sorted(generator.build_manifest.pages) == ["docs/alpha.md", "docs/beta.md", "docs/gamma.md"]
+
+    def test_large_pages_are_not_batched(self, site):
+        """Test that pages above the size limit get their own request."""
+        (site / "docs" / "gamma.md").write_text("## gamma\n\n" + "x" * 2000 + "\n\n[INSERT_CONTENT]\n")
+        generator = SlimDocGenerator(None, str(site), use_ai="openai/gpt-4o", batch_pages=3)
+
+        with patch.object(generator, "_ai_enhance_batch", return_value={}) as batch, \
+             patch("jpl.slim.utils.ai_utils.generate_ai_content", return_value="## page\n\nText."):
+            assert generator._ai_enhance_content({"project_name": "demo"})
+
+        batched = sorted(relative_path for _, relative_path, _, _ in batch.call_args.args[0])
+        assert batched == ["docs/alpha.md", "docs/beta.md"]
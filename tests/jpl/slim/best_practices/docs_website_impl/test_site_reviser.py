@@ -0,0 +1,84 @@
+"""
+Unit tests for the SiteReviser module.
+"""
+
+import logging
+import threading
+import time
+import pytest
+
+from jpl.slim.best_practices.docs_website_impl.site_reviser import SiteReviser
+
+
+@pytest.fixture
+def site(tmp_path):
+    """Create a site with overview.md and the three landing page files."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "overview.md").write_text("# Overview\n\nA demo project.\n")
+    (tmp_path / "src" / "pages").mkdir(parents=True)
+    (tmp_path / "src" / "pages" / "index.js").write_text("const title = 'Old';")
+    (tmp_path / "src" / "components" / "HomepageFeatures").mkdir(parents=True)
+    (tmp_path / "src" / "components" / "HomepageFeatures" / "index.js").write_text("const features = [];")
+    (tmp_path / "docusaurus.config.js").write_text("const config = {};")
+    return tmp_path
+
+
+class SlowEnhancer:
+    """AI enhancer stub that answers after a delay per prompt key."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.prompts = {}
+        self.lock = threading.Lock()
+
+    def enhance(self, prompt, prompt_key):
+        with self.lock:
+            self.prompts[prompt_key] = prompt
+        time.sleep(self.delays.get(prompt_key, 0))
+        return f"const updated = '{prompt_key}';"
+
+
+@pytest.mark.unit
+class TestSiteReviser:
+    """Test concurrent landing page revision."""
+
+    def test_updates_run_concurrently(self, site):
+        """Test that latency is the slowest update, not the sum of all three."""
+        enhancer = SlowEnhancer({"index_js_update": 0.3, "homepage_features_update": 0.3,
+                                 "docusaurus_config_update": 0.3})
+        reviser = SiteReviser(str(site), logging.getLogger("test"), enhancer)
+
+        started = time.monotonic()
+        assert reviser.revise_site()
+
+        assert time.monotonic() - started < 0.8
+        assert [(result.name, result.status) for result in reviser.results] == [
+            ("index.js", "updated"), ("HomepageFeatures", "updated"), ("docusaurus.config.js", "updated")
+        ]
+        assert (site / "docusaurus.config.js").read_text() == "const updated = 'docusaurus_config_update';"
+        prefixes = {prompt.split("```", 2)[1] for prompt in enhancer.prompts.values()}
+        assert prefixes == {"\n# Overview\n\nA demo project.\n\n"}
+
+    def test_shared_timeout(self, site):
+        """Test that a slow update times out without writing while the others complete."""
+        enhancer = SlowEnhancer({"homepage_features_update": 1.0})
+        reviser = SiteReviser(str(site), logging.getLogger("test"), enhancer, timeout=0.2)
+
+        assert reviser.revise_site()
+
+        assert {result.name: result.status for result in reviser.results} == {
+            "index.js": "updated", "HomepageFeatures": "timed_out", "docusaurus.config.js": "updated"
+        }
+        time.sleep(1.0)
+        assert (site / "src" / "components" / "HomepageFeatures" / "index.js").read_text() == "const features = [];"
+
+    def test_missing_file_is_reported(self, site):
+        """Test that a missing landing page file fails only its own update."""
+        (site / "docusaurus.config.js").unlink()
+        reviser = SiteReviser(str(site), logging.getLogger("test"), SlowEnhancer({}))
+
+        assert reviser.revise_site()
+
+        assert reviser.results[2].status == "failed"
+        assert reviser.results[2].message == "file not found"
+        assert reviser.results[0].status == "updated"
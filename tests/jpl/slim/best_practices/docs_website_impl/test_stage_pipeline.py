@@ -0,0 +1,58 @@
+"""
+Unit tests for the stage_pipeline module.
+"""
+
+import threading
+import pytest
+
+from jpl.slim.best_practices.docs_website_impl.stage_pipeline import StagePipeline
+
+
+@pytest.mark.unit
+class TestStagePipeline:
+    """Test the StagePipeline class."""
+
+    def test_independent_stages_overlap(self):
+        """Test that stages without dependencies between them run concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline = StagePipeline()
+        pipeline.add_stage('template', lambda results: barrier.wait() is not None)
+        pipeline.add_stage('analysis', lambda results: barrier.wait() is not None and {'project_name': 'demo'})
+        pipeline.add_stage('placeholders', lambda results: results['analysis']['project_name'],
+                           depends_on=('template', 'analysis'))
+
+        assert pipeline.run()
+
+        assert pipeline.results['placeholders'] == 'demo'
+        assert set(pipeline.timings) == {'template', 'analysis', 'placeholders'}
+        assert pipeline.format_timings().startswith("template ")
+
+    def test_failure_skips_dependents(self):
+        """Test that a failed stage, by False or by exception, stops dependent stages."""
+        ran = []
+        pipeline = StagePipeline()
+        pipeline.add_stage('template', lambda results: False)
+        pipeline.add_stage('analysis', lambda results: ran.append('analysis'))
+        pipeline.add_stage('placeholders', lambda results: ran.append('placeholders'),
+                           depends_on=('template', 'analysis'))
+
+        assert not pipeline.run()
+
+        assert pipeline.failed == ['template']
+        assert pipeline.skipped == ['placeholders']
+        assert 'placeholders' not in ran
+
+    def test_exception_is_a_failure(self):
+        """Test that exceptions are contained in the failing stage."""
+        pipeline = StagePipeline()
+        pipeline.add_stage('analysis', lambda results: 1 / 0)
+
+        assert not pipeline.run()
+        assert pipeline.failed == ['analysis']
+
+    def test_unknown_dependency(self):
+        """Test that dependencies must be added first."""
+        pipeline = StagePipeline()
+
+        with pytest.raises(ValueError):
+            pipeline.add_stage('placeholders', lambda results: True, depends_on=('template',))
@@ -0,0 +1,93 @@
+"""
+Unit tests for the template_manager module.
+"""
+
+import logging
+import os
+import pytest
+from unittest.mock import patch
+
+from tests.conftest import run_git
+from jpl.slim.best_practices.docs_website_impl.template_manager import TemplateManager
+
+
+@pytest.fixture
+def template_repo(tmp_path):
+    """Create a git template repository with two commits."""
+    repo = tmp_path / "template"
+    (repo / "docs").mkdir(parents=True)
+    (repo / "static").mkdir()
+    run_git(tmp_path, 'init', '-q', str(repo))
+    run_git(repo, 'config', 'user.email', 'test@example.com')
+    run_git(repo, 'config', 'user.name', 'Test')
+    (repo / "docs" / "index.md").write_text("# v1\n")
+    (repo / "static" / "logo.png").write_bytes(b"\x89PNG")
+    run_git(repo, 'add', '.')
+    run_git(repo, 'commit', '-q', '-m', 'v1')
+    run_git(repo, 'tag', 'v1')
+    (repo / "docs" / "index.md").write_text("# v2\n")
+    run_git(repo, 'commit', '-q', '-am', 'v2')
+    return repo
+
+
+def _manager(template_repo, output_dir, cache_dir, template_ref=None):
+    return TemplateManager(f"file://{template_repo}", str(output_dir), logging.getLogger("test"),
+                           template_ref=template_ref, cache_dir=str(cache_dir))
+
+
+@pytest.mark.unit
+class TestTemplateCache:
+    """Test the cached git template in TemplateManager."""
+
+    def test_template_cloned_once(self, template_repo, tmp_path):
+        """Test that later runs materialize from the cache without cloning."""
+        cache_dir = tmp_path / "cache"
+        assert _manager(template_repo, tmp_path / "site1", cache_dir).clone_template()
+
+        with patch("git.Repo.clone_from", side_effect=AssertionError("cloned again")):
+            assert _manager(template_repo, tmp_path / "site2", cache_dir).clone_template()
+
+        assert (tmp_path / "site2" / "docs" / "index.md").read_text() == "# v2\n"
+        assert not (tmp_path / "site2" / ".git").exists()
+
+    def test_template_ref_pins_version(self, template_repo, tmp_path):
+        """Test that --template-ref selects the template version."""
+        cache_dir = tmp_path / "cache"
+        manager = _manager(template_repo, tmp_path / "site", cache_dir, template_ref="v1")
+
+        assert manager.clone_template()
+
+        assert (tmp_path / "site" / "docs" / "index.md").read_text() == "# v1\n"
+        assert manager.template_commit == run_git(template_repo, 'rev-parse', 'v1^{commit}')
+
+    def test_unknown_template_ref_fails(self, template_repo, tmp_path):
+        """Test that a missing ref is reported as a failure."""
+        manager = _manager(template_repo, tmp_path / "site", tmp_path / "cache", template_ref="missing")
+
+        assert not manager.clone_template()
+
+    def test_stale_cache_is_fetched(self, template_repo, tmp_path):
+        """Test that the freshness check picks up new template commits."""
+        cache_dir = tmp_path / "cache"
+        assert _manager(template_repo, tmp_path / "site1", cache_dir).clone_template()
+        (template_repo / "docs" / "index.md").write_text("# v3\n")
+        run_git(template_repo, 'commit', '-q', '-am', 'v3')
+
+        with patch("jpl.slim.best_practices.docs_website_impl.template_manager.TEMPLATE_CACHE_MAX_AGE", -1):
+            assert _manager(template_repo, tmp_path / "site2", cache_dir).clone_template()
+
+        assert (tmp_path / "site2" / "docs" / "index.md").read_text() == "# v3\n"
+
+    def test_site_files_do_not_share_storage_with_cache(self, template_repo, tmp_path):
+        """Test that editing a generated site in place, assets included, leaves the cache intact."""
+        cache_dir = tmp_path / "cache"
+        assert _manager(template_repo, tmp_path / "site1", cache_dir).clone_template()
+
+        assert os.stat(tmp_path / "site1" / "docs" / "index.md").st_nlink == 1
+        assert os.stat(tmp_path / "site1" / "static" / "logo.png").st_nlink == 1
+        with open(tmp_path / "site1" / "static" / "logo.png", "r+b") as f:
+            f.write(b"corrupted")
+
+        assert _manager(template_repo, tmp_path / "site2", cache_dir).clone_template()
+        assert (tmp_path / "site2" / "static" / "logo.png").read_bytes() == \
+            (template_repo / "static" / "logo.png").read_bytes()
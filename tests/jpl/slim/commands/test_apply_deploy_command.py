@@ -0,0 +1,128 @@
+"""
+Tests for the apply-deploy command module.
+"""
+
+import json
+import threading
+from pathlib import Path
+import git
+import pytest
+from unittest.mock import patch
+
+from jpl.slim.commands.apply_deploy_command import apply_and_deploy_best_practices, write_deploy_summary
+from jpl.slim.commands.deploy_command import DEPLOY_STATUS_APPLY_FAILED, DEPLOY_STATUS_PUSHED
+
+
+def _fake_apply_and_deploy(best_practice_id, repo_url=None, branch=None, result=None, **kwargs):
+    """Record the worker thread and succeed for every repository except 'broken'."""
+    result.commits = [threading.current_thread().name]
+    if repo_url.endswith('broken'):
+        result.status = DEPLOY_STATUS_APPLY_FAILED
+        return False
+    result.remote = 'origin'
+    result.status = DEPLOY_STATUS_PUSHED
+    return True
+
+
+def _fake_apply_writing_file(best_practice_id, existing_repo_dir=None, branch=None, **kwargs):
+    """Check out the branch and write the best practice's file, like a real apply."""
+    repo = git.Repo(existing_repo_dir)
+    repo.git.checkout('-B', branch)
+    file_name = {'readme': 'README.md', 'contributing': 'CONTRIBUTING.md'}[best_practice_id]
+    Path(repo.working_tree_dir, file_name).write_text(best_practice_id)
+    return repo
+
+
+@pytest.mark.unit
+class TestParallelApplyDeploy:
+    """Test applying and deploying to many repositories."""
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_results_per_repository(self, jobs):
+        """Test that every repository gets a result, in input order, serially and in parallel."""
+        repo_urls = [f"https://github.com/org/repo{i}" for i in range(5)] + ["https://github.com/org/broken"]
+
+        with patch('jpl.slim.commands.apply_deploy_command.apply_and_deploy_best_practice',
+                   side_effect=_fake_apply_and_deploy) as mock_deploy:
+            results = apply_and_deploy_best_practices(
+                best_practice_ids=['readme'], use_ai_flag=False, model=None,
+                repo_urls=repo_urls, jobs=jobs
+            )
+
+        assert mock_deploy.call_count == len(repo_urls)
+        assert [result.repository for result in results] == repo_urls
+        assert [result.status for result in results] == [DEPLOY_STATUS_PUSHED] * 5 + [DEPLOY_STATUS_APPLY_FAILED]
+        assert all(result.branch == 'readme' for result in results)
+        worker_threads = {result.commits[0] for result in results}
+        if jobs > 1:
+            assert all(name.startswith('slim-deploy') for name in worker_threads)
+        else:
+            assert worker_threads == {threading.current_thread().name}
+
+    def test_parallel_workers_never_prompt(self):
+        """Test that concurrent repositories are processed without confirmation prompts."""
+        with patch('jpl.slim.commands.apply_deploy_command.apply_and_deploy_best_practice',
+                   side_effect=_fake_apply_and_deploy) as mock_deploy:
+            apply_and_deploy_best_practices(
+                best_practice_ids=['readme'], use_ai_flag=False, model=None,
+                repo_urls=["https://github.com/org/repo1", "https://github.com/org/repo2"], jobs=2
+            )
+
+        assert all(call.kwargs['no_prompt'] for call in mock_deploy.call_args_list)
+
+    def test_multiple_best_practices_deploy_every_file(self, tmp_path):
+        """Test that applying several best practices to a real repository commits and pushes all of their files."""
+        remote = git.Repo.init(tmp_path / "remote.git", bare=True)
+        repo = git.Repo.clone_from(remote.git_dir, tmp_path / "repo")
+        with repo.config_writer() as config:
+            config.set_value('user', 'name', 'Test')
+            config.set_value('user', 'email', 'test@example.com')
+        (tmp_path / "repo" / "LICENSE").write_text("license")
+        repo.index.add(['LICENSE'])
+        repo.index.commit("Initial commit")
+
+        with patch('jpl.slim.commands.apply_deploy_command.apply_best_practice',
+                   side_effect=_fake_apply_writing_file):
+            results = apply_and_deploy_best_practices(
+                best_practice_ids=['readme', 'contributing'], use_ai_flag=False, model=None,
+                existing_repo_dir=str(tmp_path / "repo"), no_prompt=True
+            )
+
+        assert results[0].status == DEPLOY_STATUS_PUSHED
+        assert results[0].best_practice_ids == ['readme', 'contributing']
+        pushed_files = remote.git.ls_tree('-r', '--name-only', results[0].branch).split()
+        assert sorted(pushed_files) == ['CONTRIBUTING.md', 'LICENSE', 'README.md']
+        assert not repo.untracked_files
+
+    def test_cli_rejects_jobs_without_no_prompt(self):
+        """Test that --jobs above 1 is refused unless prompts are disabled."""
+        from typer.testing import CliRunner
+        from jpl.slim.cli import app
+
+        with patch('jpl.slim.commands.apply_deploy_command.apply_and_deploy_best_practices') as mock_deploy:
+            result = CliRunner().invoke(app, ["apply-deploy", "-b", "readme", "-r", "https://github.com/org/repo",
+                                              "--jobs", "2"])
+
+        assert result.exit_code == 1
+        assert "--no-prompt" in result.output
+        mock_deploy.assert_not_called()
+
+    def test_write_deploy_summary(self, tmp_path):
+        """Test the machine-readable summary."""
+        with patch('jpl.slim.commands.apply_deploy_command.apply_and_deploy_best_practice',
+                   side_effect=_fake_apply_and_deploy):
+            results = apply_and_deploy_best_practices(
+                best_practice_ids=['readme'], use_ai_flag=False, model=None,
+                repo_urls=["https://github.com/org/repo", "https://github.com/org/broken"], jobs=2
+            )
+        summary_file = tmp_path / "summary.json"
+
+        write_deploy_summary(results, str(summary_file))
+
+        summary = json.loads(summary_file.read_text())
+        assert summary['pushed'] == 1
+        assert summary['failed'] == 1
+        assert summary['repositories'][0]['repository'] == "https://github.com/org/repo"
+        assert summary['repositories'][0]['branch'] == "readme"
+        assert summary['repositories'][0]['status'] == DEPLOY_STATUS_PUSHED
+        assert summary['repositories'][0]['best_practice_ids'] == ['readme']
@@ -0,0 +1,124 @@
+"""
+Unit tests for async_utils module.
+"""
+
+import asyncio
+import builtins
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from jpl.slim.mcp import async_utils
+from jpl.slim.mcp.async_utils import fetch_text, notify, run_blocking
+
+
+class FakeContext:
+    """Records the notifications an MCP Context would send."""
+
+    def __init__(self):
+        self.messages = []
+        self.progress = []
+
+    async def info(self, message):
+        self.messages.append(message)
+
+    async def report_progress(self, progress, total=None):
+        self.progress.append(progress)
+
+
+@pytest.mark.unit
+class TestRunBlocking:
+    """Test running blocking work from async tool handlers."""
+
+    def test_returns_result(self):
+        """Test that the function's result is returned and it runs off the event loop thread."""
+        async def main():
+            return await run_blocking(lambda a, b=0: (a + b, threading.current_thread().name), 1, b=2)
+
+        result, thread_name = asyncio.run(main())
+
+        assert result == 3
+        assert thread_name.startswith("slim-mcp-tool")
+
+    def test_propagates_exceptions(self):
+        """Test that exceptions raised by the function reach the caller."""
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            asyncio.run(run_blocking(fail))
+
+    def test_progress_notifications(self, monkeypatch):
+        """Test that long calls send progress notifications while they run."""
+        monkeypatch.setattr(async_utils, "PROGRESS_INTERVAL", 0.02)
+        ctx = FakeContext()
+
+        result = asyncio.run(run_blocking(time.sleep, 0.15, ctx=ctx, description="Applying"))
+
+        assert result is None
+        assert len(ctx.progress) >= 2
+        assert ctx.messages[0].startswith("Applying still running")
+
+    def test_cancellation_returns_promptly(self):
+        """Test that cancelling the awaiting task does not wait for the function."""
+        release = threading.Event()
+
+        async def main():
+            task = asyncio.ensure_future(run_blocking(release.wait, 5))
+            await asyncio.sleep(0.05)
+            started = time.monotonic()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return time.monotonic() - started
+
+        try:
+            assert asyncio.run(main()) < 1
+        finally:
+            release.set()
+
+
+@pytest.mark.unit
+class TestNotify:
+    """Test sending notifications to MCP clients."""
+
+    def test_sync_context_and_failures(self):
+        """Test that sync contexts work and notification errors never fail the tool."""
+        class SyncContext:
+            def __init__(self):
+                self.messages = []
+
+            def info(self, message):
+                self.messages.append(message)
+
+        class BrokenContext:
+            def info(self, message):
+                raise RuntimeError("closed")
+
+        ctx = SyncContext()
+        asyncio.run(notify(ctx, "hello", progress=1))
+        asyncio.run(notify(BrokenContext(), "hello"))
+        asyncio.run(notify(None, "hello"))
+
+        assert ctx.messages == ["hello"]
+
+
+@pytest.mark.unit
+class TestFetchText:
+    """Test non-blocking HTTP fetches."""
+
+    def test_falls_back_to_requests_without_httpx(self):
+        """Test that requests is used in the thread pool when httpx is not installed."""
+        real_import = builtins.__import__
+
+        def import_without_httpx(name, *args, **kwargs):
+            if name == "httpx":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        with patch("builtins.__import__", side_effect=import_without_httpx), \
+             patch("jpl.slim.mcp.async_utils._fetch_text_blocking", return_value="template") as fetch:
+            assert asyncio.run(fetch_text("https://example.com/template.md")) == "template"
+
+        fetch.assert_called_once_with("https://example.com/template.md", async_utils.HTTP_TIMEOUT)
@@ -0,0 +1,161 @@
+"""
+Unit tests for jobs module.
+"""
+
+import logging
+import subprocess
+import sys
+import threading
+import time
+import pytest
+
+from jpl.slim.mcp.jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_SUCCEEDED,
+    JobQueue,
+    JobStore,
+    raise_if_cancelled
+)
+
+
+def _wait_for(queue, job_id, timeout=5):
+    """Poll a job until it finishes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = queue.status(job_id)
+        if status["finished_at"]:
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    """Create job queues on a temporary database and shut them down afterwards."""
+    queues = []
+
+    def make(handlers, max_workers=1):
+        queue = JobQueue(handlers, store_path=tmp_path / "jobs.sqlite3", max_workers=max_workers)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.shutdown()
+        queue.store.close()
+
+
+@pytest.mark.unit
+class TestJobQueue:
+    """Test submitting, polling and cancelling jobs."""
+
+    def test_job_result_and_log_tail(self, make_queue, caplog):
+        """Test that a job's result and the log records of its thread are stored."""
+        caplog.set_level(logging.INFO)
+
+        def apply(repo):
+            logging.info(f"Applying to {repo}")
+            return {"success": True, "targets": [repo]}
+
+        queue = make_queue({"apply": apply})
+        job = queue.submit("apply", {"repo": "repo1"})
+        status = _wait_for(queue, job.id)
+
+        assert job.status == JOB_QUEUED
+        assert status["status"] == JOB_SUCCEEDED
+        assert status["result"] == {"success": True, "targets": ["repo1"]}
+        assert any(line.endswith("Applying to repo1") for line in status["log_tail"])
+        assert queue.status(job.id, log_lines=1)["log_tail"] == status["log_tail"][-1:]
+
+    def test_failures(self, make_queue):
+        """Test that unsuccessful results and exceptions fail the job."""
+        def fail(mode):
+            if mode == "raise":
+                raise RuntimeError("clone failed")
+            return {"success": False, "error": "apply returned false"}
+
+        queue = make_queue({"fail": fail})
+        unsuccessful = _wait_for(queue, queue.submit("fail", {"mode": "result"}).id)
+        raised = _wait_for(queue, queue.submit("fail", {"mode": "raise"}).id)
+
+        assert (unsuccessful["status"], unsuccessful["error"]) == (JOB_FAILED, "apply returned false")
+        assert (raised["status"], raised["error"]) == (JOB_FAILED, "clone failed")
+        with pytest.raises(ValueError):
+            queue.submit("unknown", {})
+
+    def test_cancel_queued_and_running_jobs(self, make_queue):
+        """Test that a queued job never runs and a running job stops at its next checkpoint."""
+        started, release = threading.Event(), threading.Event()
+        ran = []
+
+        def work(name):
+            ran.append(name)
+            started.set()
+            release.wait(5)
+            raise_if_cancelled()
+            return {"success": True}
+
+        queue = make_queue({"work": work})
+        running = queue.submit("work", {"name": "running"})
+        assert started.wait(5)
+        queued = queue.submit("work", {"name": "queued"})
+
+        assert queue.cancel(queued.id).status == JOB_CANCELLED
+        assert queue.cancel(running.id).cancel_requested
+        release.set()
+
+        assert _wait_for(queue, running.id)["status"] == JOB_CANCELLED
+        assert queue.cancel("missing") is None
+        queue.shutdown()
+        assert ran == ["running"]
+
+    def test_clients_take_turns(self, make_queue):
+        """Test that a client with many queued jobs does not starve another client."""
+        release = threading.Event()
+        order = []
+
+        def work(name):
+            if name == "blocker":
+                release.wait(5)
+            order.append(name)
+            return {"success": True}
+
+        queue = make_queue({"work": work})
+        queue.submit("work", {"name": "blocker"}, client_id="a")
+        jobs = [queue.submit("work", {"name": name}, client_id=client)
+                for name, client in [("a1", "a"), ("a2", "a"), ("b1", "b")]]
+        release.set()
+        for job in jobs:
+            _wait_for(queue, job.id)
+
+        assert order == ["blocker", "a1", "b1", "a2"]
+
+
+@pytest.mark.unit
+class TestJobStore:
+    """Test job persistence."""
+
+    def test_jobs_survive_restart_and_interrupted_jobs_fail(self, tmp_path):
+        """Test that a new store sees earlier jobs and fails jobs whose server process is gone."""
+        path = tmp_path / "jobs.sqlite3"
+        store = JobStore(path)
+        finished = store.create("apply", {"repo": "repo1"}, "a")
+        store.finish(finished.id, JOB_SUCCEEDED, result={"success": True})
+        orphan = store.create("apply", {"repo": "repo2"}, "a")
+        dead = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                              capture_output=True, text=True, check=True)
+        store._execute("UPDATE jobs SET pid = ? WHERE id = ?", (int(dead.stdout), orphan.id))
+        store.close()
+
+        reopened = JobStore(path)
+        try:
+            assert reopened.get(finished.id).result == {"success": True}
+            assert reopened.recover_interrupted() == 1
+            assert reopened.get(orphan.id).status == JOB_FAILED
+            assert [job.id for job in reopened.list(status=JOB_FAILED)] == [orphan.id]
+            assert reopened.prune(older_than=-1) == 2
+            assert reopened.get(finished.id) is None
+        finally:
+            reopened.close()
@@ -0,0 +1,138 @@
+"""
+Unit tests for registry_store module.
+"""
+
+import threading
+import time
+import pytest
+
+from jpl.slim.mcp.registry_store import RegistryStore, RegistrySnapshot, process_practice
+
+RAW_PRACTICES = [
+    {
+        "title": "Secrets Detection",
+        "description": "Detect secrets",
+        "category": "security",
+        "assets": [
+            {"name": "GitHub Action", "alias": "secrets-github", "uri": "https://example.com/action.yml"},
+            {"name": "Pre-commit", "alias": "secrets-precommit", "uri": "https://example.com/precommit.yml"}
+        ]
+    },
+    {
+        "title": "README.md",
+        "category": "documentation",
+        "assets": [{"name": "Template", "alias": "readme", "uri": "https://example.com/README.md"}]
+    },
+    {"title": "Governance_Model", "category": "governance"}
+]
+
+
+def _registry_dict(practices):
+    return {asset["alias"]: asset for practice in practices for asset in practice.get("assets", [])}
+
+
+@pytest.mark.unit
+class TestRegistrySnapshot:
+    """Test the indexes built for a registry snapshot."""
+
+    @pytest.fixture
+    def snapshot(self):
+        return RegistrySnapshot.build([process_practice(p) for p in RAW_PRACTICES], _registry_dict(RAW_PRACTICES))
+
+    def test_find_practice(self, snapshot):
+        """Test lookups by id, title, normalized title and asset alias."""
+        assert snapshot.find_practice("secrets-detection")["title"] == "Secrets Detection"
+        assert snapshot.find_practice("Secrets Detection")["id"] == "secrets-detection"
+        assert snapshot.find_practice("readme")["title"] == "README.md"
+        assert snapshot.find_practice("governance-model")["category"] == "governance"
+        assert snapshot.find_practice("secrets-precommit")["id"] == "secrets-detection"
+        assert snapshot.find_practice("unknown") is None
+        assert snapshot.find_practice(None) is None
+
+    def test_find_asset_and_categories(self, snapshot):
+        """Test asset lookups and the category index."""
+        practice = snapshot.find_practice("secrets-detection")
+
+        assert snapshot.find_asset("secrets-github", practice)["uri"] == "https://example.com/action.yml"
+        assert snapshot.find_asset("readme", practice) is None
+        assert snapshot.find_asset("readme")["name"] == "Template"
+        assert list(snapshot.by_category) == ["security", "documentation", "governance"]
+        assert snapshot.to_dict()["registry_dict"]["readme"]["name"] == "Template"
+
+
+@pytest.mark.unit
+class TestRegistryStore:
+    """Test fetching, expiring and refreshing registry snapshots."""
+
+    def test_snapshot_is_fetched_once_within_ttl(self):
+        """Test that concurrent first calls share one fetch."""
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return RAW_PRACTICES
+
+        store = RegistryStore(fetch, _registry_dict, ttl=60)
+        threads = [threading.Thread(target=store.snapshot) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(store.snapshot().practices) == 3
+        assert len(calls) == 1
+
+    def test_stale_snapshot_is_served_while_refreshing(self):
+        """Test that an expired snapshot is returned immediately and swapped after a background refresh."""
+        responses = [RAW_PRACTICES, RAW_PRACTICES[:1]]
+        store = RegistryStore(lambda: responses.pop(0), _registry_dict, ttl=0)
+        first = store.snapshot()
+
+        stale = store.snapshot()
+
+        assert stale is first
+        deadline = time.monotonic() + 5
+        while store.snapshot() is first and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(store.snapshot().practices) == 1
+
+    def test_failed_refresh_keeps_old_snapshot(self):
+        """Test that an empty or failing fetch never replaces a good snapshot."""
+        responses = [RAW_PRACTICES, []]
+        store = RegistryStore(lambda: responses.pop(0) if responses else 1 / 0, _registry_dict, ttl=60)
+        first = store.snapshot()
+
+        assert store.refresh() is False
+        assert store.refresh() is False
+        assert store.snapshot() is first
+
+    def test_failed_first_fetch_returns_empty_snapshot(self):
+        """Test that tools get an empty registry until a fetch succeeds."""
+        responses = [[], RAW_PRACTICES]
+        store = RegistryStore(lambda: responses.pop(0), _registry_dict, ttl=60)
+
+        assert store.snapshot().practices == []
+        assert len(store.snapshot().practices) == 3
+
+    def test_background_refresher(self):
+        """Test that the refresh thread loads the registry ahead of tool calls and stops cleanly."""
+        loaded = threading.Event()
+
+        def fetch():
+            loaded.set()
+            return RAW_PRACTICES
+
+        store = RegistryStore(fetch, _registry_dict, ttl=60)
+        store.start()
+        try:
+            assert loaded.wait(5)
+        finally:
+            store.stop()
+        assert len(store.snapshot().practices) == 3
+
+    def test_ttl_from_environment(self, monkeypatch):
+        """Test that SLIM_REGISTRY_TTL configures the TTL."""
+        monkeypatch.setenv("SLIM_REGISTRY_TTL", "30")
+
+        assert RegistryStore(list, dict).ttl == 30.0
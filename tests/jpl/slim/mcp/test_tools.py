@@ -0,0 +1,35 @@
+"""
+Unit tests for MCP tools module.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from jpl.slim.mcp.tools.tools import SlimApplyTool
+
+REPO_URLS = ["https://github.com/org/repo1", "https://github.com/org/repo2"]
+
+
+@pytest.mark.unit
+class TestSlimApplyTool:
+    """Test how the apply tool splits its work into apply calls."""
+
+    def _apply(self, **kwargs):
+        with patch("jpl.slim.mcp.tools.tools.apply_best_practices", return_value=True) as mock_apply:
+            result = SlimApplyTool().execute(**kwargs)
+        return result, [call.kwargs["repo_urls"] for call in mock_apply.call_args_list]
+
+    def test_applies_one_repository_url_at_a_time(self):
+        """Test that every repository URL gets its own apply call."""
+        result, batches = self._apply(best_practice_ids=["readme"], repo_urls=REPO_URLS)
+
+        assert result["success"]
+        assert batches == [[REPO_URLS[0]], [REPO_URLS[1]]]
+
+    def test_repo_dir_and_docs_website_keep_one_call(self, tmp_path):
+        """Test that a repo_dir, which takes precedence over URLs, and a lone docs-website are applied once."""
+        _, repo_dir_batches = self._apply(best_practice_ids=["readme"], repo_urls=REPO_URLS, repo_dir=str(tmp_path))
+        _, docs_batches = self._apply(best_practice_ids=["docs-website"], repo_urls=REPO_URLS)
+
+        assert repo_dir_batches == [REPO_URLS]
+        assert docs_batches == [REPO_URLS]
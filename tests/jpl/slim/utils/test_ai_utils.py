@@ -7,15 +7,20 @@ NOTE: Currently only testing failure conditions, not actual AI-generated functio
 import os
 import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, Mock
 
 from jpl.slim.utils.ai_utils import (
     generate_with_ai,
     construct_prompt,
     generate_ai_content,
     generate_with_model,
+    build_prompt_messages,
     enhance_content,
-    validate_model
+    validate_model,
+    check_model_health,
+    check_model_health_async,
+    clear_model_health_cache
 )
 
 
@@ -234,3 +239,93 @@ class TestAIUtils:
         
         # Should return original content
         assert result == "Original content"
+
+
+@pytest.mark.unit
+class TestModelHealth:
+    """Tests for the model health check cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        clear_model_health_cache()
+        yield
+        clear_model_health_cache()
+
+    @patch('jpl.slim.utils.ai_utils._send_health_probe')
+    def test_probe_runs_once_per_model(self, mock_generate):
+        """Test that concurrent and repeated checks share one probe per model."""
+        futures = [check_model_health_async("openai/gpt-4o") for _ in range(4)]
+        results = [future.result() for future in futures]
+        check_model_health("openai/gpt-4o-mini")
+
+        assert all(result.healthy for result in results)
+        assert sorted(call.args[0] for call in mock_generate.call_args_list) == ["openai/gpt-4o", "openai/gpt-4o-mini"]
+
+    @patch('jpl.slim.utils.ai_utils._send_health_probe', side_effect=[ConnectionError("refused"), None])
+    def test_failed_probe_is_retried_after_ttl(self, mock_generate):
+        """Test that a failure is cached until its TTL expires."""
+        assert not check_model_health("openai/gpt-4o").healthy
+        assert not check_model_health("openai/gpt-4o").healthy
+
+        assert check_model_health("openai/gpt-4o", ttl=0).healthy
+        assert mock_generate.call_count == 2
+
+    @patch('jpl.slim.utils.ai_utils._send_health_probe')
+    def test_missing_api_key_skips_probe(self, mock_generate, monkeypatch):
+        """Test that configuration errors are reported without a request."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+        health = check_model_health("anthropic/claude-3-5-sonnet-20241022")
+
+        assert not health.healthy
+        assert "ANTHROPIC_API_KEY" in health.message
+        mock_generate.assert_not_called()
+
+    def test_completed_response_without_text_is_healthy(self):
+        """Test that a reasoning model returning no visible text passes, and no token cap is sent."""
+        response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=None))])
+        litellm = SimpleNamespace(completion=Mock(return_value=response))
+
+        with patch.dict(sys.modules, {"litellm": litellm}), \
+             patch('jpl.slim.utils.ai_utils._configure_litellm_logging'):
+            health = check_model_health("openai/o3-mini")
+
+        assert health.healthy
+        assert "max_tokens" not in litellm.completion.call_args.kwargs
+
+
+@pytest.mark.unit
+class TestPromptPrefixCaching:
+    """Tests for sending prompts as a cacheable prefix and a variable suffix."""
+
+    def test_anthropic_prefix_is_marked_for_caching(self):
+        """Test that Anthropic models get the prefix as a cache_control block."""
+        messages = build_prompt_messages("page", "anthropic/claude-3-5-sonnet-20241022", prompt_prefix="context ")
+
+        assert messages == [{"role": "user", "content": [
+            {"type": "text", "text": "context ", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "page"}
+        ]}]
+
+    @pytest.mark.parametrize("model", ["openai/gpt-4o", "bedrock/amazon.titan-text-express-v1"])
+    def test_other_providers_get_plain_prompt(self, model):
+        """Test that providers without caching hints get the concatenated prompt."""
+        assert build_prompt_messages("page", model, prompt_prefix="context ") == [
+            {"role": "user", "content": "context page"}
+        ]
+        assert build_prompt_messages("page", model) == [{"role": "user", "content": "page"}]
+
+    def test_generate_with_model_sends_prefix(self):
+        """Test that the prefix reaches the completion request and not its kwargs."""
+        mock_completion = MagicMock()
+        mock_completion.return_value.choices = [MagicMock()]
+        mock_completion.return_value.choices[0].message.content = "generated"
+
+        with patch.dict('sys.modules', {'litellm': MagicMock(completion=mock_completion)}):
+            result = generate_ai_content("page", "bedrock/anthropic.claude-3-haiku", prompt_prefix="context ")
+
+        assert result == "generated"
+        kwargs = mock_completion.call_args.kwargs
+        assert "prompt_prefix" not in kwargs
+        assert kwargs["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
@@ -0,0 +1,346 @@
+"""
+Unit tests for file_utils module.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from jpl.slim.utils import file_utils
+from jpl.slim.utils.file_utils import (
+    git_ls_files,
+    list_repository_files,
+    walk_repository,
+    scan_tree,
+    configure_scan_threads,
+    resolve_scan_threads,
+    is_remote_filesystem,
+    user_cache_dir,
+    materialize_tree,
+    atomic_write,
+    file_lock,
+    GitignoreMatcher
+)
+
+
+def _make_tree(root: Path) -> None:
+    """Create a small tree with ignored build outputs."""
+    (root / "src").mkdir()
+    (root / "build" / "lib").mkdir(parents=True)
+    (root / "vendor").mkdir()
+    (root / "src" / "main.py").write_text("print('hello')")
+    (root / "src" / "debug.log").write_text("log")
+    (root / "build" / "lib" / "main.py").write_text("print('hello')")
+    (root / "vendor" / "dep.js").write_text("// vendored")
+    (root / "README.md").write_text("# Project")
+    (root / ".gitignore").write_text("build/\n/vendor\n*.log\n")
+
+
+@pytest.fixture
+def ignored_tree():
+    """Create a plain directory containing a .gitignore."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        _make_tree(root)
+        yield root
+
+
+@pytest.fixture
+def ignored_git_repo():
+    """Create a git repository containing a .gitignore."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        subprocess.run(['git', 'init', '-q', str(root)], check=True)
+        _make_tree(root)
+        yield root
+
+
+@pytest.mark.unit
+class TestGitLsFiles:
+    """Test the git_ls_files function."""
+
+    def test_git_ls_files_respects_gitignore(self, ignored_git_repo):
+        """Test that untracked ignored files are not listed."""
+        result = git_ls_files(ignored_git_repo)
+
+        assert sorted(result) == [".gitignore", "README.md", "src/main.py"]
+
+    def test_git_ls_files_skips_deleted_files_and_submodules(self, ignored_git_repo):
+        """Test that only regular files present in the work tree are listed."""
+        git = ['git', '-C', str(ignored_git_repo)]
+        subprocess.run(git + ['add', 'README.md', 'src/main.py'], check=True)
+        subprocess.run(git + ['update-index', '--add', '--cacheinfo',
+                              '160000,' + '1' * 40 + ',module'], check=True)
+        (ignored_git_repo / "README.md").unlink()
+        subprocess.run(['git', 'init', '-q', str(ignored_git_repo / "nested")], check=True)
+
+        result = git_ls_files(ignored_git_repo)
+
+        assert sorted(result) == [".gitignore", "src/main.py"]
+
+    def test_git_ls_files_non_git_directory(self, ignored_tree):
+        """Test that non-git directories return None."""
+        assert git_ls_files(ignored_tree) is None
+
+
+@pytest.mark.unit
+class TestListRepositoryFiles:
+    """Test the list_repository_files function."""
+
+    @pytest.mark.parametrize("fixture_name", ["ignored_tree", "ignored_git_repo"])
+    def test_list_repository_files(self, fixture_name, request):
+        """Test that both backends skip ignored files."""
+        root = request.getfixturevalue(fixture_name)
+
+        result = list_repository_files(root)
+
+        assert sorted(result) == sorted([".gitignore", "README.md", os.path.join("src", "main.py")])
+
+    @pytest.mark.parametrize("fixture_name", ["ignored_tree", "ignored_git_repo"])
+    def test_list_repository_files_exclude_dirs(self, fixture_name, request):
+        """Test that excluded directories are skipped."""
+        root = request.getfixturevalue(fixture_name)
+
+        result = list_repository_files(root, exclude_dirs={"src"})
+
+        assert sorted(result) == [".gitignore", "README.md"]
+
+    def test_list_repository_files_without_gitignore(self, ignored_tree):
+        """Test listing every file when gitignore handling is disabled."""
+        result = list_repository_files(ignored_tree, respect_gitignore=False)
+
+        assert os.path.join("build", "lib", "main.py") in result
+        assert os.path.join("vendor", "dep.js") in result
+
+
+@pytest.mark.unit
+class TestWalkRepository:
+    """Test the walk_repository function."""
+
+    @pytest.mark.parametrize("fixture_name", ["ignored_tree", "ignored_git_repo"])
+    def test_walk_repository_pruning(self, fixture_name, request):
+        """Test that callers can prune directories in place like os.walk."""
+        root = request.getfixturevalue(fixture_name)
+        (root / "src" / "nested").mkdir()
+        (root / "src" / "nested" / "util.py").write_text("pass")
+
+        visited = []
+        for dirpath, dirnames, filenames in walk_repository(root):
+            visited.append(os.path.relpath(dirpath, root))
+            dirnames[:] = [d for d in dirnames if d != "nested"]
+
+        assert visited == [".", "src"]
+
+
+@pytest.mark.unit
+class TestScanTree:
+    """Test the scan_tree function."""
+
+    @pytest.mark.parametrize("fixture_name", ["ignored_tree", "ignored_git_repo"])
+    def test_scan_tree_entries(self, fixture_name, request):
+        """Test that file entries carry names, paths and stat results."""
+        root = request.getfixturevalue(fixture_name)
+
+        results = {rel_dir: (dirnames, entries) for rel_dir, dirnames, entries in scan_tree(root)}
+
+        assert sorted(results) == ["", "src"]
+        assert results[""][0] == ["src"]
+        entry = results["src"][1][0]
+        assert entry.name == "main.py"
+        assert entry.path == os.path.join(str(root), "src", "main.py")
+        assert not entry.is_dir()
+        assert entry.stat().st_size == len("print('hello')")
+
+
+@pytest.mark.unit
+class TestParallelScan:
+    """Test scanning directory trees with worker threads."""
+
+    @pytest.fixture
+    def wide_tree(self, ignored_tree):
+        """Add enough nested directories to keep several workers busy."""
+        for i in range(6):
+            for j in range(4):
+                nested = ignored_tree / f"pkg{i}" / f"mod{j}"
+                nested.mkdir(parents=True)
+                (nested / "code.py").write_text("x" * (i + j))
+                (nested / "trace.log").write_text("ignored")
+        (ignored_tree / "pkg0" / ".gitignore").write_text("mod1/\n")
+        return ignored_tree
+
+    @staticmethod
+    def _collect(root, **kwargs):
+        return [(rel_dir, list(dirnames), [(e.name, e.stat().st_size) for e in entries])
+                for rel_dir, dirnames, entries in scan_tree(root, **kwargs)]
+
+    @pytest.mark.parametrize("threads", [2, 8])
+    def test_parallel_scan_matches_serial(self, wide_tree, threads):
+        """Test that parallel scans yield the same entries in the same order."""
+        serial = self._collect(wide_tree, threads=1)
+
+        parallel = self._collect(wide_tree, threads=threads, prefetch_stat=True)
+
+        assert parallel == serial
+        assert os.path.join("pkg0", "mod1") not in [rel_dir for rel_dir, _, _ in serial]
+        assert os.path.join("pkg1", "mod1") in [rel_dir for rel_dir, _, _ in serial]
+
+    def test_parallel_scan_matches_serial_in_git_repo(self, ignored_git_repo):
+        """Test that stat prefetching over git's file list keeps the walk order."""
+        (ignored_git_repo / "src" / "nested").mkdir()
+        (ignored_git_repo / "src" / "nested" / "util.py").write_text("pass")
+
+        serial = self._collect(ignored_git_repo, threads=1)
+        parallel = self._collect(ignored_git_repo, threads=4, prefetch_stat=True)
+
+        assert parallel == serial
+
+    def test_parallel_scan_pruning(self, wide_tree):
+        """Test that callers can prune a parallel walk in place."""
+        visited = []
+        for rel_dir, dirnames, _ in scan_tree(wide_tree, threads=4):
+            visited.append(rel_dir)
+            dirnames[:] = [d for d in dirnames if d != "pkg2"]
+
+        assert not any(rel_dir.startswith("pkg2") for rel_dir in visited)
+        assert os.path.join("pkg3", "mod0") in visited
+
+    def test_parallel_scan_pruning_stops_queued_listings(self, tmp_path):
+        """Test that a pruned subtree is not listed by workers that started before the prune."""
+        for i in range(10):
+            (tmp_path / "skip" / f"dir{i}" / "sub").mkdir(parents=True)
+            (tmp_path / "keep" / f"dir{i}").mkdir(parents=True)
+        list_directory = file_utils._list_directory
+        listed = []
+
+        def slow_list_directory(root, rel_dir, *args):
+            listed.append(rel_dir)
+            time.sleep(0.005)
+            return list_directory(root, rel_dir, *args)
+
+        with patch("jpl.slim.utils.file_utils._list_directory", side_effect=slow_list_directory):
+            for rel_dir, dirnames, _ in scan_tree(tmp_path, respect_gitignore=False, threads=8):
+                dirnames[:] = [d for d in dirnames if d != "skip"]
+
+        assert len([rel_dir for rel_dir in listed if rel_dir.startswith("skip")]) <= 1
+        assert os.path.join("keep", "dir9") in listed
+
+    def test_resolve_scan_threads(self, tmp_path):
+        """Test explicit, configured and auto-detected thread counts."""
+        with patch("jpl.slim.utils.file_utils.is_remote_filesystem", return_value=True):
+            assert resolve_scan_threads(tmp_path, 3) == 3
+            assert resolve_scan_threads(tmp_path) > 1
+            try:
+                configure_scan_threads(1)
+                assert resolve_scan_threads(tmp_path) == 1
+            finally:
+                configure_scan_threads(None)
+        with patch("jpl.slim.utils.file_utils.is_remote_filesystem", return_value=False):
+            assert resolve_scan_threads(tmp_path) == 1
+
+    def test_is_remote_filesystem(self):
+        """Test that the innermost mount decides whether a path is remote."""
+        mounts = (("/", "ext4"), ("/home", "nfs4"), ("/home/local", "xfs"))
+        with patch("jpl.slim.utils.file_utils._read_mounts", return_value=mounts), \
+             patch("os.path.realpath", side_effect=lambda path: path):
+            assert is_remote_filesystem("/home/user/repo")
+            assert not is_remote_filesystem("/home/local/repo")
+            assert not is_remote_filesystem("/homework")
+
+
+@pytest.mark.unit
+class TestCacheAndCopyHelpers:
+    """Test the cache, copy, lock and write helpers."""
+
+    def test_user_cache_dir_override(self, tmp_path, monkeypatch):
+        """Test that SLIM_CACHE_DIR relocates the cache."""
+        monkeypatch.setenv("SLIM_CACHE_DIR", str(tmp_path / "cache"))
+
+        path = user_cache_dir("templates", "abc")
+
+        assert path == tmp_path / "cache" / "templates" / "abc"
+        assert path.is_dir()
+
+    def test_materialize_tree(self, tmp_path):
+        """Test copying and skipping entries."""
+        source = tmp_path / "source"
+        (source / ".git").mkdir(parents=True)
+        (source / "docs").mkdir()
+        (source / "docs" / "page.md").write_text("page")
+        (source / "logo.png").write_bytes(b"png")
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "docs").mkdir()
+        (target / "docs" / "page.md").write_text("stale")
+
+        counts = materialize_tree(source, target)
+
+        assert (target / "docs" / "page.md").read_text() == "page"
+        assert (target / "logo.png").read_bytes() == b"png"
+        assert not (target / ".git").exists()
+        assert counts["copied"] + counts["reflinked"] == 2
+
+    def test_file_lock_is_released_when_holder_dies(self, tmp_path):
+        """Test that a lock held by a process that exits without releasing it is free again."""
+        lock_path = tmp_path / "cache.lock"
+        code = ("import os, sys\n"
+                "from jpl.slim.utils.file_utils import file_lock\n"
+                "with file_lock(sys.argv[1]):\n"
+                "    os._exit(3)\n")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+        holder = subprocess.run([sys.executable, "-c", code, str(lock_path)], env=env, timeout=60)
+
+        assert holder.returncode == 3
+        with file_lock(lock_path):
+            assert lock_path.exists()
+
+    def test_atomic_write(self, tmp_path):
+        """Test that atomic_write keeps permissions and detaches hardlinks."""
+        original = tmp_path / "original.sh"
+        original.write_text("old")
+        os.chmod(original, 0o755)
+        linked = tmp_path / "linked.sh"
+        os.link(original, linked)
+
+        atomic_write(linked, "new")
+
+        assert linked.read_text() == "new"
+        assert original.read_text() == "old"
+        assert os.stat(linked).st_mode & 0o777 == 0o755
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["linked.sh", "original.sh"]
+
+    def test_atomic_write_new_file_honors_umask(self, tmp_path):
+        """Test that a new file gets the mode open() would give it."""
+        previous = os.umask(0o027)
+        try:
+            atomic_write(tmp_path / "new.txt", "data")
+        finally:
+            os.umask(previous)
+
+        assert os.stat(tmp_path / "new.txt").st_mode & 0o777 == 0o640
+
+
+@pytest.mark.unit
+class TestGitignoreMatcher:
+    """Test the GitignoreMatcher class."""
+
+    def test_gitignore_matcher_rules(self):
+        """Test anchoring, directory-only rules, wildcards and negation."""
+        matcher = GitignoreMatcher()
+        matcher.add_patterns(["# comment", "*.pyc", "/dist", "out/", "docs/**/*.tmp", "!keep.pyc"])
+        matcher.add_patterns(["generated/"], base_dir="pkg")
+
+        assert matcher.is_ignored("a/b/mod.pyc")
+        assert not matcher.is_ignored("a/keep.pyc")
+        assert matcher.is_ignored("dist", is_dir=True)
+        assert not matcher.is_ignored("a/dist", is_dir=True)
+        assert matcher.is_ignored("a/out", is_dir=True)
+        assert not matcher.is_ignored("a/out")
+        assert matcher.is_ignored("docs/x/y/file.tmp")
+        assert matcher.is_ignored("pkg/generated", is_dir=True)
+        assert not matcher.is_ignored("generated", is_dir=True)
@@ -3,10 +3,13 @@ Tests for Git utility functions.
 """
 
 import os
+import subprocess
 import tempfile
 import pytest
 from unittest.mock import patch, MagicMock, PropertyMock
 
+from tests.conftest import create_bare_repo_with_remote, run_git
+
 # Import the module that will contain the functions (this will fail until implemented)
 from jpl.slim.utils.git_utils import (
     generate_git_branch_name,
@@ -15,7 +18,13 @@ from jpl.slim.utils.git_utils import (
     extract_git_info,
     is_git_repository,
     get_git_info_summary,
-    get_contributor_stats
+    get_contributor_stats,
+    DeployTransaction,
+    commit_paths,
+    configure_push_concurrency,
+    push_slot,
+    remote_host,
+    is_transient_push_error
 )
 
 
@@ -524,3 +533,243 @@ class TestGitUtils:
         
         # Assert
         assert result == []
+
+
+@pytest.fixture
+def deploy_repos(tmp_path):
+    """Create a bare remote and a local repository with one commit pushed to main."""
+    local, remote = tmp_path / "local", tmp_path / "remote.git"
+    create_bare_repo_with_remote(str(local), bare_repo_dir=str(remote))
+    run_git(remote, 'symbolic-ref', 'HEAD', 'refs/heads/main')
+    run_git(local, 'branch', '-M', 'main')
+    run_git(local, 'push', '-q', 'origin', 'main')
+    return local, remote
+
+
+@pytest.mark.unit
+class TestDeployTransaction:
+    """Tests for the DeployTransaction class."""
+
+    def test_commits_per_practice_and_pushes_once(self, deploy_repos):
+        """Test that several commits are published by one fetch and one push."""
+        import git
+        local, remote = deploy_repos
+        transaction = DeployTransaction(str(local), 'slim-best-practices')
+
+        with patch.object(git.cmd.Git, '_call_process', autospec=True,
+                          side_effect=git.cmd.Git._call_process) as git_command:
+            transaction.begin()
+            (local / "CONTRIBUTING.md").write_text("contributing")
+            first = transaction.commit("Add CONTRIBUTING.md", paths=["CONTRIBUTING.md"])
+            (local / "SECURITY.md").write_text("security")
+            second = transaction.commit("Add SECURITY.md", paths=["SECURITY.md"])
+            transaction.push()
+
+        commands = [call.args[1] for call in git_command.call_args_list]
+        assert commands.count('fetch') == 1
+        assert commands.count('push') == 1
+        assert transaction.commits == [first, second]
+        assert run_git(remote, 'rev-parse', 'slim-best-practices') == second
+        assert run_git(remote, 'log', '--format=%s', 'slim-best-practices') == \
+            "Add SECURITY.md\nAdd CONTRIBUTING.md\nInitial commit"
+
+    def test_commit_without_changes(self, deploy_repos):
+        """Test that an empty commit is skipped."""
+        local, _ = deploy_repos
+        transaction = DeployTransaction(str(local), 'readme')
+        transaction.begin()
+
+        assert transaction.commit("Nothing changed") is None
+        assert transaction.commits == []
+
+    def test_begin_merges_remote_branch(self, deploy_repos, tmp_path):
+        """Test that a branch that moved on the remote is merged after the single fetch."""
+        local, remote = deploy_repos
+        other = tmp_path / "other"
+        subprocess.run(['git', 'clone', '-q', str(remote), str(other)], check=True, capture_output=True)
+        run_git(other, 'config', 'user.email', 'other@example.com')
+        run_git(other, 'config', 'user.name', 'Other')
+        run_git(other, 'checkout', '-q', '-b', 'readme')
+        (other / "NOTES.md").write_text("notes")
+        run_git(other, 'add', 'NOTES.md')
+        run_git(other, 'commit', '-q', '-m', 'Add notes')
+        run_git(other, 'push', '-q', 'origin', 'readme')
+
+        transaction = DeployTransaction(str(local), 'readme')
+        transaction.begin()
+
+        assert transaction.remote_commit == run_git(remote, 'rev-parse', 'readme')
+        assert (local / "NOTES.md").exists()
+
+    def test_force_with_lease_rejects_concurrent_push(self, deploy_repos, tmp_path):
+        """Test that the lease taken at fetch time protects remote changes pushed afterwards."""
+        local, remote = deploy_repos
+        transaction = DeployTransaction(str(local), 'main', force_with_lease=True, atomic=True)
+        transaction.begin()
+
+        other = tmp_path / "other"
+        subprocess.run(['git', 'clone', '-q', str(remote), str(other)], check=True, capture_output=True)
+        run_git(other, 'config', 'user.email', 'other@example.com')
+        run_git(other, 'config', 'user.name', 'Other')
+        (other / "NOTES.md").write_text("notes")
+        run_git(other, 'add', 'NOTES.md')
+        run_git(other, 'commit', '-q', '-m', 'Add notes')
+        run_git(other, 'push', '-q', 'origin', 'HEAD:main')
+        # Update the remote-tracking ref as an unrelated fetch would
+        run_git(local, 'fetch', '-q', 'origin')
+
+        (local / "LICENSE").write_text("license")
+        transaction.commit("Add LICENSE")
+
+        from git.exc import GitCommandError
+        with pytest.raises(GitCommandError):
+            transaction.push()
+        assert run_git(remote, 'log', '-1', '--format=%s', 'main') == "Add notes"
+
+
+@pytest.mark.unit
+class TestCommitPaths:
+    """Tests for committing known paths through the index."""
+
+    def test_commits_only_known_paths(self, deploy_repos):
+        """Test that unrelated modified and untracked files stay out of the commit."""
+        import git
+        local, _ = deploy_repos
+        repo = git.Repo(local)
+        (local / "README.md").write_text("# Edited by hand\n")
+        (local / "scratch.txt").write_text("scratch")
+        (local / ".github").mkdir()
+        (local / ".github" / "CODEOWNERS").write_text("* @org/team")
+        (local / "LICENSE").write_text("license")
+
+        commit = commit_paths(repo, [".github/CODEOWNERS", str(local / "LICENSE")], "Add governance files")
+
+        assert commit == repo.head.commit.hexsha
+        assert run_git(local, 'show', '--name-only', '--format=', 'HEAD').splitlines() == [".github/CODEOWNERS", "LICENSE"]
+        assert "README.md" in run_git(local, 'diff', '--name-only')
+        assert "scratch.txt" in run_git(local, 'status', '--porcelain')
+
+    def test_removed_and_unchanged_paths(self, deploy_repos):
+        """Test that deleted tracked files are committed and unchanged paths make no commit."""
+        import git
+        local, _ = deploy_repos
+        repo = git.Repo(local)
+        head = repo.head.commit.hexsha
+
+        assert commit_paths(repo, ["README.md", "missing.md"], "No changes") is None
+        assert repo.head.commit.hexsha == head
+
+        (local / "README.md").unlink()
+        commit_paths(repo, ["README.md"], "Remove README")
+
+        assert run_git(local, 'ls-files') == ""
+
+    def test_transaction_commits_paths(self, deploy_repos):
+        """Test that a transaction given paths does not commit other changes."""
+        local, _ = deploy_repos
+        (local / "scratch.txt").write_text("scratch")
+        transaction = DeployTransaction(str(local), 'readme')
+        transaction.begin()
+        (local / "CHANGELOG.md").write_text("changes")
+
+        assert transaction.commit("Add CHANGELOG.md", paths=["CHANGELOG.md"])
+        assert run_git(local, 'show', '--name-only', '--format=', 'HEAD') == "CHANGELOG.md"
+
+
+@pytest.mark.unit
+class TestPushConcurrency:
+    """Tests for push retries and per-host push limits."""
+
+    @pytest.mark.parametrize("url,host", [
+        ("https://github.com/org/repo.git", "github.com"),
+        ("git@GitHub.com:org/repo.git", "github.com"),
+        ("ssh://git@gitlab.example.com:2222/org/repo", "gitlab.example.com"),
+        ("/srv/git/repo.git", "local"),
+    ])
+    def test_remote_host(self, url, host):
+        """Test extracting the host from remote URLs."""
+        assert remote_host(url) == host
+
+    def test_is_transient_push_error(self):
+        """Test that network failures are retried and rejections are not."""
+        from git.exc import GitCommandError
+        assert is_transient_push_error(GitCommandError('push', 128, stderr='fatal: the remote end hung up unexpectedly'))
+        assert is_transient_push_error(GitCommandError('push', 128, stderr='You have exceeded a secondary rate limit'))
+        assert not is_transient_push_error(GitCommandError('push', 1, stderr='! [rejected] main -> main (non-fast-forward)'))
+
+    def test_rejection_with_hang_up_is_not_transient(self):
+        """Test that a rejected push is not retried when git also reports that the remote hung up."""
+        from git.exc import GitCommandError
+        error = GitCommandError('push', 1, stderr='fatal: the remote end hung up unexpectedly\n'
+                                                  ' ! [rejected] main -> main (stale info)')
+
+        assert not is_transient_push_error(error)
+
+    def test_push_slot_caps_concurrency_per_host(self):
+        """Test that pushes to one host wait for a free slot while other hosts proceed."""
+        import threading
+        configure_push_concurrency(1)
+        try:
+            acquired = []
+
+            def push(host):
+                with push_slot(host):
+                    acquired.append(host)
+
+            with push_slot("github.com"):
+                same_host = threading.Thread(target=push, args=("github.com",))
+                other_host = threading.Thread(target=push, args=("gitlab.com",))
+                same_host.start()
+                other_host.start()
+                other_host.join(timeout=5)
+                same_host.join(timeout=0.2)
+                assert acquired == ["gitlab.com"]
+            same_host.join(timeout=5)
+            assert acquired == ["gitlab.com", "github.com"]
+        finally:
+            configure_push_concurrency(4)
+
+    @patch('jpl.slim.utils.git_utils.time.sleep')
+    def test_push_retries_transient_failures(self, mock_sleep, deploy_repos):
+        """Test that a push failing for a transient reason is retried with backoff."""
+        from git.exc import GitCommandError
+        local, remote = deploy_repos
+        transaction = DeployTransaction(str(local), 'readme', retries=2)
+        transaction.begin()
+        (local / "LICENSE").write_text("license")
+        transaction.commit("Add LICENSE")
+
+        real_git = transaction.repo.git
+        failures = [GitCommandError('push', 128, stderr='fatal: unable to access: Connection reset by peer')]
+
+        class FlakyGit:
+            def __getattr__(self, name):
+                return getattr(real_git, name)
+
+            def push(self, *args):
+                if failures:
+                    raise failures.pop()
+                return real_git.push(*args)
+
+        with patch.object(transaction.repo, 'git', FlakyGit()):
+            transaction.push()
+
+        assert transaction.push_attempts == 2
+        assert mock_sleep.call_count == 1
+        assert run_git(remote, 'log', '-1', '--format=%s', 'readme') == "Add LICENSE"
+
+    @patch('jpl.slim.utils.git_utils.time.sleep')
+    def test_push_does_not_retry_rejections(self, mock_sleep, deploy_repos):
+        """Test that a rejected push fails without retrying."""
+        from git.exc import GitCommandError
+        local, _ = deploy_repos
+        transaction = DeployTransaction(str(local), 'readme', retries=2)
+        transaction.begin()
+
+        with patch.object(transaction.repo, 'git') as mock_git:
+            mock_git.push.side_effect = GitCommandError('push', 1, stderr='! [rejected] (non-fast-forward)')
+            with pytest.raises(GitCommandError):
+                transaction.push()
+
+        assert transaction.push_attempts == 1
+        mock_sleep.assert_not_called()
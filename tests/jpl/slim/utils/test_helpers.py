@@ -3,7 +3,13 @@ Tests for helper functions in the docgen utils module.
 """
 
 import pytest
-from jpl.slim.best_practices.docs_website_impl.helpers import escape_yaml_value
+from unittest.mock import patch
+
+from jpl.slim.best_practices.docs_website_impl.helpers import (
+    escape_yaml_value,
+    compile_placeholders,
+    replace_placeholders_in_file
+)
 
 
 @pytest.mark.unit
@@ -40,4 +46,48 @@ class TestEscapeYamlValue:
         """Test that titles with quotes are properly escaped."""
         assert escape_yaml_value('The "Best" Practices') == '"The \\"Best\\" Practices"'
         assert escape_yaml_value("User's Guide") == '"User\'s Guide"'
-        assert escape_yaml_value('Section: "How to" Guide') == '"Section: \\"How to\\" Guide"'
\ No newline at end of file
+        assert escape_yaml_value('Section: "How to" Guide') == '"Section: \\"How to\\" Guide"'
+
+
+@pytest.mark.unit
+class TestReplacePlaceholders:
+    """Test the compile_placeholders and replace_placeholders_in_file functions."""
+
+    def test_replaces_all_placeholders_in_one_pass(self, tmp_path):
+        """Test that replacements are not themselves scanned for placeholders."""
+        page = tmp_path / "page.md"
+        page.write_bytes(b"# [NAME]\r\n[NAME_LONG] by [ORG]\r\n")
+        pattern, replacements = compile_placeholders({"[NAME]": "[ORG]", "[NAME_LONG]": "Long", "[ORG]": "NASA"})
+
+        assert replace_placeholders_in_file(str(page), pattern, replacements)
+
+        assert page.read_bytes() == b"# [ORG]\r\nLong by NASA\r\n"
+
+    def test_unchanged_file_is_not_rewritten(self, tmp_path):
+        """Test that files without placeholders are left untouched."""
+        page = tmp_path / "page.md"
+        page.write_text("no placeholders")
+        pattern, replacements = compile_placeholders({"[NAME]": "Project"})
+
+        with patch("jpl.slim.best_practices.docs_website_impl.helpers.atomic_write") as write:
+            assert not replace_placeholders_in_file(str(page), pattern, replacements)
+
+        write.assert_not_called()
+
+    def test_large_files_are_memory_mapped(self, tmp_path):
+        """Test replacement in files above the memory-map threshold."""
+        page = tmp_path / "bundle.js"
+        page.write_text("x" * 64 + "[NAME]")
+        pattern, replacements = compile_placeholders({"[NAME]": "Project"})
+
+        with patch("jpl.slim.best_practices.docs_website_impl.helpers.PLACEHOLDER_MMAP_THRESHOLD", 16):
+            assert replace_placeholders_in_file(str(page), pattern, replacements)
+
+        assert page.read_text() == "x" * 64 + "Project"
+
+    def test_no_placeholders(self, tmp_path):
+        """Test that an empty mapping compiles to no pattern."""
+        pattern, replacements = compile_placeholders({})
+
+        assert pattern is None
+        assert not replace_placeholders_in_file(str(tmp_path / "missing.md"), pattern, replacements)
@@ -7,10 +7,13 @@ import tempfile
 import os
 import json
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock, patch, mock_open
 
+from jpl.slim.utils import repo_utils
 from jpl.slim.utils.repo_utils import (
     scan_repository,
+    iter_repository_entries,
+    RepositoryEntry,
     extract_project_metadata,
     categorize_directories,
     detect_languages,
@@ -411,6 +414,67 @@ class TestScanRepository:
         
         # Should extract from package.json
         assert result["project_name"] == "test-project"
+    
+    def test_scan_repository_without_file_lists(self, temp_repo):
+        """Test that aggregates are kept when file lists are not materialized."""
+        full = scan_repository(temp_repo)
+        result = scan_repository(temp_repo, include_files=False, include_directories=False)
+        
+        assert result["files"] == []
+        assert result["directories"] == []
+        assert result["file_count"] == full["file_count"]
+        assert result["directory_count"] == len(full["directories"])
+        assert result["size_bytes"] == full["size_bytes"]
+        assert sorted(result["languages"]) == sorted(full["languages"])
+        assert result["src_dirs"] == full["src_dirs"]
+    
+    def test_scan_repository_file_predicate(self, temp_repo):
+        """Test listing only the files selected by a predicate."""
+        result = scan_repository(temp_repo, include_files=lambda path: path.endswith(".py"))
+        
+        assert sorted(result["files"]) == sorted(["src/main.py", "tests/test_main.py"])
+        assert result["file_count"] > 2
+
+
+@pytest.mark.unit
+class TestIterRepositoryEntries:
+    """Test the iter_repository_entries function."""
+    
+    def test_iter_repository_entries(self, temp_repo):
+        """Test that files and directories are streamed as compact records."""
+        entries = {entry.path: entry for entry in iter_repository_entries(temp_repo)}
+        
+        assert isinstance(entries["src/main.py"], RepositoryEntry)
+        assert not hasattr(entries["src/main.py"], "__dict__")
+        assert entries["src"].is_dir
+        assert entries["src"].category == "source"
+        assert entries["src/main.py"].category == "source"
+        assert entries["src/main.py"].language == "Python"
+        assert entries["src/main.py"].size == len("print('hello')")
+        assert entries["tests/test_main.py"].category == "test"
+        assert entries["docs/guide.md"].category == "documentation"
+        assert entries["README.md"].category == "other"
+        assert "build" not in entries
+    
+    def test_iter_repository_entries_reads_shebang_only_when_needed(self, temp_repo):
+        """Test that only extensionless files with unknown names are opened."""
+        (temp_repo / "run").write_text("#!/bin/bash\necho hi")
+        (temp_repo / "Makefile").write_text("all:")
+        
+        with patch("jpl.slim.utils.repo_utils._language_from_shebang", return_value="Shell") as mock_shebang:
+            entries = {entry.path: entry for entry in iter_repository_entries(temp_repo)}
+        
+        called_paths = sorted(os.path.basename(call.args[0]) for call in mock_shebang.call_args_list)
+        assert called_paths == ["LICENSE", "run"]
+        assert entries["run"].language == "Shell"
+        assert entries["Makefile"].language == "Makefile"
+    
+    def test_iter_repository_entries_without_size(self, temp_repo):
+        """Test skipping the per-file stat when sizes are not needed."""
+        entries = list(iter_repository_entries(temp_repo, compute_size=False))
+        
+        assert entries
+        assert all(entry.size == 0 for entry in entries)
 
 
 @pytest.mark.unit
@@ -516,6 +580,26 @@ class TestExtractProjectMetadata:
         # Should find the README
         assert result["project_name"] == "Polyglot Project"
         assert "Multi-language project" in result["description"]
+    
+    def test_extract_project_metadata_dispatches_present_manifests(self, temp_rust_repo):
+        """Test that only extractors for manifests in the repository root run."""
+        with patch('jpl.slim.utils.repo_utils._MANIFEST_EXTRACTORS',
+                   [(('package.json',), Mock()), (('Cargo.toml',), Mock())]) as extractors:
+            extract_project_metadata(temp_rust_repo)
+        
+        extractors[0][1].assert_not_called()
+        extractors[1][1].assert_called_once()
+        assert extractors[1][1].call_args[0][0] == Path(temp_rust_repo) / 'Cargo.toml'
+    
+    def test_scan_and_extract_parse_manifests_once(self, temp_rust_repo):
+        """Test that scan_repository and extract_project_metadata share parsed manifests."""
+        parse_toml = Mock(wraps=repo_utils._MANIFEST_PARSERS['toml'])
+        with patch.dict(repo_utils._MANIFEST_PARSERS, {'toml': parse_toml}):
+            scan_repository(temp_rust_repo)
+            result = extract_project_metadata(temp_rust_repo)
+        
+        assert parse_toml.call_count == 1
+        assert result["project_name"] == "test-rust-project"
 
 
 @pytest.mark.unit
@@ -893,6 +977,21 @@ class TestFindKeyFiles:
             assert result["authors"] == "AUTHORS.md"
             assert result["security"] == "SECURITY.md"
             assert result["code_of_conduct"] == "CODE_OF_CONDUCT.md"
+    
+    def test_find_key_files_skips_excluded_and_ignored_directories(self, tmp_path):
+        """Test that key files in dependency and git-ignored directories are not reported."""
+        (tmp_path / ".gitignore").write_text("build/\n")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "README.md").write_text("generated")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "LICENSE").write_text("dependency license")
+        (tmp_path / "docs" / "guide").mkdir(parents=True)
+        (tmp_path / "docs" / "guide" / "README.md").write_text("guide")
+        
+        result = find_key_files(tmp_path)
+        
+        assert result["readme"] == os.path.join("docs", "guide", "README.md")
+        assert "license" not in result
 
 
 @pytest.mark.unit
@@ -1132,6 +1231,19 @@ repository = "https://github.com/test/repo"
         assert metadata["version"] == "0.1.0"
         assert metadata["description"] == "A test package"
 
+    def test_extracted_lists_do_not_alias_manifest_cache(self, tmp_path):
+        """Test that mutating extracted metadata does not change later extractions."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "pkg"\ndependencies = ["requests", "pyyaml"]\n')
+
+        first = {}
+        extract_from_pyproject_toml(pyproject, first)
+        first["dependencies"].append("injected")
+        second = {}
+        extract_from_pyproject_toml(pyproject, second)
+
+        assert second["dependencies"] == ["requests", "pyyaml"]
+
 
 @pytest.mark.unit
 class TestNonCodeRepositories:
@@ -0,0 +1,107 @@
+"""
+Unit tests for tool_utils module.
+"""
+
+import os
+import threading
+import pytest
+from unittest.mock import patch
+
+from jpl.slim.utils import tool_utils
+from jpl.slim.utils.tool_utils import (
+    ToolSpec,
+    clear_resolved_tools,
+    ensure_tool,
+    find_tool,
+    parse_version,
+    tool_cache_dir
+)
+
+SPEC = ToolSpec('slim-fake-tool', 'slim-fake-tool', version='2.1.0', min_version='2.0.0')
+
+
+def _write_tool(directory, name, version):
+    """Write an executable that prints a version."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_text(f"#!/bin/sh\necho '{name} {version}'\n")
+    os.chmod(path, 0o755)
+    return path
+
+
+@pytest.fixture
+def tool_env(tmp_path, monkeypatch):
+    """Isolate the tool cache and PATH, and fake the pip install."""
+    monkeypatch.setenv("SLIM_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("PATH", str(tmp_path / "path"))
+    monkeypatch.setattr(tool_utils.sys, "executable", str(tmp_path / "python" / "python3"))
+    clear_resolved_tools()
+    installs = []
+
+    def fake_pip_install(venv_dir, requirement):
+        installs.append(requirement)
+        _write_tool(venv_dir / "bin", SPEC.name, requirement.split("==")[1])
+
+    with patch("jpl.slim.utils.tool_utils._create_venv"), \
+         patch("jpl.slim.utils.tool_utils._pip_install", side_effect=fake_pip_install):
+        yield tmp_path, installs
+    clear_resolved_tools()
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name == "nt", reason="Fake tools are shell scripts")
+class TestToolProvisioning:
+    """Test finding and installing command-line tools."""
+
+    def test_parse_version(self):
+        """Test parsing versions from --version output."""
+        assert parse_version("1.5.0") == (1, 5, 0)
+        assert parse_version("pre-commit 3.8.0\n") == (3, 8, 0)
+        assert parse_version("unknown") is None
+
+    def test_existing_install_is_used(self, tool_env):
+        """Test that a recent enough tool on the PATH is used without installing."""
+        tmp_path, installs = tool_env
+        existing = _write_tool(tmp_path / "path", SPEC.name, "2.0.3")
+
+        assert ensure_tool(SPEC) == str(existing)
+        assert installs == []
+
+    def test_outdated_install_is_replaced_once(self, tool_env):
+        """Test that an old tool triggers one cached install that later lookups reuse."""
+        tmp_path, installs = tool_env
+        _write_tool(tmp_path / "path", SPEC.name, "1.9.0")
+
+        executable = ensure_tool(SPEC)
+        clear_resolved_tools()
+
+        assert executable == str(tool_cache_dir(SPEC) / "bin" / SPEC.name)
+        assert find_tool(SPEC) == executable
+        assert ensure_tool(SPEC) == executable
+        assert installs == ["slim-fake-tool==2.1.0"]
+
+    def test_concurrent_callers_install_once(self, tool_env):
+        """Test that threads asking for the same tool share one install."""
+        _, installs = tool_env
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(ensure_tool(SPEC))) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(results)) == 1 and results[0]
+        assert installs == ["slim-fake-tool==2.1.0"]
+
+    def test_unverified_install_is_not_cached(self, tool_env):
+        """Test that an install reporting the wrong version fails and is retried next time."""
+        _, installs = tool_env
+
+        with patch("jpl.slim.utils.tool_utils._pip_install",
+                   side_effect=lambda venv_dir, requirement: _write_tool(venv_dir / "bin", SPEC.name, "0.1")):
+            assert ensure_tool(SPEC) is None
+
+        assert find_tool(SPEC) is None
+        assert ensure_tool(SPEC) is not None
+        assert installs == ["slim-fake-tool==2.1.0"]